@@ -0,0 +1,263 @@
+from __future__ import annotations
+import fractions
+import math
+from operator import mul
+from MatrixMath import Fraction
+
+# gmpy2 is optional. Its mpq type is only offered as a backend when it is
+# installed.
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
+
+class ScalarBackend:
+    """
+    Defines the type used for the rational entries of a Matrix. Matrix,
+    MatrixView and Factorization create and convert their rational entries
+    only through a backend; every backend's type supports the ordinary +, -,
+    *, / and comparison operators with itself and with ints. Subclasses set
+    name and scalar_type and implement from_ratio().
+    """
+    name = None
+    scalar_type = None
+
+    def __init__(self):
+        """
+        Creates the backend, with its zero and one already converted.
+        """
+        self.zero = self.from_ratio(0, 1)
+        self.one = self.from_ratio(1, 1)
+
+    def __repr__(self):
+        """
+        Defines the representation of a backend as its name.
+        :return: The representation of self.
+        """
+        return '<ScalarBackend {}>'.format(self.name)
+
+    def __reduce__(self):
+        """
+        Pickles a backend by name, so that a Matrix sent to another process,
+        such as a worker of a BlockMatrix, comes back with the same backend
+        object as the Matrices already there.
+        :return: The function and arguments that recreate self.
+        """
+        return get_backend, (self.name,)
+
+    def from_ratio(self, numerator: int, denominator: int):
+        """
+        Returns numerator / denominator as a scalar of this backend.
+        :param numerator: The numerator.
+        :param denominator: The denominator.
+        :return: The scalar.
+        """
+        raise NotImplementedError
+
+    def from_int(self, value: int):
+        """
+        Returns an int as a scalar of this backend.
+        :param value: The int.
+        :return: The scalar.
+        """
+        return self.from_ratio(value, 1)
+
+    def is_scalar(self, value) -> bool:
+        """
+        Returns True if value is already a scalar of this backend.
+        :param value: The value to be checked.
+        :return: True if value has the type of this backend.
+        """
+        return isinstance(value, self.scalar_type)
+
+    def convert(self, value):
+        """
+        Returns value, an int or a rational of any backend, as a scalar of
+        this backend.
+        :param value: The value to be converted.
+        :return: The scalar.
+        """
+        if isinstance(value, self.scalar_type):
+            return value
+        if isinstance(value, int):
+            return self.from_int(value)
+        if is_rational(value):
+            return self.from_ratio(*to_ratio(value))
+        raise TypeError
+
+    def sum(self, values):
+        """
+        Returns the sum of values, ints and scalars of this backend. Used by
+        the Matrix kernels for every sum of rational entries, so a backend
+        can add them in bulk rather than one + at a time.
+        :param values: An iterable of ints and scalars.
+        :return: The sum.
+        """
+        return sum(values)
+
+    def prod(self, values):
+        """
+        Returns the product of values, ints and scalars of this backend.
+        :param values: An iterable of ints and scalars.
+        :return: The product.
+        """
+        return math.prod(values)
+
+    def dot(self, first, second):
+        """
+        Returns the dot product of two sequences of ints and scalars of this
+        backend, of the same length.
+        :param first: The first sequence.
+        :param second: The second sequence.
+        :return: The dot product.
+        """
+        return sum(map(mul, first, second))
+
+
+class BuiltinFractionBackend(ScalarBackend):
+    """
+    The Fraction class of this package. This is the default backend.
+    """
+    name = 'builtin'
+    scalar_type = Fraction
+
+    def from_ratio(self, numerator: int, denominator: int):
+        """
+        Returns numerator / denominator as a Fraction.
+        """
+        return Fraction(numerator, denominator)
+
+    def sum(self, values):
+        """
+        Returns the sum of values with Fraction.sum(), which reduces once.
+        """
+        return Fraction.sum(values)
+
+    def prod(self, values):
+        """
+        Returns the product of values with Fraction.prod(), which reduces
+        once.
+        """
+        return Fraction.prod(values)
+
+    def dot(self, first, second):
+        """
+        Returns the dot product with Fraction.dot(), which reduces once.
+        """
+        return Fraction.dot(first, second)
+
+
+class StdlibFractionBackend(ScalarBackend):
+    """
+    fractions.Fraction from the Python standard library.
+    """
+    name = 'stdlib'
+    scalar_type = fractions.Fraction
+
+    def from_ratio(self, numerator: int, denominator: int):
+        """
+        Returns numerator / denominator as a fractions.Fraction.
+        """
+        return fractions.Fraction(numerator, denominator)
+
+
+class Gmpy2Backend(ScalarBackend):
+    """
+    gmpy2.mpq, whose arithmetic runs in GMP. Only available when gmpy2 is
+    installed.
+    """
+    name = 'gmpy2'
+    scalar_type = gmpy2.mpq if gmpy2 is not None else ()
+
+    def __init__(self):
+        """
+        Creates the backend. Raises ImportError if gmpy2 is not installed.
+        """
+
+        # Ensures that gmpy2 is installed.
+        if gmpy2 is None:
+            raise ImportError
+        super().__init__()
+
+    def from_ratio(self, numerator: int, denominator: int):
+        """
+        Returns numerator / denominator as a gmpy2.mpq.
+        """
+        return gmpy2.mpq(numerator, denominator)
+
+
+# Every available backend, by name.
+backends = {'builtin': BuiltinFractionBackend(),
+            'stdlib': StdlibFractionBackend()}
+if gmpy2 is not None:
+    backends['gmpy2'] = Gmpy2Backend()
+
+# The backend used by a Matrix created without one.
+default = backends['builtin']
+
+# The types of every available backend, used to recognize rational values.
+RATIONAL_TYPES = tuple(backend.scalar_type for backend in backends.values())
+
+
+def is_rational(value) -> bool:
+    """
+    Returns True if value is a rational scalar of any available backend.
+    Ints are not included.
+    :param value: The value to be checked.
+    :return: True if value is a rational scalar.
+    """
+    return isinstance(value, RATIONAL_TYPES)
+
+
+def to_ratio(value) -> tuple:
+    """
+    Returns value, an int or a rational of any backend, as a (numerator,
+    denominator) pair of ints in lowest terms.
+    :param value: The value to be converted.
+    :return: The pair of ints.
+    """
+    if isinstance(value, int):
+        return value, 1
+    return int(value.numerator), int(value.denominator)
+
+
+def bit_length(value) -> int:
+    """
+    Returns the number of bits needed to write value, an int or a rational of
+    any backend: the bit length of its numerator plus that of its
+    denominator. The cost of arithmetic on a rational grows with it.
+    :param value: The int or rational.
+    :return: The bit length.
+    """
+    return value.numerator.bit_length() + value.denominator.bit_length()
+
+
+def get_backend(backend=None) -> ScalarBackend:
+    """
+    Returns a backend given its name or the backend itself. If backend is
+    None, returns the default backend.
+    :param backend: The name of a backend, a ScalarBackend, or None.
+    :return: The ScalarBackend.
+    """
+    if backend is None:
+        return default
+    if isinstance(backend, ScalarBackend):
+        return backend
+    if not isinstance(backend, str):
+        raise TypeError
+
+    # Ensures that the backend exists. 'gmpy2' is missing when gmpy2 is not
+    # installed.
+    if backend not in backends:
+        raise ValueError
+    return backends[backend]
+
+
+def set_default_backend(backend):
+    """
+    Sets the backend used by every Matrix created without one from now on.
+    :param backend: The name of a backend or a ScalarBackend.
+    """
+    global default
+    default = get_backend(backend)
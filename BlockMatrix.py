@@ -0,0 +1,580 @@
+from __future__ import annotations
+from operator import mul
+from MatrixMath.Matrix import Matrix, integer_entry
+from MatrixMath.Storage import Storage
+from MatrixMath.Factorization import common_denominator_rows
+
+
+def partition(total: int, sizes) -> list:
+    """
+    Returns the sizes of the blocks that a dimension of total rows or columns
+    is split into.
+    :param total: The number of rows or columns.
+    :param sizes: Either a list of positive ints adding up to total, or a
+    positive int, the size of every block except the last, which holds what
+    is left.
+    :return: The sizes as a list.
+    """
+    if isinstance(sizes, int):
+        if sizes <= 0:
+            raise ValueError
+        return [sizes] * (total // sizes) + ([total % sizes]
+                                             if total % sizes else [])
+
+    sizes = list(sizes)
+    if not all(isinstance(size, int) for size in sizes):
+        raise TypeError
+    if not sizes or min(sizes) <= 0 or sum(sizes) != total:
+        raise ValueError
+    return sizes
+
+
+def zero_block(rows: int, cols: int, backend) -> Matrix:
+    """
+    Returns an integer Matrix of zeros, used for the blocks of products that
+    have no nonzero terms.
+    """
+    return Matrix(rows, cols, True, backend)
+
+
+def block_product(left: Matrix, right: Matrix) -> Matrix:
+    """
+    Returns the product of two blocks. If either holds rationals, each row of
+    left and each column of right is written as ints over one common
+    denominator, so that every dot product is taken in ints and only its
+    result becomes a rational, rather than adding up rationals term by term.
+    :param left: The left block.
+    :param right: The right block.
+    :return: The product.
+    """
+    if left.integer and right.integer:
+        return left * right
+
+    right = left.matching_backend(right)
+    rows, row_denominators = common_denominator_rows(left._rows())
+    columns, col_denominators = common_denominator_rows(right._columns())
+    from_ratio = left.backend.from_ratio
+    return Matrix.from_storage(
+        Storage.from_flat(
+            left.rows, right.cols,
+            [from_ratio(sum(map(mul, row, column)),
+                        row_denominator * col_denominator)
+             for row, row_denominator in zip(rows, row_denominators)
+             for column, col_denominator in zip(columns, col_denominators)]),
+        False, left.backend)
+
+
+class BlockMatrix:
+    """
+    A Matrix split into a grid of submatrices, or blocks. Sums and products
+    are found block by block, and the inverse, determinant and solutions of
+    linear systems are found recursively from Schur complements: for
+    M = [[A, B], [C, D]] with A invertible, det(M) = det(A) det(S) and M is
+    inverted through A and S alone, S = D - C A^-1 B being the Schur
+    complement of A. Blocks that are entirely zero are skipped in every
+    product, so block diagonal and block triangular matrices are handled
+    without multiplying their zero blocks at all. The block products needed
+    by each step are independent of each other, and are submitted to an
+    executor, such as a concurrent.futures.ProcessPoolExecutor, if one is
+    given.
+    """
+    def __init__(self, blocks, executor=None):
+        """
+        Creates a BlockMatrix from a grid of Matrices. The blocks are not
+        copied.
+        :param blocks: The blocks, as a list of block rows, each a list of
+        Matrices. All blocks in a block row must have the same number of
+        rows, and all blocks in a block column the same number of columns.
+        :param executor: The executor that block products are submitted to,
+        any object with a submit() method returning futures, such as a
+        concurrent.futures.Executor. Results of operations on self use the
+        same executor. Optional parameter, defaults to None, in which case
+        products are found one after another.
+        """
+
+        # Ensures that blocks is a nonempty, rectangular grid of Matrices.
+        if not isinstance(blocks, (list, tuple)) or not all(
+                isinstance(row, (list, tuple)) for row in blocks):
+            raise TypeError
+        if not blocks or not blocks[0] \
+                or any(len(row) != len(blocks[0]) for row in blocks):
+            raise ValueError
+        if not all(isinstance(block, Matrix)
+                   for row in blocks for block in row):
+            raise TypeError
+
+        self.row_sizes = [row[0].rows for row in blocks]
+        self.col_sizes = [block.cols for block in blocks[0]]
+
+        # Ensures that the blocks line up in both directions.
+        for row, size in zip(blocks, self.row_sizes):
+            if any(block.rows != size or block.cols != cols
+                   for block, cols in zip(row, self.col_sizes)):
+                raise ValueError
+
+        # Every block uses the backend of the first, so that blocks can be
+        # combined without converting their entries again.
+        first = blocks[0][0]
+        self.blocks = [[first.matching_backend(block) for block in row]
+                       for row in blocks]
+        self.rows = sum(self.row_sizes)
+        self.cols = sum(self.col_sizes)
+        self.backend = first.backend
+        self.integer = all(block.integer for row in blocks for block in row)
+        self.executor = executor
+
+        # Whether or not each block has a nonzero entry.
+        self.nonzero = [[any(block._flat()) for block in row]
+                        for row in self.blocks]
+
+        # Calculated by the find_determinant() method.
+        self.determinant_found = False
+        self.determinant = None
+
+        # Calculated by the find_inverse() method. Stored as a BlockMatrix.
+        self.inverse_found = False
+        self.inverse = None
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix, row_sizes, col_sizes=None,
+                    executor=None) -> BlockMatrix:
+        """
+        Splits a Matrix into blocks.
+        :param matrix: The Matrix.
+        :param row_sizes: The number of rows of each block row, as a list, or
+        an int giving the number of rows of every block row but the last.
+        :param col_sizes: The number of columns of each block column, in the
+        same form. Optional parameter, defaults to row_sizes, which gives
+        square blocks on the diagonal of a square Matrix.
+        :param executor: The executor, see __init__(). Optional parameter,
+        defaults to None.
+        :return: The BlockMatrix.
+        """
+        if not isinstance(matrix, Matrix):
+            raise TypeError
+        row_sizes = partition(matrix.rows, row_sizes)
+        col_sizes = partition(matrix.cols,
+                              row_sizes if col_sizes is None else col_sizes)
+
+        rows = matrix._rows()
+        blocks = []
+        top = 0
+        for height in row_sizes:
+            block_row = []
+            left = 0
+            for width in col_sizes:
+                block_row.append(Matrix.from_storage(
+                    Storage.from_flat(
+                        height, width,
+                        [entry for row in rows[top:top + height]
+                         for entry in row[left:left + width]]),
+                    matrix.integer, matrix.backend))
+                left += width
+            blocks.append(block_row)
+            top += height
+        return cls(blocks, executor)
+
+    def to_matrix(self) -> Matrix:
+        """
+        Returns the blocks of self joined into a single Matrix.
+        :return: The Matrix.
+        """
+        flat = []
+        for block_row, height in zip(self.blocks, self.row_sizes):
+            block_rows = [block._rows() for block in block_row]
+            for i in range(height):
+                for rows in block_rows:
+                    flat.extend(rows[i])
+        if not self.integer:
+            flat = list(map(self.backend.convert, flat))
+        return Matrix.from_storage(
+            Storage.from_flat(self.rows, self.cols, flat), self.integer,
+            self.backend)
+
+    def __str__(self):
+        """
+        Defines the string representation of a BlockMatrix as that of the
+        joined Matrix.
+        :return: The string representation of self.
+        """
+        return str(self.to_matrix())
+
+    def block(self, row: int, col: int) -> Matrix:
+        """
+        Returns the block at block row x block column, counting from 0.
+        :param row: The block row.
+        :param col: The block column.
+        :return: The block, which must be treated as read-only.
+        """
+        return self.blocks[row][col]
+
+    def derived(self, blocks: list) -> BlockMatrix:
+        """
+        Returns a BlockMatrix of blocks found from self, using the executor
+        of self.
+        :param blocks: The grid of blocks.
+        :return: The BlockMatrix.
+        """
+        return BlockMatrix(blocks, self.executor)
+
+    def multiply_blocks(self, pairs: list) -> list:
+        """
+        Returns the products of pairs of blocks, found through the executor
+        of self if it has one, so that they are found in parallel.
+        :param pairs: The pairs of Matrices to be multiplied.
+        :return: The products, in the same order.
+        """
+        if self.executor is None or len(pairs) < 2:
+            return [block_product(left, right) for left, right in pairs]
+        futures = [self.executor.submit(block_product, left, right)
+                   for left, right in pairs]
+        return [future.result() for future in futures]
+
+    def __add__(self, other: BlockMatrix) -> BlockMatrix:
+        """
+        Adds two BlockMatrices split in the same way, block by block. Zero
+        blocks are not added. Overrides the binary + operator.
+        :param other: The BlockMatrix to be added to self.
+        :return: The sum.
+        """
+
+        # Ensures that other is a BlockMatrix split like self.
+        if not isinstance(other, BlockMatrix):
+            raise TypeError
+        if self.row_sizes != other.row_sizes \
+                or self.col_sizes != other.col_sizes:
+            raise ValueError
+
+        blocks = []
+        for i, row in enumerate(self.blocks):
+            block_row = []
+            for j, block in enumerate(row):
+                if not other.nonzero[i][j]:
+                    block_row.append(block)
+                elif not self.nonzero[i][j]:
+                    block_row.append(other.blocks[i][j])
+                else:
+                    block_row.append(block + other.blocks[i][j])
+            blocks.append(block_row)
+        return self.derived(blocks)
+
+    def __neg__(self) -> BlockMatrix:
+        """
+        Returns self with every entry negated. Overrides the unary -
+        operator.
+        :return: The negated BlockMatrix.
+        """
+        return self.derived([[block * -1 if nonzero else block
+                              for block, nonzero in zip(row, nonzero_row)]
+                             for row, nonzero_row
+                             in zip(self.blocks, self.nonzero)])
+
+    def __sub__(self, other: BlockMatrix) -> BlockMatrix:
+        """
+        Subtracts a BlockMatrix split in the same way from self, block by
+        block. Overrides the binary - operator.
+        :param other: The BlockMatrix to be subtracted from self.
+        :return: The difference.
+        """
+        if not isinstance(other, BlockMatrix):
+            raise TypeError
+        return self + -other
+
+    def __mul__(self, other) -> BlockMatrix:
+        """
+        Multiplies two BlockMatrices, or a BlockMatrix and an int. The block
+        columns of self must be split like the block rows of other. Block
+        (i, j) of the product is the sum over k of block (i, k) of self times
+        block (k, j) of other; the products of all the pairs in which neither
+        block is zero are found at once, through the executor if there is
+        one. Overrides the * operator.
+        :param other: The BlockMatrix or int to be multiplied with self.
+        :return: The product.
+        """
+
+        # Special case if other is an int.
+        if isinstance(other, int):
+            return self.derived([[block * other for block in row]
+                                 for row in self.blocks])
+
+        # Ensures that the two BlockMatrices are possible to multiply.
+        if not isinstance(other, BlockMatrix):
+            raise TypeError
+        if self.col_sizes != other.row_sizes:
+            raise ValueError
+
+        # Collects the nonzero pairs behind each block of the product.
+        terms = {}
+        pairs = []
+        for i in range(len(self.row_sizes)):
+            for j in range(len(other.col_sizes)):
+                terms[i, j] = []
+                for k in range(len(self.col_sizes)):
+                    if self.nonzero[i][k] and other.nonzero[k][j]:
+                        terms[i, j].append(len(pairs))
+                        pairs.append((self.blocks[i][k], other.blocks[k][j]))
+        products = self.multiply_blocks(pairs)
+
+        blocks = []
+        for i, height in enumerate(self.row_sizes):
+            block_row = []
+            for j, width in enumerate(other.col_sizes):
+                block = None
+                for index in terms[i, j]:
+                    block = products[index] if block is None \
+                        else block + products[index]
+                block_row.append(zero_block(height, width, self.backend)
+                                 if block is None else block)
+            blocks.append(block_row)
+        return self.derived(blocks)
+
+    def __rmul__(self, other):
+        """
+        Allows an int to multiply a BlockMatrix from the left. Same
+        parameters as __mul__.
+        """
+        return self.__mul__(other)
+
+    def __eq__(self, other):
+        """
+        Checks whether the entries of two BlockMatrices, or of a BlockMatrix
+        and a Matrix, are the same, however they are split. Overloads the ==
+        operator.
+        :param other: The BlockMatrix or Matrix being compared to self.
+        :return: True if the entries are the same, False otherwise.
+        """
+        if isinstance(other, BlockMatrix):
+            if self.row_sizes == other.row_sizes \
+                    and self.col_sizes == other.col_sizes:
+                return all(first == second for first_row, second_row
+                           in zip(self.blocks, other.blocks)
+                           for first, second in zip(first_row, second_row))
+            other = other.to_matrix()
+        if not isinstance(other, Matrix):
+            raise TypeError
+        return self.to_matrix() == other
+
+    def __ne__(self, other):
+        """
+        Checks whether the entries of self and other differ. Overloads the
+        != operator.
+        """
+        return not self.__eq__(other)
+
+    def has_square_diagonal(self) -> bool:
+        """
+        Returns True if self is split the same way along both dimensions, so
+        that the blocks on its diagonal are square, which Schur complements
+        need.
+        """
+        return self.row_sizes == self.col_sizes
+
+    def quadrants(self, half: int = None) -> tuple:
+        """
+        Splits the block grid of self, which has square blocks on its
+        diagonal, in two along both dimensions.
+        :param half: The number of block rows and columns of A. Optional
+        parameter, defaults to half of them, rounded down.
+        :return: The four BlockMatrices A, B, C and D of [[A, B], [C, D]].
+        """
+        if half is None:
+            half = len(self.row_sizes) // 2
+        top, bottom = self.blocks[:half], self.blocks[half:]
+        return (self.derived([row[:half] for row in top]),
+                self.derived([row[half:] for row in top]),
+                self.derived([row[:half] for row in bottom]),
+                self.derived([row[half:] for row in bottom]))
+
+    def join(self, a: BlockMatrix, b: BlockMatrix, c: BlockMatrix,
+             d: BlockMatrix) -> BlockMatrix:
+        """
+        Returns the BlockMatrix [[a, b], [c, d]].
+        """
+        return self.derived([first + second for first, second
+                             in zip(a.blocks, b.blocks)]
+                            + [first + second for first, second
+                               in zip(c.blocks, d.blocks)])
+
+    def is_block_triangular(self, b: BlockMatrix, c: BlockMatrix) -> bool:
+        """
+        Returns True if either off-diagonal quadrant of self is zero.
+        """
+        return not any(map(any, b.nonzero)) or not any(map(any, c.nonzero))
+
+    def find_determinant(self):
+        """
+        Returns the determinant of self, or None if self is not square. It is
+        found as det(A) det(D - C A^-1 B), or as det(D) det(A - B D^-1 C) if
+        A is singular, recursing into A, D and the Schur complement. If
+        either off-diagonal quadrant is zero, it is simply det(A) det(D).
+        :return: The determinant, an int if every block is in the integer
+        domain and a rational otherwise.
+        """
+
+        if self.determinant_found:
+            return self.determinant
+
+        if self.rows != self.cols:
+            determinant = None
+        elif not self.has_square_diagonal():
+            determinant = self.to_matrix().find_determinant()
+        elif len(self.row_sizes) == 1:
+            determinant = self.blocks[0][0].find_determinant()
+        else:
+            a, b, c, d = self.quadrants()
+            if self.is_block_triangular(b, c):
+                determinant = a.find_determinant()
+                if determinant:
+                    determinant = determinant * d.find_determinant()
+            elif a.find_determinant():
+                a_inverse = a.find_inverse()
+                determinant = a.find_determinant() \
+                    * (d - c * (a_inverse * b)).find_determinant()
+            elif d.find_determinant():
+                d_inverse = d.find_inverse()
+                determinant = d.find_determinant() \
+                    * (a - b * (d_inverse * c)).find_determinant()
+            else:
+                determinant = self.to_matrix().find_determinant()
+
+            if self.integer and determinant is not None:
+                determinant = integer_entry(determinant)
+
+        self.determinant = determinant
+        self.determinant_found = True
+        return determinant
+
+    def find_inverse(self):
+        """
+        Returns the inverse of self, split like self, or None if self has no
+        inverse. With S = D - C A^-1 B the Schur complement of A, the inverse
+        of [[A, B], [C, D]] is
+        [[A^-1 + A^-1 B S^-1 C A^-1, -A^-1 B S^-1], [-S^-1 C A^-1, S^-1]],
+        A^-1 and S^-1 being found recursively. If A is singular, the Schur
+        complement of D is used instead, and if D is too, self is inverted
+        as a single Matrix.
+        :return: The inverse as a BlockMatrix, or None.
+        """
+
+        if self.inverse_found:
+            return self.inverse
+
+        if self.rows != self.cols:
+            inverse = None
+        elif not self.has_square_diagonal():
+            inverse = self.to_matrix().find_inverse()
+            if inverse is not None:
+                inverse = BlockMatrix.from_matrix(inverse, self.col_sizes,
+                                                  self.row_sizes,
+                                                  self.executor)
+        elif len(self.row_sizes) == 1:
+            inverse = self.blocks[0][0].find_inverse()
+            if inverse is not None:
+                inverse = self.derived([[inverse]])
+        else:
+            a, b, c, d = self.quadrants()
+            if a.find_inverse() is not None:
+                inverse = self.schur_inverse(a, b, c, d)
+            elif d.find_inverse() is not None:
+                # Swapping the roles of A and D gives
+                # [[T^-1, -T^-1 B D^-1], [-D^-1 C T^-1,
+                # D^-1 + D^-1 C T^-1 B D^-1]], T = A - B D^-1 C. That inverse
+                # has D first, so it is split after the blocks of D, which
+                # outnumber those of A when the number of blocks is odd.
+                inverse = self.schur_inverse(d, c, b, a)
+                if inverse is not None:
+                    d_part, c_part, b_part, a_part = inverse.quadrants(
+                        len(d.row_sizes))
+                    inverse = self.join(a_part, b_part, c_part, d_part)
+            else:
+                inverse = self.to_matrix().find_inverse()
+                if inverse is not None:
+                    inverse = BlockMatrix.from_matrix(
+                        inverse, self.row_sizes, self.col_sizes,
+                        self.executor)
+
+        self.inverse = inverse
+        self.inverse_found = True
+        return inverse
+
+    def schur_inverse(self, a: BlockMatrix, b: BlockMatrix, c: BlockMatrix,
+                      d: BlockMatrix):
+        """
+        Returns the inverse of [[a, b], [c, d]] through the Schur complement
+        of a, which must be invertible.
+        :return: The inverse, or None if the Schur complement is singular.
+        """
+        a_inverse = a.find_inverse()
+        a_inverse_b = a_inverse * b
+        c_a_inverse = c * a_inverse
+        complement_inverse = (d - c * a_inverse_b).find_inverse()
+        if complement_inverse is None:
+            return None
+        bottom_left = -(complement_inverse * c_a_inverse)
+        return self.join(a_inverse - a_inverse_b * bottom_left,
+                         -(a_inverse_b * complement_inverse),
+                         bottom_left, complement_inverse)
+
+    def solve_blocks(self, constants: BlockMatrix):
+        """
+        Returns the unique X with self X = constants, found without inverting
+        self: with A X1 + B X2 = C1 and C X1 + D X2 = C2, X2 solves
+        S X2 = C2 - C A^-1 C1, S being the Schur complement of A, and
+        X1 = A^-1 C1 - A^-1 B X2. A^-1 C1 and A^-1 B are themselves found
+        with solve_blocks().
+        :param constants: The right-hand sides, a BlockMatrix whose block
+        rows are split like those of self.
+        :return: X as a BlockMatrix, or None if A or S is singular.
+        """
+        if len(self.row_sizes) == 1:
+            inverse = self.blocks[0][0].find_inverse()
+            if inverse is None:
+                return None
+            return self.derived([[inverse]]) * constants
+
+        a, b, c, d = self.quadrants()
+        half = len(self.row_sizes) // 2
+        top = self.derived(constants.blocks[:half])
+        bottom = self.derived(constants.blocks[half:])
+
+        a_inverse_top = a.solve_blocks(top)
+        if a_inverse_top is None:
+            return None
+        a_inverse_b = a.solve_blocks(b)
+        lower = (d - c * a_inverse_b).solve_blocks(bottom
+                                                    - c * a_inverse_top)
+        if lower is None:
+            return None
+        upper = a_inverse_top - a_inverse_b * lower
+        return self.derived(upper.blocks + lower.blocks)
+
+    def solve(self, constants):
+        """
+        Finds the solution of the linear system whose coefficients are self
+        and whose right-hand side is constants, in the format described in
+        Matrix.find_solution(). A unique solution is found recursively from
+        Schur complements with solve_blocks(); any other system is solved as
+        a single Matrix.
+        :param constants: The right-hand side, either a list with one entry
+        per row of self or a Matrix with one column.
+        :return: The solution as a list, or None if there is no solution.
+        """
+
+        # Ensures that there is one constant for every row.
+        if isinstance(constants, Matrix):
+            if constants.cols != 1:
+                raise ValueError
+            column = constants
+        else:
+            column = Matrix.from_flat(len(constants), 1, constants, False,
+                                      self.backend)
+        if column.rows != self.rows:
+            raise ValueError
+
+        if self.rows == self.cols and self.has_square_diagonal():
+            solution = self.solve_blocks(
+                BlockMatrix.from_matrix(column, self.row_sizes, [1]))
+            if solution is not None:
+                return [list(map(self.backend.convert,
+                                 solution.to_matrix()._flat()))]
+        return self.to_matrix().solve(constants)
@@ -0,0 +1,173 @@
+from __future__ import annotations
+import asyncio
+from concurrent.futures import CancelledError
+from threading import Event, local
+from time import monotonic
+
+# The Budget active in each thread, used by checkpoint().
+active = local()
+
+
+def checkpoint(stage: str, step: int, total: int, operations: int = 0):
+    """
+    Marks a point in a long computation where it may safely stop. Does
+    nothing unless a Budget is active in the current thread, in which case
+    the Budget counts the operations, reports progress, and raises if it has
+    been cancelled or used up. Called between steps of the elimination
+    loops, where every structure being changed is in a consistent state.
+    :param stage: The name of the part of the computation, such as
+    'eliminate', 'reduce' or 'apply'.
+    :param step: The number of the step about to be done, counting from 1.
+    :param total: The number of steps in the stage.
+    :param operations: The number of entries the step is about to update.
+    Optional parameter, defaults to 0.
+    """
+    budget = getattr(active, 'budget', None)
+    if budget is not None:
+        budget.checkpoint(stage, step, total, operations)
+
+
+class Budget:
+    """
+    Limits on a computation running in one thread: a time limit, a limit on
+    the number of entry updates, and a flag that another thread can set with
+    cancel(). While a Budget is entered as a context manager, every
+    checkpoint() reached by the current thread, such as one per pivot of an
+    elimination, raises a concurrent.futures.CancelledError once it is
+    cancelled and a TimeoutError once either limit is passed, and otherwise
+    reports progress through the callback. A computation that raises leaves
+    the Matrix it was working on as it was, except for a partly reduced
+    Factorization, which carries on from where it stopped the next time.
+    """
+    def __init__(self, timeout: float = None, max_operations: int = None,
+                 progress=None):
+        """
+        Creates a Budget, which starts counting when it is entered.
+        :param timeout: The largest number of seconds the computation may
+        run. Optional parameter, defaults to None, for no limit.
+        :param max_operations: The largest number of entry updates the
+        computation may do. Optional parameter, defaults to None, for no
+        limit.
+        :param progress: A callable given the stage, step and total of every
+        checkpoint, such as ('eliminate', 3, 100) for the third pivot column
+        of 100. Optional parameter, defaults to None.
+        """
+
+        # Ensures that the limits are positive numbers and progress is
+        # callable.
+        if timeout is not None:
+            if not isinstance(timeout, (int, float)):
+                raise TypeError
+            if timeout <= 0:
+                raise ValueError
+        if max_operations is not None:
+            if not isinstance(max_operations, int):
+                raise TypeError
+            if max_operations <= 0:
+                raise ValueError
+        if progress is not None and not callable(progress):
+            raise TypeError
+
+        self.timeout = timeout
+        self.max_operations = max_operations
+        self.progress = progress
+        self.cancelled = Event()
+        self.deadline = None
+        self.operations = 0
+        self.previous = None
+
+    def cancel(self):
+        """
+        Asks the computation to stop at its next checkpoint. Safe to call
+        from any thread.
+        """
+        self.cancelled.set()
+
+    def __enter__(self) -> Budget:
+        """
+        Makes self the active Budget of the current thread and starts the
+        clock and the count of operations.
+        :return: self.
+        """
+        if self.timeout is not None:
+            self.deadline = monotonic() + self.timeout
+        self.operations = 0
+        self.previous = getattr(active, 'budget', None)
+        active.budget = self
+        return self
+
+    def __exit__(self, *exception):
+        """
+        Restores the Budget that was active before self was entered.
+        """
+        active.budget = self.previous
+        self.previous = None
+
+    def checkpoint(self, stage: str, step: int, total: int,
+                   operations: int = 0):
+        """
+        Counts the operations of the next step, then raises if self has been
+        cancelled or either limit would be passed, and otherwise reports
+        progress. See checkpoint().
+        :param stage: The name of the part of the computation.
+        :param step: The number of the step about to be done.
+        :param total: The number of steps in the stage.
+        :param operations: The number of entries the step is about to update.
+        Optional parameter, defaults to 0.
+        """
+        if self.cancelled.is_set():
+            raise CancelledError
+        self.operations += operations
+        if self.max_operations is not None \
+                and self.operations > self.max_operations:
+            raise TimeoutError
+        if self.deadline is not None and monotonic() > self.deadline:
+            raise TimeoutError
+        if self.progress is not None:
+            self.progress(stage, step, total)
+
+
+async def run_async(function, arguments: tuple = (), executor=None,
+                    timeout: float = None, max_operations: int = None,
+                    progress=None):
+    """
+    Calls function with arguments on executor under a new Budget, without
+    blocking the event loop. If the awaiting task is cancelled, the Budget
+    is cancelled too, so the computation stops at its next checkpoint
+    rather than running on in the background.
+    :param function: The function, such as a bound method of a Matrix.
+    :param arguments: The positional arguments of function. Optional
+    parameter, defaults to none.
+    :param executor: The executor, which must run function in a thread of
+    this process for the Budget to reach it, such as a
+    concurrent.futures.ThreadPoolExecutor. Optional parameter, defaults to
+    None, for the default executor of the event loop.
+    :param timeout: See Budget. Optional parameter, defaults to None.
+    :param max_operations: See Budget. Optional parameter, defaults to None.
+    :param progress: See Budget. It is called in the event loop rather than
+    in the thread doing the work. Optional parameter, defaults to None.
+    :return: The result of function.
+    """
+    loop = asyncio.get_running_loop()
+
+    # Progress is handed to the event loop, so the callback never needs to
+    # be thread-safe.
+    report = None
+    if progress is not None:
+        if not callable(progress):
+            raise TypeError
+
+        def report(stage, step, total):
+            loop.call_soon_threadsafe(progress, stage, step, total)
+
+    budget = Budget(timeout, max_operations, report)
+
+    def run():
+        with budget:
+            return function(*arguments)
+
+    try:
+        return await loop.run_in_executor(executor, run)
+    except asyncio.CancelledError:
+        budget.cancel()
+        raise
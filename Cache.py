@@ -0,0 +1,242 @@
+from __future__ import annotations
+from array import array
+from collections import OrderedDict
+from hashlib import blake2b
+from threading import Lock
+from MatrixMath.Backend import is_rational, to_ratio
+
+
+# Returned by ResultCache.get() when nothing is stored, since None is itself
+# a result that can be stored (a singular Matrix has no inverse).
+MISSING = object()
+
+
+def approximate_size(value) -> int:
+    """
+    Returns the approximate number of bytes used by a stored result: a
+    Matrix, a rational, an int, None or a list of these.
+    :param value: The result.
+    :return: The approximate size in bytes.
+    """
+
+    # Imported here since Matrix.py uses this module.
+    from MatrixMath.Matrix import Matrix
+
+    if isinstance(value, Matrix):
+        buffer = value._flat()
+        if isinstance(buffer, array):
+            return 64 + buffer.itemsize * len(buffer)
+        return 64 + sum(8 + approximate_size(entry) for entry in buffer)
+    if is_rational(value):
+        numerator, denominator = to_ratio(value)
+        return 48 + 28 + numerator.bit_length() // 8 \
+            + 28 + denominator.bit_length() // 8
+    if isinstance(value, int):
+        return 28 + value.bit_length() // 8
+    if isinstance(value, list):
+        return 56 + sum(8 + approximate_size(entry) for entry in value)
+    return 16
+
+
+def copy_result(value):
+    """
+    Returns a copy of a stored result, so that changing a result given out by
+    the cache never changes the cache itself.
+    :param value: The result.
+    :return: The copy.
+    """
+
+    # Imported here since Matrix.py uses this module.
+    from MatrixMath.Matrix import Matrix
+
+    if isinstance(value, Matrix):
+        return value.copy_matrix()
+    if isinstance(value, list):
+        return [copy_result(entry) for entry in value]
+    return value
+
+
+class ResultCache:
+    """
+    A process-wide cache of the expensive results of Matrix methods: the
+    determinant, inverse, reduced row echelon form and solution. Results are
+    stored under a digest of the dimensions and entries of the Matrix, so
+    they are shared between separate Matrix objects with the same contents,
+    and a Matrix that has been changed simply stops matching. The least
+    recently used results are evicted once the number of results or their
+    approximate size in bytes passes its limit. The cache is disabled until
+    enable() is called.
+    """
+    def __init__(self, max_entries: int = 1024,
+                 max_bytes: int = 64 * 1024 * 1024):
+        """
+        Creates an empty, disabled cache.
+        :param max_entries: The maximum number of results stored. Optional
+        parameter, defaults to 1024.
+        :param max_bytes: The maximum approximate size of all stored results,
+        in bytes. Optional parameter, defaults to 64 MiB.
+        """
+
+        # Ensures that both limits are positive ints.
+        if not isinstance(max_entries, int) or not isinstance(max_bytes, int):
+            raise TypeError
+        if max_entries <= 0 or max_bytes <= 0:
+            raise ValueError
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.enabled = False
+        self.hits = 0
+        self.misses = 0
+        self.size = 0
+        self.entries = OrderedDict()
+        self.lock = Lock()
+
+    def enable(self, max_entries: int = None, max_bytes: int = None):
+        """
+        Enables the cache, optionally changing its limits.
+        :param max_entries: The new maximum number of results. Optional
+        parameter, keeps the current limit if None.
+        :param max_bytes: The new maximum size in bytes. Optional parameter,
+        keeps the current limit if None.
+        """
+
+        # Ensures that any new limits are positive ints.
+        for limit in (max_entries, max_bytes):
+            if limit is not None and not isinstance(limit, int):
+                raise TypeError
+            if limit is not None and limit <= 0:
+                raise ValueError
+
+        with self.lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            self.evict()
+            self.enabled = True
+
+    def disable(self):
+        """
+        Disables the cache and removes every stored result.
+        """
+        self.enabled = False
+        self.clear()
+
+    def clear(self):
+        """
+        Removes every stored result. The hit and miss counters are kept.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def reset_counters(self):
+        """
+        Sets the hit and miss counters back to 0.
+        """
+        with self.lock:
+            self.hits = 0
+            self.misses = 0
+
+    def statistics(self) -> dict:
+        """
+        Returns the counters and current usage of the cache.
+        :return: A dict with the keys 'enabled', 'hits', 'misses', 'entries',
+        'bytes', 'max_entries' and 'max_bytes'.
+        """
+        return {'enabled': self.enabled, 'hits': self.hits,
+                'misses': self.misses, 'entries': len(self.entries),
+                'bytes': self.size, 'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes}
+
+    def find_digest(self, matrix):
+        """
+        Returns the digest of the dimensions and entries of matrix, or None
+        if the cache is disabled.
+        :param matrix: The Matrix.
+        :return: The digest as bytes, or None.
+        """
+
+        if not self.enabled:
+            return None
+
+        digest = blake2b(digest_size=16)
+        digest.update('{} {} {} {}:'.format(matrix.rows, matrix.cols,
+                                             matrix.integer,
+                                             matrix.backend.name).encode())
+
+        # Arrays of ints are hashed as raw bytes. Any other entries are hashed
+        # through their string form, which is "A" or "A/B" for ints and the
+        # rationals of every backend.
+        buffer = matrix._flat()
+        if isinstance(buffer, array):
+            digest.update(b'q')
+            digest.update(buffer.tobytes())
+        else:
+            digest.update(b's')
+            digest.update(','.join(map(str, buffer)).encode())
+        return digest.digest()
+
+    def get(self, digest, kind: str):
+        """
+        Returns a copy of the result of type kind stored for digest, or
+        MISSING if there is none. Counts a hit or a miss.
+        :param digest: The digest from find_digest(). If None, MISSING is
+        returned without counting anything.
+        :param kind: The type of result, such as 'determinant' or 'inverse'.
+        :return: A copy of the stored result, or MISSING.
+        """
+
+        if digest is None:
+            return MISSING
+
+        with self.lock:
+            entry = self.entries.get((digest, kind))
+            if entry is None:
+                self.misses += 1
+                return MISSING
+            self.entries.move_to_end((digest, kind))
+            self.hits += 1
+        return copy_result(entry[0])
+
+    def put(self, digest, kind: str, value):
+        """
+        Stores a copy of a result of type kind for digest, evicting the least
+        recently used results if a limit is passed. A result larger than the
+        whole cache is not stored.
+        :param digest: The digest from find_digest(). If None, nothing is
+        stored.
+        :param kind: The type of result.
+        :param value: The result.
+        """
+
+        if digest is None:
+            return
+
+        size = approximate_size(value)
+        if size > self.max_bytes:
+            return
+        value = copy_result(value)
+
+        with self.lock:
+            previous = self.entries.pop((digest, kind), None)
+            if previous is not None:
+                self.size -= previous[1]
+            self.entries[(digest, kind)] = (value, size)
+            self.size += size
+            self.evict()
+
+    def evict(self):
+        """
+        Removes the least recently used results until both limits are met.
+        Must be called with the lock held.
+        """
+        while self.entries and (len(self.entries) > self.max_entries
+                                or self.size > self.max_bytes):
+            _, (_, size) = self.entries.popitem(last=False)
+            self.size -= size
+
+
+# The cache shared by every Matrix in the process.
+result_cache = ResultCache()
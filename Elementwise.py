@@ -0,0 +1,314 @@
+from __future__ import annotations
+from array import array
+from math import sqrt
+from operator import add, mul
+from MatrixMath.Matrix import Matrix
+from MatrixMath.Storage import Storage
+from MatrixMath.Backend import is_rational, to_ratio
+from MatrixMath.MatrixBatch import fits_int64
+
+# NumPy is optional. Without it, every operation runs through comprehensions
+# over the flat buffers.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# The names of the norms accepted by Matrix.norm().
+NORMS = ('frobenius', 'max', 'one', 'infinity')
+
+
+def int64_view(buffer):
+    """
+    Returns an int64 NumPy array sharing the memory of buffer, or None if
+    NumPy is not installed or buffer is not an array('q'). No entries are
+    copied.
+    :param buffer: The flat buffer of a Matrix.
+    :return: The NumPy array, or None.
+    """
+    if numpy is None or not isinstance(buffer, array):
+        return None
+    return numpy.frombuffer(buffer, dtype=numpy.int64)
+
+
+def bound(values) -> int:
+    """
+    Returns the largest absolute value of an int64 NumPy array, as an int.
+    :param values: The array, which must not be empty.
+    :return: The bound.
+    """
+    return max(-int(values.min()), int(values.max()))
+
+
+def from_int64(values) -> array:
+    """
+    Returns an int64 NumPy array as an array('q'), in a single copy.
+    :param values: The array.
+    :return: The array('q').
+    """
+    result = array('q')
+    result.frombytes(numpy.ascontiguousarray(values).tobytes())
+    return result
+
+
+def float_entry(value) -> float:
+    """
+    Returns an int, a float or a rational of any backend as a float.
+    """
+    if is_rational(value):
+        numerator, denominator = to_ratio(value)
+        return numerator / denominator
+    return float(value)
+
+
+def quotient(first, second, backend):
+    """
+    Returns first / second exactly: a rational of backend for ints and
+    rationals, or a float if either is a float.
+    :param first: The dividend.
+    :param second: The divisor. Raises ValueError if it is 0, whatever the
+    types involved.
+    :param backend: The backend of the result.
+    :return: The quotient.
+    """
+
+    # Ensures that second is not 0. Fraction raises ValueError for a zero
+    # denominator, so the other backends and floats do the same.
+    if not second:
+        raise ValueError
+    if isinstance(first, int) and isinstance(second, int):
+        return backend.from_ratio(first, second)
+    if isinstance(first, float) or isinstance(second, float):
+        return float_entry(first) / float_entry(second)
+    return backend.convert(first) / backend.convert(second)
+
+
+def absolute(value):
+    """
+    Returns the absolute value of an int, a float or a rational of any
+    backend, in its own type.
+    """
+    return -value if value < 0 else value
+
+
+def result_matrix(rows: int, cols: int, values, integer: bool,
+                  backend) -> Matrix:
+    """
+    Returns a Matrix holding values, a flat buffer or list in row-major
+    order, without copying it again.
+    :param rows: The number of rows.
+    :param cols: The number of columns.
+    :param values: The entries.
+    :param integer: Whether or not the Matrix is in the integer domain.
+    :param backend: The backend of the Matrix.
+    :return: The Matrix.
+    """
+    storage = Storage.from_flat(rows, cols, values) \
+        if isinstance(values, list) else Storage(rows, cols, values)
+    return Matrix.from_storage(storage, integer, backend)
+
+
+def map_entries(matrix: Matrix, function) -> Matrix:
+    """
+    Returns the Matrix of function applied to every entry of matrix. A NumPy
+    ufunc, such as numpy.negative, is applied to an array('q') in a single
+    call; any other callable is applied to one entry at a time. The result is
+    in the integer domain if matrix is and every result is an int.
+    :param matrix: The Matrix.
+    :param function: A callable taking and returning one entry.
+    :return: The new Matrix.
+    """
+    if not callable(function):
+        raise TypeError
+
+    buffer = matrix._flat()
+    values = int64_view(buffer)
+    if values is not None and isinstance(function, numpy.ufunc):
+        values = function(values)
+        if values.dtype.kind in 'biu':
+            values = from_int64(values.astype(numpy.int64, copy=False))
+        else:
+            values = values.tolist()
+    else:
+        values = list(map(function, buffer))
+
+    integer = matrix.integer and (
+        isinstance(values, array)
+        or all(isinstance(value, int) for value in values))
+    return result_matrix(matrix.rows, matrix.cols, values, integer,
+                         matrix.backend)
+
+
+def hadamard(first: Matrix, second: Matrix) -> Matrix:
+    """
+    Returns the entrywise product of two Matrices of the same dimensions.
+    Two array('q') buffers are multiplied by NumPy when no product can
+    overflow an int64.
+    :param first: The first Matrix.
+    :param second: The second Matrix.
+    :return: The product.
+    """
+
+    # Ensures that second is a Matrix with the same dimensions as first.
+    if not isinstance(second, Matrix):
+        raise TypeError
+    if first.rows != second.rows or first.cols != second.cols:
+        raise ValueError
+
+    second = first.matching_backend(second)
+    left = int64_view(first._flat())
+    right = int64_view(second._flat())
+    if left is not None and right is not None \
+            and fits_int64(1, bound(left), bound(right)):
+        values = from_int64(left * right)
+    else:
+        values = list(map(mul, first._flat(), second._flat()))
+    return result_matrix(first.rows, first.cols, values,
+                         first.integer and second.integer, first.backend)
+
+
+def divide(first: Matrix, second) -> Matrix:
+    """
+    Returns the entrywise quotient of first by a Matrix of the same
+    dimensions, or by a scalar. Quotients of ints and rationals are exact
+    rationals, so the result is never in the integer domain.
+    :param first: The Matrix divided.
+    :param second: The Matrix or scalar. Raises ValueError if it is 0 or
+    has an entry that is 0.
+    :return: The quotient.
+    """
+    backend = first.backend
+    if isinstance(second, Matrix):
+        if first.rows != second.rows or first.cols != second.cols:
+            raise ValueError
+        divisors = second._flat()
+    elif isinstance(second, (int, float)) or is_rational(second):
+        divisors = [second] * (first.rows * first.cols)
+    else:
+        raise TypeError
+    values = [quotient(entry, divisor, backend)
+              for entry, divisor in zip(first._flat(), divisors)]
+    return result_matrix(first.rows, first.cols, values, False, backend)
+
+
+def kronecker(first: Matrix, second: Matrix) -> Matrix:
+    """
+    Returns the Kronecker product of two Matrices: the block Matrix whose
+    block at row i and column j is first[i][j] * second. Each row of the
+    result is built from one row of each Matrix, or the whole product is
+    found by numpy.kron when both are array('q') buffers and no product can
+    overflow an int64.
+    :param first: The first Matrix, of dimensions m x n.
+    :param second: The second Matrix, of dimensions p x q.
+    :return: The product, of dimensions mp x nq.
+    """
+    if not isinstance(second, Matrix):
+        raise TypeError
+
+    second = first.matching_backend(second)
+    rows = first.rows * second.rows
+    cols = first.cols * second.cols
+    left = int64_view(first._flat())
+    right = int64_view(second._flat())
+    if left is not None and right is not None \
+            and fits_int64(1, bound(left), bound(right)):
+        values = from_int64(numpy.kron(
+            left.reshape(first.rows, first.cols),
+            right.reshape(second.rows, second.cols)))
+    else:
+        second_rows = second._rows()
+        values = [entry * second_entry
+                  for first_row in first._rows()
+                  for second_row in second_rows
+                  for entry in first_row
+                  for second_entry in second_row]
+    return result_matrix(rows, cols, values,
+                         first.integer and second.integer, first.backend)
+
+
+def row_sums(matrix: Matrix) -> list:
+    """
+    Returns the sum of every row of matrix.
+    :param matrix: The Matrix.
+    :return: A list with one sum per row.
+    """
+    return list(map(sum, matrix._rows()))
+
+
+def column_sums(matrix: Matrix) -> list:
+    """
+    Returns the sum of every column of matrix.
+    :param matrix: The Matrix.
+    :return: A list with one sum per column.
+    """
+    return sum_rows(matrix._rows())
+
+
+def sum_rows(rows) -> list:
+    """
+    Returns the entrywise sum of a list of rows. Rows are added one at a
+    time with map(), so no list of columns is built.
+    :param rows: The rows, all of the same length.
+    :return: The sum, as a list.
+    """
+    rows = iter(rows)
+    sums = list(next(rows))
+    for row in rows:
+        sums = list(map(add, sums, row))
+    return sums
+
+
+def norm(matrix: Matrix, kind: str = 'frobenius'):
+    """
+    Returns a norm of matrix: 'frobenius', the square root of the sum of the
+    squares of the entries, as a float; 'max', the largest absolute value of
+    an entry; 'one', the largest sum of absolute values in a column; or
+    'infinity', the largest sum of absolute values in a row. Every norm but
+    the Frobenius norm is exact.
+    :param matrix: The Matrix.
+    :param kind: The name of the norm, one of NORMS. Optional parameter,
+    defaults to 'frobenius'.
+    :return: The norm.
+    """
+    if not isinstance(kind, str):
+        raise TypeError
+    if kind not in NORMS:
+        raise ValueError
+
+    buffer = matrix._flat()
+    if kind == 'frobenius':
+        # The squares are summed exactly, so only the square root rounds.
+        # Rational squares go through the backend, which can add them
+        # without reducing each partial sum.
+        if matrix.integer:
+            return sqrt(float_entry(sum(map(mul, buffer, buffer))))
+        return sqrt(float_entry(matrix.backend.dot(buffer, buffer)))
+    if kind == 'max':
+        values = int64_view(buffer)
+        if values is not None:
+            return bound(values)
+        return max(map(absolute, buffer))
+
+    cols = matrix.cols
+    absolute_values = list(map(absolute, buffer))
+    absolute_rows = [absolute_values[start:start + cols]
+                     for start in range(0, len(absolute_values), cols)]
+    if kind == 'one':
+        return max(sum_rows(absolute_rows))
+    return max(map(sum, absolute_rows))
+
+
+def extreme_entry(matrix: Matrix, largest: bool = True):
+    """
+    Returns the largest or smallest entry of matrix, found by NumPy for an
+    array('q') buffer.
+    :param matrix: The Matrix, whose entries must not be complex.
+    :param largest: Whether the largest entry is returned rather than the
+    smallest. Optional parameter, defaults to True.
+    :return: The entry.
+    """
+    buffer = matrix._flat()
+    values = int64_view(buffer)
+    if values is not None:
+        return int(values.max() if largest else values.min())
+    return max(buffer) if largest else min(buffer)
@@ -0,0 +1,625 @@
+from __future__ import annotations
+from math import gcd, lcm
+from MatrixMath.Matrix import Matrix
+from MatrixMath.Storage import Storage
+from MatrixMath.Fraction import tree_product
+from MatrixMath.Backend import bit_length, to_ratio
+from MatrixMath.Budget import checkpoint
+
+
+# The names of the pivoting strategies, as accepted by the pivoting parameter
+# of Factorization and of the Matrix methods that eliminate.
+PIVOTING = ('first', 'smallest', 'sparse')
+
+
+def check_pivoting(pivoting: str):
+    """
+    Ensures that pivoting is the name of a pivoting strategy.
+    :param pivoting: The name to be checked.
+    """
+    if not isinstance(pivoting, str):
+        raise TypeError
+    if pivoting not in PIVOTING:
+        raise ValueError
+
+
+def common_denominator_rows(rows: list) -> tuple:
+    """
+    Returns rows of ints and rationals as integer rows with one denominator
+    each: a list of the numerators of every row and a list of the positive
+    denominators, so that rows[i][j] == numerators[i][j] / denominators[i].
+    :param rows: The rows, as a list of row lists.
+    :return: The numerators and the denominators as a tuple of lists.
+    """
+    numerators = []
+    denominators = []
+    for row in rows:
+        ratios = [to_ratio(entry) for entry in row]
+        denominator = lcm(*(ratio[1] for ratio in ratios))
+        numerators.append([numerator * (denominator // entry_denominator)
+                           for numerator, entry_denominator in ratios])
+        denominators.append(denominator)
+    return numerators, denominators
+
+
+def ratio_bit_length(numerator: int, denominator: int) -> int:
+    """
+    Returns the bit length of numerator / denominator in lowest terms, as
+    bit_length() gives it for a rational.
+    :param numerator: The numerator.
+    :param denominator: The positive denominator.
+    :return: The bit length.
+    """
+    divisor = gcd(numerator, denominator)
+    return (numerator // divisor).bit_length() \
+        + (denominator // divisor).bit_length()
+
+
+def choose_pivot(rows: list, row: int, col: int, pivoting: str = 'first',
+                 denominators: list = None):
+    """
+    Returns the index of the row, at or below row, whose entry in column col
+    becomes the next pivot, or None if all of those entries are 0. With
+    'first', the first nonzero entry is taken. With 'smallest', the entry
+    with the smallest bit length is taken, so that the rows are multiplied by
+    the smallest numbers. With 'sparse', the row with the fewest nonzero
+    entries from column col onwards is taken, so that the fewest entries of
+    the other rows change. Ties go to the first such row.
+    :param rows: The rows being eliminated.
+    :param row: The first row that may be chosen.
+    :param col: The column of the pivot.
+    :param pivoting: The name of the pivoting strategy. Optional parameter,
+    defaults to 'first'.
+    :param denominators: The denominator of each row if the rows are held
+    with a common denominator, so that 'smallest' compares the entries in
+    lowest terms and chooses the same pivot as it would on rationals.
+    Optional parameter, defaults to None.
+    :return: The index of the pivot row, or None.
+    """
+
+    if pivoting == 'first':
+        for i in range(row, len(rows)):
+            if rows[i][col]:
+                return i
+        return None
+
+    candidates = [i for i in range(row, len(rows)) if rows[i][col]]
+    if not candidates:
+        return None
+    if pivoting == 'smallest':
+        if denominators is None:
+            return min(candidates, key=lambda i: bit_length(rows[i][col]))
+        return min(candidates, key=lambda i: ratio_bit_length(
+            rows[i][col], denominators[i]))
+    return min(candidates, key=lambda i: sum(1 for entry in rows[i][col:]
+                                             if entry))
+
+
+def build_solution(rref_rows: list, pivot_cols: list, variables: int,
+                   constants: list, backend) -> list:
+    """
+    Builds the solution of a consistent linear system in the format returned
+    by Matrix.find_solution(). The list holds one [column, vector] pair for
+    every independent variable, followed by the vector of constants. Every
+    vector has one entry per variable.
+    :param rref_rows: The rows of the reduced row echelon form of the
+    coefficients.
+    :param pivot_cols: The column of the leading entry of each nonzero row.
+    :param variables: The number of variables.
+    :param constants: The right-hand side after elimination, one per row.
+    :param backend: The ScalarBackend of the entries.
+    :return: The solution as a list.
+    """
+
+    zero = backend.zero
+    pivots = set(pivot_cols)
+    solution = []
+
+    # Every column without a leading entry is an independent variable. Its
+    # vector has a 1 in its own position and, in the position of each
+    # dependent variable, the negative of that variable's coefficient.
+    for i in range(variables):
+        if i in pivots:
+            continue
+        independent_vector = [zero] * variables
+        independent_vector[i] = 1
+        for row, col in enumerate(pivot_cols):
+            independent_vector[col] = -rref_rows[row][i]
+        solution.append([i, independent_vector])
+
+    # Adds a final list to the solution containing the constants.
+    constant_vector = [zero] * variables
+    for row, col in enumerate(pivot_cols):
+        constant_vector[col] = constants[row]
+    solution.append(constant_vector)
+
+    return solution
+
+
+class Factorization:
+    """
+    The result of one Gauss-Jordan elimination of a Matrix. Holds the reduced
+    row echelon form, the columns containing leading entries, the rank, the
+    determinant and a record of every row operation performed. The inverse
+    and the solutions for any right-hand side are found by replaying the
+    record, so none of them needs another elimination. Usually obtained
+    through Matrix.factorize(), which stores it so that find_determinant(),
+    gaussian_elimination(), find_inverse() and find_solution() all share it.
+
+    The pivot of each column is chosen by one of the strategies in PIVOTING
+    (see choose_pivot()). Every strategy gives the same results, but the
+    sizes of the intermediate rationals, and so the time taken, depend on it.
+    When asked for, the largest bit length of any entry during elimination is
+    kept in peak_bit_length so that the strategies can be compared on a
+    workload.
+
+    By default each row is held during elimination as a list of ints and one
+    shared denominator rather than as a list of rationals. A row operation is
+    then a run of int multiplications followed by a single gcd that removes
+    the common factor of the whole row, rather than a gcd for every entry.
+    The rows are converted back into rationals of the backend once, when the
+    reduced row echelon form is complete. The operations recorded, and so
+    every result, are the same in both representations.
+
+    The elimination is done in two halves. Creating a Factorization only
+    eliminates the entries below the pivots, which is enough for the
+    determinant, rank and pivot columns. The entries above the pivots are
+    eliminated the first time the reduced row echelon form, the inverse or a
+    solution is needed.
+    """
+    def __init__(self, matrix: Matrix, pivoting: str = 'first',
+                 track_bit_length: bool = False,
+                 common_denominator: bool = True):
+        """
+        Eliminates a copy of matrix, which is not changed.
+        :param matrix: The Matrix to be factorized.
+        :param pivoting: The name of the pivoting strategy, one of PIVOTING.
+        Optional parameter, defaults to 'first'.
+        :param track_bit_length: Whether or not the largest bit length of any
+        entry is kept in peak_bit_length. Checking every new entry slows
+        elimination by about a third, so peak_bit_length is None unless this
+        is True. Optional parameter, defaults to False.
+        :param common_denominator: Whether or not each row is held as ints
+        with a common denominator during elimination, rather than as a list of
+        rationals. Optional parameter, defaults to True.
+        """
+
+        # Ensures that matrix is a Matrix and pivoting is a strategy.
+        if not isinstance(matrix, Matrix):
+            raise TypeError
+        check_pivoting(pivoting)
+
+        self.rows = matrix.rows
+        self.cols = matrix.cols
+        self.backend = backend = matrix.backend
+        self.pivoting = pivoting
+        self.common_denominator = common_denominator
+
+        # Elimination needs division, so it works either on rows of ints with
+        # a denominator each, or on rows with every entry promoted to a
+        # rational of the backend of matrix.
+        if common_denominator:
+            if matrix.integer:
+                rows = [list(row) for row in matrix._rows()]
+                denominators = [1] * self.rows
+            else:
+                rows, denominators = common_denominator_rows(matrix._rows())
+        else:
+            rows = [list(row) for row in matrix.to_rational()._rows()]
+            denominators = None
+        self.denominators = denominators
+
+        self.track_bit_length = track_bit_length
+        self.peak_bit_length = None
+        if track_bit_length:
+            self.peak_bit_length = 0
+            for i in range(self.rows):
+                self.track(rows, i)
+
+        # Each operation is stored as a tuple counting rows from 0:
+        # ('swap', first, second), ('multiply', row, factor) or
+        # ('add', row, factor, source), the last adding factor times source
+        # to row.
+        self.operations = operations = []
+        pivot_cols = []
+
+        # The determinant is the product of the pivots, negated once for
+        # every swap. The pivots are multiplied once elimination is done, so
+        # that the product is reduced once rather than once per pivot.
+        pivots = []
+        pivot_denominators = []
+        negated = False
+
+        row = 0
+        for col in range(self.cols):
+            if row == self.rows:
+                break
+
+            # Stops here if the active Budget is cancelled or used up, before
+            # eliminating the rows below row in the rest of the columns.
+            checkpoint('eliminate', col + 1, self.cols,
+                       (self.rows - row) * (self.cols - col))
+
+            # Finds the row holding the pivot of the current column.
+            row_search = choose_pivot(rows, row, col, pivoting,
+                                      denominators)
+            if row_search is None:
+                continue
+
+            # Swaps the first row with the row holding the pivot.
+            if row_search != row:
+                rows[row], rows[row_search] = rows[row_search], rows[row]
+                if common_denominator:
+                    denominators[row], denominators[row_search] = \
+                        denominators[row_search], denominators[row]
+                operations.append(('swap', row, row_search))
+                negated = not negated
+
+            # Sets the leading entry to 1 by dividing the row by it. Entries
+            # to the left of col are already 0 in this row, so only the rest
+            # of the row is changed.
+            pivot_row = rows[row]
+            if common_denominator:
+                # Dividing by the pivot n / d makes the denominator of the
+                # row n, so the numerators are kept as they are.
+                numerator = pivot_row[col]
+                denominator = denominators[row]
+                pivots.append(numerator)
+                pivot_denominators.append(denominator)
+                if numerator != denominator:
+                    operations.append(
+                        ('multiply', row,
+                         backend.from_ratio(denominator, numerator)))
+                    denominators[row] = numerator
+                    self.normalize(rows, denominators, row)
+                    self.track(rows, row)
+            else:
+                pivot = pivot_row[col]
+                pivots.append(pivot)
+                if pivot != 1:
+                    factor = 1 / pivot
+                    pivot_row[col:] = [entry * factor
+                                       for entry in pivot_row[col:]]
+                    operations.append(('multiply', row, factor))
+                    self.track(rows, row)
+
+            # Eliminates all leading entries below the pivot by subtracting the
+            # appropriate amount of the pivot row.
+            self.eliminate(rows, row, col, range(row + 1, self.rows))
+
+            pivot_cols.append(col)
+            row += 1
+
+        self.pivot_cols = pivot_cols
+        self.rank = len(pivot_cols)
+        self.echelon_rows = rows
+        self.reduced = False
+
+        # The determinant is only defined for n x n matrices, and is 0 when
+        # elimination leaves a row without a pivot.
+        if self.rows != self.cols:
+            self.determinant = None
+        elif self.rank < self.rows:
+            self.determinant = backend.zero
+        elif common_denominator:
+            self.determinant = backend.from_ratio(
+                -tree_product(pivots) if negated else tree_product(pivots),
+                tree_product(pivot_denominators))
+        else:
+            determinant = backend.convert(backend.prod(pivots))
+            self.determinant = -determinant if negated else determinant
+
+        self.reduced_echelon_form_found = False
+        self.reduced_echelon_form_matrix = None
+
+        self.inverse_found = False
+        self.inverse = None
+
+    def track(self, rows: list, row: int):
+        """
+        Raises peak_bit_length to the largest bit length in a row if that is
+        larger. With a common denominator, the bit length of an entry is that
+        of its numerator plus that of the denominator of the row. Does
+        nothing unless the bit length is being tracked.
+        :param rows: The rows being eliminated.
+        :param row: The row that has just changed.
+        """
+        if not self.track_bit_length:
+            return
+        if self.common_denominator:
+            peak = max(map(int.bit_length, rows[row]), default=0) \
+                + self.denominators[row].bit_length()
+        else:
+            peak = max(map(bit_length, rows[row]), default=0)
+        if peak > self.peak_bit_length:
+            self.peak_bit_length = peak
+
+    @staticmethod
+    def normalize(rows: list, denominators: list, row: int):
+        """
+        Divides the numerators and the denominator of a row held with a
+        common denominator by their greatest common divisor, and makes the
+        denominator positive.
+        :param rows: The numerators of the rows.
+        :param denominators: The denominators of the rows.
+        :param row: The row.
+        """
+        numerators = rows[row]
+        denominator = denominators[row]
+        divisor = gcd(denominator, *numerators)
+        if denominator < 0:
+            divisor = -divisor
+        if divisor != 1:
+            rows[row] = [numerator // divisor for numerator in numerators]
+            denominators[row] = denominator // divisor
+
+    def eliminate_integer_rows(self, rows: list, row: int, col: int,
+                               targets):
+        """
+        Does the same as eliminate() on rows held with a common denominator.
+        The pivot row has the same numerator in column col as its
+        denominator. Subtracting factor times the pivot row from a row with
+        numerators n and denominator d gives the numerators
+        n * (pivot denominator) - (n in column col) * (pivot numerators) over
+        the denominator d * (pivot denominator), after which the row is
+        normalized.
+        :param rows: The numerators of the rows being eliminated.
+        :param row: The pivot row.
+        :param col: The pivot column.
+        :param targets: The rows to be eliminated.
+        """
+        backend = self.backend
+        denominators = self.denominators
+        pivot_row = rows[row]
+        pivot_denominator = denominators[row]
+        for i in targets:
+            numerators = rows[i]
+            factor = numerators[col]
+            if not factor:
+                continue
+            self.operations.append(
+                ('add', i, -backend.from_ratio(factor, denominators[i]), row))
+
+            # A pivot denominator of 1 leaves the other entries unchanged, so
+            # only those that meet a nonzero entry of the pivot row change.
+            if pivot_denominator == 1:
+                rows[i] = [entry - factor * pivot_entry if pivot_entry
+                           else entry
+                           for entry, pivot_entry in zip(numerators,
+                                                         pivot_row)]
+            else:
+                rows[i] = [entry * pivot_denominator - factor * pivot_entry
+                           for entry, pivot_entry in zip(numerators,
+                                                         pivot_row)]
+                denominators[i] *= pivot_denominator
+            self.normalize(rows, denominators, i)
+            self.track(rows, i)
+
+    def eliminate(self, rows: list, row: int, col: int, targets):
+        """
+        Eliminates the entries in column col of the rows in targets by
+        subtracting the appropriate amount of row, whose leading entry is a 1
+        in column col, and records each operation.
+        :param rows: The rows being eliminated.
+        :param row: The pivot row.
+        :param col: The pivot column.
+        :param targets: The rows to be eliminated.
+        """
+        if self.common_denominator:
+            self.eliminate_integer_rows(rows, row, col, targets)
+            return
+
+        pivot_tail = rows[row][col:]
+        for i in targets:
+            factor = rows[i][col]
+            if not factor:
+                continue
+            tail = [entry - factor * pivot_entry
+                    for entry, pivot_entry in zip(rows[i][col:], pivot_tail)]
+            rows[i][col:] = tail
+            self.operations.append(('add', i, -factor, row))
+            self.track(rows, i)
+
+    def reduce(self):
+        """
+        Eliminates all entries above the leading entries, completing the
+        reduced row echelon form. Does nothing if this has already been done.
+        """
+        if self.reduced:
+            return
+
+        rows = self.echelon_rows
+        for row in range(self.rank - 1, 0, -1):
+            # Rows already eliminated are skipped if this is resumed after
+            # stopping at a checkpoint, since their entries are 0.
+            checkpoint('reduce', self.rank - row, self.rank - 1,
+                       row * (self.cols - self.pivot_cols[row]))
+            self.eliminate(rows, row, self.pivot_cols[row], range(row))
+
+        # Rows held with a common denominator are converted back into
+        # rationals of the backend now that they are final.
+        if self.common_denominator:
+            from_ratio = self.backend.from_ratio
+            self.echelon_rows = [
+                [from_ratio(numerator, denominator) for numerator in row]
+                for row, denominator in zip(rows, self.denominators)]
+            self.denominators = None
+        self.reduced = True
+
+    def statistics(self) -> dict:
+        """
+        Returns figures describing the elimination, for comparing pivoting
+        strategies on a workload.
+        :return: A dict with the keys 'pivoting', 'common_denominator',
+        'rank', 'swaps', 'operations', 'reduced' (whether the entries above
+        the pivots have been eliminated yet) and 'peak_bit_length' (None
+        unless the bit length was tracked).
+        """
+        return {'pivoting': self.pivoting,
+                'common_denominator': self.common_denominator,
+                'rank': self.rank,
+                'swaps': sum(1 for operation in self.operations
+                             if operation[0] == 'swap'),
+                'operations': len(self.operations), 'reduced': self.reduced,
+                'peak_bit_length': self.peak_bit_length}
+
+    @property
+    def reduced_echelon_form(self) -> Matrix:
+        """
+        The reduced row echelon form of the factorized Matrix, as a Matrix.
+        """
+        if not self.reduced_echelon_form_found:
+            self.reduce()
+            self.reduced_echelon_form_matrix = Matrix.from_storage(
+                Storage.from_flat(
+                    self.rows, self.cols,
+                    [entry for row in self.echelon_rows for entry in row]),
+                False, self.backend)
+            self.reduced_echelon_form_found = True
+        return self.reduced_echelon_form_matrix
+
+    def apply(self, rows: list) -> list:
+        """
+        Performs the recorded row operations on rows, a list of row lists with
+        one row for every row of the factorized Matrix. The lists are changed
+        in place.
+        :param rows: The rows to be changed.
+        :return: rows.
+        """
+        total = len(self.operations)
+        width = len(rows[0]) if rows else 0
+        for index, operation in enumerate(self.operations):
+            # Checks the active Budget once for every self.rows operations,
+            # each of which changes at most one row.
+            if not index % self.rows:
+                checkpoint('apply', index + 1, total, self.rows * width)
+            kind = operation[0]
+            if kind == 'add':
+                _, target, factor, source = operation
+                source_row = rows[source]
+                rows[target] = [entry + factor * source_entry
+                                for entry, source_entry
+                                in zip(rows[target], source_row)]
+            elif kind == 'multiply':
+                _, target, factor = operation
+                rows[target] = [entry * factor for entry in rows[target]]
+            else:
+                _, first, second = operation
+                rows[first], rows[second] = rows[second], rows[first]
+        return rows
+
+    def apply_common_denominator(self, rows: list, denominators: list):
+        """
+        Does the same as apply() on rows held as ints with a common
+        denominator, so that every recorded operation becomes a run of int
+        multiplications and one gcd per row. Both lists are changed in place.
+        :param rows: The numerators of the rows.
+        :param denominators: The denominators of the rows.
+        """
+        normalize = self.normalize
+        total = len(self.operations)
+        width = len(rows[0]) if rows else 0
+        for index, operation in enumerate(self.operations):
+            if not index % self.rows:
+                checkpoint('apply', index + 1, total, self.rows * width)
+            kind = operation[0]
+            if kind == 'add':
+                # Adding p / q times a source row with denominator e to a row
+                # with denominator d gives the numerators
+                # q * e * (row) + p * d * (source) over q * d * e.
+                _, target, factor, source = operation
+                numerator, denominator = to_ratio(factor)
+                target_scale = denominator * denominators[source]
+                source_scale = numerator * denominators[target]
+                rows[target] = [entry * target_scale
+                                + source_entry * source_scale
+                                if source_entry else entry * target_scale
+                                for entry, source_entry
+                                in zip(rows[target], rows[source])]
+                denominators[target] *= target_scale
+                normalize(rows, denominators, target)
+            elif kind == 'multiply':
+                _, target, factor = operation
+                numerator, denominator = to_ratio(factor)
+                rows[target] = [entry * numerator for entry in rows[target]]
+                denominators[target] *= denominator
+                normalize(rows, denominators, target)
+            else:
+                _, first, second = operation
+                rows[first], rows[second] = rows[second], rows[first]
+                denominators[first], denominators[second] = \
+                    denominators[second], denominators[first]
+
+    def find_inverse(self):
+        """
+        Returns the inverse of the factorized Matrix, found by performing the
+        recorded row operations on the identity matrix. If the Matrix has no
+        inverse, returns None.
+        :return: The inverse as a Matrix, or None.
+        """
+
+        if self.inverse_found:
+            return self.inverse
+
+        # Only a square matrix with a pivot in every row has an inverse.
+        if self.rows != self.cols or self.rank < self.rows:
+            self.inverse_found = True
+            return None
+
+        self.reduce()
+        if self.common_denominator:
+            rows = [[1 if i == j else 0 for j in range(self.rows)]
+                    for i in range(self.rows)]
+            denominators = [1] * self.rows
+            self.apply_common_denominator(rows, denominators)
+            from_ratio = self.backend.from_ratio
+            rows = [[from_ratio(numerator, denominator) for numerator in row]
+                    for row, denominator in zip(rows, denominators)]
+        else:
+            zero = self.backend.zero
+            one = self.backend.one
+            identity = [[one if i == j else zero for j in range(self.rows)]
+                        for i in range(self.rows)]
+            rows = self.apply(identity)
+
+        inverse = Matrix.from_storage(
+            Storage.from_flat(self.rows, self.cols,
+                              [entry for row in rows for entry in row]),
+            False, self.backend)
+
+        self.inverse = inverse
+        self.inverse_found = True
+        return inverse
+
+    def find_solution(self, constants):
+        """
+        Finds the solution of the linear system whose coefficients are the
+        factorized Matrix and whose right-hand side is constants. The solution
+        is None if there is no solution, and otherwise has the format described
+        in Matrix.find_solution().
+        :param constants: The right-hand side, either a list with one entry
+        per row or a Matrix with one column.
+        :return: The solution as a list, or None.
+        """
+
+        # Ensures that there is one constant for every row.
+        if isinstance(constants, Matrix):
+            if constants.cols != 1:
+                raise ValueError
+            constants = list(constants._flat())
+        if len(constants) != self.rows:
+            raise ValueError
+
+        self.reduce()
+        constants = list(map(self.backend.convert, constants))
+        constants = [row[0] for row in self.apply([[entry]
+                                                   for entry in constants])]
+
+        # A row of zeros with a nonzero constant means there is no solution.
+        for constant in constants[self.rank:]:
+            if constant:
+                return None
+
+        return build_solution(self.reduced_echelon_form._rows(),
+                              self.pivot_cols, self.cols, constants,
+                              self.backend)
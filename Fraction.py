@@ -1,4 +1,12 @@
 from __future__ import annotations
+import math
+from functools import lru_cache
+from operator import mul
+
+
+# The number of (value, n) pairs whose integer nth roots are remembered by
+# integer_root().
+ROOT_CACHE_SIZE = 4096
 
 
 def gcd(first: int, second: int) -> int:
@@ -8,11 +16,127 @@ def gcd(first: int, second: int) -> int:
     :param second: The second number.
     :return:
     """
-    while first:    #Euclid's algorithm
-        if first < second:
-            first, second = second, first
-        first %= second
-    return second
+    # math.gcd runs Euclid's algorithm in C, and uses Lehmer's algorithm for
+    # large ints.
+    return math.gcd(first, second)
+
+
+@lru_cache(maxsize=ROOT_CACHE_SIZE)
+def integer_root(value: int, n: int) -> tuple:
+    """
+    Returns the integer nth root of value, the largest int whose nth power is
+    at most value (or, for a negative value and odd n, the negative of the
+    root of -value), and whether it is exact, that is whether value is a
+    perfect nth power. Found with Newton's method on ints, so it is exact for
+    ints of any size. Results are cached, since the same bases tend to be
+    raised to the same rational powers again and again.
+    :param value: The int.
+    :param n: The positive degree of the root.
+    :return: The root and True if root ** n == value, False otherwise.
+    """
+
+    # Ensures that n is a positive int and that the root is real.
+    if not isinstance(value, int) or not isinstance(n, int):
+        raise TypeError
+    if n <= 0 or value < 0 and not n % 2:
+        raise ValueError
+
+    if value < 0:
+        root, exact = integer_root(-value, n)
+        return -root, exact
+    if value < 2 or n == 1:
+        return value, True
+
+    if n == 2:
+        root = math.isqrt(value)
+    else:
+        # Starts from a power of two above the root, from which Newton's
+        # method decreases steadily to the floor of the root.
+        root = 1 << -(-value.bit_length() // n)
+        while True:
+            next_root = ((n - 1) * root + value // root ** (n - 1)) // n
+            if next_root >= root:
+                break
+            root = next_root
+    return root, root ** n == value
+
+
+def best_approximation(numerator: int, denominator: int,
+                       max_denominator: int) -> tuple:
+    """
+    Returns the rational closest to numerator / denominator whose denominator
+    is at most max_denominator, found from the continued fraction of the
+    value. The answer is the last convergent within the bound or the best
+    semiconvergent after it, whichever is closer.
+    :param numerator: The numerator of the value.
+    :param denominator: The positive denominator of the value.
+    :param max_denominator: The largest denominator allowed, at least 1.
+    :return: The numerator and denominator of the approximation, reduced.
+    """
+
+    # Ensures that the bound is a positive int.
+    if not isinstance(max_denominator, int):
+        raise TypeError
+    if max_denominator < 1:
+        raise ValueError
+
+    if denominator <= max_denominator:
+        return numerator, denominator
+
+    # Each step takes one term of the continued fraction of the value and
+    # finds the next convergent p1 / q1 from the two before it.
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    n, d = numerator, denominator
+    while True:
+        term = n // d
+        q2 = q0 + term * q1
+        if q2 > max_denominator:
+            break
+        p0, q0, p1, q1 = p1, q1, p0 + term * p1, q2
+        n, d = d, n - term * d
+
+    # The semiconvergent with the largest denominator within the bound.
+    k = (max_denominator - q0) // q1
+    p2, q2 = p0 + k * p1, q0 + k * q1
+
+    # Compares |p / q - value| for both candidates without division.
+    if abs(p1 * denominator - numerator * q1) * q2 \
+            <= abs(p2 * denominator - numerator * q2) * q1:
+        return p1, q1
+    return p2, q2
+
+
+def add_ratio(numerator: int, denominator: int, other_numerator: int,
+              other_denominator: int) -> tuple:
+    """
+    Returns numerator / denominator + other_numerator / other_denominator as
+    a numerator over the least common multiple of the two denominators,
+    without reducing it.
+    :return: The numerator and denominator of the sum.
+    """
+    if other_denominator == denominator:
+        return numerator + other_numerator, denominator
+    divisor = math.gcd(denominator, other_denominator)
+    scale = other_denominator // divisor
+    return (numerator * scale + other_numerator * (denominator // divisor),
+            denominator * scale)
+
+
+def tree_product(values: list) -> int:
+    """
+    Returns the product of a list of ints, multiplying neighbours in pairs
+    until one is left, so that large ints are multiplied by ints of a
+    similar size rather than one small int at a time.
+    :param values: The ints.
+    :return: The product, 1 if values is empty.
+    """
+    while len(values) > 1:
+        paired = [values[i] * values[i + 1]
+                  for i in range(0, len(values) - 1, 2)]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+    return values[0] if values else 1
 
 
 class Fraction:
@@ -77,18 +201,121 @@ class Fraction:
         be negative and the denominator positive.
         """
 
+        # Integer division keeps the result exact. Dividing through a float
+        # would round numerators and denominators larger than 2 ** 53, which
+        # integer matrices promoted to Fractions can easily reach.
         divisor = gcd(abs(self.numerator), abs(self.denominator))
-        self.numerator /= divisor
-        self.denominator /= divisor
-
-        self.numerator = int(self.numerator)
-        self.denominator = int(self.denominator)
+        self.numerator //= divisor
+        self.denominator //= divisor
 
         # Ensures the numerator carries the sign of the Fraction.
         if self.denominator < 0:
             self.denominator *= -1
             self.numerator *= -1
 
+    def limit_denominator(self, max_denominator: int) -> Fraction:
+        """
+        Returns the Fraction closest to self whose denominator is at most
+        max_denominator. See best_approximation().
+        :param max_denominator: The largest denominator allowed.
+        :return: The approximation, which is self if it is already within the
+        bound.
+        """
+        if self.denominator <= max_denominator:
+            return self
+        return Fraction(*best_approximation(self.numerator, self.denominator,
+                                            max_denominator))
+
+    @staticmethod
+    def sum(values):
+        """
+        Returns the sum of ints and Fractions, like the builtin sum(), but
+        adds raw numerators over a running least common multiple of the
+        denominators and reduces only once, at the end, rather than creating
+        and reducing a Fraction for every term.
+        :param values: An iterable of ints and Fractions.
+        :return: The sum, a Fraction if any term is one and an int otherwise.
+        """
+        numerator, denominator = 0, 1
+        rational = False
+        for value in values:
+            if isinstance(value, int):
+                numerator += value * denominator
+                continue
+            if not isinstance(value, Fraction):
+                raise TypeError
+            rational = True
+            numerator, denominator = add_ratio(
+                numerator, denominator, value.numerator, value.denominator)
+        if not rational:
+            return numerator
+        return Fraction(numerator, denominator)
+
+    @staticmethod
+    def prod(values):
+        """
+        Returns the product of ints and Fractions. The numerators and the
+        denominators are each multiplied with tree_product(), and the result
+        is reduced once.
+        :param values: An iterable of ints and Fractions.
+        :return: The product, a Fraction if any factor is one and an int
+        otherwise.
+        """
+        numerators = []
+        denominators = []
+        for value in values:
+            if isinstance(value, int):
+                numerators.append(value)
+            elif isinstance(value, Fraction):
+                numerators.append(value.numerator)
+                denominators.append(value.denominator)
+            else:
+                raise TypeError
+        numerator = tree_product(numerators)
+        if not denominators:
+            return numerator
+        return Fraction(numerator, tree_product(denominators))
+
+    @staticmethod
+    def dot(first, second):
+        """
+        Returns the dot product of two sequences of ints and Fractions, each
+        product being kept as a raw numerator and denominator and added as in
+        Fraction.sum(), so that only the result is reduced. Sequences holding
+        anything else, such as floats, are multiplied and added as they are.
+        :param first: The first sequence.
+        :param second: The second sequence, of the same length.
+        :return: The dot product, a Fraction if any entry is one.
+        """
+        numerator, denominator = 0, 1
+        rational = False
+        for left, right in zip(first, second):
+            if isinstance(left, int):
+                if isinstance(right, int):
+                    numerator += left * right * denominator
+                    continue
+                if not isinstance(right, Fraction):
+                    return sum(map(mul, first, second))
+                product, product_denominator = \
+                    left * right.numerator, right.denominator
+            elif not isinstance(left, Fraction):
+                return sum(map(mul, first, second))
+            elif isinstance(right, int):
+                product, product_denominator = \
+                    left.numerator * right, left.denominator
+            elif isinstance(right, Fraction):
+                product = left.numerator * right.numerator
+                product_denominator = left.denominator * right.denominator
+            else:
+                return sum(map(mul, first, second))
+            rational = True
+            if product:
+                numerator, denominator = add_ratio(
+                    numerator, denominator, product, product_denominator)
+        if not rational:
+            return numerator
+        return Fraction(numerator, denominator)
+
     @classmethod
     def input_fraction(cls) -> Fraction:
         """
@@ -231,9 +458,10 @@ class Fraction:
         if isinstance(other, int):
             return Fraction(self.numerator * other, self.denominator)
 
-        # Ensures that other is a valid type.
+        # Leaves other types to their own __rmul__, so that a Fraction can
+        # multiply a Matrix. Python raises a TypeError if that fails too.
         if not isinstance(other, Fraction):
-            raise TypeError
+            return NotImplemented
 
         numerator = self.numerator * other.numerator
         denominator = self.denominator * other.denominator
@@ -278,35 +506,82 @@ class Fraction:
     def __pow__(self, power) -> Fraction:
         """
         Takes the powerth power of self. Power can be either an int or a
-        Fraction. Overloads the ** operator.
+        Fraction. The result is exact: with a Fraction p/q, the qth roots of
+        the numerator and denominator are found with integer_root() and
+        raised to the power p. Overloads the ** operator; see power() for a
+        float result when the root is irrational.
+        :param power: The power to which self is being raised.
+        :return: The result as a Fraction.
+        """
+        return self.power(power)
+
+    def power(self, power, allow_float: bool = False):
+        """
+        Takes the powerth power of self, power being an int or a Fraction
+        p/q. Since self is reduced, self ** (p/q) is rational only if both
+        its numerator and its denominator are perfect qth powers.
         :param power: The power to which self is being raised.
-        :return: The result. May be either a Fraction or an int.
+        :param allow_float: What to do when the result is irrational: if
+        False, a ValueError is raised, and if True, the result is returned as
+        a float. Optional parameter, defaults to False.
+        :return: The result as a Fraction, or as a float if it is irrational
+        and allow_float is True, which is an infinity if it is beyond the
+        range of floats.
         """
 
         numerator = self.numerator
         denominator = self.denominator
 
-        # Special case if power is an int.
+        # A Fraction with a denominator of 1 is an int power.
+        if isinstance(power, Fraction) and power.denominator == 1:
+            power = power.numerator
+
+        # Special case if power is an int. Python raises ints to int powers
+        # by repeated squaring.
         if isinstance(power, int):
-            if power > 0:
+            if power >= 0:
                 return Fraction(numerator ** power, denominator ** power)
-            elif power == 0:
-                return Fraction(1, 1)
-            return Fraction(denominator ** power, numerator ** power)
+
+            # Ensures that 0 is not raised to a negative power.
+            if not numerator:
+                raise ValueError
+            return Fraction(denominator ** -power, numerator ** -power)
 
         # Ensures power is a valid type.
         if not isinstance(power, Fraction):
             raise TypeError
 
-        numerator **= (1 / float(power.denominator))
-        denominator **= (1 / float(power.denominator))
+        # Ensures that 0 is not raised to a negative power, and that an even
+        # root is only taken of a nonnegative Fraction.
+        if power.numerator < 0 and not numerator:
+            raise ValueError
+        if numerator < 0 and not power.denominator % 2:
+            raise ValueError
 
-        numerator **= power.numerator
-        denominator **= power.numerator
+        numerator_root, numerator_exact = integer_root(numerator,
+                                                       power.denominator)
+        denominator_root, denominator_exact = integer_root(denominator,
+                                                           power.denominator)
+
+        if numerator_exact and denominator_exact:
+            return Fraction(numerator_root, denominator_root) \
+                ** power.numerator
+        if not allow_float:
+            raise ValueError
 
-        if power.numerator < 0:
-            return Fraction(int(denominator), int(numerator))
-        return Fraction(int(numerator), int(denominator))
+        # Logarithms of ints are exact to float precision at any size, so
+        # the numerator and denominator never overflow a float on their own.
+        # A result too large for a float is returned as an infinity, and one
+        # too small as 0.0.
+        exponent = power.numerator / power.denominator
+        try:
+            result = math.exp(exponent * (math.log(abs(numerator))
+                                          - math.log(denominator)))
+        except OverflowError:
+            result = math.inf
+        if numerator < 0 and power.numerator % 2:
+            return -result
+        return result
 
     def __rpow__(self, other):
         """
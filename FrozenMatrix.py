@@ -0,0 +1,145 @@
+from __future__ import annotations
+from array import array
+from MatrixMath.Matrix import Matrix
+from MatrixMath.Backend import to_ratio
+
+
+def entry_key(entry):
+    """
+    Returns the value hashed for an entry: ints and floats as they are, and
+    rationals as an int if they are whole numbers or as a (numerator,
+    denominator) tuple otherwise, so that equal entries of any type and
+    backend give the same key.
+    :param entry: The entry.
+    :return: The key.
+    """
+    if isinstance(entry, (int, float)):
+        return entry
+    numerator, denominator = to_ratio(entry)
+    return numerator if denominator == 1 else (numerator, denominator)
+
+
+class FrozenMatrix(Matrix):
+    """
+    An immutable Matrix, which can be used as a dict key or stored in a set.
+    Its entries are copied from the Matrix it is made from and can never
+    change, so its hash is computed from them once, on first use, and kept.
+    Two FrozenMatrices whose dimensions or hashes differ are unequal without
+    comparing any entries. Every result found by its methods, such as the
+    determinant or inverse, stays valid for as long as it exists.
+    """
+    def __init__(self, matrix: Matrix):
+        """
+        Creates a FrozenMatrix holding the entries of matrix. Usually created
+        through Matrix.freeze() rather than directly.
+        :param matrix: The Matrix, or MatrixView, to be frozen.
+        """
+
+        # Ensures that matrix is a Matrix.
+        if not isinstance(matrix, Matrix):
+            raise TypeError
+
+        # Another FrozenMatrix can never change, so its entries are shared.
+        if not isinstance(matrix, FrozenMatrix):
+            matrix = matrix.materialize()
+
+        self.rows = matrix.rows
+        self.cols = matrix.cols
+        self.integer = matrix.integer
+        self.backend = matrix.backend
+        self.max_denominator = matrix.max_denominator
+        self.rounding_error = matrix.rounding_error
+        self._storage = matrix._storage
+
+        # Calculated by __hash__() the first time it is needed.
+        self.hash_found = False
+        self.hash = None
+
+    @property
+    def matrix(self):
+        """
+        The entries of self as a tuple of row tuples. Provided so that code
+        reading self.matrix[i][j] keeps working; there is no setter.
+        :return: The entries of self.
+        """
+        return tuple(tuple(row) for row in self._rows())
+
+    def freeze(self) -> FrozenMatrix:
+        """
+        Returns self, which is already frozen.
+        :return: self.
+        """
+        return self
+
+    def __hash__(self):
+        """
+        Returns the hash of the dimensions and entries of self, computed once.
+        Equal FrozenMatrices have equal hashes whatever the backend or domain
+        of their entries.
+        :return: The hash.
+        """
+        if not self.hash_found:
+            buffer = self._flat()
+            if isinstance(buffer, array):
+                entries = tuple(buffer)
+            else:
+                entries = tuple(map(entry_key, buffer))
+            self.hash = hash((self.rows, self.cols, entries))
+            self.hash_found = True
+        return self.hash
+
+    def __eq__(self, other: Matrix):
+        """
+        Checks to see if two Matrices are the same. A FrozenMatrix compared
+        with another FrozenMatrix of different dimensions or hash is unequal
+        without comparing any entries. Overloads the == operator.
+        :param other: The Matrix being compared to self.
+        :return: True if the matrices are the same, False otherwise.
+        """
+        if other is self:
+            return True
+        if isinstance(other, FrozenMatrix) \
+                and (self.rows != other.rows or self.cols != other.cols
+                     or hash(self) != hash(other)):
+            return False
+        return Matrix.__eq__(self, other)
+
+    def add_scaled(self, other: Matrix, factor=1):
+        """
+        A FrozenMatrix cannot change, so adding to one in place always raises
+        a TypeError.
+        """
+        raise TypeError
+
+    def __iadd__(self, other):
+        """
+        A FrozenMatrix cannot change, so += gives a new Matrix, as it does
+        for immutable types.
+        """
+        return NotImplemented
+
+    def __isub__(self, other):
+        """
+        A FrozenMatrix cannot change, so -= gives a new Matrix.
+        """
+        return NotImplemented
+
+    def __imul__(self, other):
+        """
+        A FrozenMatrix cannot change, so *= gives a new Matrix.
+        """
+        return NotImplemented
+
+    def store_value(self, value, row: int, col: int):
+        """
+        A FrozenMatrix cannot change, so storing a value always raises a
+        TypeError.
+        """
+        raise TypeError
+
+    def input_matrix(self):
+        """
+        A FrozenMatrix cannot change, so inputting entries always raises a
+        TypeError.
+        """
+        raise TypeError
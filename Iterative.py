@@ -0,0 +1,335 @@
+from __future__ import annotations
+from math import sqrt
+from operator import mul
+from MatrixMath.Matrix import Matrix
+from MatrixMath.SparseMatrix import SparseMatrix, float_value
+
+
+# The names of the methods accepted by solve_iterative().
+METHODS = ('jacobi', 'gauss_seidel', 'conjugate_gradient', 'bicgstab')
+
+
+class IterativeResult:
+    """
+    The result of an iterative solver: the approximate solution, whether it
+    met the tolerance, the number of iterations taken and the norm of the
+    residual b - Ax after each of them.
+    """
+    def __init__(self, method: str, solution: list, converged: bool,
+                 history: list):
+        """
+        Creates the result.
+        :param method: The name of the method used.
+        :param solution: The approximate solution, one float per unknown.
+        :param converged: Whether or not the relative residual met the
+        tolerance.
+        :param history: The norm of the residual before the first iteration
+        and after each iteration.
+        """
+        self.method = method
+        self.solution = solution
+        self.converged = converged
+        self.history = history
+        self.iterations = len(history) - 1
+
+    def __repr__(self):
+        """
+        Defines the representation of the result.
+        :return: The representation of self.
+        """
+        return '<IterativeResult {} converged={} iterations={} ' \
+               'residual={}>'.format(self.method, self.converged,
+                                     self.iterations, self.history[-1])
+
+
+def dot(first: list, second: list) -> float:
+    """
+    Returns the dot product of two vectors.
+    """
+    return sum(map(mul, first, second))
+
+
+def norm(vector: list) -> float:
+    """
+    Returns the Euclidean norm of a vector.
+    """
+    return sqrt(dot(vector, vector))
+
+
+def residual(matrix: SparseMatrix, solution: list, constants: list) -> list:
+    """
+    Returns the residual b - Ax of a solution.
+    """
+    return [constant - product for constant, product
+            in zip(constants, matrix.matvec(solution))]
+
+
+def inverse_diagonal(matrix: SparseMatrix) -> list:
+    """
+    Returns the reciprocals of the diagonal entries of a square matrix, used
+    by the Jacobi and Gauss-Seidel methods and by the diagonal
+    preconditioner. Raises ValueError if an entry on the diagonal is 0.
+    """
+    diagonal = matrix.diagonal()
+    if not all(diagonal):
+        raise ValueError
+    return [1.0 / entry for entry in diagonal]
+
+
+def jacobi(matrix: SparseMatrix, constants: list, solution: list,
+           tolerance: float, max_iterations: int) -> tuple:
+    """
+    The Jacobi method: every unknown is updated at once from the previous
+    solution, x <- x + D^-1 (b - Ax), D being the diagonal. Converges for
+    strictly diagonally dominant matrices. Each iteration takes one product
+    with the matrix.
+    :return: The solution, whether it converged and the residual history.
+    """
+    inverse = inverse_diagonal(matrix)
+    limit = tolerance * norm(constants)
+    r = residual(matrix, solution, constants)
+    history = [norm(r)]
+    while history[-1] > limit and len(history) <= max_iterations:
+        solution = [entry + scale * remainder for entry, scale, remainder
+                    in zip(solution, inverse, r)]
+        r = residual(matrix, solution, constants)
+        history.append(norm(r))
+    return solution, history[-1] <= limit, history
+
+
+def gauss_seidel(matrix: SparseMatrix, constants: list, solution: list,
+                 tolerance: float, max_iterations: int,
+                 relaxation: float = 1.0) -> tuple:
+    """
+    The Gauss-Seidel method, or successive over-relaxation (SOR) when
+    relaxation is not 1: the unknowns are updated one at a time, each using
+    the values already updated in the same sweep, and each update is scaled
+    by relaxation. Converges for strictly diagonally dominant and for
+    symmetric positive definite matrices when 0 < relaxation < 2. Each
+    iteration takes one sweep and one product with the matrix.
+    :return: The solution, whether it converged and the residual history.
+    """
+
+    # Ensures that the relaxation factor is one for which SOR can converge.
+    if not 0 < relaxation < 2:
+        raise ValueError
+
+    inverse = inverse_diagonal(matrix)
+    diagonal = matrix.diagonal()
+    limit = tolerance * norm(constants)
+    indptr = matrix.indptr
+    indices = matrix.indices
+    values = matrix.values
+    solution = list(solution)
+    entry = solution.__getitem__
+    history = [norm(residual(matrix, solution, constants))]
+    while history[-1] > limit and len(history) <= max_iterations:
+        for row in range(matrix.rows):
+            start, end = indptr[row], indptr[row + 1]
+
+            # The product of the row and the current solution, without the
+            # term of the diagonal.
+            total = sum(map(mul, values[start:end],
+                            map(entry, indices[start:end])))
+            total -= solution[row] * diagonal[row]
+            update = (constants[row] - total) * inverse[row]
+            solution[row] += relaxation * (update - solution[row])
+        history.append(norm(residual(matrix, solution, constants)))
+    return solution, history[-1] <= limit, history
+
+
+def conjugate_gradient(matrix: SparseMatrix, constants: list, solution: list,
+                       tolerance: float, max_iterations: int,
+                       preconditioner: list = None) -> tuple:
+    """
+    The conjugate gradient method, for symmetric positive definite matrices.
+    Each step minimizes the error over a direction conjugate to all the
+    previous ones, so in exact arithmetic it finishes within n steps. With a
+    preconditioner, the residual is scaled by it before choosing each
+    direction. Each iteration takes one product with the matrix.
+    :return: The solution, whether it converged and the residual history.
+    """
+    limit = tolerance * norm(constants)
+    r = residual(matrix, solution, constants)
+    history = [norm(r)]
+    z = r if preconditioner is None else list(map(mul, preconditioner, r))
+    direction = list(z)
+    rz = dot(r, z)
+
+    while history[-1] > limit and len(history) <= max_iterations:
+        product = matrix.matvec(direction)
+        curvature = dot(direction, product)
+
+        # A direction without curvature means the matrix is not positive
+        # definite, so no further progress can be made.
+        if not curvature:
+            break
+        alpha = rz / curvature
+        solution = [entry + alpha * step
+                    for entry, step in zip(solution, direction)]
+        r = [entry - alpha * step for entry, step in zip(r, product)]
+        history.append(norm(r))
+
+        z = r if preconditioner is None \
+            else list(map(mul, preconditioner, r))
+        rz_next = dot(r, z)
+        beta = rz_next / rz if rz else 0.0
+        rz = rz_next
+        direction = [entry + beta * step
+                     for entry, step in zip(z, direction)]
+    return solution, history[-1] <= limit, history
+
+
+def bicgstab(matrix: SparseMatrix, constants: list, solution: list,
+             tolerance: float, max_iterations: int,
+             preconditioner: list = None) -> tuple:
+    """
+    The stabilized biconjugate gradient method (BiCGSTAB), for general
+    nonsymmetric matrices. Each iteration is a biconjugate gradient step
+    followed by a one-dimensional minimization of the residual, which smooths
+    the convergence of the plain biconjugate gradient method. The
+    preconditioner is applied on the right. Each iteration takes two products
+    with the matrix.
+    :return: The solution, whether it converged and the residual history.
+    """
+
+    def precondition(vector):
+        if preconditioner is None:
+            return vector
+        return list(map(mul, preconditioner, vector))
+
+    limit = tolerance * norm(constants)
+    r = residual(matrix, solution, constants)
+    history = [norm(r)]
+    shadow = list(r)
+    rho = alpha = omega = 1.0
+    size = len(solution)
+    v = [0.0] * size
+    p = [0.0] * size
+
+    while history[-1] > limit and len(history) <= max_iterations:
+        rho_next = dot(shadow, r)
+
+        # The method breaks down if the residual becomes orthogonal to the
+        # shadow residual, or if the last minimization made no progress.
+        if not rho_next or not omega:
+            break
+        beta = (rho_next / rho) * (alpha / omega)
+        rho = rho_next
+        p = [entry + beta * (previous - omega * step)
+             for entry, previous, step in zip(r, p, v)]
+        p_hat = precondition(p)
+        v = matrix.matvec(p_hat)
+        denominator = dot(shadow, v)
+        if not denominator:
+            break
+        alpha = rho / denominator
+        s = [entry - alpha * step for entry, step in zip(r, v)]
+
+        # Stops halfway if the biconjugate gradient step was enough.
+        if norm(s) <= limit:
+            solution = [entry + alpha * step
+                        for entry, step in zip(solution, p_hat)]
+            r = s
+            history.append(norm(r))
+            break
+
+        s_hat = precondition(s)
+        t = matrix.matvec(s_hat)
+        tt = dot(t, t)
+        omega = dot(t, s) / tt if tt else 0.0
+        solution = [entry + alpha * first + omega * second
+                    for entry, first, second in zip(solution, p_hat, s_hat)]
+        r = [entry - omega * step for entry, step in zip(s, t)]
+        history.append(norm(r))
+    return solution, history[-1] <= limit, history
+
+
+def solve_iterative(matrix, constants, method: str = 'conjugate_gradient',
+                    tolerance: float = 1e-10, max_iterations: int = 1000,
+                    initial=None, diagonal_preconditioner: bool = False,
+                    relaxation: float = 1.0) -> IterativeResult:
+    """
+    Solves the linear system whose coefficients are matrix and whose
+    right-hand side is constants with an iterative method, working in floats.
+    A Matrix is converted to a SparseMatrix first, so that every iteration
+    takes time proportional to the number of nonzero entries. The methods
+    are:
+
+    'jacobi': the Jacobi method, for diagonally dominant matrices.
+    'gauss_seidel': Gauss-Seidel, or SOR if relaxation is not 1, for
+    diagonally dominant or symmetric positive definite matrices.
+    'conjugate_gradient': conjugate gradient, for symmetric positive definite
+    matrices.
+    'bicgstab': BiCGSTAB, for general square matrices.
+
+    :param matrix: The n x n coefficients, a Matrix or a SparseMatrix.
+    :param constants: The right-hand side, a sequence of n numbers or a
+    Matrix with one column.
+    :param method: The name of the method. Optional parameter, defaults to
+    'conjugate_gradient'.
+    :param tolerance: The solver stops once the norm of the residual b - Ax
+    is at most tolerance times the norm of b. Optional parameter, defaults
+    to 1e-10.
+    :param max_iterations: The largest number of iterations. Optional
+    parameter, defaults to 1000.
+    :param initial: The first guess at the solution, a sequence of n numbers.
+    Optional parameter, defaults to zeros.
+    :param diagonal_preconditioner: Whether or not conjugate gradient and
+    BiCGSTAB are preconditioned with the inverse of the diagonal. Jacobi and
+    Gauss-Seidel already divide by the diagonal. Optional parameter,
+    defaults to False.
+    :param relaxation: The relaxation factor of Gauss-Seidel, strictly
+    between 0 and 2. Optional parameter, defaults to 1.
+    :return: The IterativeResult.
+    """
+
+    # Ensures that the method exists and the options are of valid types.
+    if not isinstance(method, str) or not isinstance(max_iterations, int) \
+            or not isinstance(diagonal_preconditioner, bool):
+        raise TypeError
+    if method not in METHODS:
+        raise ValueError
+    tolerance = float_value(tolerance)
+    relaxation = float_value(relaxation)
+    if tolerance < 0 or max_iterations < 0:
+        raise ValueError
+
+    if isinstance(matrix, Matrix):
+        matrix = SparseMatrix.from_matrix(matrix)
+    if not isinstance(matrix, SparseMatrix):
+        raise TypeError
+
+    # Ensures that the system is square and has one constant for every row.
+    if isinstance(constants, Matrix):
+        if constants.cols != 1:
+            raise ValueError
+        constants = constants._flat()
+    constants = [float_value(constant) for constant in constants]
+    if matrix.rows != matrix.cols or len(constants) != matrix.rows:
+        raise ValueError
+
+    if initial is None:
+        solution = [0.0] * matrix.cols
+    else:
+        solution = [float_value(entry) for entry in initial]
+        if len(solution) != matrix.cols:
+            raise ValueError
+
+    preconditioner = inverse_diagonal(matrix) if diagonal_preconditioner \
+        else None
+
+    if method == 'jacobi':
+        outcome = jacobi(matrix, constants, solution, tolerance,
+                         max_iterations)
+    elif method == 'gauss_seidel':
+        outcome = gauss_seidel(matrix, constants, solution, tolerance,
+                               max_iterations, relaxation)
+    elif method == 'conjugate_gradient':
+        outcome = conjugate_gradient(matrix, constants, solution, tolerance,
+                                     max_iterations, preconditioner)
+    else:
+        outcome = bicgstab(matrix, constants, solution, tolerance,
+                           max_iterations, preconditioner)
+
+    return IterativeResult(method, *outcome)
@@ -1,14 +1,237 @@
 from __future__ import annotations
+from array import array
+from operator import add, mul, sub
 from MatrixMath import Fraction
+from MatrixMath.Fraction import best_approximation
+from MatrixMath.Storage import Storage, RowsAccessor, flat_buffer
+from MatrixMath.Cache import MISSING, result_cache
+from MatrixMath.Backend import get_backend, is_rational, to_ratio
+from MatrixMath.Precheck import modular_precheck
+from MatrixMath.Budget import checkpoint, run_async
+
+
+# Matrix.__pow__ uses the Cayley-Hamilton theorem for powers larger than this
+# many times the number of rows.
+CAYLEY_HAMILTON_CUTOFF = 64
+
+
+def integer_entry(value) -> int:
+    """
+    Returns value, an int or a rational with a denominator of 1, as an int so
+    that it can be stored in an integer Matrix.
+    :param value: The int or rational of any backend.
+    :return: value as an int.
+    """
+
+    if is_rational(value):
+        numerator, denominator = to_ratio(value)
+
+        # Only whole numbers can be stored in the integer domain.
+        if denominator != 1:
+            raise ValueError
+        return numerator
+    return value
+
+
+def checked_entry(value, integer: bool, backend):
+    """
+    Returns value as it is stored in a Matrix: as an int in the integer
+    domain, and as a rational of backend otherwise.
+    :param value: The int or rational of any backend.
+    :param integer: Whether or not the Matrix is in the integer domain.
+    :param backend: The backend of the Matrix.
+    :return: The entry.
+    """
+
+    # Ensures that value is an int or a rational. Floats and other types are
+    # rejected here rather than failing later inside an elimination.
+    if not isinstance(value, int) and not is_rational(value):
+        raise TypeError
+    if integer:
+        return integer_entry(value)
+    return backend.convert(value)
+
+
+def scalar_entry(value, backend):
+    """
+    Returns a scalar that multiplies a Matrix: an int if value is a whole
+    number, and a rational of backend otherwise. Floats are converted exactly
+    through their integer ratio, so 0.1 becomes 3602879701896397 /
+    36028797018963968 rather than 1/10.
+    :param value: The int, float or rational of any backend.
+    :param backend: The backend of the Matrix.
+    :return: The int or rational.
+    """
+
+    # Ensures that value is a valid type.
+    if isinstance(value, float):
+        # Infinite and NaN floats have no integer ratio.
+        try:
+            numerator, denominator = value.as_integer_ratio()
+        except (OverflowError, ValueError):
+            raise ValueError
+    elif is_rational(value):
+        numerator, denominator = to_ratio(value)
+    elif isinstance(value, int):
+        return value
+    else:
+        raise TypeError
+
+    if denominator == 1:
+        return numerator
+    return backend.from_ratio(numerator, denominator)
+
+
+def magnitude(value) -> float:
+    """
+    Returns the absolute value of an int, a float or a rational of any
+    backend as a float.
+    """
+    if is_rational(value):
+        numerator, denominator = to_ratio(value)
+        return abs(numerator) / denominator
+    return float(abs(value))
+
+
+def snap_entries(values, max_denominator: int, backend) -> tuple:
+    """
+    Returns values with every rational whose denominator is larger than
+    max_denominator replaced by its best approximation within the bound (see
+    Fraction.best_approximation()), along with the largest change made.
+    Ints and floats are kept as they are.
+    :param values: The entries of a Matrix.
+    :param max_denominator: The largest denominator allowed.
+    :param backend: The backend of the approximations.
+    :return: The new entries as a list, or values itself if none changed,
+    and the largest change as a float.
+    """
+    snapped = None
+    change = 0
+    for index, entry in enumerate(values):
+        if not is_rational(entry):
+            continue
+        numerator, denominator = to_ratio(entry)
+        if denominator <= max_denominator:
+            continue
+        if snapped is None:
+            snapped = list(values)
+        p, q = best_approximation(numerator, denominator, max_denominator)
+        snapped[index] = backend.from_ratio(p, q)
+        change = max(change,
+                     abs(p * denominator - numerator * q) / (q * denominator))
+    return (values if snapped is None else snapped), float(change)
+
+
+def common_bound(*matrices):
+    """
+    Returns the bound on denominators of a result found from matrices: the
+    smallest max_denominator among those in the bounded rational mode, or
+    None if none of them is.
+    :param matrices: The operands, any of which may be None.
+    :return: The bound, or None.
+    """
+    bounds = [matrix.max_denominator for matrix in matrices
+              if matrix is not None and matrix.max_denominator is not None]
+    return min(bounds) if bounds else None
+
+
+def is_scalar(value) -> bool:
+    """
+    Returns True if value can multiply a Matrix as a scalar: an int, a float
+    or a rational of any backend.
+    """
+    return isinstance(value, (int, float)) or is_rational(value)
+
+
+# The names of the results stored on a Matrix by its methods, which are
+# cleared by Matrix.init_cache().
+CACHED_RESULTS = ('determinant_found', 'determinant', 'factorization_found',
+                  'factorization', 'inverse_found', 'inverse',
+                  'reduced_echelon_form_found', 'reduced_echelon_form',
+                  'solution_found', 'solution', 'transpose_found',
+                  'transpose', 'cofactor_matrix_found', 'cofactor_matrix',
+                  'adjoint_matrix_found', 'adjoint_matrix',
+                  'characteristic_polynomial_found',
+                  'characteristic_polynomial', 'minimal_polynomial_found',
+                  'minimal_polynomial')
 
 
 class Matrix:
-    def __init__(self, rows, cols):
+    # The results below are found by methods of the class and stored on the
+    # Matrix the first time they are needed. Until then these class
+    # attributes are read instead, so that creating a Matrix sets none of
+    # them.
+
+    # Calculated by the find_determinant() method. If it exists, it is
+    # stored as a Fraction.
+    determinant_found = False
+    determinant = None
+
+    # Calculated by the factorize() method, and used by most of the methods
+    # below. Stored as a Factorization.
+    factorization_found = False
+    factorization = None
+
+    # Calculated by the find_inverse() method. Once found, it is stored as
+    # a Matrix.
+    inverse_found = False
+    inverse = None
+
+    # Calculated by the gaussian_elimination() method. Stored as a Matrix.
+    reduced_echelon_form_found = False
+    reduced_echelon_form = None
+
+    # Calculated by the find_solution() method. If a solution exists, it
+    # will be stored as a list (see documentation for find_solution for
+    # more details). If no solution exists, remains None.
+    solution_found = False
+    solution = None
+
+    # Calculated by the find_transpose() method. Stored as a Matrix.
+    transpose_found = False
+    transpose = None
+
+    # Calculated by the find_cofactor_matrix method. Stored as a Matrix.
+    cofactor_matrix_found = False
+    cofactor_matrix = None
+
+    # Calculated by the find_adjoint_matrix method. Stored as a Matrix.
+    adjoint_matrix_found = False
+    adjoint_matrix = None
+
+    # Calculated by the find_characteristic_polynomial method. Stored as
+    # a list of coefficients, lowest degree first.
+    characteristic_polynomial_found = False
+    characteristic_polynomial = None
+
+    # Calculated by the find_minimal_polynomial method. Stored as a list
+    # of coefficients, lowest degree first.
+    minimal_polynomial_found = False
+    minimal_polynomial = None
+
+    # The bounded rational mode, set by bounded(). While max_denominator is
+    # an int, the results of +, -, * and ** are snapped to rationals with
+    # denominators no larger than it, and rounding_error bounds how far every
+    # entry may be from its exact value.
+    max_denominator = None
+    rounding_error = 0.0
+
+    def __init__(self, rows, cols, integer: bool = False, backend=None):
         """
         Creates a Matrix of dimensions rows x cols with all entries initialized
         to 0.
         :param rows: The number of rows in the matrix.
         :param cols: The number of cols in the matrix.
+        :param integer: Whether or not the Matrix is in the integer domain. The
+        entries of an integer Matrix are kept as ints instead of being promoted
+        to Fractions, and are only converted to Fractions by operations that
+        need division, such as find_inverse() and find_solution(). Optional
+        parameter, defaults to False.
+        :param backend: The ScalarBackend, or the name of one, that provides
+        the type of the rational entries of the Matrix: 'builtin' for the
+        Fraction class of this package, 'stdlib' for fractions.Fraction or
+        'gmpy2' for gmpy2.mpq. Optional parameter, defaults to the backend set
+        by Backend.set_default_backend(), which is 'builtin' unless changed.
         """
 
         # Ensures that rows and cols are both ints.
@@ -21,45 +244,171 @@ class Matrix:
 
         self.rows = rows
         self.cols = cols
-        self.matrix = [[0] * cols for i in range(rows)]
-
-        # The following values default to None, but are calculated as a result
-        # of certain methods in the class. These can be accessed by calling the
-        # functions detailed in each variable's comment.
-
-        # Calculated by the find_determinant() method. If it exists, it is
-        # stored as a Fraction.
-        self.determinant_found = False
-        self.determinant = None
-
-        # Calculated by the find_inverse() method. Once found, it is stored as
-        # a Matrix.
-        self.inverse_found = False
-        self.inverse = None
-
-        # Calculated by the gaussian_elimination() method unless
-        # stop_early_no_solution is True and the Matrix has no solution. If it
-        # is found, it is stored as a Matrix.
-        self.reduced_echelon_form_found = False
-        self.reduced_echelon_form = None
-
-        # Calculated by the find_solution() method. If a solution exists, it
-        # will be stored as a list (see documentation for find_solution for
-        # more details). If no solution exists, remains None.
-        self.solution_found = False
-        self.solution = None
-
-        # Calculated by the find_transpose() method. Stored as a Matrix.
-        self.transpose_found = False
-        self.transpose = None
-
-        # Calculated by the find_cofactor_matrix method. Stored as a Matrix.
-        self.cofactor_matrix_found = False
-        self.cofactor_matrix = None
-
-        # Calculated by the find_adjoint_matrix method. Stored as a Matrix.
-        self.adjoint_matrix_found = False
-        self.adjoint_matrix = None
+        self.integer = integer
+        self.backend = get_backend(backend)
+        self._storage = Storage.zeros(rows, cols)
+
+    def init_cache(self):
+        """
+        Sets every stored result of self back to its default, not yet
+        calculated state. The defaults are attributes of the class, and a
+        result is only stored on self once it is found, so a new Matrix
+        allocates nothing for its results, and clearing them removes what
+        was stored.
+        """
+        stored = self.__dict__
+        for name in CACHED_RESULTS:
+            stored.pop(name, None)
+
+    @staticmethod
+    def from_storage(storage: Storage, integer: bool = False,
+                     backend=None) -> Matrix:
+        """
+        Returns a Matrix around an existing Storage, which is adopted rather
+        than copied. Unlike Matrix(), no zero-filled buffer is created only
+        to be replaced, so methods creating a new result use this. The
+        entries are not checked, so they must already be ints in the integer
+        domain and ints or rationals of backend otherwise.
+        :param storage: The Storage of the entries.
+        :param integer: Whether or not the Matrix is in the integer domain.
+        Optional parameter, defaults to False.
+        :param backend: The ScalarBackend, or the name of one. Optional
+        parameter, defaults to the default backend.
+        :return: The Matrix.
+        """
+        result = Matrix.__new__(Matrix)
+        result.rows = storage.rows
+        result.cols = storage.cols
+        result.integer = integer
+        result.backend = get_backend(backend)
+        result._storage = storage
+        return result
+
+    @staticmethod
+    def from_flat(rows: int, cols: int, values, integer: bool = False,
+                  backend=None, copy: bool = True) -> Matrix:
+        """
+        Returns a Matrix holding values, given in row-major order, in a
+        single pass. Every entry is checked and converted as by
+        store_value().
+        :param rows: The number of rows.
+        :param cols: The number of columns.
+        :param values: An iterable of rows * cols ints or rationals of any
+        backend.
+        :param integer: Whether or not the Matrix is in the integer domain.
+        Optional parameter, defaults to False.
+        :param backend: The ScalarBackend, or the name of one. Optional
+        parameter, defaults to the default backend.
+        :param copy: Whether or not an integer Matrix gets its own copy of
+        values when it is an array('q'). If False, the array is adopted as
+        the buffer of the Matrix, and must not be changed afterwards. Any
+        other values are always copied. Optional parameter, defaults to
+        True.
+        :return: The Matrix.
+        """
+
+        # Ensures that rows and cols are both positive ints.
+        if not isinstance(rows, int) or not isinstance(cols, int):
+            raise TypeError
+        if rows <= 0 or cols <= 0:
+            raise ValueError
+
+        # The entries of an array('q') are already ints, so only a Matrix
+        # outside the integer domain needs them converted.
+        backend = get_backend(backend)
+        if isinstance(values, array) and values.typecode == 'q' \
+                and integer:
+            buffer = values[:] if copy else values
+        else:
+            buffer = flat_buffer([checked_entry(value, integer, backend)
+                                  for value in values])
+
+        # Ensures that there is one value for every entry.
+        if len(buffer) != rows * cols:
+            raise ValueError
+        return Matrix.from_storage(Storage(rows, cols, buffer), integer,
+                                   backend)
+
+    @staticmethod
+    def from_rows(rows, integer: bool = False, backend=None) -> Matrix:
+        """
+        Returns a Matrix holding the entries of a list of row sequences,
+        which are checked and copied into a flat buffer in a single pass.
+        :param rows: The rows of ints or rationals of any backend. All rows
+        must have the same length.
+        :param integer: Whether or not the Matrix is in the integer domain.
+        Optional parameter, defaults to False.
+        :param backend: The ScalarBackend, or the name of one. Optional
+        parameter, defaults to the default backend.
+        :return: The Matrix.
+        """
+        rows = list(rows)
+        cols = len(rows[0]) if rows else 0
+
+        # Ensures that every row has the same length.
+        if any(len(row) != cols for row in rows):
+            raise ValueError
+        return Matrix.from_flat(len(rows), cols,
+                                [entry for row in rows for entry in row],
+                                integer, backend, False)
+
+    @staticmethod
+    def zeros(rows: int, cols: int, integer: bool = False,
+              backend=None) -> Matrix:
+        """
+        Returns a Matrix of dimensions rows x cols with every entry 0. The
+        same as Matrix(rows, cols, integer, backend).
+        :param rows: The number of rows.
+        :param cols: The number of columns.
+        :param integer: Whether or not the Matrix is in the integer domain.
+        Optional parameter, defaults to False.
+        :param backend: The ScalarBackend, or the name of one. Optional
+        parameter, defaults to the default backend.
+        :return: The Matrix.
+        """
+        return Matrix(rows, cols, integer, backend)
+
+    @staticmethod
+    def identity(size: int, integer: bool = False, backend=None) -> Matrix:
+        """
+        Returns the size x size identity Matrix, whose buffer is filled with
+        0s and then has every entry of its diagonal set to 1 in one slice
+        assignment.
+        :param size: The number of rows and columns.
+        :param integer: Whether or not the Matrix is in the integer domain.
+        Optional parameter, defaults to False.
+        :param backend: The ScalarBackend, or the name of one. Optional
+        parameter, defaults to the default backend.
+        :return: The Matrix.
+        """
+        if not isinstance(size, int):
+            raise TypeError
+        if size <= 0:
+            raise ValueError
+        buffer = array('q', bytes(8 * size * size))
+        buffer[::size + 1] = array('q', [1]) * size
+        return Matrix.from_storage(Storage(size, size, buffer), integer,
+                                   backend)
+
+    @property
+    def matrix(self):
+        """
+        The entries of self, indexed as self.matrix[row][col] with both
+        counting from 0. Entries are kept in a flat Storage rather than a list
+        of rows; this accessor reads and writes that Storage, so existing code
+        indexing self.matrix keeps working. Methods of the class use the
+        Storage directly.
+        :return: A RowsAccessor for the entries of self.
+        """
+        return RowsAccessor(self._storage)
+
+    @matrix.setter
+    def matrix(self, rows):
+        """
+        Replaces the entries of self with those of a list of row lists.
+        :param rows: The new rows.
+        """
+        self._storage = Storage.from_rows(rows)
 
     def __bool__(self):
         """
@@ -67,10 +416,9 @@ class Matrix:
         all entries are 0, True otherwise.
         :return: False if all entries are 0, True otherwise.
         """
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if self.matrix[row][col]:
-                    return False
+        for entry in self._flat():
+            if entry:
+                return False
         return True
 
     def __str__(self):
@@ -79,10 +427,11 @@ class Matrix:
         :return: The string representation of self.
         """
 
+        rows = self._rows()
         string = '['
         for i in range(self.rows):
             for j in range(self.cols):
-                string += '{:^10}'.format(str(self.matrix[i][j]))
+                string += '{:^10}'.format(str(rows[i][j]))
             if i == self.rows - 1:
                 string += ']'
             string += '\n\n '
@@ -95,30 +444,309 @@ class Matrix:
         :return: The copy of self.
         """
 
-        result = Matrix(self.rows, self.cols)
-        result.matrix = [i[:] for i in self.matrix]
+        result = Matrix.from_storage(self._storage.copy(), self.integer,
+                                     self.backend)
+        if self.max_denominator is not None or self.rounding_error:
+            result.max_denominator = self.max_denominator
+            result.rounding_error = self.rounding_error
         return result
 
+    def to_rational(self) -> Matrix:
+        """
+        Returns a copy of self outside the integer domain, with every entry
+        converted to a rational of the backend of self.
+        :return: The rational copy of self.
+        """
+
+        return Matrix.from_storage(
+            Storage.from_flat(self.rows, self.cols,
+                              list(map(self.backend.convert, self._flat()))),
+            False, self.backend)
+
+    def to_integer(self) -> Matrix:
+        """
+        Returns a copy of self in the integer domain. Every entry of self must
+        be an int or a rational with a denominator of 1.
+        :return: The integer copy of self.
+        """
+
+        return Matrix.from_storage(
+            Storage.from_flat(self.rows, self.cols,
+                              [integer_entry(entry)
+                               for entry in self._flat()]),
+            True, self.backend)
+
+    def materialize(self) -> Matrix:
+        """
+        Returns a Matrix holding its own copy of the entries of self. Provided
+        so that code accepting either a Matrix or a MatrixView can always ask
+        for an independent copy.
+        :return: The copy of self.
+        """
+        return self.copy_matrix()
+
+    def _flat(self):
+        """
+        Returns the entries of self in row-major order as a list or array,
+        which must be treated as read-only, as it may be the storage of self.
+        :return: The entries of self.
+        """
+        return self._storage.buffer
+
+    def _rows(self) -> list:
+        """
+        Returns the rows of self as a list of row sequences, which must be
+        treated as read-only.
+        :return: The rows of self.
+        """
+        return self._storage.rows_list()
+
+    def _row(self, row: int) -> list:
+        """
+        Returns the row of self with index row (counting from 0) as a
+        sequence, which must be treated as read-only.
+        :param row: The index of the row.
+        :return: The row.
+        """
+        return self._storage.row(row)
+
+    def _columns(self) -> list:
+        """
+        Returns the columns of self as a list of sequences, which must be
+        treated as read-only.
+        :return: The columns of self.
+        """
+        return self._storage.columns_list()
+
+    def _transposed_storage(self) -> Storage:
+        """
+        Returns a new Storage holding the transpose of self.
+        :return: The Storage.
+        """
+        return self._storage.transposed()
+
+    def freeze(self):
+        """
+        Returns an immutable copy of self, a FrozenMatrix, which is hashable
+        and can be used as a dict key. Its hash is computed once, and
+        FrozenMatrices with different hashes compare unequal without looking
+        at their entries.
+        :return: The FrozenMatrix.
+        """
+        from MatrixMath.FrozenMatrix import FrozenMatrix
+        return FrozenMatrix(self)
+
+    def to_modular(self, modulus: int):
+        """
+        Returns the entries of self modulo modulus as a ModularMatrix, whose
+        products, powers and, for a prime modulus, eliminations work on
+        machine-sized residues.
+        :param modulus: The modulus, an int from 2 to 2 ** 62. The
+        denominators of rational entries must be prime to it.
+        :return: The ModularMatrix.
+        """
+        from MatrixMath.ModularMatrix import ModularMatrix
+        return ModularMatrix.from_matrix(self, modulus)
+
+    def view(self, row_slice: slice = slice(None),
+             col_slice: slice = slice(None)):
+        """
+        Returns a read-only MatrixView of the submatrix of self selected by
+        row_slice and col_slice. Both are ordinary Python slices, so they count
+        from 0. No entries are copied and later changes to self are visible
+        through the view.
+        :param row_slice: The slice of rows to be kept.
+        :param col_slice: The slice of columns to be kept.
+        :return: The MatrixView.
+        """
+        from MatrixMath.MatrixView import MatrixView
+
+        return MatrixView(self, range(self.rows), range(self.cols)) \
+            .view(row_slice, col_slice)
+
+    def row_view(self, row: int):
+        """
+        Returns a read-only 1 x cols MatrixView of a row of self.
+        :param row: The row to be viewed.
+        :return: The MatrixView.
+        """
+
+        # Ensures that row is a valid row of self.
+        if not isinstance(row, int):
+            raise TypeError
+        if not 0 < row <= self.rows:
+            raise ValueError
+
+        return self.view(slice(row - 1, row))
+
+    def col_view(self, col: int):
+        """
+        Returns a read-only rows x 1 MatrixView of a column of self.
+        :param col: The column to be viewed.
+        :return: The MatrixView.
+        """
+
+        # Ensures that col is a valid column of self.
+        if not isinstance(col, int):
+            raise TypeError
+        if not 0 < col <= self.cols:
+            raise ValueError
+
+        return self.view(slice(None), slice(col - 1, col))
+
+    def minor_view(self, row: int, col: int):
+        """
+        Returns a read-only MatrixView of self with one row and one column
+        skipped, as used to compute the minor of an entry.
+        :param row: The row to be skipped.
+        :param col: The column to be skipped.
+        :return: The MatrixView.
+        """
+        from MatrixMath.MatrixView import MatrixView
+
+        return MatrixView(self, range(self.rows), range(self.cols)) \
+            .minor_view(row, col)
+
+    def transpose_view(self):
+        """
+        Returns a read-only MatrixView of the transpose of self. Unlike
+        find_transpose(), no entries are copied.
+        :return: The MatrixView.
+        """
+        from MatrixMath.MatrixView import MatrixView
+
+        return MatrixView(self, range(self.rows), range(self.cols), True)
+
+    def convert(self, backend) -> Matrix:
+        """
+        Returns a copy of self using another backend, with every rational
+        entry converted to the type of that backend. Int entries are kept as
+        they are.
+        :param backend: The ScalarBackend, or the name of one.
+        :return: The converted copy of self.
+        """
+
+        backend = get_backend(backend)
+        if self.integer:
+            storage = self._storage.copy()
+        else:
+            storage = Storage.from_flat(
+                self.rows, self.cols,
+                [entry if isinstance(entry, int) else backend.convert(entry)
+                 for entry in self._flat()])
+        return Matrix.from_storage(storage, self.integer, backend)
+
+    def matching_backend(self, other: Matrix) -> Matrix:
+        """
+        Returns other converted to the backend of self if its rational entries
+        are of a different type, so that they can be combined with those of
+        self. Otherwise returns other itself.
+        :param other: The Matrix to be combined with self.
+        :return: other, converted if needed.
+        """
+        if other.backend is self.backend or other.integer:
+            return other
+        return other.convert(self.backend)
+
+    def bounded(self, max_denominator: int = None) -> Matrix:
+        """
+        Returns a copy of self in the bounded rational mode: every rational
+        entry is replaced by the closest rational with a denominator of at
+        most max_denominator, and so is every entry of the results of +, -,
+        * and ** on it, so their cost per operation stops growing. The
+        rounding_error of each result bounds how far any of its entries may
+        be from the exact result, counting both the snapping and the errors
+        carried in from its operands. Methods that eliminate, such as
+        find_determinant() and find_inverse(), stay exact on the entries as
+        stored.
+        :param max_denominator: The largest denominator allowed, a positive
+        int. Optional parameter, defaults to None, which returns an exact
+        copy that keeps the rounding_error of self.
+        :return: The new Matrix.
+        """
+        if max_denominator is not None:
+            if not isinstance(max_denominator, int):
+                raise TypeError
+            if max_denominator < 1:
+                raise ValueError
+        result = self.copy_matrix()
+        result.max_denominator = None
+        return result.snap(max_denominator, self.rounding_error)
+
+    def snap(self, max_denominator: int, error: float) -> Matrix:
+        """
+        NOTE: This method is used internally by other methods. Use bounded()
+        instead.
+
+        Puts self, a new result, in the bounded rational mode with
+        max_denominator, snapping its entries in place, and sets its
+        rounding_error to error plus the largest change made. Does nothing
+        but set the error if max_denominator is None.
+        :param max_denominator: The largest denominator allowed, or None.
+        :param error: The error carried in from the operands.
+        :return: self.
+        """
+        change = 0.0
+        if max_denominator is not None and not self.integer:
+            values, change = snap_entries(self._flat(), max_denominator,
+                                          self.backend)
+            if change:
+                self._storage.replace(values)
+                self.init_cache()
+        self.max_denominator = max_denominator
+        self.rounding_error = error + change
+        return self
+
+    def bounded_result(self, result: Matrix, error: float,
+                       other: Matrix = None) -> Matrix:
+        """
+        NOTE: This method is used internally by other methods.
+
+        Returns result, found from self and other, in the bounded rational
+        mode of its operands if either is in it. The smaller bound is used if
+        both are.
+        :param result: The new Matrix.
+        :param error: The error carried into result from the operands.
+        :param other: The second operand, if any. Optional parameter,
+        defaults to None.
+        :return: result.
+        """
+        bound = common_bound(self, other)
+        if bound is None and not error:
+            return result
+        return result.snap(bound, error)
+
+    def largest_magnitude(self) -> float:
+        """
+        Returns the largest absolute value of an entry of self, as a float.
+        :return: The largest absolute value.
+        """
+        return max(map(magnitude, self._flat()))
+
     def add_to_entry(self, other, row: int, col: int) -> Matrix:
         """
-        Adds other, which must be either an int or a Fraction, to
+        Adds other, which must be either an int or a rational, to
         self.matrix[row][col].
-        :param other: The int or Fraction to be added to an entry in self.
+        :param other: The int or rational to be added to an entry in self.
         :param row: The row of the entry to be added to.
         :param col: the column of the entry to be added to.
         :return: The Matrix with the changed entry.
         """
 
         # Ensures that other is a valid type.
-        if not isinstance(other, int) and not isinstance(other, Fraction):
+        if not isinstance(other, int) and not is_rational(other):
             raise TypeError
 
-        # Special case if other is an int.
-        if isinstance(other, int):
-            other = Fraction(other, 1)
+        # Converts other to the backend of self. Ints are kept as they are in
+        # the integer domain, where other must also be a whole number.
+        if self.integer:
+            other = integer_entry(other)
+        else:
+            other = self.backend.convert(other)
 
         result = self.copy_matrix()
-        result.matrix[row - 1][col - 1] += other
+        result._storage.set(row - 1, col - 1,
+                            result._storage.get(row - 1, col - 1) + other)
         return result
 
     def __add__(self, other: Matrix) -> Matrix:
@@ -137,43 +765,248 @@ class Matrix:
         if self.rows != other.rows or self.cols != other.cols:
             raise ValueError
 
-        result = Matrix(self.rows, self.cols)
-
-        for i in range(self.rows):
-            for j in range(self.cols):
-                result.matrix[i][j] = self.matrix[i][j] + other.matrix[i][j]
-        return result
+        # The sum stays in the integer domain only if both Matrices are in it.
+        other = self.matching_backend(other)
+        result = Matrix.from_storage(
+            Storage.from_flat(self.rows, self.cols,
+                              list(map(add, self._flat(), other._flat()))),
+            self.integer and other.integer, self.backend)
+        return self.bounded_result(
+            result, self.rounding_error + other.rounding_error, other)
 
     def __mul__(self, other) -> Matrix:
         """
-        Multiplies two Matrices. or a matrix and an int. If two Matrices,
-        self.cols must be equal to other.rows. Overrides the * operator.
-        :param other: The Matrix to be multiplied with self.
+        Multiplies two Matrices, or a Matrix and a scalar: an int, a float or
+        a rational of any backend. If two Matrices, self.cols must be equal to
+        other.rows. Overrides the * operator.
+        :param other: The Matrix or scalar to be multiplied with self.
         :return: The product of self and other.
         """
 
-        # Special case if other is an int.
-        if isinstance(other, int):
-            result = Matrix(self.rows, self.cols)
-            for i in range(self.rows):
-                for j in range(self.cols):
-                    result.matrix[i][j] = self.matrix[i][j] * other
-            return result
+        # Special case if other is a scalar. Multiplying by a rational that is
+        # not a whole number leaves the integer domain.
+        if is_scalar(other):
+            factor = scalar_entry(other, self.backend)
+            result = Matrix.from_storage(
+                Storage.from_flat(self.rows, self.cols,
+                                  [entry * factor for entry in self._flat()]),
+                self.integer and isinstance(factor, int), self.backend)
+            return self.bounded_result(
+                result, magnitude(factor) * self.rounding_error)
 
         # Ensures that the two Matrices are possible to multiply.
+        if not isinstance(other, Matrix):
+            raise TypeError
         if self.cols != other.rows:
             raise ValueError
 
-        result = Matrix(self.rows, other.cols)
+        other = self.matching_backend(other)
+
+        # Each entry is the dot product of a row of self and a column of
+        # other. The columns of other are gathered once rather than indexed
+        # entry by entry. Rational dot products go through the backend, which
+        # can add the products without reducing each partial sum.
+        columns = other._columns()
+        integer = self.integer and other.integer
+        if integer:
+            values = [sum(map(mul, row, column))
+                      for row in self._rows() for column in columns]
+        else:
+            dot = self.backend.dot
+            values = [dot(row, column)
+                      for row in self._rows() for column in columns]
+        result = Matrix.from_storage(
+            Storage.from_flat(self.rows, other.cols, values), integer,
+            self.backend)
+
+        # An entry of the product is a sum of self.cols products, each of
+        # which is off by at most |a| * e + |b| * f + e * f when a and b are
+        # off by at most e and f.
+        error = 0.0
+        if self.rounding_error or other.rounding_error:
+            error = self.cols * (
+                self.largest_magnitude() * other.rounding_error
+                + other.largest_magnitude() * self.rounding_error
+                + self.rounding_error * other.rounding_error)
+        return self.bounded_result(result, error, other)
+
+    def multiply(self, other, verify: bool = False) -> Matrix:
+        """
+        Returns self * other, a Matrix or a scalar, checking a product of
+        Matrices with verify_product() if verify is True.
+        :param other: The Matrix or scalar self is multiplied by.
+        :param verify: Whether or not the product is checked. Optional
+        parameter, defaults to False.
+        :return: The product.
+        """
+        product = self * other
+        if verify and isinstance(other, Matrix):
+            Matrix.verify_product(self, other, product)
+        return product
+
+    @staticmethod
+    def verify_product(first: Matrix, second: Matrix, product: Matrix,
+                       trials: int = 2, modular: bool = False) -> bool:
+        """
+        Checks that product is first * second with Freivalds' algorithm, in
+        O(n ** 2) operations per trial (see Verification.verify_product()).
+        :param first: The left Matrix.
+        :param second: The right Matrix.
+        :param product: The Matrix being checked.
+        :param trials: The number of random vectors. Optional parameter,
+        defaults to 2.
+        :param modular: Whether or not the trials work modulo random primes.
+        Optional parameter, defaults to False.
+        :return: True. Raises ArithmeticError if product is wrong.
+        """
+        from MatrixMath.Verification import verify_product
+        return verify_product(first, second, product, trials, modular)
 
-        for row in range(self.rows):
-            for col in range(other.cols):
-                result.matrix[row][col] = 0
-                for i in range(self.cols):
-                    result.matrix[row][col] += \
-                        self.matrix[row][i] * other.matrix[i][col]
+    @staticmethod
+    def verify_inverse(matrix: Matrix, inverse: Matrix, trials: int = 2,
+                       modular: bool = False) -> bool:
+        """
+        Checks that inverse is the inverse of matrix with Freivalds'
+        algorithm (see Verification.verify_inverse()).
+        :param matrix: The n x n Matrix.
+        :param inverse: The n x n Matrix being checked.
+        :param trials: The number of random vectors. Optional parameter,
+        defaults to 2.
+        :param modular: Whether or not the trials work modulo random primes.
+        Optional parameter, defaults to False.
+        :return: True. Raises ArithmeticError if inverse is wrong.
+        """
+        from MatrixMath.Verification import verify_inverse
+        return verify_inverse(matrix, inverse, trials, modular)
 
-        return result
+    @staticmethod
+    def verify_solution(matrix: Matrix, solution: list, constants=None,
+                        trials: int = 2, modular: bool = False) -> bool:
+        """
+        Checks a solution in the format returned by find_solution() with
+        Freivalds' algorithm (see Verification.verify_solution()).
+        :param matrix: The coefficients, followed by a column of constants if
+        constants is None.
+        :param solution: The solution list, which must not be None.
+        :param constants: The right-hand side, as in solve(). Optional
+        parameter, defaults to None, for the last column of matrix.
+        :param trials: The number of random vectors. Optional parameter,
+        defaults to 2.
+        :param modular: Whether or not the trials work modulo random primes.
+        Optional parameter, defaults to False.
+        :return: True. Raises ArithmeticError if solution is wrong.
+        """
+        from MatrixMath.Verification import verify_solution
+        return verify_solution(matrix, solution, constants, trials, modular)
+
+    def __neg__(self) -> Matrix:
+        """
+        Returns self with every entry negated. Overrides the unary - operator.
+        :return: The negated Matrix.
+        """
+        return self * -1
+
+    def __sub__(self, other: Matrix) -> Matrix:
+        """
+        Subtracts other from self. Dimensions of Matrices must be the same.
+        Overrides the binary - operator.
+        :param other: The Matrix to be subtracted from self.
+        :return: The difference of the two Matrices.
+        """
+
+        # Ensures that other is a Matrix with the same dimensions as self.
+        if not isinstance(other, Matrix):
+            raise TypeError
+        if self.rows != other.rows or self.cols != other.cols:
+            raise ValueError
+
+        other = self.matching_backend(other)
+        result = Matrix.from_storage(
+            Storage.from_flat(self.rows, self.cols,
+                              list(map(sub, self._flat(), other._flat()))),
+            self.integer and other.integer, self.backend)
+        return self.bounded_result(
+            result, self.rounding_error + other.rounding_error, other)
+
+    def add_scaled(self, other: Matrix, factor=1) -> Matrix:
+        """
+        Adds factor times other to self in place, in a single pass over the
+        entries, without creating the Matrix factor * other or a new Matrix
+        for the sum. The buffer of self is reused, and the stored results of
+        self are cleared, since its entries change.
+        :param other: The Matrix to be added, with the same dimensions as
+        self.
+        :param factor: The int, float or rational other is multiplied by.
+        Optional parameter, defaults to 1.
+        :return: self.
+        """
+
+        # Ensures that other is a Matrix with the same dimensions as self.
+        if not isinstance(other, Matrix):
+            raise TypeError
+        if self.rows != other.rows or self.cols != other.cols:
+            raise ValueError
+
+        factor = scalar_entry(factor, self.backend)
+        other = self.matching_backend(other)
+        if factor == 1:
+            values = list(map(add, self._flat(), other._flat()))
+        elif factor == -1:
+            values = list(map(sub, self._flat(), other._flat()))
+        else:
+            values = [entry + factor * other_entry for entry, other_entry
+                      in zip(self._flat(), other._flat())]
+
+        self._storage.replace(values)
+        self.integer = self.integer and other.integer \
+            and isinstance(factor, int)
+        self.init_cache()
+        return self.snap(common_bound(self, other),
+                         self.rounding_error
+                         + magnitude(factor) * other.rounding_error)
+
+    def __iadd__(self, other: Matrix) -> Matrix:
+        """
+        Adds other to self in place, reusing the buffer of self. Overrides
+        the += operator.
+        :param other: The Matrix to be added to self.
+        :return: self.
+        """
+        return self.add_scaled(other)
+
+    def __isub__(self, other: Matrix) -> Matrix:
+        """
+        Subtracts other from self in place, reusing the buffer of self.
+        Overrides the -= operator.
+        :param other: The Matrix to be subtracted from self.
+        :return: self.
+        """
+        return self.add_scaled(other, -1)
+
+    def __imul__(self, other) -> Matrix:
+        """
+        Multiplies self by a scalar in place, reusing the buffer of self, or
+        replaces self by its product with a Matrix, whose entries cannot be
+        found in place. Overrides the *= operator.
+        :param other: The Matrix or scalar self is multiplied by.
+        :return: self.
+        """
+        if is_scalar(other):
+            factor = scalar_entry(other, self.backend)
+            self._storage.replace([entry * factor
+                                   for entry in self._flat()])
+            self.integer = self.integer and isinstance(factor, int)
+            self.init_cache()
+            return self.snap(self.max_denominator,
+                             magnitude(factor) * self.rounding_error)
+        product = self * other
+        self.cols = product.cols
+        self._storage = product._storage
+        self.integer = product.integer
+        self.max_denominator = product.max_denominator
+        self.rounding_error = product.rounding_error
+        self.init_cache()
+        return self
 
     def __rmul__(self, other):
         """
@@ -182,6 +1015,82 @@ class Matrix:
         """
         return self.__mul__(other)
 
+    def matvec(self, vector):
+        """
+        Returns the product of self and a Vector treated as a column, as a
+        Vector. Unlike multiplying by an n x 1 Matrix, no Matrix is created
+        for the result.
+        :param vector: The Vector, with one entry per column of self.
+        :return: The product, with one entry per row of self.
+        """
+        from MatrixMath.Vector import matvec
+        return matvec(self, vector)
+
+    def vecmat(self, vector):
+        """
+        Returns the product of a Vector treated as a row and self, as a
+        Vector.
+        :param vector: The Vector, with one entry per row of self.
+        :return: The product, with one entry per column of self.
+        """
+        from MatrixMath.Vector import vecmat
+        return vecmat(vector, self)
+
+    def __truediv__(self, other) -> Matrix:
+        """
+        Divides self entry by entry by a scalar or by a Matrix of the same
+        dimensions. Overrides the / operator. See divide().
+        :param other: The scalar or Matrix self is divided by.
+        :return: The quotient.
+        """
+        return self.divide(other)
+
+    def map(self, function) -> Matrix:
+        """
+        Returns a Matrix holding function applied to every entry of self. A
+        NumPy ufunc is applied to a buffer of machine-sized ints in a single
+        call. The result stays in the integer domain if self is in it and
+        every result is an int.
+        :param function: A callable taking and returning one entry.
+        :return: The new Matrix.
+        """
+        from MatrixMath.Elementwise import map_entries
+        return map_entries(self, function)
+
+    def hadamard(self, other: Matrix) -> Matrix:
+        """
+        Returns the Hadamard product of self and other, the Matrix of the
+        products of their entries in the same positions. Dimensions of the
+        Matrices must be the same.
+        :param other: The Matrix multiplied with self.
+        :return: The Hadamard product.
+        """
+        from MatrixMath.Elementwise import hadamard
+        return hadamard(self, other)
+
+    def divide(self, other) -> Matrix:
+        """
+        Returns the Matrix of the entries of self divided by other, a scalar,
+        or by the entries in the same positions of other, a Matrix of the
+        same dimensions. The quotients are exact rationals unless a float is
+        involved.
+        :param other: The scalar or Matrix, with no entry that is 0.
+        :return: The quotient, outside the integer domain.
+        """
+        from MatrixMath.Elementwise import divide
+        return divide(self, other)
+
+    def kronecker(self, other: Matrix) -> Matrix:
+        """
+        Returns the Kronecker product of self and other, the block Matrix
+        whose block at row i and column j is self[i][j] * other.
+        :param other: The Matrix, of any dimensions.
+        :return: The Kronecker product, of dimensions
+        (self.rows * other.rows) x (self.cols * other.cols).
+        """
+        from MatrixMath.Elementwise import kronecker
+        return kronecker(self, other)
+
     def __pow__(self, power: int) -> Matrix:
         """
         Raises a Matrix to the power of an integer. For a matrix to be raised
@@ -199,26 +1108,50 @@ class Matrix:
         # rows as columns.
         if self.rows != self.cols:
             raise ValueError
-        result = Matrix(self.rows, self.cols)
 
         # A matrix raised to the power of 0 is the identity matrix with the
         # same dimensions as the original matrix.
         if not power:
-            for row in range(self.rows):
-                for col in range(self.cols):
-                    if row == col:
-                        result.matrix[row][col] = 1
-        # A matrix raised to a positive power is is simply said matrix
-        # multiplied by itself n times (where n is the power).
+            result = Matrix.identity(self.rows, self.integer, self.backend)
+            if self.max_denominator is not None:
+                result.max_denominator = self.max_denominator
+        # Large powers are reduced modulo the characteristic polynomial, so
+        # that the squaring is done on polynomials of degree below n rather
+        # than on Matrices. Below the cutoff, finding the polynomial costs
+        # more than it saves. In the bounded rational mode, every product is
+        # snapped instead, so the squaring is done on Matrices.
+        elif power > CAYLEY_HAMILTON_CUTOFF * self.rows > 0 \
+                and self.max_denominator is None:
+            from MatrixMath.Spectral import cayley_hamilton_power
+            result = cayley_hamilton_power(self, power)
+        # A matrix raised to a positive power is said matrix multiplied by
+        # itself n times (where n is the power). The product is built by
+        # repeated squaring, which takes about log2(n) multiplications.
         elif power > 0:
-            result = self.copy_matrix()
-            for i in range(power):
-                result *= self
+            result = None
+            square = self
+            while power:
+                if power & 1:
+                    result = square if result is None else result * square
+                power >>= 1
+                if power:
+                    square = square * square
+            if result is self:
+                result = self.copy_matrix()
         # A matrix raised to a negative power is the inverse of the matrix
         # raised to the absolute value of the power.
         else:
-            self.find_inverse()
-            result = self.retrieve_inverse() ** -power
+            inverse = self.find_inverse()
+
+            # A singular matrix has no inverse to raise to a power.
+            if inverse is None:
+                raise ValueError
+
+            # The inverse is exact for the entries of self as stored, so in
+            # the bounded rational mode only its own snapping is counted.
+            if self.max_denominator is not None:
+                inverse = inverse.bounded(self.max_denominator)
+            result = inverse ** -power
 
         return result
 
@@ -236,12 +1169,18 @@ class Matrix:
         # If the Matrices have different dimensions, they cannot be equal.
         if self.rows != other.rows or self.cols != other.cols:
             return False
+        other = self.matching_backend(other)
+
+        # Buffers of the same type are compared in a single comparison, which
+        # stops at the first difference.
+        first, second = self._flat(), other._flat()
+        if type(first) is type(second):
+            return first == second
 
         # Iterates through both matrixes and compares every individual entry.
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if self.matrix[row][col] != other.matrix[row][col]:
-                    return False
+        for first_entry, second_entry in zip(first, second):
+            if first_entry != second_entry:
+                return False
         return True
 
     def __ne__(self, other):
@@ -272,9 +1211,7 @@ class Matrix:
         result = self.copy_matrix()
 
         # Swaps the rows.
-        for col in range(self.cols):
-            result.matrix[first_row - 1][col], result.matrix[second_row - 1][col] = \
-                result.matrix[second_row - 1][col], result.matrix[first_row - 1][col]
+        result._storage.swap_rows(first_row - 1, second_row - 1)
         return result
 
     def add_row(self, first_row: int, factor, second_row: int) -> Matrix:
@@ -291,31 +1228,38 @@ class Matrix:
 
         # Ensures that all parameters are valid types.
         if not isinstance(first_row, int) or not isinstance(second_row, int) \
-           or not isinstance(factor, int) and not isinstance(factor, Fraction):
+           or not isinstance(factor, int) and not is_rational(factor):
             raise TypeError
 
         # Ensures that both rows are positive.
         if first_row <= 0 or second_row <= 0:
             raise ValueError
 
-        # Adds the rows together.
-        result = self.copy_matrix()
-        for col in range(self.cols):
-            result.matrix[first_row - 1][col] += \
-                self.matrix[second_row - 1][col] * factor
+        # Adds the rows together. A rational factor takes an integer Matrix
+        # out of the integer domain.
+        if not isinstance(factor, int):
+            factor = self.backend.convert(factor)
+        if self.integer and not isinstance(factor, int):
+            result = self.to_rational()
+        else:
+            result = self.copy_matrix()
+        result._storage.set_row(
+            first_row - 1,
+            [entry + source * factor for entry, source in
+             zip(self._row(first_row - 1), self._row(second_row - 1))])
         return result
 
     def multiply_row(self, row: int, factor) -> Matrix:
         """
         Multiplies all the elements in a given row by factor, which can be a
-        Fraction or an int. One of the three elementary row operations.
+        rational or an int. One of the three elementary row operations.
         :param row: The row to be multiplied.
         :param factor: The factor to multiply all elements by.
         :return: The resulting Matrix.
         """
 
         # Ensures that row and factor are valid types.
-        if not isinstance(row, int) or not isinstance(factor, Fraction) \
+        if not isinstance(row, int) or not is_rational(factor) \
                 and not isinstance(factor, int):
             raise TypeError
 
@@ -323,21 +1267,31 @@ class Matrix:
         if row <= 0:
             raise ValueError
 
-        result = self.copy_matrix()
+        # A rational factor takes an integer Matrix out of the integer domain.
+        if not isinstance(factor, int):
+            factor = self.backend.convert(factor)
+        if self.integer and not isinstance(factor, int):
+            result = self.to_rational()
+        else:
+            result = self.copy_matrix()
 
         # Multiplies the rows.
-        for i in range(self.cols):
-            result.matrix[row - 1][i] *= factor
+        result._storage.set_row(
+            row - 1, [entry * factor for entry in self._row(row - 1)])
 
         return result
 
-    def find_determinant_internal(self, factor: Fraction = None):
+    def find_determinant_internal(self, pivoting: str = None):
         """
-        NOTE: This method is used internally by other methods and contains
-        features not intended for users. Use find_determinant() instead.
-
-        Returns the determinant of the matrix from which self, an echelon form
-        Matrix, was computed. Determinant is only defined for a n x n Matrix.
+        NOTE: This method is used internally by other methods. Use
+        find_determinant() instead.
+
+        Returns the determinant of self. Determinant is only defined for a
+        n x n Matrix.
+        :param pivoting: The name of the pivoting strategy used if self has
+        to be eliminated, one of 'first', 'smallest' or 'sparse' (see
+        Factorization.choose_pivot()). Optional parameter, defaults to the
+        strategy of the stored Factorization of self, or 'first'.
         :return: The calculated determinant as a Fraction, or None if no
         determinant exists.
         """
@@ -351,184 +1305,291 @@ class Matrix:
             self.determinant_found = True
             return self.determinant
 
+        # Checks the process-wide cache for a Matrix with the same contents.
+        digest = result_cache.find_digest(self)
+        cached = result_cache.get(digest, 'determinant')
+        if cached is not MISSING:
+            self.determinant = cached
+
+        # If self has already been factorized, the determinant was found along
+        # the way.
+        elif self.factorization_found:
+            self.determinant = self.factorization.determinant
+
         # The determinant of a 2 x 2 matrix is ad - bc (a, b, c, d from left
         # to right, top to bottom.
+        elif self.rows == 2:
+            (a, b), (c, d) = self._rows()
+            self.determinant = a * d - b * c
+
+        # A Matrix that is singular modulo random primes is taken to be
+        # singular without any exact work. The result is not shared through
+        # the process-wide cache, since it is only probably correct.
+        elif modular_precheck.enabled and not modular_precheck.confirm \
+                and modular_precheck.is_singular(self):
+            modular_precheck.reject()
+            self.determinant = 0 if self.integer else self.backend.zero
+            cached = None
+
+        # Integer matrices use fraction-free elimination, so that their
+        # determinant is found without ever creating a Fraction.
+        elif self.integer:
+            self.determinant = self.find_integer_determinant(pivoting
+                                                             or 'first')
 
-        if self.rows == 2:
-            self.determinant = self.matrix[0][0] * self.matrix[1][1] \
-                               - self.matrix[0][1] * self.matrix[1][0]
-            self.determinant_found = True
-            return self.determinant
+        else:
+            self.determinant = self.factorize(pivoting).determinant
 
-        # If this method is called from anywhere other than
-        # gaussian_elimination_internal(), factor will be None. factor is
-        # needed to calculate the determinant so it will call
-        # gaussian_elimination_internal(), which will then call this method
-        # with the appropriate factor.
-        if factor is None:
-            return self.gaussian_elimination_internal(True, True)
-
-        # Computes the determinant by multiplying the entries in the diagonal
-        # of the reduced echelon form matrix and multiplying it by factor.
-        # This code can only be reached if the method is called from
-        # gaussian_elimination_internal.
-        determinant = Fraction(1, 1)
-        for i in range(self.rows):
-            determinant *= self.matrix[i][i]
-        determinant *= factor
+        if cached is MISSING:
+            result_cache.put(digest, 'determinant', self.determinant)
 
-        self.determinant = determinant
         self.determinant_found = True
-        return determinant
+        return self.determinant
 
-    def find_determinant(self):
+    def find_integer_determinant(self, pivoting: str = 'first') -> int:
+        """
+        Returns the determinant of self, an n x n Matrix of ints, using
+        Bareiss' fraction-free elimination. Every division in the algorithm is
+        exact, so all intermediate values stay ints.
+        :param pivoting: The name of the pivoting strategy. Optional
+        parameter, defaults to 'first', which only looks for another pivot
+        when the entry on the diagonal is 0.
+        :return: The determinant as an int.
+        """
+        from MatrixMath.Factorization import check_pivoting, choose_pivot
+
+        check_pivoting(pivoting)
+
+        rows = [list(row) for row in self._rows()]
+        size = self.rows
+        sign = 1
+        previous_pivot = 1
+
+        for k in range(size - 1):
+            checkpoint('eliminate', k + 1, size - 1, (size - k) ** 2)
+
+            # Finds a row with a nonzero entry in column k to serve as the
+            # pivot. If there is none, the matrix is singular.
+            if not rows[k][k] or pivoting != 'first':
+                row_search = choose_pivot(rows, k, k, pivoting)
+                if row_search is None:
+                    return 0
+                if row_search != k:
+                    rows[k], rows[row_search] = rows[row_search], rows[k]
+                    sign = -sign
+
+            pivot_row = rows[k]
+            pivot = pivot_row[k]
+
+            # Replaces every entry below and to the right of the pivot with a
+            # 2 x 2 determinant divided by the previous pivot.
+            for i in range(k + 1, size):
+                row = rows[i]
+                factor = row[k]
+                rows[i] = row[:k + 1] + [
+                    (row[j] * pivot - factor * pivot_row[j]) // previous_pivot
+                    for j in range(k + 1, size)]
+            previous_pivot = pivot
+
+        return sign * rows[-1][-1]
+
+    def find_determinant(self, pivoting: str = None):
         """
         Returns the determinant of self if it exists as a Fraction, or None if
         the determinant does not exist.
+        :param pivoting: The name of the pivoting strategy used if self has
+        to be eliminated, one of 'first', 'smallest' or 'sparse' (see
+        Factorization.choose_pivot()). Optional parameter, defaults to the
+        strategy of the stored Factorization of self, or 'first'.
         :return: The determinant of self as a fraction or None.
         """
-        return self.find_determinant_internal()
+        return self.find_determinant_internal(pivoting)
+
+    async def find_determinant_async(self, pivoting: str = None,
+                                     executor=None, timeout: float = None,
+                                     max_operations: int = None,
+                                     progress=None):
+        """
+        Does the same as find_determinant() on an executor, without blocking
+        the event loop, and under a Budget (see Budget.py): cancelling the
+        awaiting task, or passing either limit, stops the elimination at its
+        next checkpoint. Nothing is stored in self unless it completes.
+        :param pivoting: See find_determinant(). Optional parameter.
+        :param executor: The executor that runs the computation in another
+        thread, such as a concurrent.futures.ThreadPoolExecutor. Optional
+        parameter, defaults to None, for the default executor of the event
+        loop.
+        :param timeout: The largest number of seconds the computation may
+        run before it stops with a TimeoutError. Optional parameter, defaults
+        to None, for no limit.
+        :param max_operations: The largest number of entry updates the
+        computation may do before it stops with a TimeoutError. Optional
+        parameter, defaults to None, for no limit.
+        :param progress: A callable given the stage, step and total at every
+        checkpoint of the computation, such as ('eliminate', 3, 100), called
+        in the event loop. Optional parameter, defaults to None.
+        :return: The determinant of self, or None.
+        """
+        return await run_async(self.find_determinant, (pivoting,), executor,
+                               timeout, max_operations, progress)
+
+    def factorize(self, pivoting: str = None,
+                  common_denominator: bool = None):
+        """
+        Returns the Factorization of self, which is found by a single
+        Gauss-Jordan elimination and holds the reduced row echelon form, the
+        pivot columns, the rank, the determinant and a record of the row
+        operations performed. It is stored, and find_determinant(),
+        gaussian_elimination(), find_inverse(), find_solution() and solve()
+        all draw from it, so using several of them eliminates self only once.
+        Asking for a different pivoting strategy or row representation than
+        that of the stored Factorization eliminates self again and stores the
+        new one.
+        :param pivoting: The name of the pivoting strategy, one of 'first',
+        'smallest' or 'sparse'. Optional parameter, defaults to the strategy
+        of the stored Factorization, or 'first'.
+        :param common_denominator: Whether or not each row is held as ints
+        with a common denominator during elimination, rather than as a list
+        of rationals. Optional parameter, defaults to the representation of
+        the stored Factorization, or True.
+        :return: The Factorization of self.
+        """
+        from MatrixMath.Factorization import Factorization, check_pivoting
+
+        if pivoting is not None:
+            check_pivoting(pivoting)
+        if common_denominator is not None \
+                and not isinstance(common_denominator, bool):
+            raise TypeError
+
+        if self.factorization_found:
+            if pivoting is None:
+                pivoting = self.factorization.pivoting
+            if common_denominator is None:
+                common_denominator = self.factorization.common_denominator
+            if pivoting == self.factorization.pivoting and \
+                    common_denominator == \
+                    self.factorization.common_denominator:
+                return self.factorization
+
+        self.factorization = Factorization(
+            self, pivoting or 'first',
+            common_denominator=common_denominator is not False)
+        self.factorization_found = True
+        return self.factorization
+
+    def elimination_statistics(self, pivoting: str = None) -> dict:
+        """
+        Returns figures describing the elimination of self with a pivoting
+        strategy, including the largest bit length of any entry along the
+        way, so that strategies can be compared on a workload. See
+        Factorization.statistics(). Unless the stored Factorization already
+        tracked the bit length with the same strategy, self is eliminated
+        again, and the new Factorization is stored.
+        :param pivoting: The name of the pivoting strategy, one of 'first',
+        'smallest' or 'sparse'. Optional parameter, defaults to the strategy
+        of the stored Factorization of self, or 'first'.
+        :return: The statistics as a dict.
+        """
+        from MatrixMath.Factorization import Factorization, check_pivoting
+
+        if pivoting is None:
+            pivoting = self.factorization.pivoting \
+                if self.factorization_found else 'first'
+        check_pivoting(pivoting)
+
+        common_denominator = self.factorization.common_denominator \
+            if self.factorization_found else True
+
+        if not self.factorization_found \
+                or pivoting != self.factorization.pivoting \
+                or not self.factorization.track_bit_length:
+            self.factorization = Factorization(self, pivoting, True,
+                                               common_denominator)
+            self.factorization_found = True
+
+        # Completes the elimination so that the peak covers every entry of
+        # the reduced row echelon form.
+        self.factorization.reduce()
+        return self.factorization.statistics()
 
     def gaussian_elimination_internal(self,
                                       stop_early_no_solution: bool = False,
-                                      stop_early_determinant: bool = False):
-        """
-        NOTE: This method is used internally by other methods and contains
-        features not intended for users. Use gaussian_elimination() instead.
-
-        Returns either the row echelon form or the reduced row echelon form
-        resulting from Gauss-Jordan elimination on self. If stop_early is True,
-        the function will return the row echelon form if the leading entry in
-        any row is in the last column (indicating no solutions to a linear
-        system.) In all other cases, it will return the reduced row echelon
-        form matrix. If the reduced row echelon form matrix is computed, will
-        also find the determinant.
-        :param stop_early_no_solution: Whether or not the algorithm stops after
-        determining the row echelon form if there is no solution. Optional
+                                      stop_early_determinant: bool = False,
+                                      pivoting: str = None):
+        """
+        NOTE: This method is used internally by other methods. Use
+        gaussian_elimination() or find_determinant() instead.
+
+        Returns the reduced row echelon form resulting from Gauss-Jordan
+        elimination on self, taken from the Factorization of self.
+        :param stop_early_no_solution: Kept for compatibility. The reduced row
+        echelon form is always returned, since the Factorization finds it in
+        the same pass either way. Optional parameter, defaults to False.
+        :param stop_early_determinant: Whether or not the method returns the
+        determinant rather than the reduced row echelon form. Optional
         parameter, defaults to False.
-        :param stop_early_determinant: Whether or not the method stops after
-        determining the row echelon form regardless of whether or not there is
-        a solution. Used when calculating determinants. Optional parameter,
-        defaults to False.
+        :param pivoting: The name of the pivoting strategy used if self has
+        to be eliminated, one of 'first', 'smallest' or 'sparse' (see
+        Factorization.choose_pivot()). Optional parameter, defaults to the
+        strategy of the stored Factorization of self, or 'first'.
         :return: The resulting Matrix, or the determinant if
         stop_early_determinant is True.
         """
 
+        if stop_early_determinant:
+            return self.find_determinant_internal(pivoting)
+
         if self.reduced_echelon_form_found:
             return self.reduced_echelon_form
 
-        result = self.copy_matrix()
-        col = 0
-        row = 0
-
-        # This is used to compute the determinant at the end of the function.
-        # Multiplied by -1 when two rows are swapped and divided by the factor
-        # when a row is added to another. Unchanged when a row is multiplied by
-        # a scalar factor.
-        det_factor = Fraction(1, 1)
-
-        # Iterates through the rows and columns of the Matrix until reaching
-        # the end of one of them.
-        while col < result.cols and row < result.rows:
-            # Finds the first row in the current column with a leading entry.
-            row_search = row
-            while row_search < result.rows \
-                    and not result.matrix[row_search][col]:
-                row_search += 1
-
-            # Swaps the first row with the first row containing a leading
-            # entry to create a pivot.
-            if row_search != row and row_search != result.rows:
-                det_factor *= -1
-                result = result.swap_rows(row + 1, row_search + 1)
-
-            # If there is now a leading entry, sets it to 1 to serve as the
-            # pivot by dividing the entire row by the leading entry.
-            if result.matrix[row][col]:
-                det_factor /= 1 / result.matrix[row][col]
-                result = result.multiply_row(row + 1, 1 /
-                                             result.matrix[row][col])
-
-            # Eliminates all leading entries below the pivot by subtracting the
-            # appropriate amount of the leading entry's row.
-            for i in range(row + 1, result.rows):
-                if result.matrix[i][col]:
-                    result = result.add_row(i + 1, -result.matrix[i][col],
-                                            row + 1)
-
-            col += 1
-
-            # If a pivot was found in the column, increases row.
-            if row_search != result.rows:
-                row += 1
-
-        # When calculating the determinant, there is no point in continuing
-        # Gaussian elimination once an echelon form matrix has been computed.
-        if stop_early_determinant:
-            self.determinant = result.find_determinant_internal(det_factor)
-            return self.determinant
+        # Checks the process-wide cache for a Matrix with the same contents.
+        digest = result_cache.find_digest(self)
+        result = result_cache.get(digest, 'reduced_echelon_form')
+        if result is MISSING:
+            result = self.factorize(pivoting).reduced_echelon_form
+            result_cache.put(digest, 'reduced_echelon_form', result)
 
-        # If stop_early_no_solution is True, checks if the Matrix has no
-        # solution. If so, returns the Matrix early without computing the
-        # reduced echelon form.
-        if stop_early_no_solution:
-            col = -1
-            row = -1
-
-            # Searches for the last row to contain an entry in the last column.
-            while row >= -result.rows and not result.matrix[row][col]:
-                row -= 1
-
-            # Checks if the entry in that row is a leading entry.
-            is_leading = True
-            while col >= -result.cols + 1:
-                if result.matrix[row][col - 1]:
-                    is_leading = False
-                col -= 1
-            if is_leading:
-                return result
-
-        row = 0
-        col = 1
-
-        # Eliminates all entries above the leading entries in order to reduce
-        # the Matrix to reduced row echelon form.
-        while row < result.rows - 1 and col < result.cols:
-            while col < result.cols - 1 and not result.matrix[row + 1][col]:
-                col += 1
-
-            for i in range(row + 1):
-                result = result.add_row(i + 1, -result.matrix[i][col], row + 2)
-
-            row += 1
-            col += 1
-
-        # Stores the computed reduced echelon form Matrix in
-        # self.reduced_echelon_form.
         self.reduced_echelon_form = result
         self.reduced_echelon_form_found = True
         return result
 
-    def gaussian_elimination(self) -> Matrix:
+    def gaussian_elimination(self, pivoting: str = None) -> Matrix:
         """
         Returns the reduced row echelon form of self as a Matrix.
+        :param pivoting: The name of the pivoting strategy used if self has
+        to be eliminated, one of 'first', 'smallest' or 'sparse' (see
+        Factorization.choose_pivot()). Optional parameter, defaults to the
+        strategy of the stored Factorization of self, or 'first'.
         :return: The reduced row echelon form of self as a Matrix.
         """
-        return self.gaussian_elimination_internal()
+        return self.gaussian_elimination_internal(pivoting=pivoting)
 
-    def find_solution(self):
+    def find_solution(self, pivoting: str = None, verify: bool = False):
         """
         Finds the solution for the system of linear equations defined by the
-        Matrix self. Solution is None if no solution, an n x 1 matrix for just
-        one solution with n being the number of variables, and a list if there
-        are infinite solutions. The list consists of m lists containing the
-        numbers of the independent variables and the vectors associated with
-        them, written as lists of length m, where m is the number of variables.
-        The last entry in the returned list will be another list of length m
-        containing the constants. The computed solution is stored in
-        self.solution.
-        :return: None
+        Matrix self, whose last column holds the constants. Solution is None
+        if no solution, and otherwise a list. The list consists of one list
+        for every independent variable, containing the number of the variable
+        (counting from 0) and the vector associated with it, written as a
+        list of length m, where m is the number of variables. The last entry
+        in the returned list will be another list of length m containing the
+        constants, so a system with just one solution gives a list holding
+        only the constants. The computed solution is stored in self.solution.
+        :param pivoting: The name of the pivoting strategy used if self has
+        to be eliminated, one of 'first', 'smallest' or 'sparse' (see
+        Factorization.choose_pivot()). Optional parameter, defaults to the
+        strategy of the stored Factorization of self, or 'first'.
+        :param verify: Whether or not a solution is checked with
+        verify_solution(), which raises ArithmeticError if it is wrong.
+        Optional parameter, defaults to False.
+        :return: The solution as a list, or None.
         """
+        if verify:
+            solution = self.find_solution(pivoting)
+            if solution is not None:
+                Matrix.verify_solution(self, solution)
+            return solution
 
         # Checks if the solution has already been found. If so, returns it
         # without redoing all the calculations.
@@ -536,55 +1597,129 @@ class Matrix:
         if self.solution_found:
             return self.solution
 
-        echelon_matrix = self.gaussian_elimination_internal(True)
+        from MatrixMath.Factorization import build_solution
 
-        col = -1
-        row = -1
-
-        # checks if the matrix has a row with the leading entry in the last
-        # column. If so, stores None into self.solution and returns None to
-        # end the function call.
-        while row >= -echelon_matrix.rows \
-                and not echelon_matrix.matrix[row][col]:
-            row -= 1
-        if not echelon_matrix.matrix[row][col - 1]:
-            self.solution = None
+        # Checks the process-wide cache for a Matrix with the same contents.
+        digest = result_cache.find_digest(self)
+        solution = result_cache.get(digest, 'solution')
+        if solution is not MISSING:
+            self.solution = solution
             self.solution_found = True
+            return solution
+
+        # A system that is inconsistent modulo random primes has no solution.
+        # Without confirm, no exact work is done.
+        if not self.factorization_found and modular_precheck.enabled \
+                and not modular_precheck.confirm \
+                and modular_precheck.solution_dimension(
+                    self._rows(), self.cols - 1) is None:
+            modular_precheck.reject()
+            self.solution_found = True
+            self.solution = None
             return None
 
-        row = 0
-        col = 0
-        independent = []
+        factorization = self.factorize(pivoting)
+        variables = self.cols - 1
 
-        # Searches for columns in the reduced echelon form matrix representing
-        # independent variables and stores the number of the column in a list.
-        while col < echelon_matrix.cols - 1:
-            if row != echelon_matrix.rows and echelon_matrix.matrix[row][col]:
-                row += 1
-            else:
-                independent.append(col)
-            col += 1
-
-        # Creates the list that will be returned. The last element will be a
-        # list containing the constants.
-        solution = []
-        for i in independent:
-            independent_vector = []
-            for j in range(echelon_matrix.rows):
-                if j == i:
-                    independent_vector.append(1)
-                else:
-                    independent_vector.append(-echelon_matrix.matrix[j][i])
-            solution.append([i, independent_vector])
-
-        # Adds a final list to the solution containing the constants.
-        constant_vector = []
-        for i in range(echelon_matrix.rows):
-            constant_vector.append(echelon_matrix.matrix[i][col])
-        solution.append(constant_vector)
+        # checks if the matrix has a row with the leading entry in the last
+        # column. If so, there is no solution and it remains None.
+        if factorization.pivot_cols and \
+                factorization.pivot_cols[-1] == variables:
+            solution = None
+        else:
+            rref_rows = factorization.reduced_echelon_form._rows()
+            solution = build_solution(rref_rows, factorization.pivot_cols,
+                                      variables,
+                                      [row[-1] for row in rref_rows],
+                                      self.backend)
 
+        result_cache.put(digest, 'solution', solution)
         self.solution_found = True
         self.solution = solution
+        return solution
+
+    def solve(self, constants, pivoting: str = None, verify: bool = False):
+        """
+        Finds the solution of the linear system whose coefficients are self
+        and whose right-hand side is constants, in the format described in
+        find_solution(). Unlike find_solution(), self does not include the
+        constants, so the Factorization of self is reused for every
+        right-hand side and by find_determinant() and find_inverse().
+        :param constants: The right-hand side, either a list with one entry
+        per row of self or a Matrix with one column.
+        :param pivoting: The name of the pivoting strategy used if self has
+        to be eliminated, one of 'first', 'smallest' or 'sparse' (see
+        Factorization.choose_pivot()). Optional parameter, defaults to the
+        strategy of the stored Factorization of self, or 'first'.
+        :param verify: Whether or not a solution is checked with
+        verify_solution(), which raises ArithmeticError if it is wrong.
+        Optional parameter, defaults to False.
+        :return: The solution as a list, or None if there is no solution.
+        """
+        if verify:
+            solution = self.solve(constants, pivoting)
+            if solution is not None:
+                Matrix.verify_solution(self, solution, constants)
+            return solution
+
+        # A system that is inconsistent modulo random primes has no solution.
+        # Once self is factorized, every right-hand side is solved exactly.
+        if not self.factorization_found and modular_precheck.enabled \
+                and not modular_precheck.confirm:
+            values = constants._flat() if isinstance(constants, Matrix) \
+                else constants
+            if len(values) == self.rows and \
+                    modular_precheck.solution_dimension(
+                        [list(row) + [value] for row, value
+                         in zip(self._rows(), values)], self.cols) is None:
+                modular_precheck.reject()
+                return None
+
+        return self.factorize(pivoting).find_solution(constants)
+
+    async def solve_async(self, constants, pivoting: str = None,
+                          executor=None, timeout: float = None,
+                          max_operations: int = None, progress=None):
+        """
+        Does the same as solve() on an executor, without blocking the event
+        loop, and under a Budget (see find_determinant_async()).
+        :param constants: See solve().
+        :param pivoting: See solve(). Optional parameter.
+        :param executor: The executor that runs the computation in another
+        thread, such as a concurrent.futures.ThreadPoolExecutor. Optional
+        parameter, defaults to None, for the default executor of the event
+        loop.
+        :param timeout: The largest number of seconds the computation may
+        run before it stops with a TimeoutError. Optional parameter, defaults
+        to None, for no limit.
+        :param max_operations: The largest number of entry updates the
+        computation may do before it stops with a TimeoutError. Optional
+        parameter, defaults to None, for no limit.
+        :param progress: A callable given the stage, step and total at every
+        checkpoint of the computation, such as ('eliminate', 3, 100), called
+        in the event loop. Optional parameter, defaults to None.
+        :return: The solution as a list, or None if there is no solution.
+        """
+        return await run_async(self.solve, (constants, pivoting), executor,
+                               timeout, max_operations, progress)
+
+    def find_solution_dimension(self):
+        """
+        Returns the number of free variables of the system of linear
+        equations defined by self, whose last column holds the constants, or
+        None if it has no solution. Once self is factorized the answer is
+        exact; before that, it is found from the ranks of self modulo random
+        primes (see Precheck.ModularPrecheck), which is much cheaper and is
+        wrong with probability at most modular_precheck.error_probability.
+        :return: The number of free variables, or None.
+        """
+        if self.factorization_found:
+            pivot_cols = self.factorization.pivot_cols
+            if pivot_cols and pivot_cols[-1] == self.cols - 1:
+                return None
+            return self.cols - 1 - len(pivot_cols)
+        return modular_precheck.solution_dimension(self._rows(),
+                                                   self.cols - 1)
 
     def output_solution(self):                                              #TODO: Allow it to deal with solutions containing only one line.
         """
@@ -641,49 +1776,90 @@ class Matrix:
 
         return string
 
-    def find_inverse(self):
+    def find_inverse(self, pivoting: str = None, verify: bool = False):
         """
         Returns the inverse of self. If self has no inverse, returns None.
+        :param pivoting: The name of the pivoting strategy used if self has
+        to be eliminated, one of 'first', 'smallest' or 'sparse' (see
+        Factorization.choose_pivot()). Optional parameter, defaults to the
+        strategy of the stored Factorization of self, or 'first'.
+        :param verify: Whether or not an inverse is checked with
+        verify_inverse(), which raises ArithmeticError if it is wrong.
+        Optional parameter, defaults to False.
         :return: A Matrix that is the inverse of self if one exists, None if
         self has no inverse.
         """
+        if verify:
+            inverse = self.find_inverse(pivoting)
+            if inverse is not None:
+                Matrix.verify_inverse(self, inverse)
+            return inverse
 
         # Checks if the inverse has been previously found to avoid wasting time
         # calculating it again.
         if self.inverse_found:
             return self.inverse
 
-        # Checks if the matrix is singular or not n x n. In either case, there
-        # is no inverse.
-        if self.find_determinant() == 0 or self.find_determinant() is None:
+        # A matrix that is not n x n has no inverse.
+        if self.rows != self.cols:
             return None
 
-        # Creates an n x 2n Matrix with in the left 3 columns and the identity
-        # matrix in the right n columns.
-        identity_appended = Matrix(self.rows, 2 * self.rows)
-        for row in range(self.rows):
-            for col in range(2 * self.rows):
-                if col < self.rows:
-                    identity_appended.matrix[row][col] = self.matrix[row][col]
-                elif col - self.rows == row:
-                    identity_appended.matrix[row][col] = 1
-                else:
-                    identity_appended.matrix[row][col] = 0
-
-        ref = identity_appended.gaussian_elimination()
-
-        inverse = Matrix(self.rows, self.cols)
-
-        # Copies the right half of the reduced echelon form that was
-        # originally an identity matrix and is now the inverse into a new
-        # matrix.
-        for i in range(inverse.rows):
-            for j in range(inverse.cols):
-                inverse.matrix[i][j] = ref.matrix[i][j + inverse.cols]
+        # Checks the process-wide cache for a Matrix with the same contents.
+        digest = result_cache.find_digest(self)
+        inverse = result_cache.get(digest, 'inverse')
+
+        # A Matrix that is singular modulo random primes has no inverse. With
+        # confirm, its determinant is found exactly first, which for an
+        # integer Matrix needs no rationals.
+        if inverse is MISSING and not self.factorization_found \
+                and modular_precheck.enabled \
+                and modular_precheck.is_singular(self):
+            if not modular_precheck.confirm:
+                modular_precheck.reject()
+                return None
+            if not self.find_determinant(pivoting):
+                modular_precheck.reject()
+                modular_precheck.count_confirmation()
+                return None
+
+        # The inverse is found from the row operations recorded while
+        # factorizing self, so no second elimination on an n x 2n Matrix is
+        # needed. It is None if self is singular.
+        if inverse is MISSING:
+            inverse = self.factorize(pivoting).find_inverse()
+            result_cache.put(digest, 'inverse', inverse)
+        if inverse is None:
+            return None
 
+        self.inverse = inverse
         self.inverse_found = True
         return inverse
 
+    async def find_inverse_async(self, pivoting: str = None, executor=None,
+                                 timeout: float = None,
+                                 max_operations: int = None, progress=None):
+        """
+        Does the same as find_inverse() on an executor, without blocking the
+        event loop, and under a Budget (see find_determinant_async()).
+        :param pivoting: See find_inverse(). Optional parameter.
+        :param executor: The executor that runs the computation in another
+        thread, such as a concurrent.futures.ThreadPoolExecutor. Optional
+        parameter, defaults to None, for the default executor of the event
+        loop.
+        :param timeout: The largest number of seconds the computation may
+        run before it stops with a TimeoutError. Optional parameter, defaults
+        to None, for no limit.
+        :param max_operations: The largest number of entry updates the
+        computation may do before it stops with a TimeoutError. Optional
+        parameter, defaults to None, for no limit.
+        :param progress: A callable given the stage, step and total at every
+        checkpoint of the computation, such as ('eliminate', 3, 100), called
+        in the event loop. Optional parameter, defaults to None.
+        :return: The inverse of self, or None if self has no inverse.
+        """
+        return await run_async(self.find_inverse, (pivoting,), executor,
+                               timeout, max_operations, progress)
+
     def find_transpose(self) -> Matrix:
         """
         Returns the transpose of self as a Matrix.
@@ -694,11 +1870,8 @@ class Matrix:
             return self.transpose
 
         # Creates a Matrix of the correct dimensions to store the transpose.
-        result = Matrix(self.cols, self.rows)
-
-        for i in range(self.rows):
-            for j in range(self.cols):
-                result.matrix[j][i] = self.matrix[i][j]
+        result = Matrix.from_storage(self._transposed_storage(),
+                                     self.integer, self.backend)
 
         # Stores the transpose so that it can be retrieved later without
         # recalculating it and returns it.
@@ -734,25 +1907,9 @@ class Matrix:
         if self.rows == 1:
             return None
 
-        # Creates a matrix with one less row and col than self that will store
-        # self with row and col removed.
-        row_col_removed = Matrix(self.rows - 1, self.cols - 1)
-
-        # Copies self into row_col_removed, except for the row and col of the
-        # entry having its minor calculated.
-        for i in range(row_col_removed.rows):
-            for j in range(row_col_removed.cols):
-                if i >= row - 1 and j >= col - 1:
-                    row_col_removed.matrix[i][j] = self.matrix[i + 1][j + 1]
-                elif i >= row - 1:
-                    row_col_removed.matrix[i][j] = self.matrix[i + 1][j]
-                elif j >= col - 1:
-                    row_col_removed.matrix[i][j] = self.matrix[i][j + 1]
-                else:
-                    row_col_removed.matrix[i][j] = self.matrix[i][j]
-
-        # Returns the minor.
-        return row_col_removed.find_determinant()
+        # Views self with row and col removed rather than copying it into a
+        # smaller Matrix, and returns the minor.
+        return self.minor_view(row, col).find_determinant()
 
     def find_cofactor_matrix(self) -> Matrix:
         """
@@ -763,7 +1920,7 @@ class Matrix:
         if self.cofactor_matrix_found:
             return self.cofactor_matrix
 
-        result = Matrix(self.rows, self.cols)
+        result = Matrix(self.rows, self.cols, self.integer, self.backend)
 
         # Stores the cofactor of each entry of self in the corresponding
         # positions in result. The cofactor is the minor of the entry
@@ -771,8 +1928,9 @@ class Matrix:
         # they have the same parity.
         for row in range(self.rows):
             for col in range(self.cols):
-                result.matrix[row][col] = self.find_minor(row + 1, col + 1) \
-                                          * (-1) ** ((row + col) & 1)
+                result._storage.set(row, col,
+                                    self.find_minor(row + 1, col + 1)
+                                    * (-1) ** ((row + col) & 1))
 
         # Stores the cofactor matrix so that it can be retrieved later without
         # recalculating it.
@@ -789,32 +1947,237 @@ class Matrix:
         if self.adjoint_matrix_found:
             return self.adjoint_matrix
 
-        result = self.copy_matrix()
-        result = result.find_cofactor_matrix()
+        result = self.find_cofactor_matrix()
 
         self.adjoint_matrix = result.find_transpose()
         self.adjoint_matrix_found = True
         return self.adjoint_matrix
 
+    def find_trace(self):
+        """
+        Returns the trace of self, the sum of the entries on its diagonal, or
+        None if self is not n x n.
+        :return: The trace as an int or a rational, or None.
+        """
+
+        # The trace is only defined for n x n matrices.
+        if self.rows != self.cols:
+            return None
+
+        diagonal = self._flat()[::self.cols + 1]
+        if self.integer:
+            return sum(diagonal)
+        return self.backend.convert(self.backend.sum(diagonal))
+
+    def row_sums(self) -> list:
+        """
+        Returns the sum of the entries of every row of self.
+        :return: A list with one sum per row.
+        """
+        from MatrixMath.Elementwise import row_sums
+        return row_sums(self)
+
+    def column_sums(self) -> list:
+        """
+        Returns the sum of the entries of every column of self.
+        :return: A list with one sum per column.
+        """
+        from MatrixMath.Elementwise import column_sums
+        return column_sums(self)
+
+    def max_entry(self):
+        """
+        Returns the largest entry of self.
+        :return: The entry.
+        """
+        from MatrixMath.Elementwise import extreme_entry
+        return extreme_entry(self)
+
+    def min_entry(self):
+        """
+        Returns the smallest entry of self.
+        :return: The entry.
+        """
+        from MatrixMath.Elementwise import extreme_entry
+        return extreme_entry(self, False)
+
+    def norm(self, kind: str = 'frobenius'):
+        """
+        Returns a norm of self: 'frobenius' (as a float), 'max' (the largest
+        absolute value of an entry), 'one' (the largest absolute column sum)
+        or 'infinity' (the largest absolute row sum). All but the Frobenius
+        norm are exact.
+        :param kind: The name of the norm. Optional parameter, defaults to
+        'frobenius'.
+        :return: The norm.
+        """
+        from MatrixMath.Elementwise import norm
+        return norm(self, kind)
+
+    def find_characteristic_polynomial(self):
+        """
+        Returns the characteristic polynomial det(xI - self) of self, or None
+        if self is not n x n. Integer Matrices use Berkowitz' division-free
+        algorithm, in O(n ** 4) int operations. Rational Matrices are reduced
+        to Hessenberg form first, in O(n ** 3) operations. The polynomial is
+        monic, its constant term is (-1) ** n times the determinant and its
+        second highest coefficient is minus the trace.
+        :return: The coefficients as a list of ints for an integer Matrix or
+        rationals otherwise, lowest degree first, so that the coefficient of
+        x ** k is at index k. None if self is not n x n.
+        """
+        from MatrixMath.Spectral import berkowitz, \
+            hessenberg_characteristic_polynomial
+
+        if self.characteristic_polynomial_found:
+            return self.characteristic_polynomial
+
+        # The characteristic polynomial is only defined for n x n matrices.
+        if self.rows != self.cols:
+            return None
+
+        # Checks the process-wide cache for a Matrix with the same contents.
+        digest = result_cache.find_digest(self)
+        polynomial = result_cache.get(digest, 'characteristic_polynomial')
+        if polynomial is MISSING:
+            if self.integer:
+                polynomial = berkowitz(self._rows())
+            else:
+                polynomial = hessenberg_characteristic_polynomial(
+                    [list(row) for row in self.to_rational()._rows()],
+                    self.backend.one)
+            result_cache.put(digest, 'characteristic_polynomial', polynomial)
+
+        self.characteristic_polynomial = polynomial
+        self.characteristic_polynomial_found = True
+        return polynomial
+
+    def find_minimal_polynomial(self):
+        """
+        Returns the minimal polynomial of self, the monic polynomial of lowest
+        degree p such that p(self) is the zero Matrix, or None if self is not
+        n x n. It divides the characteristic polynomial. Found exactly from
+        the first linear dependency among the powers of self, in O(n ** 4)
+        operations.
+        :return: The coefficients as a list of ints for an integer Matrix or
+        rationals otherwise, lowest degree first. None if self is not n x n.
+        """
+        from MatrixMath.Spectral import minimal_polynomial
+
+        if self.minimal_polynomial_found:
+            return self.minimal_polynomial
+
+        # The minimal polynomial is only defined for n x n matrices.
+        if self.rows != self.cols:
+            return None
+
+        # Checks the process-wide cache for a Matrix with the same contents.
+        digest = result_cache.find_digest(self)
+        polynomial = result_cache.get(digest, 'minimal_polynomial')
+        if polynomial is MISSING:
+            polynomial = minimal_polynomial(self)
+            result_cache.put(digest, 'minimal_polynomial', polynomial)
+
+        self.minimal_polynomial = polynomial
+        self.minimal_polynomial_found = True
+        return polynomial
+
+    def to_sparse(self):
+        """
+        Returns the nonzero entries of self as a SparseMatrix of floats, whose
+        memory and products with vectors grow with the number of nonzero
+        entries.
+        :return: The SparseMatrix.
+        """
+        from MatrixMath.SparseMatrix import SparseMatrix
+        return SparseMatrix.from_matrix(self)
+
+    def to_tiled(self, tile_size: int = 256, path: str = None,
+                 memory_budget: int = 64 * 1024 * 1024):
+        """
+        Returns the entries of self as a TiledMatrix of floats, stored as
+        tiles in a memory-mapped file rather than in memory. Requires NumPy.
+        :param tile_size: The number of rows and columns of each tile.
+        Optional parameter, defaults to 256.
+        :param path: The file the tiles are stored in. Optional parameter,
+        defaults to a temporary file.
+        :param memory_budget: The largest number of bytes of tiles held in
+        memory by the operations of the TiledMatrix. Optional parameter,
+        defaults to 64 MiB.
+        :return: The TiledMatrix.
+        """
+        from MatrixMath.TiledMatrix import TiledMatrix
+        return TiledMatrix.from_matrix(self, tile_size, path, memory_budget)
+
+    @classmethod
+    def from_blocks(cls, blocks) -> Matrix:
+        """
+        Returns a Matrix made by joining a grid of Matrices. All blocks in a
+        block row must have the same number of rows, and all blocks in a
+        block column the same number of columns.
+        :param blocks: The blocks, as a list of block rows, each a list of
+        Matrices.
+        :return: The joined Matrix.
+        """
+        from MatrixMath.BlockMatrix import BlockMatrix
+        return BlockMatrix(blocks).to_matrix()
+
+    def to_blocks(self, row_sizes, col_sizes=None, executor=None):
+        """
+        Returns self split into a BlockMatrix, whose find_inverse(),
+        find_determinant() and solve() work recursively on Schur complements
+        of the blocks and skip blocks that are entirely zero, and whose block
+        products can be found in parallel through an executor.
+        :param row_sizes: The number of rows of each block row, as a list, or
+        an int giving the number of rows of every block row but the last.
+        :param col_sizes: The number of columns of each block column, in the
+        same form. Optional parameter, defaults to row_sizes.
+        :param executor: The executor that block products are submitted to,
+        such as a concurrent.futures.ProcessPoolExecutor. Optional parameter,
+        defaults to None, in which case products are found one after
+        another.
+        :return: The BlockMatrix.
+        """
+        from MatrixMath.BlockMatrix import BlockMatrix
+        return BlockMatrix.from_matrix(self, row_sizes, col_sizes, executor)
+
+    def solve_iterative(self, constants, method: str = 'conjugate_gradient',
+                        **options):
+        """
+        Solves the linear system whose coefficients are self and whose
+        right-hand side is constants approximately, in floats, with the
+        Jacobi, Gauss-Seidel/SOR, conjugate gradient or BiCGSTAB method. Meant
+        for large sparse systems, where find_solution() and solve() would
+        take too long. See Iterative.solve_iterative() for the methods and
+        options.
+        :param constants: The right-hand side, either a list with one entry
+        per row of self or a Matrix with one column.
+        :param method: The name of the method: 'jacobi', 'gauss_seidel',
+        'conjugate_gradient' or 'bicgstab'. Optional parameter, defaults to
+        'conjugate_gradient'.
+        :return: The IterativeResult, holding the solution, whether it
+        converged and the norm of the residual after each iteration.
+        """
+        from MatrixMath.Iterative import solve_iterative
+        return solve_iterative(self, constants, method, **options)
+
     def store_value(self, value, row: int, col: int):
         """
-        Stores a value of type int or Fraction into position row x col of the
-        matrix.
+        Stores an int or a rational of any backend into position row x col of
+        the matrix. Rationals are converted to the backend of self.
         :param value: The value to be stored.
         :param row: The row it is to be stored in.
         :param col: The column it is to be stored in.
         """
 
         # Ensures that all parameters are of appropriate types.
-        if not isinstance(value, int) and not isinstance(value, Fraction) \
-                or not isinstance(row, int) or not isinstance(col, int):
+        if not isinstance(row, int) or not isinstance(col, int):
             raise TypeError
 
-        # Ensures that value is of a valid type.
-        if isinstance(value, int):
-            value = Fraction(value, 1)
-
-        self.matrix[row - 1][col - 1] = value
+        # Ensures that value is of a valid type. In the integer domain, value
+        # is kept as an int instead.
+        self._storage.set(row - 1, col - 1,
+                          checked_entry(value, self.integer, self.backend))
 
     def input_matrix(self):
         """
@@ -824,4 +2187,9 @@ class Matrix:
             for j in range(self.cols):
                 print("Value to be input in position ("
                       + str(i + 1) + ", " + str(j + 1) + ")")
-                self.matrix[i][j] = Fraction.input_fraction()
+                value = Fraction.input_fraction()
+                if self.integer:
+                    value = integer_entry(value)
+                else:
+                    value = self.backend.convert(value)
+                self._storage.set(i, j, value)
@@ -0,0 +1,462 @@
+from __future__ import annotations
+from math import factorial
+from MatrixMath.Matrix import Matrix, scalar_entry
+from MatrixMath.Storage import Storage
+from MatrixMath.Backend import get_backend, is_rational, to_ratio
+
+# NumPy is optional. MatrixBatch can only be used when it is installed.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# The largest matrices handled by the closed-form kernels. Larger batches
+# fall back to NumPy's linear algebra for floats and to Matrix for exact
+# results.
+CLOSED_FORM_SIZE = 4
+
+
+def fits_int64(terms: int, *bounds: int) -> bool:
+    """
+    Returns True if a sum of terms products, each of one value bounded by
+    every bound, cannot overflow an int64.
+    :param terms: The number of products summed.
+    :param bounds: The largest absolute value of each factor of a product.
+    :return: True if the sum always fits in an int64.
+    """
+    product = terms
+    for bound in bounds:
+        product *= bound
+    return product < 2 ** 63
+
+
+def closed_form_determinant(data):
+    """
+    Returns the determinants of a stack of n x n matrices, n at most 4, using
+    the closed-form expansion for each size. Works on arrays of any dtype,
+    including object arrays of Python ints.
+    :param data: An array of shape (K, n, n).
+    :return: An array of K determinants.
+    """
+    size = data.shape[1]
+    a = [[data[:, i, j] for j in range(size)] for i in range(size)]
+
+    if size == 1:
+        return a[0][0].copy()
+    if size == 2:
+        return a[0][0] * a[1][1] - a[0][1] * a[1][0]
+    if size == 3:
+        return a[0][0] * (a[1][1] * a[2][2] - a[1][2] * a[2][1]) \
+            - a[0][1] * (a[1][0] * a[2][2] - a[1][2] * a[2][0]) \
+            + a[0][2] * (a[1][0] * a[2][1] - a[1][1] * a[2][0])
+
+    # Laplace expansion along the first two rows, as a sum of products of
+    # the 2 x 2 minors of the top and bottom halves.
+    s, c = two_by_two_minors(a)
+    return s[0] * c[5] - s[1] * c[4] + s[2] * c[3] \
+        + s[3] * c[2] - s[4] * c[1] + s[5] * c[0]
+
+
+def two_by_two_minors(a: list) -> tuple:
+    """
+    Returns the six 2 x 2 minors of the first two rows and the six of the
+    last two rows of a stack of 4 x 4 matrices.
+    :param a: The entries of the matrices, as a 4 x 4 list of arrays.
+    :return: The two lists of minors.
+    """
+    s = [a[0][0] * a[1][1] - a[1][0] * a[0][1],
+         a[0][0] * a[1][2] - a[1][0] * a[0][2],
+         a[0][0] * a[1][3] - a[1][0] * a[0][3],
+         a[0][1] * a[1][2] - a[1][1] * a[0][2],
+         a[0][1] * a[1][3] - a[1][1] * a[0][3],
+         a[0][2] * a[1][3] - a[1][2] * a[0][3]]
+    c = [a[2][0] * a[3][1] - a[3][0] * a[2][1],
+         a[2][0] * a[3][2] - a[3][0] * a[2][2],
+         a[2][0] * a[3][3] - a[3][0] * a[2][3],
+         a[2][1] * a[3][2] - a[3][1] * a[2][2],
+         a[2][1] * a[3][3] - a[3][1] * a[2][3],
+         a[2][2] * a[3][3] - a[3][2] * a[2][3]]
+    return s, c
+
+
+def closed_form_adjugate(data) -> tuple:
+    """
+    Returns the adjugates and determinants of a stack of n x n matrices, n at
+    most 4, using the closed-form cofactors for each size. The inverse of
+    each matrix is its adjugate divided by its determinant.
+    :param data: An array of shape (K, n, n).
+    :return: The adjugates as an array of shape (K, n, n) and the
+    determinants as an array of K values.
+    """
+    size = data.shape[1]
+    a = [[data[:, i, j] for j in range(size)] for i in range(size)]
+
+    if size == 1:
+        adjugate = [[numpy.ones_like(a[0][0])]]
+        determinant = a[0][0].copy()
+    elif size == 2:
+        adjugate = [[a[1][1], -a[0][1]],
+                    [-a[1][0], a[0][0]]]
+        determinant = a[0][0] * a[1][1] - a[0][1] * a[1][0]
+    elif size == 3:
+        # The cofactor of each entry, written straight into the transposed
+        # position.
+        adjugate = [[a[1][1] * a[2][2] - a[1][2] * a[2][1],
+                     a[0][2] * a[2][1] - a[0][1] * a[2][2],
+                     a[0][1] * a[1][2] - a[0][2] * a[1][1]],
+                    [a[1][2] * a[2][0] - a[1][0] * a[2][2],
+                     a[0][0] * a[2][2] - a[0][2] * a[2][0],
+                     a[0][2] * a[1][0] - a[0][0] * a[1][2]],
+                    [a[1][0] * a[2][1] - a[1][1] * a[2][0],
+                     a[0][1] * a[2][0] - a[0][0] * a[2][1],
+                     a[0][0] * a[1][1] - a[0][1] * a[1][0]]]
+        determinant = a[0][0] * adjugate[0][0] + a[0][1] * adjugate[1][0] \
+            + a[0][2] * adjugate[2][0]
+    else:
+        # Every 3 x 3 cofactor is a sum of an entry times a 2 x 2 minor of the
+        # other half of the matrix.
+        s, c = two_by_two_minors(a)
+        adjugate = [[a[1][1] * c[5] - a[1][2] * c[4] + a[1][3] * c[3],
+                     -a[0][1] * c[5] + a[0][2] * c[4] - a[0][3] * c[3],
+                     a[3][1] * s[5] - a[3][2] * s[4] + a[3][3] * s[3],
+                     -a[2][1] * s[5] + a[2][2] * s[4] - a[2][3] * s[3]],
+                    [-a[1][0] * c[5] + a[1][2] * c[2] - a[1][3] * c[1],
+                     a[0][0] * c[5] - a[0][2] * c[2] + a[0][3] * c[1],
+                     -a[3][0] * s[5] + a[3][2] * s[2] - a[3][3] * s[1],
+                     a[2][0] * s[5] - a[2][2] * s[2] + a[2][3] * s[1]],
+                    [a[1][0] * c[4] - a[1][1] * c[2] + a[1][3] * c[0],
+                     -a[0][0] * c[4] + a[0][1] * c[2] - a[0][3] * c[0],
+                     a[3][0] * s[4] - a[3][1] * s[2] + a[3][3] * s[0],
+                     -a[2][0] * s[4] + a[2][1] * s[2] - a[2][3] * s[0]],
+                    [-a[1][0] * c[3] + a[1][1] * c[1] - a[1][2] * c[0],
+                     a[0][0] * c[3] - a[0][1] * c[1] + a[0][2] * c[0],
+                     -a[3][0] * s[3] + a[3][1] * s[1] - a[3][2] * s[0],
+                     a[2][0] * s[3] - a[2][1] * s[1] + a[2][2] * s[0]]]
+        determinant = s[0] * c[5] - s[1] * c[4] + s[2] * c[3] \
+            + s[3] * c[2] - s[4] * c[1] + s[5] * c[0]
+
+    adjugate = numpy.stack([numpy.stack(row, axis=-1) for row in adjugate],
+                           axis=-2)
+    return adjugate, determinant
+
+
+def float_entry(entry):
+    """
+    Returns entry, an int, a float or a rational of any backend, as a float
+    if it is a rational. Ints and floats are returned as they are.
+    :param entry: The entry.
+    :return: The entry, with rationals rounded to the nearest float.
+    """
+    if is_rational(entry):
+        numerator, denominator = to_ratio(entry)
+        return numerator / denominator
+    return entry
+
+
+class MatrixBatch:
+    """
+    A batch of K matrices of the same dimensions, stored together in one
+    NumPy array of shape (K, rows, cols). Every operation works on the whole
+    batch at once, so that millions of small determinants, inverses and
+    products cost a few array operations rather than millions of Matrix
+    objects. For matrices of at most 4 x 4, the determinant and inverse use
+    closed-form expressions instead of elimination.
+
+    A batch holds either floats, as float64, or ints, as int64. Operations on
+    an int batch are exact: when a determinant or product could overflow an
+    int64, it is computed with Python ints in an object array instead. The
+    exact inverse of an int batch is given as rational Matrices.
+    """
+    def __init__(self, data):
+        """
+        Creates a batch from an array or nested sequence of shape
+        (K, rows, cols). Requires NumPy.
+        :param data: The entries, as ints or floats.
+        """
+
+        # Ensures that NumPy is installed.
+        if numpy is None:
+            raise ImportError
+
+        data = numpy.asarray(data)
+
+        # Ensures that data is a stack of matrices.
+        if data.ndim != 3:
+            raise ValueError
+
+        # Ensures that the entries are ints or floats. An object array is
+        # only kept if it holds Python ints too large for an int64. Unsigned
+        # entries from 2 ** 63 up would wrap around in an int64, so they are
+        # turned into Python ints instead.
+        if data.dtype.kind == 'u' and data.size \
+                and data.max() > numpy.iinfo(numpy.int64).max:
+            data = data.astype(object)
+        elif data.dtype.kind in 'biu':
+            data = data.astype(numpy.int64, copy=False)
+        elif data.dtype.kind == 'f':
+            data = data.astype(numpy.float64, copy=False)
+        elif data.dtype.kind != 'O' \
+                or not all(isinstance(entry, int) for entry in data.flat):
+            raise TypeError
+
+        self.data = data
+        self.count, self.rows, self.cols = data.shape
+
+    @classmethod
+    def from_matrices(cls, matrices) -> MatrixBatch:
+        """
+        Returns a batch holding the entries of a sequence of Matrices of the
+        same dimensions. The batch holds ints if every entry is an int, and
+        floats otherwise, so rational entries are rounded.
+        :param matrices: The Matrices.
+        :return: The MatrixBatch.
+        """
+
+        matrices = list(matrices)
+
+        # Ensures that every Matrix has the same dimensions.
+        if not matrices or not all(isinstance(matrix, Matrix)
+                                   for matrix in matrices):
+            raise TypeError
+        rows, cols = matrices[0].rows, matrices[0].cols
+        if any(matrix.rows != rows or matrix.cols != cols
+               for matrix in matrices):
+            raise ValueError
+
+        # Rationals are rounded to the nearest float.
+        entries = [[float_entry(entry) for entry in matrix._flat()]
+                   if not matrix.integer else list(matrix._flat())
+                   for matrix in matrices]
+        return cls(numpy.array(entries).reshape(len(matrices), rows, cols))
+
+    @property
+    def integer(self) -> bool:
+        """
+        Whether or not the batch holds ints.
+        """
+        return self.data.dtype.kind != 'f'
+
+    def __len__(self):
+        """
+        Returns the number of matrices in the batch.
+        """
+        return self.count
+
+    def __getitem__(self, index: int) -> Matrix:
+        """
+        Returns one matrix of the batch as a Matrix, which is an integer Matrix
+        if the batch holds ints. The floats of a float batch are converted
+        exactly to rationals of the default backend through their integer
+        ratio, so a matrix holding infinite or NaN entries raises ValueError.
+        :param index: The position of the matrix in the batch.
+        :return: The Matrix.
+        """
+        entries = self.data[index].ravel().tolist()
+        if self.integer:
+            return Matrix.from_storage(
+                Storage.from_flat(self.rows, self.cols, entries), True)
+        backend = get_backend()
+        return Matrix.from_flat(self.rows, self.cols,
+                                [scalar_entry(entry, backend)
+                                 for entry in entries],
+                                False, backend)
+
+    def to_matrices(self) -> list:
+        """
+        Returns every matrix of the batch as a Matrix.
+        :return: The list of Matrices.
+        """
+        return [self[index] for index in range(self.count)]
+
+    def largest_entry(self) -> int:
+        """
+        Returns the largest absolute value of any entry of an int batch.
+        :return: The largest absolute value, as a Python int.
+        """
+        if not self.data.size:
+            return 0
+        if self.data.dtype.kind == 'O':
+            return max(abs(entry) for entry in self.data.flat)
+        return max(abs(int(self.data.max())), abs(int(self.data.min())))
+
+    def exact_data(self, terms: int, *bounds: int):
+        """
+        Returns the entries of an int batch in a dtype that holds every sum
+        of terms products of values bounded by bounds exactly: int64 when
+        that cannot overflow, and Python ints otherwise.
+        :param terms: The number of products summed.
+        :param bounds: The largest absolute value of each factor of a product.
+        :return: The array.
+        """
+        if self.data.dtype.kind != 'O' and fits_int64(terms, *bounds):
+            return self.data
+        return self.data.astype(object)
+
+    def transpose(self) -> MatrixBatch:
+        """
+        Returns the batch of the transposes of every matrix.
+        :return: The transposed MatrixBatch.
+        """
+        return MatrixBatch(numpy.ascontiguousarray(
+            self.data.transpose(0, 2, 1)))
+
+    def determinant(self):
+        """
+        Returns the determinant of every matrix, or None if the matrices are
+        not square. The determinants of an int batch are exact.
+        :return: An array of K determinants: float64 for a float batch, and
+        int64 or Python ints for an int batch.
+        """
+
+        # The determinant is only defined for n x n matrices.
+        if self.rows != self.cols:
+            return None
+
+        size = self.rows
+        if not self.integer:
+            if size <= CLOSED_FORM_SIZE:
+                return closed_form_determinant(self.data)
+            return numpy.linalg.det(self.data)
+
+        # The closed forms sum size! products of size entries.
+        bound = self.largest_entry()
+        if size <= CLOSED_FORM_SIZE:
+            return closed_form_determinant(
+                self.exact_data(factorial(size), *[bound] * size))
+
+        # Larger int matrices use the fraction-free elimination of Matrix.
+        return numpy.array([matrix.find_determinant()
+                            for matrix in self.to_matrices()], dtype=object)
+
+    def inverse(self, exact: bool = False, backend=None):
+        """
+        Returns the inverse of every matrix, or None if the matrices are not
+        square.
+        :param exact: Whether or not the inverses of an int batch are found
+        exactly, as rational Matrices. Optional parameter, defaults to False.
+        :param backend: The ScalarBackend, or the name of one, for the exact
+        inverses. Optional parameter, defaults to the default backend.
+        :return: If exact is False, a float MatrixBatch in which the inverse
+        of each singular matrix is filled with NaN. If exact is True, a list
+        holding a Matrix, or None if singular, for each matrix.
+        """
+
+        # Ensures that exact inverses are only asked of an int batch.
+        if not isinstance(exact, bool):
+            raise TypeError
+        if exact and not self.integer:
+            raise TypeError
+
+        # The inverse is only defined for n x n matrices.
+        if self.rows != self.cols:
+            return None
+
+        size = self.rows
+        if exact:
+            return self.exact_inverse(get_backend(backend))
+
+        data = self.data.astype(numpy.float64, copy=False)
+        if size <= CLOSED_FORM_SIZE:
+            adjugate, determinant = closed_form_adjugate(data)
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                inverse = adjugate / determinant[:, None, None]
+            inverse[determinant == 0] = numpy.nan
+            return MatrixBatch(inverse)
+
+        # Larger matrices use NumPy, which inverts the batch at once unless
+        # one of them is singular.
+        try:
+            return MatrixBatch(numpy.linalg.inv(data))
+        except numpy.linalg.LinAlgError:
+            inverse = numpy.full_like(data, numpy.nan)
+            for index in range(self.count):
+                try:
+                    inverse[index] = numpy.linalg.inv(data[index])
+                except numpy.linalg.LinAlgError:
+                    pass
+            return MatrixBatch(inverse)
+
+    def exact_inverse(self, backend) -> list:
+        """
+        Returns the exact inverse of every matrix of an int batch as a Matrix
+        of rationals, or None for a singular matrix.
+        :param backend: The ScalarBackend of the rationals.
+        :return: The list of inverses.
+        """
+        size = self.rows
+        if size > CLOSED_FORM_SIZE:
+            return [matrix.convert(backend).find_inverse()
+                    for matrix in self.to_matrices()]
+
+        bound = self.largest_entry()
+        adjugates, determinants = closed_form_adjugate(
+            self.exact_data(factorial(size), *[bound] * size))
+
+        from_ratio = backend.from_ratio
+        inverses = []
+        for adjugate, determinant in zip(adjugates.tolist(),
+                                         determinants.tolist()):
+            if not determinant:
+                inverses.append(None)
+                continue
+            inverses.append(Matrix.from_storage(
+                Storage.from_flat(size, size,
+                                  [from_ratio(entry, determinant)
+                                   for row in adjugate for entry in row]),
+                False, backend))
+        return inverses
+
+    def matmul(self, other) -> MatrixBatch:
+        """
+        Returns the batch of products of every matrix of self with the
+        matrix in the same position of other. other may also be a single
+        Matrix, which multiplies every matrix of self. The products of two int
+        batches are exact.
+        :param other: A MatrixBatch of the same length, or a Matrix.
+        :return: The MatrixBatch of products.
+        """
+
+        if isinstance(other, Matrix):
+            other = MatrixBatch.from_matrices([other])
+        if not isinstance(other, MatrixBatch):
+            raise TypeError
+
+        # Ensures that the matrices can be multiplied and that there is one
+        # matrix of other for each, or a single one for all.
+        if self.cols != other.rows \
+                or other.count not in (1, self.count):
+            raise ValueError
+
+        if self.integer and other.integer:
+            left = self.exact_data(self.cols, self.largest_entry(),
+                                   other.largest_entry())
+            right = other.data.astype(left.dtype, copy=False)
+            if left.dtype.kind == 'O':
+                # matmul has no loop for object arrays, so the products are
+                # summed with broadcasting instead.
+                product = (left[:, :, :, None] * right[:, None, :, :]) \
+                    .sum(axis=2)
+            else:
+                product = numpy.matmul(left, right)
+            return MatrixBatch(product)
+
+        return MatrixBatch(numpy.matmul(
+            self.data.astype(numpy.float64, copy=False),
+            other.data.astype(numpy.float64, copy=False)))
+
+    def __mul__(self, other) -> MatrixBatch:
+        """
+        Multiplies the batch with another batch or a Matrix. See matmul().
+        :param other: A MatrixBatch of the same length, or a Matrix.
+        :return: The MatrixBatch of products.
+        """
+        return self.matmul(other)
+
+    def __matmul__(self, other) -> MatrixBatch:
+        """
+        Multiplies the batch with another batch or a Matrix. See matmul().
+        :param other: A MatrixBatch of the same length, or a Matrix.
+        :return: The MatrixBatch of products.
+        """
+        return self.matmul(other)
@@ -0,0 +1,290 @@
+from __future__ import annotations
+from MatrixMath.Matrix import Matrix
+from MatrixMath.Storage import Storage
+
+
+class MatrixView(Matrix):
+    """
+    A read-only view of part of a Matrix. The view stores the Matrix it was
+    taken from along with the rows and columns it selects, so creating one
+    copies no entries. Changes made to the viewed Matrix are visible through
+    the view. A MatrixView can be used wherever a Matrix is read, for example
+    when finding a determinant, multiplying or comparing, and materialize()
+    returns an ordinary Matrix when an independent copy is needed.
+    """
+    def __init__(self, base: Matrix, row_map, col_map,
+                 transposed: bool = False):
+        """
+        Creates a view of base. Usually created through Matrix.view(),
+        Matrix.row_view(), Matrix.col_view(), Matrix.minor_view() or
+        Matrix.transpose_view() rather than directly.
+        :param base: The Matrix being viewed.
+        :param row_map: The indices (counting from 0) of the rows of base
+        selected by the view, in order.
+        :param col_map: The indices (counting from 0) of the columns of base
+        selected by the view, in order.
+        :param transposed: Whether or not the view shows the transpose of the
+        selected entries. Optional parameter, defaults to False.
+        """
+
+        # Ensures that base is a Matrix.
+        if not isinstance(base, Matrix):
+            raise TypeError
+
+        # A view of a view is a view of the original Matrix with the two sets
+        # of selections combined.
+        if isinstance(base, MatrixView):
+            if base.transposed:
+                row_map, col_map = col_map, row_map
+                transposed = not transposed
+            row_map = base.compose(base.row_map, row_map)
+            col_map = base.compose(base.col_map, col_map)
+            base = base.base
+
+        # Ensures that the view has at least one row and one column.
+        if not len(row_map) or not len(col_map):
+            raise ValueError
+
+        self.base = base
+        self.row_map = row_map
+        self.col_map = col_map
+        self.transposed = transposed
+        self.integer = base.integer
+        self.backend = base.backend
+        self.max_denominator = base.max_denominator
+        self.rounding_error = base.rounding_error
+
+        if transposed:
+            self.rows = len(col_map)
+            self.cols = len(row_map)
+        else:
+            self.rows = len(row_map)
+            self.cols = len(col_map)
+
+    @staticmethod
+    def compose(outer, inner):
+        """
+        Returns the indices of the base Matrix selected by taking the indices
+        inner of a view whose own selection is outer.
+        :param outer: The selection of the existing view.
+        :param inner: The selection taken from the existing view.
+        :return: The combined selection.
+        """
+
+        # Slicing a range gives another range, so slices of slices are never
+        # expanded into lists.
+        if isinstance(inner, range) and isinstance(outer, range):
+            return outer[inner.start:inner.stop:inner.step]
+        return [outer[i] for i in inner]
+
+    @property
+    def matrix(self):
+        """
+        The entries of the view as a tuple of row tuples. Provided so that
+        code reading self.matrix[i][j] keeps working. The tuples are built on
+        every access, so methods of the view read through _rows() instead.
+        :return: The entries of the view.
+        """
+        return tuple(tuple(row) for row in self._rows())
+
+    def _full_cols(self) -> bool:
+        """
+        Returns True if the view selects every column of its base Matrix in
+        order, in which case whole rows of the base can be sliced out.
+        :return: True if all columns of the base are selected in order.
+        """
+        return isinstance(self.col_map, range) \
+            and self.col_map == range(self.base.cols)
+
+    def _selected_rows(self) -> list:
+        """
+        Returns the selected entries of the base Matrix as a list of rows,
+        ignoring whether or not the view is transposed. Rows are found in the
+        flat storage of the base by offset arithmetic, and are sliced out
+        whole when every column is selected.
+        :return: The selected rows.
+        """
+        buffer = self.base._flat()
+        base_cols = self.base.cols
+        if self._full_cols():
+            return [buffer[row * base_cols:(row + 1) * base_cols]
+                    for row in self.row_map]
+        return [[buffer[row * base_cols + col] for col in self.col_map]
+                for row in self.row_map]
+
+    def _selected_columns(self) -> list:
+        """
+        Returns the selected entries of the base Matrix as a list of columns,
+        ignoring whether or not the view is transposed.
+        :return: The selected columns.
+        """
+        buffer = self.base._flat()
+        base_cols = self.base.cols
+        if isinstance(self.row_map, range) \
+                and self.row_map == range(self.base.rows):
+            return [buffer[col::base_cols] for col in self.col_map]
+        offsets = [row * base_cols for row in self.row_map]
+        return [[buffer[offset + col] for offset in offsets]
+                for col in self.col_map]
+
+    def _flat(self) -> list:
+        """
+        Returns the entries of the view in row-major order as a list.
+        :return: The entries of the view.
+        """
+        return [entry for row in self._rows() for entry in row]
+
+    def _rows(self) -> list:
+        """
+        Returns the rows of the view as a list of row lists, which must be
+        treated as read-only.
+        :return: The rows of the view.
+        """
+        if self.transposed:
+            return self._selected_columns()
+        return self._selected_rows()
+
+    def _row(self, row: int) -> list:
+        """
+        Returns the row of the view with index row (counting from 0) as a
+        list, which must be treated as read-only.
+        :param row: The index of the row.
+        :return: The row as a list.
+        """
+        buffer = self.base._flat()
+        base_cols = self.base.cols
+        if self.transposed:
+            col = self.col_map[row]
+            return [buffer[i * base_cols + col] for i in self.row_map]
+        offset = self.row_map[row] * base_cols
+        if self._full_cols():
+            return buffer[offset:offset + base_cols]
+        return [buffer[offset + col] for col in self.col_map]
+
+    def _columns(self) -> list:
+        """
+        Returns the columns of the view as a list of sequences, which must be
+        treated as read-only. The columns of a transposed view are the rows of
+        its base, so they are sliced out whole when every column is selected.
+        :return: The columns of the view.
+        """
+        if self.transposed:
+            return self._selected_rows()
+        return self._selected_columns()
+
+    def _transposed_storage(self) -> Storage:
+        """
+        Returns a new Storage holding the transpose of the view.
+        :return: The Storage.
+        """
+        return Storage.from_flat(
+            self.cols, self.rows,
+            [entry for column in self._columns() for entry in column])
+
+    def copy_matrix(self) -> Matrix:
+        """
+        Returns the entries of the view as a new Matrix.
+        :return: The new Matrix.
+        """
+        return Matrix.from_storage(
+            Storage.from_flat(self.rows, self.cols, self._flat()),
+            self.integer, self.backend)
+
+    def materialize(self) -> Matrix:
+        """
+        Returns the entries of the view as a new Matrix that no longer depends
+        on the viewed Matrix.
+        :return: The new Matrix.
+        """
+        return self.copy_matrix()
+
+    def view(self, row_slice: slice = slice(None),
+             col_slice: slice = slice(None)) -> MatrixView:
+        """
+        Returns a read-only MatrixView of the submatrix of the view selected
+        by row_slice and col_slice. Both count from 0.
+        :param row_slice: The slice of rows to be kept.
+        :param col_slice: The slice of columns to be kept.
+        :return: The MatrixView.
+        """
+
+        # Ensures that both slices are slices.
+        if not isinstance(row_slice, slice) \
+                or not isinstance(col_slice, slice):
+            raise TypeError
+
+        return MatrixView(self, range(self.rows)[row_slice],
+                          range(self.cols)[col_slice])
+
+    def minor_view(self, row: int, col: int) -> MatrixView:
+        """
+        Returns a read-only MatrixView of the view with one row and one column
+        skipped.
+        :param row: The row to be skipped.
+        :param col: The column to be skipped.
+        :return: The MatrixView.
+        """
+
+        # Ensures that row and col are both ints.
+        if not isinstance(row, int) or not isinstance(col, int):
+            raise TypeError
+
+        # Ensures that row and col are both valid rows and cols of self.
+        if not 0 < row <= self.rows or not 0 < col <= self.cols:
+            raise ValueError
+
+        return MatrixView(self,
+                          [i for i in range(self.rows) if i != row - 1],
+                          [j for j in range(self.cols) if j != col - 1])
+
+    def transpose_view(self) -> MatrixView:
+        """
+        Returns a read-only MatrixView of the transpose of the view.
+        :return: The MatrixView.
+        """
+        return MatrixView(self, range(self.rows), range(self.cols), True)
+
+    def add_to_entry(self, other, row: int, col: int) -> Matrix:
+        """
+        Returns a Matrix holding the entries of the view with other added to
+        the entry at row x col. The view itself is not changed.
+        """
+        return self.materialize().add_to_entry(other, row, col)
+
+    def add_scaled(self, other: Matrix, factor=1):
+        """
+        Views are read-only, so adding to one in place always raises a
+        TypeError.
+        """
+        raise TypeError
+
+    def __iadd__(self, other):
+        """
+        Views are read-only, so += gives a new Matrix, as it does for
+        immutable types.
+        """
+        return NotImplemented
+
+    def __isub__(self, other):
+        """
+        Views are read-only, so -= gives a new Matrix.
+        """
+        return NotImplemented
+
+    def __imul__(self, other):
+        """
+        Views are read-only, so *= gives a new Matrix.
+        """
+        return NotImplemented
+
+    def store_value(self, value, row: int, col: int):
+        """
+        Views are read-only, so storing a value always raises a TypeError.
+        """
+        raise TypeError
+
+    def input_matrix(self):
+        """
+        Views are read-only, so inputting entries always raises a TypeError.
+        """
+        raise TypeError
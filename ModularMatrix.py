@@ -0,0 +1,599 @@
+from __future__ import annotations
+from array import array
+from operator import mul
+from MatrixMath.Matrix import Matrix
+from MatrixMath.Storage import Storage
+from MatrixMath.Precheck import is_prime, residue
+from MatrixMath.MatrixBatch import fits_int64
+from MatrixMath.Elementwise import int64_view, from_int64
+
+# NumPy is optional. Without it, products and eliminations run over Python
+# ints, which are always exact but much slower.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# The largest modulus, so that every residue is a machine-sized int.
+MAX_MODULUS = 2 ** 62
+
+
+def limb_bits(modulus: int, terms: int) -> int:
+    """
+    Returns the number of bits of the limbs the right factor of a product is
+    split into, so that a sum of terms products of a residue and a limb, and
+    a residue shifted by one limb, both fit in an int64.
+    :param modulus: The modulus.
+    :param terms: The number of products summed for each entry.
+    :return: The number of bits, 0 or less if no split is safe.
+    """
+    return 62 - (modulus - 1).bit_length() - terms.bit_length()
+
+
+def matmul_modulo(first: array, second: array, rows: int, inner: int,
+                  cols: int, modulus: int) -> array:
+    """
+    Returns the product of two flat buffers of residues modulo modulus. With
+    NumPy, the product is found by int64 matrix products: in one product when
+    no sum of inner products of residues can overflow, and otherwise by
+    splitting second into limbs of limb_bits() bits, multiplying first by
+    each limb, and combining the reduced products from the highest limb down,
+    which keeps every value below 2 ** 63. Moduli too large for any split
+    fall back to Python ints.
+    :param first: The residues of the rows x inner left factor.
+    :param second: The residues of the inner x cols right factor.
+    :param rows: The number of rows of first.
+    :param inner: The number of columns of first and rows of second.
+    :param cols: The number of columns of second.
+    :param modulus: The modulus.
+    :return: The residues of the product, as an array('q').
+    """
+    bits = limb_bits(modulus, inner)
+    if numpy is None or (bits < 1 and not fits_int64(inner, modulus - 1,
+                                                     modulus - 1)):
+        columns = [second[col::cols] for col in range(cols)]
+        return array('q', [sum(map(mul, first[start:start + inner],
+                                   column)) % modulus
+                           for start in range(0, rows * inner, inner)
+                           for column in columns])
+
+    left = int64_view(first).reshape(rows, inner)
+    right = int64_view(second).reshape(inner, cols)
+    if fits_int64(inner, modulus - 1, modulus - 1):
+        return from_int64(left @ right % modulus)
+
+    limbs = []
+    mask = (1 << bits) - 1
+    while right.any():
+        limbs.append(right & mask)
+        right = right >> bits
+    result = numpy.zeros((rows, cols), dtype=numpy.int64)
+    for limb in reversed(limbs):
+        result = ((result << bits) + left @ limb % modulus) % modulus
+    return from_int64(result)
+
+
+def gauss_jordan(values: array, rows: int, cols: int, modulus: int,
+                 pivot_limit: int = None) -> tuple:
+    """
+    Reduces a flat buffer of residues modulo a prime to reduced row echelon
+    form, dividing each pivot row by its pivot through its modular inverse.
+    With NumPy, and a modulus whose products fit in an int64, every pivot
+    updates all the other rows in one vectorized step.
+    :param values: The residues, which are not changed.
+    :param rows: The number of rows.
+    :param cols: The number of columns.
+    :param modulus: The prime modulus.
+    :param pivot_limit: The number of leading columns searched for pivots.
+    Optional parameter, defaults to None, for every column.
+    :return: The reduced rows as a list of row lists, the pivot columns, and
+    the determinant of the leading square block modulo modulus.
+    """
+    if pivot_limit is None:
+        pivot_limit = cols
+    pivot_cols = []
+    determinant = 1
+    row = 0
+
+    if numpy is not None and fits_int64(1, modulus - 1, modulus - 1):
+        data = numpy.array(values, dtype=numpy.int64).reshape(rows, cols)
+        for col in range(pivot_limit):
+            if row == rows:
+                break
+            candidates = numpy.flatnonzero(data[row:, col])
+            if not candidates.size:
+                continue
+            pivot_row = row + int(candidates[0])
+            if pivot_row != row:
+                data[[row, pivot_row]] = data[[pivot_row, row]]
+                determinant = -determinant
+            pivot = int(data[row, col])
+            determinant = determinant * pivot % modulus
+            data[row] = data[row] * pow(pivot, -1, modulus) % modulus
+            factors = data[:, col].copy()
+            factors[row] = 0
+            data = (data - numpy.outer(factors, data[row])) % modulus
+            pivot_cols.append(col)
+            row += 1
+        reduced = data.tolist()
+    else:
+        reduced = [list(values[start:start + cols])
+                   for start in range(0, rows * cols, cols)]
+        for col in range(pivot_limit):
+            if row == rows:
+                break
+            pivot_row = next((i for i in range(row, rows)
+                              if reduced[i][col]), None)
+            if pivot_row is None:
+                continue
+            if pivot_row != row:
+                reduced[row], reduced[pivot_row] = \
+                    reduced[pivot_row], reduced[row]
+                determinant = -determinant
+            pivot = reduced[row][col]
+            determinant = determinant * pivot % modulus
+            inverse = pow(pivot, -1, modulus)
+            pivot_entries = [entry * inverse % modulus
+                             for entry in reduced[row]]
+            reduced[row] = pivot_entries
+            for i in range(rows):
+                factor = reduced[i][col]
+                if i != row and factor:
+                    reduced[i] = [(entry - factor * pivot_entry) % modulus
+                                  for entry, pivot_entry
+                                  in zip(reduced[i], pivot_entries)]
+            pivot_cols.append(col)
+            row += 1
+
+    if row < min(rows, pivot_limit):
+        determinant = 0
+    return reduced, pivot_cols, determinant % modulus
+
+
+class ModularMatrix:
+    """
+    A Matrix over the integers modulo m, whose entries are residues from 0 to
+    m - 1 held in one flat array('q'), so no entry ever grows. Products and
+    powers run through NumPy int64 matrix products with the reduction
+    arranged so that nothing overflows (see matmul_modulo()), and a power
+    takes about 2 * log2(power) products, so A ** (10 ** 18) is found in
+    milliseconds for a small A. When m is prime, elimination uses modular
+    inverses, giving the rank, determinant, inverse and solutions of linear
+    systems over GF(m) with no rationals at all. Other moduli only support
+    the ring operations and the determinant.
+    """
+    def __init__(self, rows: int, cols: int, modulus: int, values=None):
+        """
+        Creates a ModularMatrix.
+        :param rows: The number of rows.
+        :param cols: The number of columns.
+        :param modulus: The modulus m, an int from 2 to MAX_MODULUS.
+        :param values: The entries in row-major order: ints, or rationals of
+        any backend whose denominators are prime to m. Optional parameter,
+        defaults to None, for a Matrix of zeros.
+        """
+
+        # Ensures that the dimensions are positive ints and the modulus is an
+        # int of at most 62 bits.
+        if not isinstance(rows, int) or not isinstance(cols, int) \
+                or not isinstance(modulus, int):
+            raise TypeError
+        if rows <= 0 or cols <= 0 or not 2 <= modulus <= MAX_MODULUS:
+            raise ValueError
+
+        self.rows = rows
+        self.cols = cols
+        self.modulus = modulus
+        self.prime = is_prime(modulus)
+
+        if values is None:
+            self.values = array('q', bytes(8 * rows * cols))
+            return
+        values = [residue(value, modulus) for value in values]
+        if len(values) != rows * cols:
+            raise ValueError
+        if None in values:
+            raise ValueError
+        self.values = array('q', values)
+
+    @classmethod
+    def from_residues(cls, rows: int, cols: int, modulus: int,
+                      values: array) -> ModularMatrix:
+        """
+        Returns a ModularMatrix holding values, an array('q') of residues
+        that is adopted without being checked or copied.
+        """
+        matrix = cls.__new__(cls)
+        matrix.rows = rows
+        matrix.cols = cols
+        matrix.modulus = modulus
+        matrix.prime = is_prime(modulus)
+        matrix.values = values
+        return matrix
+
+    @classmethod
+    def from_rows(cls, rows, modulus: int) -> ModularMatrix:
+        """
+        Returns a ModularMatrix with the given rows.
+        :param rows: A non-empty list of rows of equal length.
+        :param modulus: The modulus.
+        :return: The ModularMatrix.
+        """
+        rows = [list(row) for row in rows]
+        if not rows:
+            raise ValueError
+        return cls(len(rows), len(rows[0]), modulus,
+                   [entry for row in rows for entry in row])
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix, modulus: int) -> ModularMatrix:
+        """
+        Returns the entries of a Matrix of ints or rationals modulo modulus.
+        :param matrix: The Matrix.
+        :param modulus: The modulus.
+        :return: The ModularMatrix.
+        """
+        if not isinstance(matrix, Matrix):
+            raise TypeError
+        return cls(matrix.rows, matrix.cols, modulus, matrix._flat())
+
+    @classmethod
+    def identity(cls, size: int, modulus: int) -> ModularMatrix:
+        """
+        Returns the size x size identity Matrix modulo modulus.
+        """
+        matrix = cls(size, size, modulus)
+        matrix.values[::size + 1] = array('q', [1]) * size
+        return matrix
+
+    def to_matrix(self) -> Matrix:
+        """
+        Returns the residues of self as an integer Matrix.
+        :return: The Matrix.
+        """
+        return Matrix.from_storage(
+            Storage(self.rows, self.cols, self.values[:]), True)
+
+    def like(self, rows: int, cols: int, values: array) -> ModularMatrix:
+        """
+        Returns a ModularMatrix with the modulus of self holding values.
+        """
+        return ModularMatrix.from_residues(rows, cols, self.modulus, values)
+
+    def copy_matrix(self) -> ModularMatrix:
+        """
+        Returns a copy of self with its own buffer.
+        """
+        return self.like(self.rows, self.cols, self.values[:])
+
+    def get(self, row: int, col: int) -> int:
+        """
+        Returns the residue at row x col, counting from 0.
+        :param row: The row.
+        :param col: The column.
+        :return: The residue.
+        """
+        if not 0 <= row < self.rows or not 0 <= col < self.cols:
+            raise IndexError
+        return self.values[row * self.cols + col]
+
+    def set(self, row: int, col: int, value):
+        """
+        Stores value modulo the modulus at row x col, counting from 0.
+        :param row: The row.
+        :param col: The column.
+        :param value: An int, or a rational whose denominator is prime to the
+        modulus.
+        """
+        if not 0 <= row < self.rows or not 0 <= col < self.cols:
+            raise IndexError
+        value = residue(value, self.modulus)
+        if value is None:
+            raise ValueError
+        self.values[row * self.cols + col] = value
+
+    def rows_list(self) -> list:
+        """
+        Returns the residues of self as a list of row lists.
+        """
+        return [self.values[start:start + self.cols].tolist()
+                for start in range(0, self.rows * self.cols, self.cols)]
+
+    def __str__(self):
+        """
+        Defines the string representation of a ModularMatrix, one row per
+        line followed by the modulus.
+        :return: The string representation of self.
+        """
+        return '\n'.join('[{}]'.format(' '.join(map(str, row)))
+                         for row in self.rows_list()) \
+            + ' (mod {})'.format(self.modulus)
+
+    def __repr__(self):
+        """
+        Defines the representation of a ModularMatrix.
+        :return: The representation of self.
+        """
+        return 'ModularMatrix({}, {})'.format(self.rows_list(),
+                                              self.modulus)
+
+    def __eq__(self, other) -> bool:
+        """
+        Checks to see if two ModularMatrices have the same modulus,
+        dimensions and residues. Overloads the == operator.
+        :param other: The ModularMatrix being compared to self.
+        :return: True if they are the same, False otherwise.
+        """
+        if not isinstance(other, ModularMatrix):
+            raise TypeError
+        return self.modulus == other.modulus and self.rows == other.rows \
+            and self.cols == other.cols and self.values == other.values
+
+    def __ne__(self, other) -> bool:
+        """
+        Checks to see if two ModularMatrices differ. Overloads the !=
+        operator.
+        """
+        return not self == other
+
+    def check_modulus(self, other: ModularMatrix):
+        """
+        Ensures that other is a ModularMatrix with the modulus of self.
+        :param other: The other ModularMatrix.
+        """
+        if not isinstance(other, ModularMatrix):
+            raise TypeError
+        if other.modulus != self.modulus:
+            raise ValueError
+
+    def combine(self, other: ModularMatrix, subtract: bool) -> ModularMatrix:
+        """
+        Returns self + other, or self - other if subtract is True.
+        """
+        self.check_modulus(other)
+        if self.rows != other.rows or self.cols != other.cols:
+            raise ValueError
+        modulus = self.modulus
+        left = int64_view(self.values)
+        right = int64_view(other.values)
+        if left is not None:
+            # Residues are below 2 ** 62, so neither the sum nor the
+            # difference overflows.
+            values = from_int64(((left - right) if subtract
+                                 else (left + right)) % modulus)
+        elif subtract:
+            values = array('q', [(first - second) % modulus
+                                 for first, second
+                                 in zip(self.values, other.values)])
+        else:
+            values = array('q', [(first + second) % modulus
+                                 for first, second
+                                 in zip(self.values, other.values)])
+        return self.like(self.rows, self.cols, values)
+
+    def __add__(self, other: ModularMatrix) -> ModularMatrix:
+        """
+        Adds two ModularMatrices with the same modulus and dimensions.
+        Overloads the binary + operator.
+        :param other: The ModularMatrix added to self.
+        :return: The sum.
+        """
+        return self.combine(other, False)
+
+    def __sub__(self, other: ModularMatrix) -> ModularMatrix:
+        """
+        Subtracts other from self. Overloads the binary - operator.
+        :param other: The ModularMatrix subtracted from self.
+        :return: The difference.
+        """
+        return self.combine(other, True)
+
+    def __neg__(self) -> ModularMatrix:
+        """
+        Returns self with every residue negated. Overloads the unary -
+        operator.
+        :return: The negated ModularMatrix.
+        """
+        return self * -1
+
+    def __mul__(self, other) -> ModularMatrix:
+        """
+        Multiplies self by another ModularMatrix with the same modulus, or by
+        an int or rational scalar taken modulo the modulus. Overloads the *
+        operator.
+        :param other: The ModularMatrix or scalar.
+        :return: The product.
+        """
+        modulus = self.modulus
+        if not isinstance(other, ModularMatrix):
+            if isinstance(other, Matrix):
+                return NotImplemented
+            factor = residue(other, modulus)
+            if factor is None:
+                raise ValueError
+            return self.like(self.rows, self.cols, array(
+                'q', [entry * factor % modulus for entry in self.values]))
+
+        # Ensures that the two ModularMatrices are possible to multiply.
+        self.check_modulus(other)
+        if self.cols != other.rows:
+            raise ValueError
+        return self.like(self.rows, other.cols,
+                         matmul_modulo(self.values, other.values, self.rows,
+                                       self.cols, other.cols, modulus))
+
+    def __rmul__(self, other):
+        """
+        Allows for the overloaded * operator from __mul__ to be commutative
+        for scalars. Same parameters as __mul__.
+        """
+        return self.__mul__(other)
+
+    def __matmul__(self, other: ModularMatrix) -> ModularMatrix:
+        """
+        Multiplies two ModularMatrices. Overloads the @ operator.
+        """
+        if not isinstance(other, ModularMatrix):
+            return NotImplemented
+        return self * other
+
+    def __pow__(self, power: int) -> ModularMatrix:
+        """
+        Raises a square ModularMatrix to the power of an int by repeated
+        squaring, which takes about 2 * log2(power) products. A negative
+        power is a power of the inverse, which must exist. Overloads the **
+        operator.
+        :param power: The power.
+        :return: The result of the exponentiation.
+        """
+        if not isinstance(power, int):
+            raise TypeError
+        if self.rows != self.cols:
+            raise ValueError
+
+        square = self
+        if power < 0:
+            square = self.find_inverse()
+
+            # A singular matrix has no inverse to raise to a power.
+            if square is None:
+                raise ValueError
+            power = -power
+
+        result = ModularMatrix.identity(self.rows, self.modulus)
+        while power:
+            if power & 1:
+                result = result * square
+            power >>= 1
+            if power:
+                square = square * square
+        return result
+
+    def transpose(self) -> ModularMatrix:
+        """
+        Returns the transpose of self.
+        """
+        cols = self.cols
+        values = array('q')
+        for col in range(cols):
+            values.extend(self.values[col::cols])
+        return self.like(cols, self.rows, values)
+
+    def check_prime(self):
+        """
+        Ensures that the modulus is prime, which elimination needs, so that
+        every nonzero residue has an inverse.
+        """
+        if not self.prime:
+            raise ValueError
+
+    def find_rank(self) -> int:
+        """
+        Returns the rank of self over GF(p), p being the prime modulus.
+        :return: The rank.
+        """
+        self.check_prime()
+        return len(gauss_jordan(self.values, self.rows, self.cols,
+                                self.modulus)[1])
+
+    def find_determinant(self):
+        """
+        Returns the determinant of self modulo the modulus, or None if self
+        is not n x n. For a prime modulus it is the product of the pivots of
+        the elimination; for any other modulus, the exact determinant of the
+        residues is found by fraction-free elimination and then reduced.
+        :return: The determinant, an int from 0 to modulus - 1, or None.
+        """
+        if self.rows != self.cols:
+            return None
+        if not self.prime:
+            return self.to_matrix().find_determinant() % self.modulus
+        return gauss_jordan(self.values, self.rows, self.cols,
+                            self.modulus)[2]
+
+    def find_inverse(self):
+        """
+        Returns the inverse of self over GF(p), p being the prime modulus,
+        found by reducing self next to the identity. If self has no inverse,
+        returns None.
+        :return: The inverse, or None.
+        """
+        self.check_prime()
+        if self.rows != self.cols:
+            return None
+
+        size = self.rows
+        augmented = array('q')
+        identity = ModularMatrix.identity(size, self.modulus).values
+        for start in range(0, size * size, size):
+            augmented.extend(self.values[start:start + size])
+            augmented.extend(identity[start:start + size])
+        reduced, pivot_cols, _ = gauss_jordan(augmented, size, 2 * size,
+                                              self.modulus, size)
+        if len(pivot_cols) < size:
+            return None
+        values = array('q')
+        for row in reduced:
+            values.extend(row[size:])
+        return self.like(size, size, values)
+
+    def solve(self, constants):
+        """
+        Finds the solution over GF(p) of the linear system whose coefficients
+        are self and whose right-hand side is constants, p being the prime
+        modulus, in the format of Matrix.find_solution(): one [column,
+        vector] pair for every independent variable, followed by the vector
+        of constants, every entry being a residue.
+        :param constants: The right-hand side, a list with one int or
+        rational per row, or a Matrix or ModularMatrix with one column.
+        :return: The solution as a list, or None if there is no solution.
+        """
+        self.check_prime()
+        modulus = self.modulus
+
+        # Ensures that there is one constant for every row.
+        if isinstance(constants, ModularMatrix):
+            self.check_modulus(constants)
+            if constants.cols != 1:
+                raise ValueError
+            constants = constants.values
+        elif isinstance(constants, Matrix):
+            if constants.cols != 1:
+                raise ValueError
+            constants = constants._flat()
+        if len(constants) != self.rows:
+            raise ValueError
+        constants = [residue(constant, modulus) for constant in constants]
+        if None in constants:
+            raise ValueError
+
+        cols = self.cols
+        augmented = array('q')
+        for row, constant in zip(range(self.rows), constants):
+            augmented.extend(self.values[row * cols:(row + 1) * cols])
+            augmented.append(constant)
+        reduced, pivot_cols, _ = gauss_jordan(augmented, self.rows,
+                                              cols + 1, modulus)
+
+        # A pivot in the column of constants means there is no solution.
+        if pivot_cols and pivot_cols[-1] == cols:
+            return None
+
+        # Every column without a pivot is an independent variable, whose
+        # vector has a 1 in its own position and the negated coefficients of
+        # the pivot variables.
+        pivots = set(pivot_cols)
+        solution = []
+        for i in range(cols):
+            if i in pivots:
+                continue
+            vector = [0] * cols
+            vector[i] = 1
+            for row, col in enumerate(pivot_cols):
+                vector[col] = -reduced[row][i] % modulus
+            solution.append([i, vector])
+        constant_vector = [0] * cols
+        for row, col in enumerate(pivot_cols):
+            constant_vector[col] = reduced[row][cols]
+        solution.append(constant_vector)
+        return solution
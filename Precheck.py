@@ -0,0 +1,328 @@
+from __future__ import annotations
+import math
+from random import Random
+from threading import Lock
+from MatrixMath.Backend import to_ratio
+from MatrixMath.Budget import checkpoint
+
+# Bases for which the Miller-Rabin test is deterministic below 3.3 * 10 ** 24,
+# so for every 61-bit number.
+WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+# The number of bits of the random primes.
+PRIME_BITS = 61
+
+
+def is_prime(value: int) -> bool:
+    """
+    Returns True if value is prime, using the Miller-Rabin test with bases
+    that make it exact for every value below 3.3 * 10 ** 24.
+    :param value: The int to be tested.
+    :return: True if value is prime.
+    """
+    if value < 2:
+        return False
+    for witness in WITNESSES:
+        if value % witness == 0:
+            return value == witness
+
+    odd, twos = value - 1, 0
+    while not odd % 2:
+        odd //= 2
+        twos += 1
+    for witness in WITNESSES:
+        power = pow(witness, odd, value)
+        if power in (1, value - 1):
+            continue
+        for _ in range(twos - 1):
+            power = power * power % value
+            if power == value - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def residue(value, prime: int):
+    """
+    Returns an int or rational modulo prime, or None if its denominator is a
+    multiple of prime, in which case it has no residue.
+    :param value: The int or rational of any backend.
+    :param prime: The prime.
+    :return: The residue, an int from 0 to prime - 1, or None.
+    """
+    if isinstance(value, int):
+        return value % prime
+    numerator, denominator = to_ratio(value)
+    if not denominator % prime:
+        return None
+    return numerator * pow(denominator, -1, prime) % prime
+
+
+def eliminate_modulo(rows: list, prime: int) -> tuple:
+    """
+    Reduces rows of residues to row echelon form modulo prime, taking the
+    first nonzero entry of each column as the pivot. Every value stays below
+    prime, so each operation is on ints of at most two machine words.
+    :param rows: The rows, as a list of row lists, which is changed.
+    :param prime: The prime.
+    :return: The pivot columns, and the determinant modulo prime if the rows
+    are square.
+    """
+    size = len(rows)
+    cols = len(rows[0]) if rows else 0
+    pivot_cols = []
+    determinant = 1
+    row = 0
+    for col in range(cols):
+        if row == size:
+            break
+        pivot_row = next((i for i in range(row, size) if rows[i][col]),
+                         None)
+        if pivot_row is None:
+            determinant = 0
+            continue
+        if pivot_row != row:
+            rows[row], rows[pivot_row] = rows[pivot_row], rows[row]
+            determinant = -determinant
+        pivot = rows[row]
+        determinant = determinant * pivot[col] % prime
+        inverse = pow(pivot[col], -1, prime)
+        for i in range(row + 1, size):
+            factor = rows[i][col] * inverse % prime
+            if factor:
+                rows[i] = [(entry - factor * pivot_entry) % prime
+                           for entry, pivot_entry in zip(rows[i], pivot)]
+        pivot_cols.append(col)
+        row += 1
+    if row < size or size != cols:
+        determinant = 0
+    return pivot_cols, determinant % prime
+
+
+def row_bits(row) -> int:
+    """
+    Returns a bound on the bit length of the Euclidean norm of a row once its
+    denominators are cleared, used to bound the determinants of its minors.
+    """
+    numerator_bits = 0
+    denominator_bits = 0
+    for entry in row:
+        if isinstance(entry, int):
+            numerator_bits = max(numerator_bits, entry.bit_length())
+        else:
+            numerator, denominator = to_ratio(entry)
+            numerator_bits = max(numerator_bits, numerator.bit_length())
+            denominator_bits += denominator.bit_length()
+    return numerator_bits + denominator_bits + len(row).bit_length()
+
+
+class ModularPrecheck:
+    """
+    A process-wide, randomized check that runs before the exact elimination
+    of a Matrix: the Matrix is reduced modulo random 61-bit primes, which
+    takes O(n ** 3) operations on ints of at most two machine words,
+    whatever the size of its entries. The rank modulo a prime is never more
+    than the true rank, and a nonzero determinant modulo a prime proves that
+    the determinant is nonzero. A zero determinant, or a rank that falls
+    short, only happens by chance if the prime divides a nonzero minor, and
+    enough primes are tried for that to happen with at most
+    error_probability. Once enabled, find_determinant() and find_inverse()
+    return 0 and None for a Matrix that is singular modulo the primes, and
+    find_solution() and solve() return None for a system that is
+    inconsistent modulo them, all without any rational arithmetic. With
+    confirm, such results are confirmed exactly first, and the check only
+    decides which exact method is used. The check is disabled until enable()
+    is called.
+    """
+    def __init__(self, error_probability: float = 2.0 ** -64,
+                 confirm: bool = False):
+        """
+        Creates a disabled check.
+        :param error_probability: The largest probability that a nonsingular
+        Matrix or consistent system is reported singular or inconsistent.
+        Optional parameter, defaults to 2 ** -64.
+        :param confirm: Whether or not a singular or inconsistent result is
+        confirmed exactly before being returned. Optional parameter, defaults
+        to False.
+        """
+        self.enabled = False
+        self.random = Random()
+        self.lock = Lock()
+        self.configure(error_probability, confirm)
+        self.reset_counters()
+
+    def configure(self, error_probability: float = None,
+                  confirm: bool = None):
+        """
+        Changes the settings of the check, keeping those given as None.
+        :param error_probability: The new error probability, strictly
+        between 0 and 1.
+        :param confirm: Whether or not results are confirmed exactly.
+        """
+        if error_probability is not None:
+            if not isinstance(error_probability, (int, float)):
+                raise TypeError
+            if not 0 < error_probability < 1:
+                raise ValueError
+            self.error_probability = float(error_probability)
+        if confirm is not None:
+            if not isinstance(confirm, bool):
+                raise TypeError
+            self.confirm = confirm
+
+    def enable(self, error_probability: float = None, confirm: bool = None):
+        """
+        Enables the check, optionally changing its settings.
+        :param error_probability: The new error probability. Optional
+        parameter, keeps the current one if None.
+        :param confirm: Whether or not results are confirmed exactly.
+        Optional parameter, keeps the current setting if None.
+        """
+        self.configure(error_probability, confirm)
+        self.enabled = True
+
+    def disable(self):
+        """
+        Disables the check.
+        """
+        self.enabled = False
+
+    def reset_counters(self):
+        """
+        Sets the counters back to 0.
+        """
+        self.checks = 0
+        self.primes = 0
+        self.rejected = 0
+        self.confirmed = 0
+
+    def statistics(self) -> dict:
+        """
+        Returns the settings and counters of the check.
+        :return: A dict with the keys 'enabled', 'error_probability',
+        'confirm', 'checks', 'primes' (the primes tried), 'rejected' (the
+        Matrices found singular or inconsistent) and 'confirmed' (the
+        rejections confirmed exactly).
+        """
+        return {'enabled': self.enabled,
+                'error_probability': self.error_probability,
+                'confirm': self.confirm, 'checks': self.checks,
+                'primes': self.primes, 'rejected': self.rejected,
+                'confirmed': self.confirmed}
+
+    def random_prime(self) -> int:
+        """
+        Returns a random prime of PRIME_BITS bits.
+        """
+        while True:
+            candidate = self.random.getrandbits(PRIME_BITS) \
+                | (1 << (PRIME_BITS - 1)) | 1
+            if is_prime(candidate):
+                return candidate
+
+    def trials(self, rows: list) -> int:
+        """
+        Returns the number of primes needed for the error probability. A
+        nonzero minor of the rows, once their denominators are cleared, is at
+        most 2 ** bits by Hadamard's bound, so at most bits / 60 primes of 61
+        bits divide it, out of about 2 ** 60 / 42 such primes.
+        :param rows: The rows of the Matrix.
+        :return: The number of primes to try.
+        """
+        bits = max(1, sum(row_bits(row) for row in rows))
+        per_trial = bits / (PRIME_BITS - 1) / (2 ** (PRIME_BITS - 1)
+                                               / (PRIME_BITS * math.log(2)))
+        if per_trial >= 1:
+            return 64
+        return max(1, math.ceil(math.log(self.error_probability)
+                                / math.log(per_trial)))
+
+    def reduce(self, rows: list) -> list:
+        """
+        Reduces rows modulo each of the primes needed for the error
+        probability.
+        :param rows: The rows of ints and rationals.
+        :return: A list with the pivot columns and determinant residue found
+        for each prime.
+        """
+        results = []
+        trials = self.trials(rows)
+        cols = len(rows[0]) if rows else 0
+        updates = len(rows) * cols * min(len(rows), cols)
+        for trial in range(trials):
+            checkpoint('precheck', trial + 1, trials, updates)
+
+            # A prime that divides a denominator gives no residues, so
+            # another is drawn.
+            while True:
+                prime = self.random_prime()
+                residues = [[residue(entry, prime) for entry in row]
+                            for row in rows]
+                if all(entry is not None
+                       for row in residues for entry in row):
+                    break
+            results.append(eliminate_modulo(residues, prime))
+        with self.lock:
+            self.checks += 1
+            self.primes += len(results)
+        return results
+
+    def rank(self, matrix) -> int:
+        """
+        Returns the rank of matrix, which is correct with probability at
+        least 1 - error_probability and is never more than the true rank.
+        :param matrix: The Matrix.
+        :return: The rank.
+        """
+        return max(len(pivot_cols) for pivot_cols, _
+                   in self.reduce(matrix._rows()))
+
+    def is_singular(self, matrix) -> bool:
+        """
+        Returns True if the square Matrix is probably singular. False is
+        always correct, and True is wrong with probability at most
+        error_probability.
+        :param matrix: The square Matrix.
+        :return: True if the determinant is 0 modulo every prime.
+        """
+        return not any(determinant for _, determinant
+                       in self.reduce(matrix._rows()))
+
+    def solution_dimension(self, rows: list, variables: int):
+        """
+        Returns the number of free variables of the system whose augmented
+        rows are given, or None if it is inconsistent. The augmented rows are
+        reduced once for each prime, the rank of the coefficients being the
+        number of pivots before the last column.
+        :param rows: The rows of coefficients, each followed by its constant.
+        :param variables: The number of variables.
+        :return: The number of free variables, or None.
+        """
+        coefficient_rank = 0
+        augmented_rank = 0
+        for pivot_cols, _ in self.reduce(rows):
+            augmented_rank = max(augmented_rank, len(pivot_cols))
+            coefficient_rank = max(coefficient_rank,
+                                   sum(col < variables for col in pivot_cols))
+        if augmented_rank > coefficient_rank:
+            return None
+        return variables - coefficient_rank
+
+    def reject(self):
+        """
+        Counts a Matrix found singular or inconsistent.
+        """
+        with self.lock:
+            self.rejected += 1
+
+    def count_confirmation(self):
+        """
+        Counts a rejection that was confirmed exactly.
+        """
+        with self.lock:
+            self.confirmed += 1
+
+
+# The check shared by every Matrix in the process.
+modular_precheck = ModularPrecheck()
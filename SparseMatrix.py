@@ -0,0 +1,167 @@
+from __future__ import annotations
+from array import array
+from operator import mul
+from MatrixMath.Matrix import Matrix, scalar_entry
+from MatrixMath.Backend import get_backend, is_rational, to_ratio
+
+
+class SparseMatrix:
+    """
+    A Matrix of floats stored in compressed sparse row form, which keeps only
+    the nonzero entries. The entries of row i are values[indptr[i]:
+    indptr[i + 1]], in the columns indices[indptr[i]:indptr[i + 1]], in
+    increasing order. Memory and the time of a product with a vector are
+    proportional to the number of nonzero entries rather than to
+    rows * cols. Used by the iterative solvers of Iterative.py for large
+    sparse systems; most other operations are done by converting to a Matrix
+    with to_matrix().
+    """
+    def __init__(self, rows: int, cols: int, entries=()):
+        """
+        Creates a SparseMatrix from (row, col, value) triplets, counting rows
+        and columns from 0. Entries given more than once are added together,
+        and entries that are 0 are not stored.
+        :param rows: The number of rows.
+        :param cols: The number of columns.
+        :param entries: An iterable of (row, col, value) triplets, value
+        being an int, a float or a rational of any backend. Optional
+        parameter, defaults to no entries.
+        """
+
+        # Ensures that rows and cols are both positive ints.
+        if not isinstance(rows, int) or not isinstance(cols, int):
+            raise TypeError
+        if rows <= 0 or cols <= 0:
+            raise ValueError
+
+        self.rows = rows
+        self.cols = cols
+
+        # Collects the entries of each row, adding duplicates.
+        row_entries = [{} for _ in range(rows)]
+        for row, col, value in entries:
+            if not isinstance(row, int) or not isinstance(col, int):
+                raise TypeError
+            if not 0 <= row < rows or not 0 <= col < cols:
+                raise IndexError
+            value = float_value(value)
+            row_entries[row][col] = row_entries[row].get(col, 0.0) + value
+
+        self.indptr = array('q', [0])
+        self.indices = array('q')
+        self.values = array('d')
+        for entries_of_row in row_entries:
+            for col in sorted(entries_of_row):
+                if entries_of_row[col]:
+                    self.indices.append(col)
+                    self.values.append(entries_of_row[col])
+            self.indptr.append(len(self.indices))
+
+        # The positions of the entries of each row, so that products do not
+        # rebuild them.
+        self.row_slices = [slice(self.indptr[row], self.indptr[row + 1])
+                           for row in range(rows)]
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix) -> SparseMatrix:
+        """
+        Returns the nonzero entries of a Matrix as a SparseMatrix of floats.
+        :param matrix: The Matrix.
+        :return: The SparseMatrix.
+        """
+        if not isinstance(matrix, Matrix):
+            raise TypeError
+        cols = matrix.cols
+        return cls(matrix.rows, cols,
+                   ((index // cols, index % cols, entry)
+                    for index, entry in enumerate(matrix._flat()) if entry))
+
+    def to_matrix(self, backend=None) -> Matrix:
+        """
+        Returns self as a dense Matrix. Every float is converted exactly to a
+        rational of backend through its integer ratio, as by scalar_entry(),
+        so the result works with every exact method of Matrix.
+        :param backend: The backend of the Matrix. Optional parameter,
+        defaults to the default backend.
+        :return: The Matrix.
+        """
+        backend = get_backend(backend)
+        flat = [0] * (self.rows * self.cols)
+        for row in range(self.rows):
+            for k in range(self.indptr[row], self.indptr[row + 1]):
+                flat[row * self.cols + self.indices[k]] = \
+                    scalar_entry(self.values[k], backend)
+        return Matrix.from_flat(self.rows, self.cols, flat, False, backend)
+
+    def count_nonzero(self) -> int:
+        """
+        Returns the number of stored, nonzero entries.
+        :return: The number of nonzero entries.
+        """
+        return len(self.values)
+
+    def get(self, row: int, col: int) -> float:
+        """
+        Returns the entry at row x col, counting from 0.
+        :param row: The row.
+        :param col: The column.
+        :return: The entry, which is 0.0 if it is not stored.
+        """
+        for k in range(self.indptr[row], self.indptr[row + 1]):
+            if self.indices[k] == col:
+                return self.values[k]
+        return 0.0
+
+    def diagonal(self) -> list:
+        """
+        Returns the entries on the diagonal of self.
+        :return: The diagonal as a list of floats.
+        """
+        return [self.get(i, i) for i in range(min(self.rows, self.cols))]
+
+    def matvec(self, vector) -> list:
+        """
+        Returns the product of self and a vector, in time proportional to the
+        number of nonzero entries.
+        :param vector: The vector, a sequence with one float per column.
+        :return: The product, as a list with one float per row.
+        """
+
+        # Ensures that the vector has one entry per column.
+        if len(vector) != self.cols:
+            raise ValueError
+
+        # Multiplies every stored entry by the matching entry of vector in
+        # one pass, then sums the products of each row.
+        products = list(map(mul, self.values,
+                            map(vector.__getitem__, self.indices)))
+        return list(map(sum, map(products.__getitem__, self.row_slices)))
+
+    def solve_iterative(self, constants, method: str = 'conjugate_gradient',
+                        **options):
+        """
+        Solves the linear system whose coefficients are self and whose
+        right-hand side is constants with an iterative method. See
+        Iterative.solve_iterative() for the methods and options.
+        :param constants: The right-hand side, a sequence with one entry per
+        row.
+        :param method: The name of the method. Optional parameter, defaults
+        to 'conjugate_gradient'.
+        :return: The IterativeResult.
+        """
+        from MatrixMath.Iterative import solve_iterative
+        return solve_iterative(self, constants, method, **options)
+
+
+def float_value(value) -> float:
+    """
+    Returns value, an int, a float or a rational of any backend, as a float.
+    :param value: The value.
+    :return: The float.
+    """
+    if is_rational(value):
+        numerator, denominator = to_ratio(value)
+        return numerator / denominator
+    if not isinstance(value, (int, float)):
+        raise TypeError
+    return float(value)
@@ -0,0 +1,270 @@
+from __future__ import annotations
+from MatrixMath.Matrix import Matrix, integer_entry
+from MatrixMath.Storage import Storage
+
+# Polynomials are lists of coefficients, lowest degree first, so that
+# coefficients[k] is the coefficient of x ** k.
+
+
+def berkowitz(rows: list) -> list:
+    """
+    Returns the characteristic polynomial det(xI - A) of a square matrix A
+    using Berkowitz' algorithm, which needs no division, so a matrix of ints
+    gives ints throughout. Each leading principal submatrix extends the
+    polynomial of the one before it through a Toeplitz matrix built from
+    products of its last row, its last column and the submatrix itself. Takes
+    O(n ** 4) multiplications.
+    :param rows: The rows of A, as a list of row lists.
+    :return: The coefficients, lowest degree first.
+    """
+    size = len(rows)
+    if not size:
+        return [1]
+
+    # The polynomial of the leading 1 x 1 submatrix, highest degree first.
+    polynomial = [1, -rows[0][0]]
+
+    for r in range(1, size):
+        # The leading (r + 1) x (r + 1) submatrix is split into the leading
+        # r x r submatrix M, the row R and column S beside it, and the entry a
+        # in its corner. The first column of the Toeplitz matrix is
+        # 1, -a, -RS, -RMS, -RM^2S, ..., -RM^(r-1)S.
+        row = rows[r][:r]
+        column = [rows[i][r] for i in range(r)]
+        toeplitz = [1, -rows[r][r]]
+        for _ in range(r):
+            toeplitz.append(-sum(left * right
+                                 for left, right in zip(row, column)))
+            column = [sum(entry * value for entry, value
+                          in zip(rows[i][:r], column)) for i in range(r)]
+
+        # Multiplies the lower triangular Toeplitz matrix, of r + 2 rows and
+        # r + 1 columns, by the previous polynomial.
+        polynomial = [sum(toeplitz[i - j] * polynomial[j]
+                          for j in range(max(0, i - r - 1),
+                                         min(i, r) + 1))
+                      for i in range(r + 2)]
+
+    polynomial.reverse()
+    return polynomial
+
+
+def hessenberg(rows: list) -> list:
+    """
+    Reduces a square matrix of rationals to an upper Hessenberg matrix, with
+    zeros below the first subdiagonal, by similarity transformations: each
+    row operation of Gaussian elimination is followed by the inverse column
+    operation, so the characteristic polynomial does not change. Takes
+    O(n ** 3) operations.
+    :param rows: The rows of the matrix, as a list of row lists, which is
+    changed in place.
+    :return: rows.
+    """
+    size = len(rows)
+    for col in range(size - 2):
+        # Finds a nonzero entry below the subdiagonal to serve as the pivot,
+        # and moves it onto the subdiagonal by swapping both its row and its
+        # column.
+        pivot_row = col + 1
+        while pivot_row < size and not rows[pivot_row][col]:
+            pivot_row += 1
+        if pivot_row == size:
+            continue
+        if pivot_row != col + 1:
+            rows[pivot_row], rows[col + 1] = rows[col + 1], rows[pivot_row]
+            for row in rows:
+                row[pivot_row], row[col + 1] = row[col + 1], row[pivot_row]
+
+        pivot = rows[col + 1][col]
+        for i in range(col + 2, size):
+            if not rows[i][col]:
+                continue
+
+            # Subtracts factor times the pivot row from row i, then adds
+            # factor times column i to the pivot column.
+            factor = rows[i][col] / pivot
+            rows[i] = [entry - factor * pivot_entry
+                       for entry, pivot_entry in zip(rows[i], rows[col + 1])]
+            for row in rows:
+                row[col + 1] += factor * row[i]
+    return rows
+
+
+def hessenberg_characteristic_polynomial(rows: list, one) -> list:
+    """
+    Returns the characteristic polynomial det(xI - A) of a square matrix A of
+    rationals by reducing it to an upper Hessenberg matrix H and expanding
+    det(xI - H) along its last column, which gives the polynomial of each
+    leading submatrix from those of the smaller ones. Takes O(n ** 3)
+    operations.
+    :param rows: The rows of A, as a list of row lists, which is changed.
+    :param one: The rational 1, which leads the polynomial.
+    :return: The coefficients, lowest degree first.
+    """
+    rows = hessenberg(rows)
+    size = len(rows)
+
+    # polynomials[m] is the polynomial of the leading m x m submatrix of H.
+    polynomials = [[one]]
+    for m in range(size):
+        # (x - h[m][m]) times the previous polynomial.
+        previous = polynomials[m]
+        polynomial = [-rows[m][m] * previous[0]] + [
+            previous[k - 1] - rows[m][m] * previous[k]
+            for k in range(1, m + 1)] + [previous[m]]
+
+        # Subtracts h[i][m] times the product of the subdiagonal entries from
+        # i + 1 to m times the polynomial of the leading i x i submatrix.
+        product = one
+        for i in range(m - 1, -1, -1):
+            product = product * rows[i + 1][i]
+            if not product:
+                break
+            factor = product * rows[i][m]
+            if factor:
+                for k, coefficient in enumerate(polynomials[i]):
+                    polynomial[k] -= factor * coefficient
+        polynomials.append(polynomial)
+
+    return polynomials[size]
+
+
+def multiply_modulo(first: list, second: list, modulus: list) -> list:
+    """
+    Returns the product of two polynomials modulo a monic polynomial. Since
+    the modulus is monic, no division is needed.
+    :param first: The first polynomial, of lower degree than modulus.
+    :param second: The second polynomial, of lower degree than modulus.
+    :param modulus: The monic modulus, lowest degree first.
+    :return: The remainder of the product, with len(modulus) - 1
+    coefficients.
+    """
+    degree = len(modulus) - 1
+    product = [0] * (len(first) + len(second) - 1)
+    for i, left in enumerate(first):
+        if left:
+            for j, right in enumerate(second):
+                product[i + j] += left * right
+
+    # Replaces x ** k, from the highest k down, by x ** k - x ** (k - degree)
+    # times the modulus.
+    for k in range(len(product) - 1, degree - 1, -1):
+        coefficient = product[k]
+        if coefficient:
+            for i in range(degree):
+                product[k - degree + i] -= coefficient * modulus[i]
+    product = product[:degree]
+    return product + [0] * (degree - len(product))
+
+
+def power_modulo(exponent: int, modulus: list) -> list:
+    """
+    Returns x ** exponent modulo a monic polynomial, found by repeated
+    squaring.
+    :param exponent: The nonnegative exponent.
+    :param modulus: The monic modulus, lowest degree first.
+    :return: The remainder, with len(modulus) - 1 coefficients.
+    """
+    degree = len(modulus) - 1
+    x = [0, 1] if degree > 1 else multiply_modulo([0, 1], [1], modulus)
+    result = multiply_modulo([1], [1], modulus)
+    for bit in bin(exponent)[2:]:
+        result = multiply_modulo(result, result, modulus)
+        if bit == '1':
+            result = multiply_modulo(result, x, modulus)
+    return result
+
+
+def evaluate_polynomial(coefficients: list, matrix: Matrix) -> Matrix:
+    """
+    Returns the polynomial evaluated at a square Matrix, the sum of each
+    coefficient times the corresponding power of the Matrix. The powers are
+    found first, so each large coefficient is only multiplied by the small
+    entries of a power, never through a product of Matrices.
+    :param coefficients: The coefficients, lowest degree first.
+    :param matrix: The Matrix.
+    :return: The resulting Matrix.
+    """
+    size = matrix.rows
+    identity = [1 if i == j else 0 for i in range(size) for j in range(size)]
+    powers = [identity]
+    power = None
+    for _ in range(1, len(coefficients)):
+        power = matrix if power is None else power * matrix
+        powers.append(list(power._flat()))
+
+    entries = [sum(coefficient * flat[index]
+                   for coefficient, flat in zip(coefficients, powers)
+                   if coefficient)
+               for index in range(size * size)]
+    integer = matrix.integer and all(isinstance(coefficient, int)
+                                     for coefficient in coefficients)
+    convert = int if integer else matrix.backend.convert
+    return Matrix.from_storage(
+        Storage.from_flat(size, size, map(convert, entries)), integer,
+        matrix.backend)
+
+
+def cayley_hamilton_power(matrix: Matrix, power: int) -> Matrix:
+    """
+    Returns a square Matrix raised to a nonnegative power using the
+    Cayley-Hamilton theorem: every Matrix is a root of its characteristic
+    polynomial p, so A ** power equals r(A), where r is x ** power modulo p.
+    r is found by repeated squaring of polynomials of degree below n, which
+    takes O(n ** 2) multiplications per step rather than the O(n ** 3) of a
+    product of Matrices.
+    :param matrix: The Matrix.
+    :param power: The nonnegative power.
+    :return: The resulting Matrix.
+    """
+    remainder = power_modulo(power, matrix.find_characteristic_polynomial())
+    return evaluate_polynomial(remainder, matrix)
+
+
+def minimal_polynomial(matrix: Matrix) -> list:
+    """
+    Returns the minimal polynomial of a square Matrix: the monic polynomial of
+    lowest degree that has the Matrix as a root. The powers I, A, A ** 2, ...
+    are flattened into vectors and reduced against those before them until
+    one of them is a combination of the others. The reductions are tracked as
+    polynomials, so the polynomial that reduced to zero is the minimal
+    polynomial. Takes O(n ** 4) operations.
+    :param matrix: The Matrix.
+    :return: The coefficients, lowest degree first. They are ints for an
+    integer Matrix, and rationals of its backend otherwise.
+    """
+    backend = matrix.backend
+    convert = backend.convert
+    size = matrix.rows
+
+    # Each element of basis holds a reduced vector, the position of its first
+    # nonzero entry and the polynomial it is the value of.
+    basis = []
+    power = None
+    for degree in range(size + 1):
+        if degree == 0:
+            vector = [backend.one if i == j else backend.zero
+                      for i in range(size) for j in range(size)]
+        else:
+            power = matrix if power is None else power * matrix
+            vector = list(map(convert, power._flat()))
+        polynomial = [backend.zero] * degree + [backend.one]
+
+        for reduced, pivot, reduced_polynomial in basis:
+            factor = vector[pivot]
+            if not factor:
+                continue
+            factor = factor / reduced[pivot]
+            vector = [entry - factor * reduced_entry
+                      for entry, reduced_entry in zip(vector, reduced)]
+            for k, coefficient in enumerate(reduced_polynomial):
+                polynomial[k] -= factor * coefficient
+
+        pivot = next((i for i, entry in enumerate(vector) if entry), None)
+        if pivot is None:
+            break
+        basis.append((vector, pivot, polynomial))
+
+    if matrix.integer:
+        return [integer_entry(coefficient) for coefficient in polynomial]
+    return polynomial
@@ -0,0 +1,330 @@
+from __future__ import annotations
+from array import array
+
+
+def flat_buffer(values):
+    """
+    Returns the values as a flat buffer: an array('q') if every value is a
+    machine-sized int, and a list otherwise.
+    :param values: An iterable of entries.
+    :return: The array or list.
+    """
+    if not isinstance(values, list):
+        values = list(values)
+
+    # Floats and Fractions are rejected by array() with a TypeError and ints
+    # that are too large with an OverflowError, both without a Python-level
+    # check of every value.
+    try:
+        return array('q', values)
+    except (TypeError, OverflowError):
+        return values
+
+
+class Storage:
+    """
+    Stores the entries of a Matrix in one flat, row-major buffer. The entry at
+    row i and column j (counting from 0) is buffer[i * cols + j], so rows are
+    found by offset arithmetic rather than through a list per row. Matrices of
+    machine-sized ints are kept in an array('q'), which holds the values
+    themselves rather than pointers to int objects. Any other entries are kept
+    in a single list. An array is turned into a list the first time a value
+    that does not fit in it is stored.
+    """
+    def __init__(self, rows: int, cols: int, buffer):
+        """
+        Creates a Storage around an existing buffer, which is not copied.
+        :param rows: The number of rows.
+        :param cols: The number of columns.
+        :param buffer: An array('q') or list of length rows * cols.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.buffer = buffer
+
+    @classmethod
+    def zeros(cls, rows: int, cols: int) -> Storage:
+        """
+        Returns a Storage of dimensions rows x cols with every entry 0.
+        :param rows: The number of rows.
+        :param cols: The number of columns.
+        :return: The Storage.
+        """
+        return cls(rows, cols, array('q', bytes(8 * rows * cols)))
+
+    @classmethod
+    def from_flat(cls, rows: int, cols: int, values) -> Storage:
+        """
+        Returns a Storage holding values, which are given in row-major order.
+        :param rows: The number of rows.
+        :param cols: The number of columns.
+        :param values: An iterable of rows * cols entries.
+        :return: The Storage.
+        """
+        return cls(rows, cols, flat_buffer(values))
+
+    @classmethod
+    def from_rows(cls, rows) -> Storage:
+        """
+        Returns a Storage holding the entries of a list of row lists.
+        :param rows: The rows. All rows must have the same length.
+        :return: The Storage.
+        """
+        rows = [list(row) for row in rows]
+        cols = len(rows[0]) if rows else 0
+        return cls(len(rows), cols,
+                   flat_buffer([entry for row in rows for entry in row]))
+
+    def copy(self) -> Storage:
+        """
+        Returns a Storage with its own copy of the buffer.
+        :return: The copy.
+        """
+        return Storage(self.rows, self.cols, self.buffer[:])
+
+    def is_machine_int(self) -> bool:
+        """
+        Returns True if the entries are stored in an array('q').
+        :return: True if the buffer is an array, False if it is a list.
+        """
+        return isinstance(self.buffer, array)
+
+    def to_list(self):
+        """
+        Changes the buffer into a list so that it can hold any value.
+        """
+        if isinstance(self.buffer, array):
+            self.buffer = self.buffer.tolist()
+
+    def index(self, row: int, col: int) -> int:
+        """
+        Returns the position in the buffer of the entry at row x col. Negative
+        row and col count from the end as they do for lists.
+        :param row: The row, counting from 0.
+        :param col: The column, counting from 0.
+        :return: The position in the buffer.
+        """
+        if row < 0:
+            row += self.rows
+        if col < 0:
+            col += self.cols
+        return row * self.cols + col
+
+    def get(self, row: int, col: int):
+        """
+        Returns the entry at row x col, counting from 0.
+        """
+        return self.buffer[self.index(row, col)]
+
+    def set(self, row: int, col: int, value):
+        """
+        Stores value at row x col, counting from 0.
+        """
+        index = self.index(row, col)
+        try:
+            self.buffer[index] = value
+        except (TypeError, OverflowError):
+            self.to_list()
+            self.buffer[index] = value
+
+    def row(self, row: int):
+        """
+        Returns a copy of the row with index row, counting from 0, as a list
+        or array.
+        """
+        if row < 0:
+            row += self.rows
+        start = row * self.cols
+        return self.buffer[start:start + self.cols]
+
+    def set_row(self, row: int, values):
+        """
+        Replaces the row with index row, counting from 0, with values.
+        """
+        if row < 0:
+            row += self.rows
+        start = row * self.cols
+        if isinstance(self.buffer, array):
+            try:
+                self.buffer[start:start + self.cols] = array('q', values)
+                return
+            except (TypeError, OverflowError):
+                self.to_list()
+        self.buffer[start:start + self.cols] = values
+
+    def replace(self, values):
+        """
+        Replaces every entry with values, given in row-major order, reusing
+        the buffer. An array is turned into a list if a value does not fit in
+        it.
+        :param values: A list of rows * cols entries.
+        """
+        if isinstance(self.buffer, array):
+            try:
+                self.buffer[:] = array('q', values)
+                return
+            except (TypeError, OverflowError):
+                self.to_list()
+        self.buffer[:] = values
+
+    def swap_rows(self, first: int, second: int):
+        """
+        Swaps two rows, counting from 0.
+        """
+        cols = self.cols
+        first *= cols
+        second *= cols
+        buffer = self.buffer
+        buffer[first:first + cols], buffer[second:second + cols] = \
+            buffer[second:second + cols], buffer[first:first + cols]
+
+    def rows_list(self) -> list:
+        """
+        Returns copies of all the rows as a list of lists. Rows of an array
+        are unboxed into lists here, once, so that callers reading each entry
+        many times do not create a new int object on every read.
+        """
+        buffer = self.buffer
+        cols = self.cols
+        if isinstance(buffer, array):
+            return [buffer[start:start + cols].tolist()
+                    for start in range(0, self.rows * cols, cols)]
+        return [buffer[start:start + cols]
+                for start in range(0, self.rows * cols, cols)]
+
+    def columns_list(self) -> list:
+        """
+        Returns copies of all the columns as a list of lists. Each column is a
+        strided slice of the buffer.
+        """
+        buffer = self.buffer
+        cols = self.cols
+        if isinstance(buffer, array):
+            return [buffer[col::cols].tolist() for col in range(cols)]
+        return [buffer[col::cols] for col in range(cols)]
+
+    def transposed(self) -> Storage:
+        """
+        Returns a new Storage holding the transpose of the entries.
+        """
+        buffer = self.buffer
+        cols = self.cols
+        if isinstance(buffer, array):
+            result = array('q')
+            for col in range(cols):
+                result.extend(buffer[col::cols])
+        else:
+            result = []
+            for col in range(cols):
+                result.extend(buffer[col::cols])
+        return Storage(self.cols, self.rows, result)
+
+
+class RowAccessor:
+    """
+    One row of a Storage, as returned by indexing Matrix.matrix. Reads and
+    writes go straight to the flat buffer, so matrix[i][j] = value keeps
+    working for code written against the old list of lists.
+    """
+    def __init__(self, storage: Storage, row: int):
+        """
+        Creates an accessor for a row of storage.
+        :param storage: The Storage holding the row.
+        :param row: The row, counting from 0. Negative rows count from the
+        end.
+        """
+        if row < 0:
+            row += storage.rows
+        if not 0 <= row < storage.rows:
+            raise IndexError
+        self.storage = storage
+        self.row = row
+
+    def __len__(self):
+        """
+        Returns the number of entries in the row.
+        """
+        return self.storage.cols
+
+    def __getitem__(self, col):
+        """
+        Returns the entry in column col, or a list of entries if col is a
+        slice.
+        """
+        if isinstance(col, slice):
+            return list(self.storage.row(self.row))[col]
+        if not -self.storage.cols <= col < self.storage.cols:
+            raise IndexError
+        return self.storage.get(self.row, col)
+
+    def __setitem__(self, col, value):
+        """
+        Stores value in column col of the row.
+        """
+        if not -self.storage.cols <= col < self.storage.cols:
+            raise IndexError
+        self.storage.set(self.row, col, value)
+
+    def __iter__(self):
+        """
+        Iterates over the entries of the row.
+        """
+        return iter(self.storage.row(self.row))
+
+    def __eq__(self, other):
+        """
+        Compares the entries of the row with those of any sequence.
+        """
+        return list(self) == list(other)
+
+    def __repr__(self):
+        """
+        Represents the row as the list it would have been before.
+        """
+        return repr(list(self))
+
+
+class RowsAccessor:
+    """
+    The rows of a Storage, as returned by Matrix.matrix. Indexing gives a
+    RowAccessor for the row.
+    """
+    def __init__(self, storage: Storage):
+        """
+        Creates an accessor for the rows of storage.
+        :param storage: The Storage.
+        """
+        self.storage = storage
+
+    def __len__(self):
+        """
+        Returns the number of rows.
+        """
+        return self.storage.rows
+
+    def __getitem__(self, row):
+        """
+        Returns a RowAccessor for row, or a list of them if row is a slice.
+        """
+        if isinstance(row, slice):
+            return [RowAccessor(self.storage, i)
+                    for i in range(self.storage.rows)[row]]
+        return RowAccessor(self.storage, row)
+
+    def __iter__(self):
+        """
+        Iterates over RowAccessors for every row.
+        """
+        return (RowAccessor(self.storage, i) for i in range(self.storage.rows))
+
+    def __eq__(self, other):
+        """
+        Compares the rows with those of any sequence of sequences.
+        """
+        return [list(row) for row in self] == [list(row) for row in other]
+
+    def __repr__(self):
+        """
+        Represents the rows as the list of lists they would have been before.
+        """
+        return repr([list(row) for row in self])
@@ -0,0 +1,686 @@
+from __future__ import annotations
+import os
+import tempfile
+import weakref
+from collections import OrderedDict
+from MatrixMath.Matrix import Matrix, scalar_entry
+from MatrixMath.Backend import get_backend
+from MatrixMath.SparseMatrix import float_value
+
+# NumPy is optional. TiledMatrix can only be used when it is installed.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# The number of bytes of one float64 entry.
+ENTRY_BYTES = 8
+
+
+def remove_file(path: str):
+    """
+    Removes the temporary file of a TiledMatrix, if it still exists.
+    :param path: The path of the file.
+    """
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class TiledMatrix:
+    """
+    A Matrix of floats too large to be held in memory, stored in a file as
+    square tiles of tile_size x tile_size float64 entries. The file is
+    memory-mapped and only the tiles being worked on are read into memory:
+    they are kept in a cache of the least recently used tiles, bounded by
+    memory_budget bytes, and changed tiles are written back when they are
+    evicted or flush() is called. Tiles on the last row and column of tiles
+    are padded with zeros to the full size.
+
+    Products, sums and transposes stream the tiles through the cache, so
+    each needs only a few tiles in memory at once, and the LU factorization
+    used by find_determinant() and solve() is blocked, holding at most two
+    columns of tiles. The tiles read and written are counted, and are given
+    by statistics().
+    """
+    def __init__(self, rows: int, cols: int, tile_size: int = 256,
+                 path: str = None, memory_budget: int = 64 * 1024 * 1024,
+                 overwrite: bool = True):
+        """
+        Creates a TiledMatrix of dimensions rows x cols with all entries
+        initialized to 0. Requires NumPy.
+        :param rows: The number of rows.
+        :param cols: The number of columns.
+        :param tile_size: The number of rows and columns of each tile.
+        Optional parameter, defaults to 256, which gives tiles of 512 KiB.
+        :param path: The file the tiles are stored in, which is created or
+        overwritten. Optional parameter, defaults to a temporary file that is
+        removed by close() or once self is garbage collected.
+        :param memory_budget: The largest number of bytes of tiles held in
+        memory by the operations of self, which must fit at least three
+        tiles. Optional parameter, defaults to 64 MiB.
+        :param overwrite: Whether the file at path is created or overwritten
+        with zeros, rather than opened with the tiles already in it. Optional
+        parameter, defaults to True.
+        """
+
+        # Ensures that NumPy is installed.
+        if numpy is None:
+            raise ImportError
+
+        # Ensures that the dimensions, tile size and budget are positive ints
+        # and that the budget fits the tiles of a product.
+        if not all(isinstance(value, int)
+                   for value in (rows, cols, tile_size, memory_budget)):
+            raise TypeError
+        if min(rows, cols, tile_size) <= 0 \
+                or memory_budget < 3 * tile_size * tile_size * ENTRY_BYTES:
+            raise ValueError
+
+        self.rows = rows
+        self.cols = cols
+        self.tile_size = tile_size
+        self.tile_rows = -(-rows // tile_size)
+        self.tile_cols = -(-cols // tile_size)
+        self.tile_bytes = tile_size * tile_size * ENTRY_BYTES
+        self.memory_budget = memory_budget
+
+        # A temporary file is removed along with self.
+        self.temporary = path is None
+        if self.temporary:
+            handle, path = tempfile.mkstemp(suffix='.tiles')
+            os.close(handle)
+            self.finalizer = weakref.finalize(self, remove_file, path)
+        self.path = path
+        self.map = numpy.memmap(path, numpy.float64,
+                                'w+' if overwrite else 'r+',
+                                shape=(self.tile_rows, self.tile_cols,
+                                       tile_size, tile_size))
+
+        # The cache of tiles in memory, from least to most recently used,
+        # mapping (tile row, tile column) to [tile, changed].
+        self.cache = OrderedDict()
+        self.cached_bytes = 0
+        self.reset_statistics()
+
+        # Calculated by the factorize() method. Stored as a tuple of the
+        # TiledMatrix holding L and U, the row permutation and its sign.
+        self.factorization_found = False
+        self.factorization = None
+
+    @classmethod
+    def open(cls, path: str, rows: int, cols: int, tile_size: int = 256,
+             memory_budget: int = 64 * 1024 * 1024) -> TiledMatrix:
+        """
+        Returns a TiledMatrix stored in an existing file, such as one written
+        by an earlier TiledMatrix with the same dimensions and tile size.
+        Changes are written to the file.
+        :param path: The path of the file.
+        :param rows: The number of rows.
+        :param cols: The number of columns.
+        :param tile_size: The tile size the file was written with. Optional
+        parameter, defaults to 256.
+        :param memory_budget: The memory budget, see __init__(). Optional
+        parameter, defaults to 64 MiB.
+        :return: The TiledMatrix.
+        """
+        if not isinstance(path, str):
+            raise TypeError
+        return cls(rows, cols, tile_size, path, memory_budget, False)
+
+    @classmethod
+    def from_rows(cls, rows, row_count: int, cols: int, tile_size: int = 256,
+                  path: str = None,
+                  memory_budget: int = 64 * 1024 * 1024) -> TiledMatrix:
+        """
+        Returns a TiledMatrix holding rows, which are read one at a time, so
+        that a matrix larger than memory can be written from a generator.
+        Only one row of tiles is held in memory.
+        :param rows: An iterable of row_count rows, each a sequence of cols
+        ints, floats or rationals of any backend.
+        :param row_count: The number of rows.
+        :param cols: The number of columns.
+        :param tile_size: The tile size. Optional parameter, defaults to 256.
+        :param path: The file, see __init__(). Optional parameter, defaults
+        to a temporary file.
+        :param memory_budget: The memory budget, see __init__(). Optional
+        parameter, defaults to 64 MiB.
+        :return: The TiledMatrix.
+        """
+        result = cls(row_count, cols, tile_size, path, memory_budget)
+        band = numpy.zeros((tile_size, result.tile_cols * tile_size))
+        count = 0
+        for row in rows:
+            # Ensures that every row has cols entries, and that there are
+            # exactly row_count rows.
+            if len(row) != cols or count == row_count:
+                raise ValueError
+            band[count % tile_size, :cols] = [float_value(entry)
+                                              for entry in row]
+            count += 1
+            if count % tile_size == 0 or count == row_count:
+                result.write_band((count - 1) // tile_size, band)
+                band[:] = 0.0
+        if count != row_count:
+            raise ValueError
+        return result
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix, tile_size: int = 256,
+                    path: str = None,
+                    memory_budget: int = 64 * 1024 * 1024) -> TiledMatrix:
+        """
+        Returns the entries of a Matrix as a TiledMatrix of floats. Rationals
+        are rounded to the nearest float.
+        :param matrix: The Matrix.
+        :param tile_size: The tile size. Optional parameter, defaults to 256.
+        :param path: The file, see __init__(). Optional parameter, defaults
+        to a temporary file.
+        :param memory_budget: The memory budget, see __init__(). Optional
+        parameter, defaults to 64 MiB.
+        :return: The TiledMatrix.
+        """
+        if not isinstance(matrix, Matrix):
+            raise TypeError
+        return cls.from_rows(matrix._rows(), matrix.rows, matrix.cols,
+                             tile_size, path, memory_budget)
+
+    def to_matrix(self, backend=None) -> Matrix:
+        """
+        Returns self as an in-memory Matrix, which must fit in memory. Every
+        float is converted exactly to a rational of backend through its
+        integer ratio, as by scalar_entry(), so the result works with every
+        exact method of Matrix.
+        :param backend: The backend of the Matrix. Optional parameter,
+        defaults to the default backend.
+        :return: The Matrix.
+        """
+        self.flush()
+        backend = get_backend(backend)
+        flat = []
+        for tile_row in range(self.tile_rows):
+            band = self.read_band(tile_row)
+            for row in band[:self.tile_height(tile_row), :self.cols]:
+                flat.extend(scalar_entry(value, backend)
+                            for value in row.tolist())
+        return Matrix.from_flat(self.rows, self.cols, flat, False, backend)
+
+    def close(self):
+        """
+        Writes back every changed tile and closes the file. A temporary file
+        is removed. self cannot be used afterwards.
+        """
+        self.flush()
+        self.cache.clear()
+        self.cached_bytes = 0
+        self.map = None
+        if self.temporary:
+            self.finalizer()
+
+    def __enter__(self):
+        """
+        Allows a TiledMatrix to be used in a with statement, which closes it
+        on exit.
+        """
+        return self
+
+    def __exit__(self, *exception):
+        """
+        Closes self at the end of a with statement.
+        """
+        self.close()
+
+    def tile_height(self, tile_row: int) -> int:
+        """
+        Returns the number of rows of self in a row of tiles, which is less
+        than tile_size only for the last one.
+        """
+        return min(self.tile_size, self.rows - tile_row * self.tile_size)
+
+    def tile_width(self, tile_col: int) -> int:
+        """
+        Returns the number of columns of self in a column of tiles, which is
+        less than tile_size only for the last one.
+        """
+        return min(self.tile_size, self.cols - tile_col * self.tile_size)
+
+    def reset_statistics(self):
+        """
+        Sets the I/O counters back to 0.
+        """
+        self.tile_reads = 0
+        self.tile_writes = 0
+        self.hits = 0
+        self.evictions = 0
+        self.peak_bytes = self.cached_bytes
+
+    def statistics(self) -> dict:
+        """
+        Returns the I/O counters of self since it was created or
+        reset_statistics() was last called.
+        :return: A dict with the keys 'tile_reads', 'tile_writes',
+        'bytes_read' and 'bytes_written' (tiles and bytes moved between the
+        file and memory), 'hits' (tiles found in the cache), 'evictions',
+        'cached_bytes', 'peak_bytes' (the most bytes of tiles cached at once)
+        and 'memory_budget'.
+        """
+        return {'tile_reads': self.tile_reads,
+                'tile_writes': self.tile_writes,
+                'bytes_read': self.tile_reads * self.tile_bytes,
+                'bytes_written': self.tile_writes * self.tile_bytes,
+                'hits': self.hits, 'evictions': self.evictions,
+                'cached_bytes': self.cached_bytes,
+                'peak_bytes': self.peak_bytes,
+                'memory_budget': self.memory_budget}
+
+    def read_tile(self, tile_row: int, tile_col: int):
+        """
+        Reads a tile from the file into memory, bypassing the cache.
+        :return: A copy of the tile, as a tile_size x tile_size array.
+        """
+        self.tile_reads += 1
+        return numpy.array(self.map[tile_row, tile_col])
+
+    def write_tile(self, tile_row: int, tile_col: int, tile):
+        """
+        Writes a tile to the file, bypassing the cache.
+        """
+        self.tile_writes += 1
+        self.map[tile_row, tile_col] = tile
+
+    def read_band(self, tile_row: int):
+        """
+        Reads a row of tiles from the file as one tile_size-row array.
+        """
+        self.tile_reads += self.tile_cols
+        return numpy.hstack(self.map[tile_row])
+
+    def write_band(self, tile_row: int, band):
+        """
+        Writes a tile_size-row array to a row of tiles of the file.
+        """
+        size = self.tile_size
+        for tile_col in range(self.tile_cols):
+            self.write_tile(tile_row, tile_col,
+                            band[:, tile_col * size:(tile_col + 1) * size])
+
+    def read_panel(self, tile_col: int, first: int = 0):
+        """
+        Reads a column of tiles, from row of tiles first down, as one tall
+        array holding only the rows and columns of self.
+        """
+        height = self.rows - first * self.tile_size
+        width = self.tile_width(tile_col)
+        panel = numpy.empty((height, width))
+        for tile_row in range(first, self.tile_rows):
+            top = (tile_row - first) * self.tile_size
+            rows = self.tile_height(tile_row)
+            panel[top:top + rows] = \
+                self.read_tile(tile_row, tile_col)[:rows, :width]
+        return panel
+
+    def write_panel(self, tile_col: int, panel, first: int = 0):
+        """
+        Writes an array read by read_panel() back to its column of tiles.
+        """
+        size = self.tile_size
+        for tile_row in range(first, self.tile_rows):
+            tile = numpy.zeros((size, size))
+            top = (tile_row - first) * size
+            part = panel[top:top + size]
+            tile[:part.shape[0], :part.shape[1]] = part
+            self.write_tile(tile_row, tile_col, tile)
+
+    def tile(self, tile_row: int, tile_col: int):
+        """
+        Returns a tile through the cache, reading it from the file if it is
+        not in memory. The tile must be treated as read-only; use
+        store_tile() to change it.
+        :param tile_row: The row of tiles, counting from 0.
+        :param tile_col: The column of tiles, counting from 0.
+        :return: The tile, as a tile_size x tile_size array.
+        """
+        key = (tile_row, tile_col)
+        entry = self.cache.get(key)
+        if entry is not None:
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        tile = self.read_tile(tile_row, tile_col)
+        self.make_room()
+        self.cache[key] = [tile, False]
+        self.cached_bytes += self.tile_bytes
+        self.peak_bytes = max(self.peak_bytes, self.cached_bytes)
+        return tile
+
+    def store_tile(self, tile_row: int, tile_col: int, tile):
+        """
+        Replaces a tile in the cache. It is written to the file when it is
+        evicted or flush() is called.
+        :param tile_row: The row of tiles, counting from 0.
+        :param tile_col: The column of tiles, counting from 0.
+        :param tile: The new tile, a tile_size x tile_size array.
+        """
+        key = (tile_row, tile_col)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+        else:
+            self.make_room()
+            self.cached_bytes += self.tile_bytes
+            self.peak_bytes = max(self.peak_bytes, self.cached_bytes)
+        self.cache[key] = [tile, True]
+
+    def make_room(self):
+        """
+        Evicts the least recently used tiles until one more fits in the
+        memory budget, writing back the ones that changed.
+        """
+        while self.cache \
+                and self.cached_bytes + self.tile_bytes > self.memory_budget:
+            (tile_row, tile_col), (tile, changed) = \
+                self.cache.popitem(last=False)
+            if changed:
+                self.write_tile(tile_row, tile_col, tile)
+            self.cached_bytes -= self.tile_bytes
+            self.evictions += 1
+
+    def flush(self):
+        """
+        Writes every changed tile in the cache back to the file, keeping
+        them cached.
+        """
+        for (tile_row, tile_col), entry in self.cache.items():
+            if entry[1]:
+                self.write_tile(tile_row, tile_col, entry[0])
+                entry[1] = False
+        if self.map is not None:
+            self.map.flush()
+
+    def get(self, row: int, col: int) -> float:
+        """
+        Returns the entry at row x col, counting from 0.
+        :param row: The row.
+        :param col: The column.
+        :return: The entry.
+        """
+        if not 0 <= row < self.rows or not 0 <= col < self.cols:
+            raise IndexError
+        size = self.tile_size
+        return float(self.tile(row // size, col // size)[row % size,
+                                                          col % size])
+
+    def set(self, row: int, col: int, value):
+        """
+        Stores an int, float or rational of any backend, as a float, at
+        row x col, counting from 0.
+        :param row: The row.
+        :param col: The column.
+        :param value: The value.
+        """
+        if not 0 <= row < self.rows or not 0 <= col < self.cols:
+            raise IndexError
+        size = self.tile_size
+        tile = self.tile(row // size, col // size).copy()
+        tile[row % size, col % size] = float_value(value)
+        self.store_tile(row // size, col // size, tile)
+
+    def like(self, rows: int, cols: int) -> TiledMatrix:
+        """
+        Returns a new TiledMatrix of zeros with the tile size and memory
+        budget of self, stored in a temporary file.
+        """
+        return TiledMatrix(rows, cols, self.tile_size,
+                           memory_budget=self.memory_budget)
+
+    def copy_matrix(self) -> TiledMatrix:
+        """
+        Returns a copy of self in a new temporary file, copied one tile at a
+        time.
+        :return: The copy.
+        """
+        self.flush()
+        result = self.like(self.rows, self.cols)
+        for tile_row in range(self.tile_rows):
+            for tile_col in range(self.tile_cols):
+                result.write_tile(tile_row, tile_col,
+                                  self.read_tile(tile_row, tile_col))
+        return result
+
+    def transpose(self) -> TiledMatrix:
+        """
+        Returns the transpose of self, found by reading each tile once and
+        writing it transposed to the mirrored position.
+        :return: The transpose, a new TiledMatrix.
+        """
+        result = self.like(self.cols, self.rows)
+        for tile_row in range(self.tile_rows):
+            for tile_col in range(self.tile_cols):
+                result.write_tile(tile_col, tile_row,
+                                  self.tile(tile_row, tile_col).T)
+        return result
+
+    def __add__(self, other: TiledMatrix) -> TiledMatrix:
+        """
+        Adds two TiledMatrices of the same dimensions and tile size, one pair
+        of tiles at a time. Overrides the binary + operator.
+        :param other: The TiledMatrix to be added to self.
+        :return: The sum, a new TiledMatrix.
+        """
+
+        # Ensures that other is a TiledMatrix split like self.
+        if not isinstance(other, TiledMatrix):
+            raise TypeError
+        if self.rows != other.rows or self.cols != other.cols \
+                or self.tile_size != other.tile_size:
+            raise ValueError
+
+        result = self.like(self.rows, self.cols)
+        for tile_row in range(self.tile_rows):
+            for tile_col in range(self.tile_cols):
+                result.write_tile(tile_row, tile_col,
+                                  self.tile(tile_row, tile_col)
+                                  + other.tile(tile_row, tile_col))
+        return result
+
+    def __mul__(self, other) -> TiledMatrix:
+        """
+        Multiplies two TiledMatrices with the same tile size, or a
+        TiledMatrix and an int or float. Each tile of the product is the sum
+        of the products of a row of tiles of self and a column of tiles of
+        other, and is written as soon as it is found. If a whole row of tiles
+        of self fits in its memory budget, the product is found row by row so
+        that those tiles are read once; otherwise, if a column of tiles of
+        other fits in its budget, it is found column by column. Overrides the
+        * operator.
+        :param other: The TiledMatrix, int or float to be multiplied with
+        self.
+        :return: The product, a new TiledMatrix.
+        """
+
+        # Special case if other is a number.
+        if isinstance(other, (int, float)):
+            result = self.like(self.rows, self.cols)
+            for tile_row in range(self.tile_rows):
+                for tile_col in range(self.tile_cols):
+                    result.write_tile(tile_row, tile_col,
+                                      self.tile(tile_row, tile_col) * other)
+            return result
+
+        # Ensures that the two TiledMatrices are possible to multiply.
+        if not isinstance(other, TiledMatrix):
+            raise TypeError
+        if self.cols != other.rows or self.tile_size != other.tile_size:
+            raise ValueError
+
+        result = self.like(self.rows, other.cols)
+        inner = self.tile_cols
+        row_fits = inner * self.tile_bytes <= self.memory_budget
+        col_fits = inner * other.tile_bytes <= other.memory_budget
+        if row_fits or not col_fits:
+            order = ((i, j) for i in range(self.tile_rows)
+                     for j in range(other.tile_cols))
+        else:
+            order = ((i, j) for j in range(other.tile_cols)
+                     for i in range(self.tile_rows))
+
+        for tile_row, tile_col in order:
+            total = self.tile(tile_row, 0) @ other.tile(0, tile_col)
+            for k in range(1, inner):
+                total += self.tile(tile_row, k) @ other.tile(k, tile_col)
+            result.write_tile(tile_row, tile_col, total)
+        return result
+
+    def __rmul__(self, other):
+        """
+        Allows an int or float to multiply a TiledMatrix from the left. Same
+        parameters as __mul__.
+        """
+        return self.__mul__(other)
+
+    def factorize(self):
+        """
+        Returns the LU factorization of self, a square TiledMatrix, with
+        partial pivoting: P A = L U, L being unit lower triangular and U upper
+        triangular. It is found on a copy of self, one column of tiles at a
+        time. Each step reads the column as a tall panel, factors it, then
+        reads every other column of tiles below the diagonal in turn to apply
+        the row swaps, solve for the tiles of U and update the tiles below
+        them, so at most two columns of tiles are in memory and each step
+        reads and writes every remaining tile once. The result is stored.
+        :return: The TiledMatrix holding L below its diagonal and U on and
+        above it, the permutation as a list of rows of self, and its sign.
+        """
+
+        if self.factorization_found:
+            return self.factorization
+
+        # Ensures that self is square and that two columns of tiles fit in
+        # the memory budget.
+        if self.rows != self.cols:
+            raise ValueError
+        if 2 * self.rows * self.tile_size * ENTRY_BYTES > self.memory_budget:
+            raise ValueError
+
+        factors = self.copy_matrix()
+        size = self.tile_size
+        permutation = list(range(self.rows))
+        sign = 1
+
+        for step in range(self.tile_cols):
+            start = step * size
+            width = factors.tile_width(step)
+            panel = factors.read_panel(step, step)
+
+            # Factors the panel, swapping the largest entry of each column
+            # into the pivot position.
+            swaps = []
+            for j in range(width):
+                pivot = j + int(numpy.argmax(numpy.abs(panel[j:, j])))
+                swaps.append(pivot)
+                if pivot != j:
+                    panel[[j, pivot]] = panel[[pivot, j]]
+                    permutation[start + j], permutation[start + pivot] = \
+                        permutation[start + pivot], permutation[start + j]
+                    sign = -sign
+                if panel[j, j]:
+                    panel[j + 1:, j] /= panel[j, j]
+                    panel[j + 1:, j + 1:] -= numpy.outer(panel[j + 1:, j],
+                                                         panel[j, j + 1:])
+            factors.write_panel(step, panel, step)
+
+            diagonal = panel[:width]
+            lower = numpy.tril(diagonal, -1) + numpy.eye(width)
+            below = panel[width:]
+
+            # Applies the swaps to every other column of tiles, and updates
+            # those to the right.
+            for tile_col in range(factors.tile_cols):
+                if tile_col == step:
+                    continue
+                column = factors.read_panel(tile_col, step)
+                for j, pivot in enumerate(swaps):
+                    if pivot != j:
+                        column[[j, pivot]] = column[[pivot, j]]
+                if tile_col > step:
+                    column[:width] = numpy.linalg.solve(lower,
+                                                        column[:width])
+                    column[width:] -= below @ column[:width]
+                factors.write_panel(tile_col, column, step)
+
+        factors.flush()
+        self.factorization = (factors, permutation, sign)
+        self.factorization_found = True
+        return self.factorization
+
+    def find_determinant(self) -> float:
+        """
+        Returns the determinant of self, the product of the diagonal of U
+        times the sign of the row permutation, or None if self is not
+        square.
+        :return: The determinant as a float, or None.
+        """
+        if self.rows != self.cols:
+            return None
+        factors, _, sign = self.factorize()
+        determinant = float(sign)
+        for step in range(factors.tile_cols):
+            width = factors.tile_width(step)
+            determinant *= float(numpy.prod(numpy.diagonal(
+                factors.tile(step, step))[:width]))
+        return determinant
+
+    def solve(self, constants):
+        """
+        Finds the solution of the linear system whose coefficients are self
+        and whose right-hand side is constants from the LU factorization of
+        self, by forward and back substitution one tile at a time. The
+        solution is held in memory.
+        :param constants: The right-hand side, either a sequence with one
+        entry per row of self or a Matrix with one column.
+        :return: The solution as a list holding one list of floats, in the
+        format described in Matrix.find_solution(), or None if a pivot is 0.
+        """
+
+        if isinstance(constants, Matrix):
+            if constants.cols != 1:
+                raise ValueError
+            constants = constants._flat()
+        if len(constants) != self.rows:
+            raise ValueError
+
+        factors, permutation, _ = self.factorize()
+        size = self.tile_size
+        count = factors.tile_rows
+        values = numpy.array([float_value(constants[row])
+                              for row in permutation])
+
+        # Solves L y = P b, then U x = y, a block of size unknowns at a time.
+        for tile_row in range(count):
+            part = slice(tile_row * size,
+                         tile_row * size + factors.tile_height(tile_row))
+            height = part.stop - part.start
+            for k in range(tile_row):
+                values[part] -= factors.tile(tile_row, k)[:height] \
+                    @ values[k * size:(k + 1) * size]
+            diagonal = factors.tile(tile_row, tile_row)[:height, :height]
+            lower = numpy.tril(diagonal, -1) + numpy.eye(height)
+            values[part] = numpy.linalg.solve(lower, values[part])
+
+        for tile_row in range(count - 1, -1, -1):
+            part = slice(tile_row * size,
+                         tile_row * size + factors.tile_height(tile_row))
+            height = part.stop - part.start
+            for k in range(tile_row + 1, count):
+                width = factors.tile_width(k)
+                values[part] -= factors.tile(tile_row, k)[:height, :width] \
+                    @ values[k * size:k * size + width]
+            upper = numpy.triu(factors.tile(tile_row,
+                                            tile_row)[:height, :height])
+            if not numpy.all(numpy.diagonal(upper)):
+                return None
+            values[part] = numpy.linalg.solve(upper, values[part])
+
+        return [values.tolist()]
@@ -0,0 +1,402 @@
+from __future__ import annotations
+from array import array
+from math import sqrt
+from operator import add, eq, mul, sub
+from MatrixMath import Fraction
+from MatrixMath.Matrix import Matrix, is_scalar, magnitude, scalar_entry
+from MatrixMath.Storage import Storage, flat_buffer
+from MatrixMath.Backend import get_backend
+
+# The names of the norms accepted by Vector.norm().
+VECTOR_NORMS = ('euclidean', 'one', 'max')
+
+
+class Vector:
+    """
+    A lightweight vector of ints, floats or rationals, held in one flat
+    buffer: an array('q') if every entry is a machine-sized int, and a list
+    otherwise, as in Storage. It carries no cache of results, so creating one
+    costs no more than creating its buffer, which makes it suited to loops
+    that multiply a Matrix by a vector many times, such as Markov chains and
+    iterative methods. Products with a Matrix are found with
+    Matrix.matvec() and Matrix.vecmat(), and the in-place operations +=, -=,
+    *= and axpy() reuse the buffer.
+    """
+    def __init__(self, values):
+        """
+        Creates a Vector holding values.
+        :param values: An iterable of ints, floats or rationals of one
+        backend.
+        """
+        self.values = flat_buffer(values)
+
+    @classmethod
+    def zeros(cls, size: int) -> Vector:
+        """
+        Returns a Vector of size entries that are all 0.
+        :param size: The number of entries, a positive int.
+        :return: The Vector.
+        """
+        if not isinstance(size, int):
+            raise TypeError
+        if size <= 0:
+            raise ValueError
+        vector = cls.__new__(cls)
+        vector.values = array('q', bytes(8 * size))
+        return vector
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix) -> Vector:
+        """
+        Returns the entries of a Matrix with one row or one column as a
+        Vector.
+        :param matrix: The n x 1 or 1 x n Matrix.
+        :return: The Vector.
+        """
+        if not isinstance(matrix, Matrix):
+            raise TypeError
+        if matrix.rows != 1 and matrix.cols != 1:
+            raise ValueError
+        return cls(matrix._flat())
+
+    @classmethod
+    def from_solution(cls, solution: list, parameters=None) -> Vector:
+        """
+        Returns one solution of a linear system from the list returned by
+        Matrix.find_solution() or Matrix.solve(): the vector of constants,
+        plus each given parameter times the vector of its independent
+        variable.
+        :param solution: The solution list, which must not be None.
+        :param parameters: The values of the independent variables, one for
+        each [column, vector] pair of solution, in order. Optional parameter,
+        defaults to None, which gives the solution with every independent
+        variable 0.
+        :return: The Vector.
+        """
+
+        # Ensures that solution is a solution list, with one parameter for
+        # each independent variable.
+        if not isinstance(solution, list) or not solution:
+            raise TypeError
+        free = solution[:-1]
+        if parameters is None:
+            parameters = [0] * len(free)
+        parameters = list(parameters)
+        if len(parameters) != len(free):
+            raise ValueError
+
+        vector = cls(solution[-1])
+        for (_, direction), parameter in zip(free, parameters):
+            if parameter:
+                vector.axpy(parameter, Vector(direction))
+        return vector
+
+    def to_matrix(self, column: bool = True, backend=None) -> Matrix:
+        """
+        Returns self as a Matrix with one column, or with one row.
+        :param column: Whether the Matrix has one column rather than one row.
+        Optional parameter, defaults to True.
+        :param backend: The backend of the Matrix. Optional parameter,
+        defaults to the default backend.
+        :return: The Matrix, in the integer domain if every entry is an int.
+        Otherwise its rationals are converted to backend, and its floats are
+        converted exactly through their integer ratio.
+        """
+        size = len(self.values)
+        rows, cols = (size, 1) if column else (1, size)
+        integer = isinstance(self.values, array) \
+            or all(isinstance(entry, int) for entry in self.values)
+        if integer:
+            return Matrix.from_storage(Storage(rows, cols, self.values[:]),
+                                       True, backend)
+
+        backend = get_backend(backend)
+        return Matrix.from_flat(rows, cols,
+                                [scalar_entry(entry, backend)
+                                 for entry in self.values],
+                                False, backend)
+
+    def copy(self) -> Vector:
+        """
+        Returns a copy of self with its own buffer.
+        :return: The copy.
+        """
+        vector = Vector.__new__(Vector)
+        vector.values = self.values[:]
+        return vector
+
+    def replace(self, values):
+        """
+        Replaces every entry with values, reusing the buffer. An array is
+        turned into a list if a value does not fit in it.
+        :param values: A list with one entry per entry of self.
+        """
+        if isinstance(self.values, array):
+            try:
+                self.values[:] = array('q', values)
+                return
+            except (TypeError, OverflowError):
+                self.values = self.values.tolist()
+        self.values[:] = values
+
+    def __len__(self):
+        """
+        Returns the number of entries of self.
+        """
+        return len(self.values)
+
+    def __getitem__(self, index):
+        """
+        Returns the entry at index, counting from 0, or a list of entries for
+        a slice.
+        """
+        if isinstance(index, slice):
+            return list(self.values[index])
+        return self.values[index]
+
+    def __iter__(self):
+        """
+        Iterates over the entries of self.
+        """
+        return iter(self.values)
+
+    def __str__(self):
+        """
+        Defines the string representation of a Vector, as its entries in
+        brackets.
+        :return: The string representation of self.
+        """
+        return '[{}]'.format(', '.join(map(str, self.values)))
+
+    def __repr__(self):
+        """
+        Defines the representation of a Vector.
+        :return: The representation of self.
+        """
+        return 'Vector({})'.format(self)
+
+    def __eq__(self, other) -> bool:
+        """
+        Checks to see if two Vectors have the same entries. Overloads the ==
+        operator.
+        :param other: The Vector being compared to self.
+        :return: True if the Vectors are the same, False otherwise.
+        """
+        if not isinstance(other, Vector):
+            raise TypeError
+        if len(self.values) != len(other.values):
+            return False
+        if type(self.values) is type(other.values):
+            return self.values == other.values
+        return all(map(eq, self.values, other.values))
+
+    def __ne__(self, other) -> bool:
+        """
+        Checks to see if two Vectors differ. Overloads the != operator.
+        """
+        return not self == other
+
+    def check_size(self, other: Vector):
+        """
+        Ensures that other is a Vector with as many entries as self.
+        :param other: The other Vector.
+        """
+        if not isinstance(other, Vector):
+            raise TypeError
+        if len(self.values) != len(other.values):
+            raise ValueError
+
+    def __add__(self, other: Vector) -> Vector:
+        """
+        Adds two Vectors of the same size. Overloads the binary + operator.
+        :param other: The Vector added to self.
+        :return: The sum.
+        """
+        self.check_size(other)
+        return Vector(list(map(add, self.values, other.values)))
+
+    def __sub__(self, other: Vector) -> Vector:
+        """
+        Subtracts other from self. Overloads the binary - operator.
+        :param other: The Vector subtracted from self.
+        :return: The difference.
+        """
+        self.check_size(other)
+        return Vector(list(map(sub, self.values, other.values)))
+
+    def __neg__(self) -> Vector:
+        """
+        Returns self with every entry negated. Overloads the unary -
+        operator.
+        :return: The negated Vector.
+        """
+        return Vector([-entry for entry in self.values])
+
+    def __mul__(self, other) -> Vector:
+        """
+        Multiplies self by a scalar: an int, a float or a rational of any
+        backend. Overloads the * operator; see dot() for the dot product.
+        :param other: The scalar.
+        :return: The product.
+        """
+        if not is_scalar(other):
+            return NotImplemented
+        return Vector([entry * other for entry in self.values])
+
+    def __rmul__(self, other):
+        """
+        Allows for the overloaded * operator from __mul__ to be commutative.
+        Same parameters as __mul__.
+        """
+        return self.__mul__(other)
+
+    def __iadd__(self, other: Vector) -> Vector:
+        """
+        Adds other to self in place, reusing the buffer of self. Overloads
+        the += operator.
+        :param other: The Vector added to self.
+        :return: self.
+        """
+        self.check_size(other)
+        self.replace(list(map(add, self.values, other.values)))
+        return self
+
+    def __isub__(self, other: Vector) -> Vector:
+        """
+        Subtracts other from self in place, reusing the buffer of self.
+        Overloads the -= operator.
+        :param other: The Vector subtracted from self.
+        :return: self.
+        """
+        self.check_size(other)
+        self.replace(list(map(sub, self.values, other.values)))
+        return self
+
+    def __imul__(self, other) -> Vector:
+        """
+        Multiplies self by a scalar in place, reusing the buffer of self.
+        Overloads the *= operator.
+        :param other: The scalar.
+        :return: self.
+        """
+        if not is_scalar(other):
+            return NotImplemented
+        self.replace([entry * other for entry in self.values])
+        return self
+
+    def axpy(self, factor, other: Vector) -> Vector:
+        """
+        Adds factor times other to self in place, in a single pass and
+        without creating the Vector factor * other.
+        :param factor: The int, float or rational other is multiplied by.
+        :param other: The Vector, with as many entries as self.
+        :return: self.
+        """
+        self.check_size(other)
+        if not is_scalar(factor):
+            raise TypeError
+        if factor == 1:
+            values = list(map(add, self.values, other.values))
+        elif factor == -1:
+            values = list(map(sub, self.values, other.values))
+        else:
+            values = [entry + factor * other_entry for entry, other_entry
+                      in zip(self.values, other.values)]
+        self.replace(values)
+        return self
+
+    def dot(self, other: Vector):
+        """
+        Returns the dot product of self and other.
+        :param other: The Vector, with as many entries as self.
+        :return: The dot product.
+        """
+        self.check_size(other)
+        if isinstance(self.values, array) and isinstance(other.values, array):
+            return sum(map(mul, self.values, other.values))
+
+        # Rationals go through Fraction.dot(), which reduces only the result
+        # and adds the products of any other entries as they are.
+        return Fraction.dot(self.values, other.values)
+
+    def norm(self, kind: str = 'euclidean'):
+        """
+        Returns a norm of self: 'euclidean', the square root of the sum of
+        the squares of the entries, as a float; 'one', the sum of their
+        absolute values; or 'max', the largest absolute value. Only the
+        Euclidean norm is rounded.
+        :param kind: The name of the norm, one of VECTOR_NORMS. Optional
+        parameter, defaults to 'euclidean'.
+        :return: The norm.
+        """
+        if not isinstance(kind, str):
+            raise TypeError
+        if kind not in VECTOR_NORMS:
+            raise ValueError
+
+        if kind == 'euclidean':
+            # The squares are summed exactly, so only the square root rounds.
+            return sqrt(magnitude(self.dot(self)))
+        absolute = [-entry if entry < 0 else entry for entry in self.values]
+        if kind == 'one':
+            return sum(absolute)
+        return max(absolute)
+
+
+def integer_dot(first, second):
+    """
+    Returns the dot product of two sequences of ints with sum().
+    """
+    return sum(map(mul, first, second))
+
+
+def dot_function(matrix: Matrix, vector: Vector):
+    """
+    Returns the dot product used for the products of matrix and vector:
+    sum() if both hold only machine-sized ints, and the dot() of the backend
+    of matrix otherwise, which can add rational products without reducing
+    each partial sum, as in Matrix.__mul__().
+    """
+    if matrix.integer and isinstance(vector.values, array):
+        return integer_dot
+    return matrix.backend.dot
+
+
+def matvec(matrix: Matrix, vector: Vector) -> Vector:
+    """
+    Returns the product of matrix and vector, treated as a column, one dot
+    product per row read straight from the flat buffer of matrix.
+    :param matrix: The Matrix.
+    :param vector: The Vector, with one entry per column of matrix.
+    :return: The product, with one entry per row of matrix.
+    """
+    if not isinstance(vector, Vector):
+        raise TypeError
+    if len(vector.values) != matrix.cols:
+        raise ValueError
+    buffer = matrix._flat()
+    values = vector.values
+    cols = matrix.cols
+    dot = dot_function(matrix, vector)
+    return Vector([dot(buffer[start:start + cols], values)
+                   for start in range(0, matrix.rows * cols, cols)])
+
+
+def vecmat(vector: Vector, matrix: Matrix) -> Vector:
+    """
+    Returns the product of vector, treated as a row, and matrix, one dot
+    product per column, each column being a strided slice of the flat buffer
+    of matrix.
+    :param vector: The Vector, with one entry per row of matrix.
+    :param matrix: The Matrix.
+    :return: The product, with one entry per column of matrix.
+    """
+    if not isinstance(vector, Vector):
+        raise TypeError
+    if len(vector.values) != matrix.rows:
+        raise ValueError
+    buffer = matrix._flat()
+    values = vector.values
+    cols = matrix.cols
+    dot = dot_function(matrix, vector)
+    return Vector([dot(values, buffer[col::cols]) for col in range(cols)])
@@ -0,0 +1,258 @@
+from __future__ import annotations
+from operator import mul
+from random import Random
+from MatrixMath.Matrix import Matrix
+from MatrixMath.Precheck import modular_precheck, residue
+
+# The number of bits of the random entries of the vectors used in exact
+# arithmetic. A wrong result passes one such trial with probability at most
+# 2 ** -VECTOR_BITS.
+VECTOR_BITS = 32
+
+# The random numbers used for the vectors of every check.
+vector_random = Random()
+
+
+def check_trials(trials: int):
+    """
+    Ensures that trials is a positive int.
+    :param trials: The number of trials.
+    """
+    if not isinstance(trials, int):
+        raise TypeError
+    if trials <= 0:
+        raise ValueError
+
+
+def integer_dot(first, second):
+    """
+    Returns the dot product of two sequences with sum(), which is fastest
+    when one of them holds only ints.
+    """
+    return sum(map(mul, first, second))
+
+
+def residue_rows(rows: list, prime: int):
+    """
+    Returns rows of ints and rationals with every entry taken modulo prime,
+    or None if an entry has no residue because prime divides its
+    denominator.
+    :param rows: The rows, as a list of sequences.
+    :param prime: The prime.
+    :return: The rows of residues, or None.
+    """
+    reduced = []
+    for row in rows:
+        reduced_row = [residue(entry, prime) for entry in row]
+        if None in reduced_row:
+            return None
+        reduced.append(reduced_row)
+    return reduced
+
+
+def trial_rows(groups: list, trials: int, modular: bool):
+    """
+    Yields the modulus of every trial and each group of rows reduced modulo
+    it. Without modular, the modulus is None and the rows are yielded as
+    they are. With modular, every trial draws a random prime, and draws again
+    if the prime divides a denominator.
+    :param groups: A list of lists of rows.
+    :param trials: The number of trials.
+    :param modular: Whether or not the trials work modulo random primes.
+    :return: A generator of (modulus, groups) tuples.
+    """
+    for _ in range(trials):
+        if not modular:
+            yield None, groups
+            continue
+        while True:
+            prime = modular_precheck.random_prime()
+            reduced = [residue_rows(rows, prime) for rows in groups]
+            if None not in reduced:
+                break
+        yield prime, reduced
+
+
+def random_vector(size: int, prime) -> list:
+    """
+    Returns a list of size random ints: residues modulo prime, or ints of
+    VECTOR_BITS bits if prime is None.
+    """
+    bound = (1 << VECTOR_BITS) if prime is None else prime
+    return [vector_random.randrange(bound) for _ in range(size)]
+
+
+def multiply_vector(rows: list, vector: list, prime, dot) -> list:
+    """
+    Returns the product of the Matrix with the given rows and a column
+    vector, modulo prime unless it is None.
+    :param rows: The rows of the Matrix.
+    :param vector: The vector, with one entry per column.
+    :param prime: The prime, or None for exact arithmetic.
+    :param dot: The function giving the exact dot product of two sequences.
+    :return: The product, as a list.
+    """
+    if prime is None:
+        return [dot(row, vector) for row in rows]
+    return [sum(map(mul, row, vector)) % prime for row in rows]
+
+
+def dot_function(matrix: Matrix):
+    """
+    Returns the dot product used for the rows of matrix: sum() for an integer
+    Matrix, and the dot() of its backend otherwise.
+    """
+    return integer_dot if matrix.integer else matrix.backend.dot
+
+
+def verify_product(first: Matrix, second: Matrix, product: Matrix,
+                   trials: int = 2, modular: bool = False) -> bool:
+    """
+    Checks that product is first * second with Freivalds' algorithm: for a
+    random vector r, first * (second * r) must equal product * r. Each trial
+    takes three products of a Matrix and a vector, so O(n ** 2) operations
+    rather than the O(n ** 3) of multiplying again. A wrong product passes a
+    trial with probability at most 2 ** -VECTOR_BITS, or about 2 ** -60 with
+    modular, where every trial works modulo a random 61-bit prime so that no
+    value grows beyond two machine words.
+    :param first: The left Matrix.
+    :param second: The right Matrix.
+    :param product: The Matrix being checked.
+    :param trials: The number of random vectors. Optional parameter,
+    defaults to 2.
+    :param modular: Whether or not the trials work modulo random primes.
+    Optional parameter, defaults to False.
+    :return: True. Raises ArithmeticError if product is wrong.
+    """
+
+    # Ensures that the three Matrices have matching dimensions.
+    if not all(isinstance(matrix, Matrix)
+               for matrix in (first, second, product)):
+        raise TypeError
+    if first.cols != second.rows or product.rows != first.rows \
+            or product.cols != second.cols:
+        raise ValueError
+    check_trials(trials)
+
+    second = first.matching_backend(second)
+    product = first.matching_backend(product)
+    first_dot = dot_function(first)
+    second_dot = dot_function(second)
+    product_dot = dot_function(product)
+    groups = [first._rows(), second._rows(), product._rows()]
+    for prime, (first_rows, second_rows, product_rows) \
+            in trial_rows(groups, trials, modular):
+        vector = random_vector(second.cols, prime)
+        expected = multiply_vector(
+            first_rows, multiply_vector(second_rows, vector, prime,
+                                        second_dot), prime, first_dot)
+        if multiply_vector(product_rows, vector, prime,
+                           product_dot) != expected:
+            raise ArithmeticError
+    return True
+
+
+def verify_inverse(matrix: Matrix, inverse: Matrix, trials: int = 2,
+                   modular: bool = False) -> bool:
+    """
+    Checks that inverse is the inverse of the square Matrix matrix with
+    Freivalds' algorithm: for a random vector r, matrix * (inverse * r) must
+    equal r. See verify_product().
+    :param matrix: The n x n Matrix.
+    :param inverse: The n x n Matrix being checked.
+    :param trials: The number of random vectors. Optional parameter,
+    defaults to 2.
+    :param modular: Whether or not the trials work modulo random primes.
+    Optional parameter, defaults to False.
+    :return: True. Raises ArithmeticError if inverse is wrong.
+    """
+
+    # Ensures that both Matrices are n x n and of the same size.
+    if not isinstance(matrix, Matrix) or not isinstance(inverse, Matrix):
+        raise TypeError
+    if matrix.rows != matrix.cols or inverse.rows != matrix.rows \
+            or inverse.cols != matrix.cols:
+        raise ValueError
+    check_trials(trials)
+
+    inverse = matrix.matching_backend(inverse)
+    matrix_dot = dot_function(matrix)
+    inverse_dot = dot_function(inverse)
+    groups = [matrix._rows(), inverse._rows()]
+    for prime, (matrix_rows, inverse_rows) \
+            in trial_rows(groups, trials, modular):
+        vector = random_vector(matrix.cols, prime)
+        if multiply_vector(
+                matrix_rows, multiply_vector(inverse_rows, vector, prime,
+                                             inverse_dot),
+                prime, matrix_dot) != vector:
+            raise ArithmeticError
+    return True
+
+
+def verify_solution(matrix: Matrix, solution: list, constants=None,
+                    trials: int = 2, modular: bool = False) -> bool:
+    """
+    Checks a solution of a linear system, in the format returned by
+    Matrix.find_solution(), with Freivalds' algorithm: for random values of
+    the independent variables, the solution they give must satisfy every
+    equation. That checks the vector of constants and every vector of an
+    independent variable in one product of a Matrix and a vector per trial.
+    See verify_product().
+    :param matrix: The coefficients, followed by a column of constants if
+    constants is None.
+    :param solution: The solution list, which must not be None.
+    :param constants: The right-hand side, either a list with one entry per
+    row of matrix or a Matrix with one column. Optional parameter, defaults
+    to None, for the last column of matrix.
+    :param trials: The number of random vectors. Optional parameter,
+    defaults to 2.
+    :param modular: Whether or not the trials work modulo random primes.
+    Optional parameter, defaults to False.
+    :return: True. Raises ArithmeticError if solution is wrong.
+    """
+
+    # Ensures that there is one constant for every row.
+    if not isinstance(matrix, Matrix):
+        raise TypeError
+    rows = matrix._rows()
+    if constants is None:
+        variables = matrix.cols - 1
+    else:
+        if isinstance(constants, Matrix):
+            if constants.cols != 1:
+                raise ValueError
+            constants = constants._flat()
+        if len(constants) != matrix.rows:
+            raise ValueError
+        variables = matrix.cols
+        rows = [list(row) + [matrix.backend.convert(constant)]
+                for row, constant in zip(rows, constants)]
+
+    # Ensures that solution is a solution list with one entry per variable in
+    # every vector.
+    if not isinstance(solution, list) or not solution:
+        raise TypeError
+    vectors = [pair[1] for pair in solution[:-1]] + [solution[-1]]
+    if any(len(vector) != variables for vector in vectors):
+        raise ValueError
+    check_trials(trials)
+
+    dot = matrix.backend.dot
+    for prime, (augmented_rows, vector_rows) \
+            in trial_rows([rows, vectors], trials, modular):
+        # The solution for random values of the independent variables.
+        values = vector_rows[-1]
+        parameters = random_vector(len(vector_rows) - 1, prime)
+        for parameter, vector in zip(parameters, vector_rows):
+            values = [value + parameter * entry
+                      for value, entry in zip(values, vector)]
+        if prime is not None:
+            values = [value % prime for value in values]
+
+        for row in augmented_rows:
+            total = dot(row[:-1], values) if prime is None \
+                else sum(map(mul, row[:-1], values)) % prime
+            if total != row[-1]:
+                raise ArithmeticError
+    return True
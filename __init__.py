@@ -1,2 +1,15 @@
 from MatrixMath.Fraction import Fraction
 from MatrixMath.Matrix import Matrix
+from MatrixMath.MatrixView import MatrixView
+from MatrixMath.Factorization import Factorization
+from MatrixMath.Cache import ResultCache, result_cache
+from MatrixMath.Backend import ScalarBackend, get_backend, set_default_backend
+from MatrixMath.MatrixBatch import MatrixBatch
+from MatrixMath.SparseMatrix import SparseMatrix
+from MatrixMath.BlockMatrix import BlockMatrix
+from MatrixMath.TiledMatrix import TiledMatrix
+from MatrixMath.FrozenMatrix import FrozenMatrix
+from MatrixMath.Precheck import ModularPrecheck, modular_precheck
+from MatrixMath.Budget import Budget
+from MatrixMath.Vector import Vector
+from MatrixMath.ModularMatrix import ModularMatrix
@@ -0,0 +1,98 @@
+"""
+Compares the scalar backends on identical workloads: the determinant, inverse,
+product and solution of the same random rational matrices. Run from the
+directory containing the MatrixMath package:
+
+    python -m MatrixMath.benchmarks.backends [size] [repeats]
+"""
+from __future__ import annotations
+import random
+import sys
+import time
+from MatrixMath import Matrix, result_cache
+from MatrixMath.Backend import backends
+
+
+def random_entries(size: int, seed: int) -> list:
+    """
+    Returns size x size random rational entries as (numerator, denominator)
+    pairs, the same for every call with the same seed.
+    :param size: The number of rows and columns.
+    :param seed: The seed of the random number generator.
+    :return: The entries as a list of row lists.
+    """
+    generator = random.Random(seed)
+    return [[(generator.randint(-9, 9), generator.randint(1, 9))
+             for _ in range(size)] for _ in range(size)]
+
+
+def build_matrix(entries: list, backend) -> Matrix:
+    """
+    Returns a Matrix over backend holding entries.
+    :param entries: The entries from random_entries().
+    :param backend: The ScalarBackend.
+    :return: The Matrix.
+    """
+    size = len(entries)
+    matrix = Matrix(size, size, backend=backend)
+    matrix.matrix = [[backend.from_ratio(numerator, denominator)
+                      for numerator, denominator in row] for row in entries]
+    return matrix
+
+
+def time_workload(function, repeats: int) -> float:
+    """
+    Returns the shortest time in seconds taken by function over repeats runs.
+    :param function: The workload, taking no arguments.
+    :param repeats: The number of runs.
+    :return: The shortest time.
+    """
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def main(size: int = 20, repeats: int = 3):
+    """
+    Prints the time taken by every backend on every workload.
+    :param size: The number of rows and columns of the matrices.
+    :param repeats: The number of runs of each workload.
+    """
+
+    # The cache would make every run after the first one free.
+    result_cache.disable()
+
+    first = random_entries(size, 1)
+    second = random_entries(size, 2)
+    constants = [1] * size
+
+    workloads = (
+        ('determinant', lambda a, b: a.find_determinant()),
+        ('inverse', lambda a, b: a.find_inverse()),
+        ('product', lambda a, b: a * b),
+        ('solve', lambda a, b: a.solve(constants)),
+    )
+
+    print('{} x {}, best of {}'.format(size, size, repeats))
+    print('{:<10}'.format('backend')
+          + ''.join('{:>13}'.format(name) for name, _ in workloads))
+    for name, backend in backends.items():
+        times = []
+        for _, workload in workloads:
+            # Fresh Matrices for every run, so that no run reuses a stored
+            # factorization.
+            def run():
+                workload(build_matrix(first, backend),
+                         build_matrix(second, backend))
+            times.append(time_workload(run, repeats))
+        print('{:<10}'.format(name)
+              + ''.join('{:>12.4f}s'.format(elapsed) for elapsed in times))
+
+
+if __name__ == '__main__':
+    main(*(int(argument) for argument in sys.argv[1:]))
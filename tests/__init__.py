@@ -0,0 +1,62 @@
+from random import Random
+from MatrixMath import Fraction, Matrix
+
+
+def build_matrix(rows, integer: bool = False, backend=None) -> Matrix:
+    """
+    Returns a Matrix holding the given rows.
+    :param rows: A non-empty list of rows of equal length.
+    :param integer: Whether or not the Matrix is in the integer domain.
+    Optional parameter, defaults to False.
+    :param backend: The scalar backend of the rational entries. Optional
+    parameter, defaults to None, for the default backend.
+    :return: The Matrix.
+    """
+    matrix = Matrix(len(rows), len(rows[0]), integer, backend)
+    for row, values in enumerate(rows, 1):
+        for col, value in enumerate(values, 1):
+            matrix.store_value(value, row, col)
+    return matrix
+
+
+def identity_matrix(size: int, integer: bool = False) -> Matrix:
+    """
+    Returns the size x size identity Matrix.
+    :param size: The number of rows and columns.
+    :param integer: Whether or not the Matrix is in the integer domain.
+    Optional parameter, defaults to False.
+    :return: The Matrix.
+    """
+    return build_matrix([[int(row == col) for col in range(size)]
+                         for row in range(size)], integer)
+
+
+def random_matrix(rows: int, cols: int = None, seed=0, bound: int = 9,
+                  integer: bool = True, denominator: int = None) -> Matrix:
+    """
+    Returns a Matrix of random entries, drawn row by row.
+    :param rows: The number of rows.
+    :param cols: The number of columns. Optional parameter, defaults to None,
+    for a square Matrix.
+    :param seed: An int seeding a new Random, or a Random whose draws are
+    used, so that several Matrices can share one sequence. Optional
+    parameter, defaults to 0.
+    :param bound: The entries, or the numerators of rational entries, are
+    ints from -bound to bound. Optional parameter, defaults to 9.
+    :param integer: Whether or not a Matrix of ints is in the integer
+    domain. Optional parameter, defaults to True.
+    :param denominator: If given, the entries are Fractions whose
+    denominators are ints from 1 to denominator. Optional parameter,
+    defaults to None, for int entries.
+    :return: The Matrix.
+    """
+    generator = seed if isinstance(seed, Random) else Random(seed)
+    if cols is None:
+        cols = rows
+    if denominator is None:
+        return build_matrix([[generator.randint(-bound, bound)
+                              for _ in range(cols)] for _ in range(rows)],
+                            integer)
+    return build_matrix([[Fraction(generator.randint(-bound, bound),
+                                   generator.randint(1, denominator))
+                          for _ in range(cols)] for _ in range(rows)])
@@ -0,0 +1,97 @@
+import fractions
+import pickle
+import unittest
+from MatrixMath import Fraction, Matrix, ScalarBackend, get_backend, \
+    set_default_backend
+from MatrixMath.Backend import backends, bit_length, is_rational, to_ratio
+from MatrixMath.tests import build_matrix, identity_matrix
+
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
+
+ROWS = [[2, 1, 1], [1, 3, 2], [1, 0, 0]]
+
+
+class TestBackend(unittest.TestCase):
+    def test_get_backend(self):
+        self.assertIs(get_backend(), get_backend('builtin'))
+        backend = get_backend('stdlib')
+        self.assertIsInstance(backend, ScalarBackend)
+        self.assertIs(get_backend(backend), backend)
+        with self.assertRaises(ValueError):
+            get_backend('decimal')
+        with self.assertRaises(TypeError):
+            get_backend(3)
+
+    def test_convert(self):
+        backend = get_backend('stdlib')
+        self.assertEqual(backend.convert(Fraction(3, 6)),
+                         fractions.Fraction(1, 2))
+        self.assertIsInstance(backend.convert(5), fractions.Fraction)
+        self.assertEqual(get_backend().convert(fractions.Fraction(2, 4)),
+                         Fraction(1, 2))
+        with self.assertRaises(TypeError):
+            backend.convert(0.5)
+
+    def test_helpers(self):
+        self.assertTrue(is_rational(Fraction(1, 2)))
+        self.assertTrue(is_rational(fractions.Fraction(1, 2)))
+        self.assertFalse(is_rational(1))
+        self.assertEqual(to_ratio(fractions.Fraction(-6, 4)), (-3, 2))
+        self.assertEqual(to_ratio(7), (7, 1))
+        self.assertEqual(bit_length(Fraction(5, 8)), 7)
+
+    def test_backends_pickle_by_name(self):
+        for backend in backends.values():
+            self.assertIs(pickle.loads(pickle.dumps(backend)), backend)
+
+    def test_set_default_backend(self):
+        try:
+            set_default_backend('stdlib')
+            matrix = Matrix(1, 1)
+            self.assertIs(matrix.backend, get_backend('stdlib'))
+        finally:
+            set_default_backend('builtin')
+        self.assertIs(Matrix(1, 1).backend, get_backend('builtin'))
+
+
+class TestMatrixBackends(unittest.TestCase):
+    def check_backend(self, name):
+        backend = get_backend(name)
+        matrix = build_matrix(ROWS, backend=name)
+        self.assertIs(matrix.backend, backend)
+        self.assertTrue(all(isinstance(entry, backend.scalar_type)
+                            for entry in matrix._flat()))
+
+        inverse = matrix.find_inverse()
+        self.assertIs(inverse.backend, backend)
+        self.assertTrue(all(isinstance(entry, backend.scalar_type)
+                            for entry in inverse._flat()))
+        self.assertEqual(matrix * inverse, identity_matrix(3))
+        self.assertEqual(matrix.find_determinant(), -1)
+
+        builtin = build_matrix(ROWS)
+        self.assertEqual(matrix, builtin)
+        self.assertEqual(inverse.convert('builtin'), builtin.find_inverse())
+        self.assertEqual((matrix + builtin).backend, backend)
+
+    def test_stdlib(self):
+        self.check_backend('stdlib')
+
+    @unittest.skipUnless(gmpy2, 'gmpy2 is not installed')
+    def test_gmpy2(self):
+        self.check_backend('gmpy2')
+        self.assertEqual(get_backend('gmpy2').convert(Fraction(1, 3)),
+                         gmpy2.mpq(1, 3))
+
+    def test_integer_matrices_keep_ints(self):
+        matrix = build_matrix(ROWS, True).convert('stdlib')
+        self.assertTrue(matrix.integer)
+        self.assertTrue(all(type(entry) is int for entry in matrix._flat()))
+
+
+if __name__ == '__main__':
+    unittest.main()
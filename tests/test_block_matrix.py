@@ -0,0 +1,107 @@
+import random
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from MatrixMath import BlockMatrix, Fraction, Matrix
+from MatrixMath.tests import build_matrix, random_matrix
+
+
+class TestBlockMatrix(unittest.TestCase):
+    def test_from_blocks_joins_the_grid(self):
+        a = build_matrix([[1, 2], [3, 4]], True)
+        b = build_matrix([[5], [6]], True)
+        c = build_matrix([[7, 8]], True)
+        d = build_matrix([[9]], True)
+        joined = Matrix.from_blocks([[a, b], [c, d]])
+        self.assertEqual(joined, build_matrix(
+            [[1, 2, 5], [3, 4, 6], [7, 8, 9]], True))
+
+    def test_mismatched_blocks_are_rejected(self):
+        a = build_matrix([[1, 2], [3, 4]], True)
+        b = build_matrix([[5]], True)
+        with self.assertRaises(ValueError):
+            BlockMatrix([[a, b]])
+        with self.assertRaises(TypeError):
+            BlockMatrix([[a, 1]])
+
+    def test_round_trip(self):
+        generator = random.Random(1)
+        matrix = random_matrix(5, 7, generator, 2)
+        blocks = matrix.to_blocks([2, 3], [3, 1, 3])
+        self.assertEqual(blocks.row_sizes, [2, 3])
+        self.assertEqual(blocks.col_sizes, [3, 1, 3])
+        self.assertEqual(blocks.to_matrix(), matrix)
+
+    def test_sum_and_product_match_dense(self):
+        generator = random.Random(2)
+        for _ in range(20):
+            first = random_matrix(5, 4, generator, 2)
+            second = random_matrix(4, 6, generator, 2)
+            third = random_matrix(5, 4, generator, 2)
+            self.assertEqual(
+                (first.to_blocks(2, 3) * second.to_blocks(3, 2)).to_matrix(),
+                first * second)
+            self.assertEqual(
+                (first.to_blocks(2, 3) + third.to_blocks(2, 3)).to_matrix(),
+                first + third)
+            self.assertEqual(
+                (first.to_blocks(2, 3) - third.to_blocks(2, 3)).to_matrix(),
+                first - third)
+
+    def test_products_through_an_executor(self):
+        generator = random.Random(3)
+        first = random_matrix(6, 6, generator, 2)
+        second = random_matrix(6, 6, generator, 2)
+        with ThreadPoolExecutor(2) as executor:
+            product = first.to_blocks(2, executor=executor) \
+                * second.to_blocks(2, executor=executor)
+        self.assertEqual(product.to_matrix(), first * second)
+
+    def test_odd_block_count_with_singular_leading_block(self):
+        # The leading 1 x 1 block is 0, so the Schur complement of D is
+        # used, and D has more blocks than A.
+        matrix = build_matrix([[0, 2, 0, 0, -1], [0, -1, 0, 0, 0],
+                               [0, 0, 0, -2, 1], [2, 0, 1, -2, -2],
+                               [-1, -1, 0, 0, 2]], True)
+        blocks = matrix.to_blocks(1)
+        self.assertEqual(blocks.find_determinant(), 2)
+        self.assertEqual(blocks.find_inverse().to_matrix(),
+                         matrix.find_inverse())
+
+    def test_inverse_and_determinant_match_dense(self):
+        generator = random.Random(4)
+        for trial in range(150):
+            size = generator.randint(2, 6)
+            matrix = random_matrix(size, size, generator, 2)
+            for sizes in (1, 2, [size - 1, 1]):
+                blocks = matrix.to_blocks(sizes)
+                self.assertEqual(blocks.find_determinant(),
+                                 matrix.find_determinant(), trial)
+                inverse = blocks.find_inverse()
+                expected = matrix.find_inverse()
+                if expected is None:
+                    self.assertIsNone(inverse)
+                else:
+                    self.assertEqual(inverse.to_matrix(), expected)
+
+    def test_solve_matches_dense(self):
+        generator = random.Random(5)
+        for _ in range(50):
+            size = generator.randint(2, 6)
+            matrix = random_matrix(size, size, generator, 2)
+            constants = [generator.randint(-3, 3) for _ in range(size)]
+            self.assertEqual(matrix.to_blocks(1).solve(constants),
+                             matrix.solve(constants))
+
+    def test_block_diagonal_rationals(self):
+        a = build_matrix([[Fraction(1, 2), 1], [0, 3]])
+        d = build_matrix([[Fraction(2, 3)]])
+        zero_right = Matrix(2, 1)
+        zero_below = Matrix(1, 2)
+        blocks = BlockMatrix([[a, zero_right], [zero_below, d]])
+        self.assertEqual(blocks.find_determinant(), Fraction(1, 1))
+        self.assertEqual(blocks.find_inverse().to_matrix(),
+                         blocks.to_matrix().find_inverse())
+
+
+if __name__ == '__main__':
+    unittest.main()
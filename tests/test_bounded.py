@@ -0,0 +1,116 @@
+import fractions
+import unittest
+from random import Random
+from MatrixMath import Fraction
+from MatrixMath.Fraction import best_approximation
+from MatrixMath.tests import build_matrix, random_matrix
+
+
+def largest_difference(first, second):
+    differences = map(lambda a, b: a - b, first._flat(), second._flat())
+    return max(abs(difference.numerator / difference.denominator)
+               for difference in differences)
+
+
+class TestBestApproximation(unittest.TestCase):
+    def test_matches_the_standard_library(self):
+        generator = Random(0)
+        for _ in range(500):
+            numerator = generator.randint(-10 ** 12, 10 ** 12)
+            denominator = generator.randint(1, 10 ** 12)
+            bound = generator.randint(1, 10 ** 4)
+            expected = fractions.Fraction(numerator, denominator) \
+                .limit_denominator(bound)
+            reduced = fractions.Fraction(numerator, denominator)
+            self.assertEqual(
+                best_approximation(reduced.numerator, reduced.denominator,
+                                   bound),
+                (expected.numerator, expected.denominator))
+
+    def test_limit_denominator(self):
+        self.assertEqual(Fraction(355, 113).limit_denominator(10),
+                         Fraction(22, 7))
+        half = Fraction(1, 2)
+        self.assertIs(half.limit_denominator(2), half)
+        with self.assertRaises(ValueError):
+            Fraction(1, 3).limit_denominator(0)
+
+
+class TestBoundedMatrix(unittest.TestCase):
+    def check_bounded(self, matrix, bound):
+        self.assertEqual(matrix.max_denominator, bound)
+        self.assertTrue(all(isinstance(entry, int)
+                            or entry.denominator <= bound
+                            for entry in matrix._flat()))
+
+    def test_bounded_copy(self):
+        exact = build_matrix([[Fraction(355, 113), Fraction(1, 3)]])
+        bounded = exact.bounded(10)
+        self.check_bounded(bounded, 10)
+        self.assertEqual(bounded.matrix[0][0], Fraction(22, 7))
+        self.assertEqual(bounded.matrix[0][1], Fraction(1, 3))
+        self.assertAlmostEqual(bounded.rounding_error,
+                               abs(22 / 7 - 355 / 113))
+        self.assertIsNone(exact.max_denominator)
+        self.assertEqual(exact.rounding_error, 0)
+
+    def test_results_stay_bounded_and_within_their_error(self):
+        first = random_matrix(4, seed=1, bound=50, denominator=97)
+        second = random_matrix(4, seed=2, bound=50, denominator=97)
+        bounded_first = first.bounded(1000)
+        bounded_second = second.bounded(1000)
+        for exact, bounded in ((first + second,
+                                bounded_first + bounded_second),
+                               (first - second,
+                                bounded_first - bounded_second),
+                               (first * second,
+                                bounded_first * bounded_second),
+                               (first * Fraction(7, 3),
+                                bounded_first * Fraction(7, 3)),
+                               (first ** 6, bounded_first ** 6)):
+            self.check_bounded(bounded, 1000)
+            self.assertLessEqual(largest_difference(exact, bounded),
+                                 bounded.rounding_error + 1e-12)
+
+    def test_in_place_operators(self):
+        first = random_matrix(3, seed=3, bound=50, denominator=97)
+        bounded = first.bounded(100)
+        bounded += random_matrix(3, seed=4, bound=50, denominator=97)
+        bounded *= Fraction(1, 7)
+        self.check_bounded(bounded, 100)
+        exact = (first + random_matrix(3, seed=4, bound=50, denominator=97)) \
+            * Fraction(1, 7)
+        self.assertLessEqual(largest_difference(exact, bounded),
+                             bounded.rounding_error + 1e-12)
+
+    def test_the_smaller_bound_is_kept(self):
+        first = random_matrix(3, seed=5, bound=50,
+                              denominator=97).bounded(100)
+        second = random_matrix(3, seed=6, bound=50,
+                               denominator=97).bounded(10)
+        self.check_bounded(first * second, 10)
+
+    def test_elimination_is_exact(self):
+        bounded = random_matrix(3, seed=7, bound=50,
+                                denominator=97).bounded(50)
+        copy = build_matrix(bounded._rows())
+        self.assertEqual(bounded.find_determinant(), copy.find_determinant())
+        self.assertEqual(bounded.find_inverse(), copy.find_inverse())
+
+    def test_integer_matrices_are_unchanged(self):
+        matrix = build_matrix([[1, 2], [3, 4]], True).bounded(1)
+        self.assertEqual(matrix ** 3, build_matrix([[37, 54],
+                                                    [81, 118]]))
+        self.assertEqual((matrix ** 3).rounding_error, 0)
+
+    def test_invalid_bounds(self):
+        matrix = random_matrix(2, seed=8, bound=50, denominator=97)
+        with self.assertRaises(TypeError):
+            matrix.bounded(1.5)
+        with self.assertRaises(ValueError):
+            matrix.bounded(0)
+        self.assertIsNone(matrix.bounded().max_denominator)
+
+
+if __name__ == '__main__':
+    unittest.main()
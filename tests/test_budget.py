@@ -0,0 +1,104 @@
+import asyncio
+import unittest
+from concurrent.futures import CancelledError
+from MatrixMath import Budget
+from MatrixMath.Budget import checkpoint
+from MatrixMath.tests import random_matrix
+
+
+class TestBudget(unittest.TestCase):
+    def test_checkpoints_do_nothing_without_a_budget(self):
+        checkpoint('eliminate', 1, 1, 10 ** 9)
+
+    def test_progress(self):
+        steps = []
+        matrix = random_matrix(5, bound=1000, integer=False)
+        with Budget(progress=lambda *step: steps.append(step)) as budget:
+            matrix.find_inverse()
+        self.assertIn(('eliminate', 1, 5), steps)
+        self.assertIn('reduce', {stage for stage, _, _ in steps})
+        self.assertGreater(budget.operations, 0)
+
+    def test_operation_limit(self):
+        for integer in (True, False):
+            matrix = random_matrix(30, bound=1000, integer=integer)
+            with self.assertRaises(TimeoutError):
+                with Budget(max_operations=1000):
+                    matrix.find_determinant()
+            self.assertFalse(matrix.determinant_found)
+            expected = random_matrix(30, bound=1000, integer=integer)
+            self.assertEqual(matrix.find_determinant(),
+                             expected.find_determinant())
+
+    def test_timeout(self):
+        with self.assertRaises(TimeoutError):
+            with Budget(timeout=1e-9):
+                random_matrix(30, bound=1000, integer=False).find_inverse()
+
+    def test_cancel(self):
+        budget = Budget()
+        budget.cancel()
+        with self.assertRaises(CancelledError):
+            with budget:
+                random_matrix(5, bound=1000, integer=False).find_determinant()
+
+    def test_budgets_nest(self):
+        outer = Budget()
+        inner = Budget(max_operations=1)
+        with outer:
+            with self.assertRaises(TimeoutError):
+                with inner:
+                    checkpoint('eliminate', 1, 1, 2)
+            checkpoint('eliminate', 1, 1, 2)
+        self.assertEqual(outer.operations, 2)
+        checkpoint('eliminate', 1, 1, 2)
+
+    def test_reduction_resumes(self):
+        matrix = random_matrix(20, bound=1000, integer=False)
+        factorization = matrix.factorize()
+        with self.assertRaises(TimeoutError):
+            with Budget(max_operations=500):
+                factorization.reduce()
+        self.assertFalse(factorization.reduced)
+        expected = random_matrix(20, bound=1000, integer=False)
+        self.assertEqual(matrix.find_inverse(), expected.find_inverse())
+
+    def test_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            Budget(timeout=0)
+        with self.assertRaises(TypeError):
+            Budget(max_operations=1.5)
+        with self.assertRaises(TypeError):
+            Budget(progress=1)
+
+
+class TestAsync(unittest.TestCase):
+    def test_results_match(self):
+        matrix = random_matrix(6, bound=1000, integer=False)
+        copy = matrix.copy_matrix()
+
+        async def main():
+            steps = []
+            determinant = await matrix.find_determinant_async()
+            inverse = await matrix.find_inverse_async(
+                progress=lambda *step: steps.append(step))
+            solution = await matrix.solve_async([1, 2, 3, 4, 5, 6])
+            return determinant, inverse, solution, steps
+
+        determinant, inverse, solution, steps = asyncio.run(main())
+        self.assertEqual(determinant, copy.find_determinant())
+        self.assertEqual(inverse, copy.find_inverse())
+        self.assertEqual(solution, copy.solve([1, 2, 3, 4, 5, 6]))
+        self.assertTrue(steps)
+
+    def test_limits(self):
+        async def main():
+            matrix = random_matrix(30, bound=1000)
+            await matrix.find_determinant_async(max_operations=1000)
+
+        with self.assertRaises(TimeoutError):
+            asyncio.run(main())
+
+
+if __name__ == '__main__':
+    unittest.main()
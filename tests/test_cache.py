@@ -0,0 +1,113 @@
+import unittest
+from MatrixMath import ResultCache, result_cache
+from MatrixMath.Cache import MISSING
+from MatrixMath.tests import build_matrix, identity_matrix
+
+
+class TestResultCache(unittest.TestCase):
+    def test_disabled_by_default(self):
+        cache = ResultCache()
+        matrix = build_matrix([[1, 2], [3, 4]], True)
+        self.assertIsNone(cache.find_digest(matrix))
+        cache.put(None, 'determinant', 5)
+        self.assertEqual(cache.statistics()['entries'], 0)
+
+    def test_hits_and_misses(self):
+        cache = ResultCache()
+        cache.enable()
+        digest = cache.find_digest(build_matrix([[1, 2], [3, 4]], True))
+        self.assertEqual(digest, cache.find_digest(
+            build_matrix([[1, 2], [3, 4]], True)))
+        self.assertNotEqual(digest, cache.find_digest(
+            build_matrix([[1, 2], [3, 5]], True)))
+
+        self.assertIs(cache.get(digest, 'determinant'), MISSING)
+        cache.put(digest, 'determinant', -2)
+        self.assertEqual(cache.get(digest, 'determinant'), -2)
+        statistics = cache.statistics()
+        self.assertEqual((statistics['hits'], statistics['misses']), (1, 1))
+        cache.reset_counters()
+        self.assertEqual(cache.statistics()['hits'], 0)
+
+    def test_results_are_copied(self):
+        cache = ResultCache()
+        cache.enable()
+        matrix = build_matrix([[1, 2], [3, 4]], True)
+        digest = cache.find_digest(matrix)
+        cache.put(digest, 'inverse', matrix)
+        matrix.store_value(9, 1, 1)
+        result = cache.get(digest, 'inverse')
+        self.assertEqual(result.matrix[0][0], 1)
+        result.store_value(7, 1, 1)
+        self.assertEqual(cache.get(digest, 'inverse').matrix[0][0], 1)
+
+    def test_least_recently_used_results_are_evicted(self):
+        cache = ResultCache(max_entries=2)
+        cache.enable()
+        cache.put(b'a', 'determinant', 1)
+        cache.put(b'b', 'determinant', 2)
+        cache.get(b'a', 'determinant')
+        cache.put(b'c', 'determinant', 3)
+        self.assertEqual(cache.get(b'a', 'determinant'), 1)
+        self.assertIs(cache.get(b'b', 'determinant'), MISSING)
+        self.assertEqual(cache.get(b'c', 'determinant'), 3)
+
+        cache.enable(max_entries=1)
+        self.assertEqual(cache.statistics()['entries'], 1)
+        cache.clear()
+        self.assertEqual(cache.statistics()['entries'], 0)
+        self.assertEqual(cache.statistics()['bytes'], 0)
+
+    def test_large_results_are_not_stored(self):
+        cache = ResultCache(max_bytes=100)
+        cache.enable()
+        cache.put(b'a', 'inverse', identity_matrix(10))
+        self.assertEqual(cache.statistics()['entries'], 0)
+
+    def test_invalid_limits(self):
+        with self.assertRaises(TypeError):
+            ResultCache(max_entries=1.5)
+        with self.assertRaises(ValueError):
+            ResultCache(max_bytes=0)
+        with self.assertRaises(ValueError):
+            ResultCache().enable(max_entries=-1)
+
+
+class TestMatrixResultCache(unittest.TestCase):
+    def setUp(self):
+        result_cache.enable()
+        result_cache.reset_counters()
+
+    def tearDown(self):
+        result_cache.disable()
+        result_cache.reset_counters()
+
+    def test_results_are_shared_between_equal_matrices(self):
+        rows = [[2, 1], [7, 4]]
+        first = build_matrix(rows, True)
+        self.assertEqual(first.find_determinant(), 1)
+        inverse = first.find_inverse()
+        hits = result_cache.statistics()['hits']
+
+        second = build_matrix(rows, True)
+        self.assertEqual(second.find_determinant(), 1)
+        self.assertEqual(second.find_inverse(), inverse)
+        self.assertFalse(second.factorization_found)
+        self.assertEqual(result_cache.statistics()['hits'], hits + 2)
+
+    def test_changed_matrices_stop_matching(self):
+        matrix = build_matrix([[2, 1], [7, 4]], True)
+        matrix.find_determinant()
+        other = build_matrix([[2, 1], [7, 5]], True)
+        self.assertEqual(other.find_determinant(), 3)
+
+    def test_disable_clears_the_cache(self):
+        build_matrix([[2, 1], [7, 4]], True).find_determinant()
+        self.assertGreater(result_cache.statistics()['entries'], 0)
+        result_cache.disable()
+        self.assertEqual(result_cache.statistics()['entries'], 0)
+        self.assertFalse(result_cache.statistics()['enabled'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+from MatrixMath import Fraction
+from MatrixMath.Factorization import Factorization, common_denominator_rows
+from MatrixMath.tests import build_matrix, random_matrix
+
+
+class TestCommonDenominator(unittest.TestCase):
+    def test_common_denominator_rows(self):
+        numerators, denominators = common_denominator_rows(
+            [[Fraction(1, 2), Fraction(2, 3), 4], [1, 2, 3]])
+        self.assertEqual(numerators, [[3, 4, 24], [1, 2, 3]])
+        self.assertEqual(denominators, [6, 1])
+
+    def test_normalize(self):
+        rows = [[4, -6, 8]]
+        denominators = [-10]
+        Factorization.normalize(rows, denominators, 0)
+        self.assertEqual(rows, [[-2, 3, -4]])
+        self.assertEqual(denominators, [5])
+
+    def test_both_representations_agree(self):
+        for seed in range(6):
+            matrix = random_matrix(5, 5, seed, 20, denominator=12)
+            rows = random_matrix(5, 1, seed + 100, 20, denominator=12)
+            constants = [row[0] for row in rows._rows()]
+            for pivoting in ('first', 'smallest'):
+                integer = Factorization(matrix, pivoting)
+                rational = Factorization(matrix, pivoting,
+                                         common_denominator=False)
+                self.assertTrue(integer.common_denominator)
+                self.assertEqual(integer.determinant, rational.determinant)
+                self.assertEqual(integer.operations, rational.operations)
+                self.assertEqual(integer.reduced_echelon_form,
+                                 rational.reduced_echelon_form)
+                self.assertEqual(integer.find_inverse(),
+                                 rational.find_inverse())
+                self.assertEqual(integer.find_solution(constants),
+                                 rational.find_solution(constants))
+
+    def test_rank_deficient_matrix(self):
+        matrix = build_matrix([[Fraction(1, 2), 1, Fraction(3, 2)],
+                               [1, 2, 3], [Fraction(1, 3), 0, 1]])
+        integer = Factorization(matrix)
+        rational = Factorization(matrix, common_denominator=False)
+        self.assertEqual(integer.rank, 2)
+        self.assertEqual(integer.determinant, 0)
+        self.assertEqual(integer.reduced_echelon_form,
+                         rational.reduced_echelon_form)
+        self.assertIsNone(integer.find_inverse())
+
+    def test_results_are_rationals_of_the_backend(self):
+        matrix = build_matrix([[2, 1], [1, 1]], backend='stdlib')
+        factorization = Factorization(matrix)
+        backend = matrix.backend
+        self.assertIsInstance(factorization.determinant, backend.scalar_type)
+        self.assertTrue(all(isinstance(entry, backend.scalar_type)
+                            for entry in factorization.find_inverse()._flat()))
+
+    def test_matrix_factorize(self):
+        matrix = random_matrix(3, 3, 7, 20, denominator=12)
+        factorization = matrix.factorize()
+        self.assertTrue(factorization.common_denominator)
+        rational = matrix.factorize(common_denominator=False)
+        self.assertFalse(rational.common_denominator)
+        self.assertIs(matrix.factorize(), rational)
+        with self.assertRaises(TypeError):
+            matrix.factorize(common_denominator=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
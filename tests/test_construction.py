@@ -0,0 +1,98 @@
+import fractions
+import unittest
+from array import array
+from MatrixMath import Fraction, FrozenMatrix, Matrix
+from MatrixMath.Matrix import CACHED_RESULTS
+
+
+class TestConstruction(unittest.TestCase):
+    def test_from_rows_matches_store_value(self):
+        stored = Matrix(2, 2)
+        for row, values in enumerate([[1, Fraction(1, 2)], [3, 4]]):
+            for col, value in enumerate(values):
+                stored.store_value(value, row + 1, col + 1)
+        built = Matrix.from_rows([[1, Fraction(1, 2)], [3, 4]])
+        self.assertEqual(built, stored)
+        self.assertTrue(all(isinstance(entry, Fraction)
+                            for entry in built._flat()))
+
+    def test_integer_domain_rejects_fractions(self):
+        with self.assertRaises(ValueError):
+            Matrix.from_rows([[Fraction(1, 2), 1], [1, 1]], True)
+        whole = Matrix.from_rows([[Fraction(4, 2), 1], [1, 1]], True)
+        self.assertEqual(whole._flat()[0], 2)
+        self.assertIsInstance(whole._flat()[0], int)
+
+    def test_invalid_entries_are_rejected(self):
+        with self.assertRaises(TypeError):
+            Matrix.from_rows([['1', 2], [3, 4]])
+        with self.assertRaises(TypeError):
+            Matrix.from_rows([[1.5, 2], [3, 4]])
+        with self.assertRaises(TypeError):
+            Matrix.from_flat(1, 2, [1, None])
+
+    def test_entries_are_converted_to_the_backend(self):
+        matrix = Matrix.from_rows([[Fraction(1, 2), 1], [2, 3]],
+                                  backend='stdlib')
+        self.assertTrue(all(isinstance(entry, fractions.Fraction)
+                            for entry in matrix._flat()))
+        self.assertEqual(matrix.find_determinant(),
+                         fractions.Fraction(-1, 2))
+
+    def test_dimensions_are_checked(self):
+        with self.assertRaises(ValueError):
+            Matrix.from_rows([[1, 2], [3]])
+        with self.assertRaises(ValueError):
+            Matrix.from_flat(2, 2, [1, 2, 3])
+        with self.assertRaises(ValueError):
+            Matrix.from_rows([])
+        with self.assertRaises(TypeError):
+            Matrix.from_flat(2.0, 1, [1, 2])
+
+    def test_from_flat_adopts_an_integer_array_only_without_copy(self):
+        values = array('q', [1, 2, 3, 4])
+        adopted = Matrix.from_flat(2, 2, values, True, copy=False)
+        copied = Matrix.from_flat(2, 2, values, True)
+        self.assertIs(adopted._flat(), values)
+        self.assertIsNot(copied._flat(), values)
+        rational = Matrix.from_flat(2, 2, values, False, copy=False)
+        self.assertIsNot(rational._flat(), values)
+        self.assertIsInstance(rational._flat()[0], Fraction)
+
+    def test_factories_return_plain_matrices(self):
+        self.assertIs(type(FrozenMatrix.from_rows([[1, 2]], True)), Matrix)
+        self.assertIs(type(FrozenMatrix.identity(2, True)), Matrix)
+        self.assertIs(type(FrozenMatrix.zeros(1, 2)), Matrix)
+
+    def test_zeros_and_identity(self):
+        self.assertEqual(Matrix.zeros(2, 3), Matrix(2, 3))
+        identity = Matrix.identity(3, True)
+        self.assertEqual(identity, Matrix.from_rows(
+            [[1, 0, 0], [0, 1, 0], [0, 0, 1]], True))
+        self.assertEqual(identity.find_determinant(), 1)
+        with self.assertRaises(ValueError):
+            Matrix.identity(0)
+
+    def test_results_are_stored_lazily(self):
+        matrix = Matrix.from_rows([[1, 2], [3, 4]], True)
+        self.assertFalse(any(name in matrix.__dict__
+                             for name in CACHED_RESULTS))
+        self.assertFalse(matrix.determinant_found)
+        self.assertEqual(matrix.find_determinant(), -2)
+        self.assertTrue(matrix.determinant_found)
+        matrix.init_cache()
+        self.assertFalse(matrix.determinant_found)
+        self.assertFalse(any(name in matrix.__dict__
+                             for name in CACHED_RESULTS))
+
+    def test_float_conversions_keep_their_entries(self):
+        matrix = Matrix.from_rows([[4, -1], [-1, 3]], True)
+        self.assertEqual(matrix.to_sparse().to_matrix()._flat(),
+                         [4, -1, -1, 3])
+        with matrix.to_tiled(2) as tiled:
+            self.assertEqual(tiled.to_matrix()._flat(),
+                             [4, -1, -1, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
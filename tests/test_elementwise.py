@@ -0,0 +1,93 @@
+import unittest
+from MatrixMath import Fraction, Matrix
+from MatrixMath.tests import build_matrix, identity_matrix
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestElementwise(unittest.TestCase):
+    def setUp(self):
+        self.first = build_matrix([[1, -2, 3], [-4, 5, -6]], True)
+        self.second = build_matrix([[2, 2, 2], [3, 3, -1]], True)
+
+    def test_map(self):
+        squares = self.first.map(lambda entry: entry * entry)
+        self.assertTrue(squares.integer)
+        self.assertEqual(squares, build_matrix([[1, 4, 9],
+                                                [16, 25, 36]]))
+        halves = self.first.map(lambda entry: Fraction(entry, 2))
+        self.assertFalse(halves.integer)
+        self.assertEqual(halves.matrix[0][0], Fraction(1, 2))
+        with self.assertRaises(TypeError):
+            self.first.map(2)
+
+    @unittest.skipUnless(numpy, 'NumPy is not installed')
+    def test_map_ufunc(self):
+        negated = self.first.map(numpy.negative)
+        self.assertTrue(negated.integer)
+        self.assertEqual(negated, -self.first)
+
+    def test_hadamard(self):
+        product = self.first.hadamard(self.second)
+        self.assertTrue(product.integer)
+        self.assertEqual(product, build_matrix([[2, -4, 6],
+                                                [-12, 15, 6]]))
+        big = self.first * 2 ** 40
+        self.assertEqual(big.hadamard(big).matrix[1][2], 36 * 2 ** 80)
+        with self.assertRaises(ValueError):
+            self.first.hadamard(Matrix(3, 2))
+
+    def test_divide(self):
+        quotient = self.first / self.second
+        self.assertFalse(quotient.integer)
+        self.assertEqual(quotient.matrix[0][0], Fraction(1, 2))
+        self.assertEqual(quotient.matrix[1][2], 6)
+        self.assertEqual(self.first / 2, self.first * Fraction(1, 2))
+        self.assertEqual((self.first / 0.5).matrix[0][0], 2.0)
+        for divisor in (0, 0.0, Matrix(2, 3, True)):
+            with self.assertRaises(ValueError):
+                self.first / divisor
+        with self.assertRaises(ValueError):
+            self.first.convert('stdlib') / Fraction(0, 1)
+        with self.assertRaises(TypeError):
+            self.first / 'a'
+
+    def test_kronecker(self):
+        first = build_matrix([[1, 2], [3, 4]], True)
+        second = build_matrix([[0, 5], [6, 7]], True)
+        self.assertEqual(first.kronecker(second), build_matrix(
+            [[0, 5, 0, 10], [6, 7, 12, 14],
+             [0, 15, 0, 20], [18, 21, 24, 28]]))
+        big = first * 2 ** 40
+        self.assertEqual(big.kronecker(big).matrix[3][3], 16 * 2 ** 80)
+        self.assertEqual(first.kronecker(identity_matrix(1, True)), first)
+
+    def test_reductions(self):
+        self.assertEqual(self.first.row_sums(), [2, -5])
+        self.assertEqual(self.first.column_sums(), [-3, 3, -3])
+        self.assertEqual(self.first.max_entry(), 5)
+        self.assertEqual(self.first.min_entry(), -6)
+        rational = self.first * Fraction(1, 3)
+        self.assertEqual(rational.row_sums(), [Fraction(2, 3),
+                                               Fraction(-5, 3)])
+        self.assertEqual(rational.max_entry(), Fraction(5, 3))
+
+    def test_norms(self):
+        self.assertAlmostEqual(self.first.norm(), 91 ** 0.5)
+        self.assertEqual(self.first.norm('max'), 6)
+        self.assertEqual(self.first.norm('one'), 9)
+        self.assertEqual(self.first.norm('infinity'), 15)
+        self.assertEqual((self.first * Fraction(1, 2)).norm('one'),
+                         Fraction(9, 2))
+        for backend in ('builtin', 'stdlib'):
+            half = (self.first * Fraction(1, 2)).convert(backend)
+            self.assertAlmostEqual(half.norm(), 91 ** 0.5 / 2)
+        with self.assertRaises(ValueError):
+            self.first.norm('two')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+from MatrixMath import Fraction
+from MatrixMath.Factorization import Factorization
+from MatrixMath.tests import build_matrix, identity_matrix
+
+
+class TestFactorization(unittest.TestCase):
+    def setUp(self):
+        self.matrix = build_matrix([[0, 2, 1], [1, 1, 0], [2, 0, 3]],
+                                   True)
+
+    def test_results(self):
+        factorization = Factorization(self.matrix)
+        self.assertEqual(factorization.rank, 3)
+        self.assertEqual(factorization.pivot_cols, [0, 1, 2])
+        self.assertEqual(factorization.determinant, -8)
+        self.assertEqual(factorization.reduced_echelon_form,
+                         identity_matrix(3))
+        inverse = factorization.find_inverse()
+        self.assertEqual(inverse * self.matrix, identity_matrix(3))
+
+    def test_methods_share_one_factorization(self):
+        factorization = self.matrix.factorize()
+        self.assertIs(self.matrix.factorize(), factorization)
+        self.assertEqual(self.matrix.find_determinant(), -8)
+        self.assertIs(self.matrix.find_inverse(), factorization.inverse)
+        self.assertIs(self.matrix.gaussian_elimination(),
+                      factorization.reduced_echelon_form)
+        self.assertEqual(self.matrix.solve([1, 2, 3]),
+                         factorization.find_solution([1, 2, 3]))
+        self.assertIs(self.matrix.factorize(), factorization)
+
+    def test_solve_reuses_the_factorization(self):
+        for constants in ([1, 0, 0], [0, 1, 0], [3, -1, Fraction(1, 2)]):
+            solution = self.matrix.solve(constants)
+            self.assertEqual(len(solution), 1)
+            values = build_matrix([[value] for value in solution[0]])
+            self.assertEqual(self.matrix * values,
+                             build_matrix([[value]
+                                           for value in constants]))
+        column = build_matrix([[1], [0], [0]], True)
+        self.assertEqual(self.matrix.solve(column),
+                         self.matrix.solve([1, 0, 0]))
+        with self.assertRaises(ValueError):
+            self.matrix.solve([1, 2])
+
+    def test_singular_matrix(self):
+        matrix = build_matrix([[1, 2, 3], [2, 4, 6], [1, 0, 1]], True)
+        factorization = matrix.factorize()
+        self.assertEqual(factorization.rank, 2)
+        self.assertEqual(factorization.pivot_cols, [0, 1])
+        self.assertEqual(matrix.find_determinant(), 0)
+        self.assertIsNone(matrix.find_inverse())
+        self.assertIsNone(matrix.solve([1, 0, 0]))
+
+        # x + 2y + 3z = 1 and x + z = 1 leave z free.
+        solution = matrix.solve([1, 2, 1])
+        self.assertEqual(solution, [[2, [-1, -1, 1]], [1, 0, 0]])
+
+    def test_find_solution_matches_solve(self):
+        augmented = build_matrix([[0, 2, 1, 4], [1, 1, 0, 5],
+                                  [2, 0, 3, 6]], True)
+        self.assertEqual(augmented.find_solution(),
+                         self.matrix.solve([4, 5, 6]))
+
+    def test_non_square_matrix(self):
+        matrix = build_matrix([[1, 2, 3], [4, 5, 6]], True)
+        factorization = matrix.factorize()
+        self.assertIsNone(factorization.determinant)
+        self.assertIsNone(factorization.find_inverse())
+        self.assertEqual(matrix.gaussian_elimination(),
+                         build_matrix([[1, 0, -1], [0, 1, 2]]))
+
+    def test_the_matrix_is_not_changed(self):
+        copy = self.matrix.copy_matrix()
+        Factorization(self.matrix).reduce()
+        self.assertEqual(self.matrix, copy)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(TypeError):
+            Factorization([[1]])
+        with self.assertRaises(ValueError):
+            self.matrix.factorize('largest')
+
+
+if __name__ == '__main__':
+    unittest.main()
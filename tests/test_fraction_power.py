@@ -0,0 +1,72 @@
+import math
+import unittest
+from MatrixMath import Fraction
+from MatrixMath.Fraction import integer_root
+
+
+class TestIntegerRoot(unittest.TestCase):
+    def test_perfect_powers(self):
+        self.assertEqual(integer_root(27, 3), (3, True))
+        self.assertEqual(integer_root(-32, 5), (-2, True))
+        self.assertEqual(integer_root(1, 7), (1, True))
+        self.assertEqual(integer_root((10 ** 40 + 7) ** 3, 3),
+                         (10 ** 40 + 7, True))
+
+    def test_floor_of_irrational_roots(self):
+        self.assertEqual(integer_root(26, 3), (2, False))
+        self.assertEqual(integer_root(2, 2), (1, False))
+        value = (10 ** 40 + 7) ** 3 - 1
+        self.assertEqual(integer_root(value, 3), (10 ** 40 + 6, False))
+
+    def test_invalid_roots(self):
+        with self.assertRaises(ValueError):
+            integer_root(-4, 2)
+        with self.assertRaises(ValueError):
+            integer_root(4, 0)
+        with self.assertRaises(TypeError):
+            integer_root(4.0, 2)
+
+
+class TestFractionPower(unittest.TestCase):
+    def test_int_powers(self):
+        self.assertEqual(Fraction(2, 3) ** 3, Fraction(8, 27))
+        self.assertEqual(Fraction(2, 3) ** -2, Fraction(9, 4))
+        self.assertEqual(Fraction(5, 7) ** 0, Fraction(1, 1))
+        with self.assertRaises(ValueError):
+            Fraction(0, 1) ** -1
+
+    def test_exact_rational_powers(self):
+        self.assertEqual(Fraction(4, 9) ** Fraction(1, 2), Fraction(2, 3))
+        self.assertEqual(Fraction(8, 27) ** Fraction(-2, 3), Fraction(9, 4))
+        self.assertEqual(Fraction(-8, 1) ** Fraction(1, 3), Fraction(-2, 1))
+        big = Fraction(3 ** 300, 2 ** 200)
+        self.assertEqual(big ** Fraction(1, 100), Fraction(27, 4))
+
+    def test_irrational_powers(self):
+        with self.assertRaises(ValueError):
+            Fraction(2, 1) ** Fraction(1, 2)
+        with self.assertRaises(ValueError):
+            Fraction(-4, 1) ** Fraction(1, 2)
+        root = Fraction(2, 1).power(Fraction(1, 2), allow_float=True)
+        self.assertAlmostEqual(root, math.sqrt(2))
+        cube = Fraction(-2, 1).power(Fraction(1, 3), allow_float=True)
+        self.assertAlmostEqual(cube, -2 ** (1 / 3))
+
+    def test_float_results_beyond_the_float_range(self):
+        huge = Fraction(10 ** 300 + 1, 1)
+        self.assertEqual(huge.power(Fraction(3, 2), allow_float=True),
+                         math.inf)
+        self.assertEqual((-huge).power(Fraction(5, 3), allow_float=True),
+                         -math.inf)
+        tiny = Fraction(1, 10 ** 300 + 1)
+        self.assertEqual(tiny.power(Fraction(3, 2), allow_float=True), 0.0)
+
+    def test_float_results_of_huge_operands(self):
+        # Neither operand fits in a float, but the result does.
+        value = Fraction(10 ** 400 + 1, 10 ** 398)
+        self.assertAlmostEqual(value.power(Fraction(1, 2), allow_float=True),
+                               10.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
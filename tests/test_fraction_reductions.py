@@ -0,0 +1,111 @@
+import fractions
+import unittest
+from functools import reduce
+from operator import add, mul
+from MatrixMath import Fraction, Matrix, get_backend
+from MatrixMath.Fraction import add_ratio, tree_product
+
+VALUES = [Fraction(1, 2), 3, Fraction(-5, 6), Fraction(7, 10), -2,
+          Fraction(4, 9)]
+OTHERS = [Fraction(2, 3), Fraction(-1, 4), 5, Fraction(9, 7), Fraction(1, 8),
+          -1]
+
+
+def as_stdlib(value):
+    if isinstance(value, Fraction):
+        return fractions.Fraction(value.numerator, value.denominator)
+    return value
+
+
+class TestHelpers(unittest.TestCase):
+    def test_add_ratio(self):
+        self.assertEqual(add_ratio(1, 4, 1, 4), (2, 4))
+        self.assertEqual(add_ratio(1, 4, 1, 6), (5, 12))
+        self.assertEqual(add_ratio(1, 2, -1, 3), (1, 6))
+
+    def test_tree_product(self):
+        self.assertEqual(tree_product([]), 1)
+        self.assertEqual(tree_product([7]), 7)
+        self.assertEqual(tree_product([2, 3, 5, 7, 11]), 2310)
+        self.assertEqual(tree_product(list(range(1, 21))), 2432902008176640000)
+
+
+class TestReductions(unittest.TestCase):
+    def check(self, result, expected):
+        self.assertIsInstance(result, Fraction)
+        self.assertEqual(as_stdlib(result), expected)
+        self.assertEqual(
+            (result.numerator, result.denominator),
+            (expected.numerator, expected.denominator))
+
+    def test_sum(self):
+        expected = sum(map(as_stdlib, VALUES))
+        self.check(Fraction.sum(VALUES), expected)
+        self.check(Fraction.sum(iter(VALUES)), expected)
+        self.check(Fraction.sum([Fraction(1, 2), Fraction(1, 2)]),
+                   fractions.Fraction(1))
+        self.assertEqual(Fraction.sum([1, 2, 3]), 6)
+        self.assertIsInstance(Fraction.sum([1, 2, 3]), int)
+        self.assertEqual(Fraction.sum([]), 0)
+
+    def test_prod(self):
+        expected = reduce(mul, map(as_stdlib, VALUES))
+        self.check(Fraction.prod(VALUES), expected)
+        self.check(Fraction.prod([Fraction(2, 3), Fraction(3, 2)]),
+                   fractions.Fraction(1))
+        self.assertEqual(Fraction.prod([2, 3, 4]), 24)
+        self.assertEqual(Fraction.prod([]), 1)
+        self.assertEqual(Fraction.prod([Fraction(1, 2), 0]), 0)
+
+    def test_dot(self):
+        expected = sum(map(mul, map(as_stdlib, VALUES),
+                           map(as_stdlib, OTHERS)))
+        self.check(Fraction.dot(VALUES, OTHERS), expected)
+        self.assertEqual(Fraction.dot([1, 2, 3], [4, 5, 6]), 32)
+        self.assertEqual(Fraction.dot([0.5, 1.0], [0.5, 2.0]), 2.25)
+
+    def test_matches_repeated_addition(self):
+        self.assertEqual(Fraction.sum(VALUES), reduce(add, VALUES))
+        self.assertEqual(Fraction.prod(VALUES), reduce(mul, VALUES))
+
+    def test_invalid_types(self):
+        with self.assertRaises(TypeError):
+            Fraction.sum([Fraction(1, 2), 'a'])
+        with self.assertRaises(TypeError):
+            Fraction.prod([1, None])
+
+
+class TestBackendHooks(unittest.TestCase):
+    def test_builtin_backend(self):
+        backend = get_backend('builtin')
+        self.assertEqual(backend.sum(VALUES), Fraction.sum(VALUES))
+        self.assertEqual(backend.prod(VALUES), Fraction.prod(VALUES))
+        self.assertEqual(backend.dot(VALUES, OTHERS),
+                         Fraction.dot(VALUES, OTHERS))
+
+    def test_stdlib_backend(self):
+        backend = get_backend('stdlib')
+        values = [as_stdlib(value) for value in VALUES]
+        others = [as_stdlib(value) for value in OTHERS]
+        self.assertEqual(backend.sum(values), sum(values))
+        self.assertEqual(backend.prod(values), reduce(mul, values))
+        self.assertEqual(backend.dot(values, others),
+                         sum(map(mul, values, others)))
+
+    def test_kernels_agree_across_backends(self):
+        rows = [[Fraction(1, 2), 2, Fraction(-1, 3)],
+                [Fraction(3, 4), Fraction(1, 5), 1],
+                [2, Fraction(-2, 7), Fraction(5, 6)]]
+        builtin = Matrix.from_rows(rows)
+        stdlib = Matrix.from_rows(rows, backend='stdlib')
+        self.assertEqual(as_stdlib(builtin.find_determinant()),
+                         stdlib.find_determinant())
+        product = builtin * builtin
+        expected = stdlib * stdlib
+        for row, expected_row in zip(product.matrix, expected.matrix):
+            self.assertEqual([as_stdlib(entry) for entry in row],
+                             expected_row)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import fractions
+import unittest
+from MatrixMath import Fraction, FrozenMatrix
+from MatrixMath.tests import build_matrix, identity_matrix
+
+
+class TestFrozenMatrix(unittest.TestCase):
+    def setUp(self):
+        self.matrix = build_matrix([[1, 2], [3, 4]], True)
+        self.frozen = self.matrix.freeze()
+
+    def test_freeze_copies_the_entries(self):
+        self.assertIsInstance(self.frozen, FrozenMatrix)
+        self.assertEqual(self.frozen, self.matrix)
+        self.matrix.store_value(9, 1, 1)
+        self.assertEqual(self.frozen.matrix, ((1, 2), (3, 4)))
+        self.assertIs(self.frozen.freeze(), self.frozen)
+
+    def test_views_can_be_frozen(self):
+        frozen = self.matrix.transpose_view().freeze()
+        self.assertEqual(frozen.matrix, ((1, 3), (2, 4)))
+
+    def test_equal_matrices_hash_equally(self):
+        other = build_matrix([[1, 2], [3, 4]], True).freeze()
+        self.assertIsNot(other, self.frozen)
+        self.assertEqual(hash(other), hash(self.frozen))
+        self.assertEqual(len({self.frozen, other}), 1)
+        self.assertEqual(hash(self.matrix.to_rational().freeze()),
+                         hash(self.frozen))
+
+        rows = [[Fraction(1, 2), 3]]
+        builtin = build_matrix(rows).freeze()
+        stdlib = build_matrix(rows, backend='stdlib').freeze()
+        self.assertEqual(builtin, stdlib)
+        self.assertEqual(hash(builtin), hash(stdlib))
+        self.assertIsInstance(stdlib.matrix[0][0], fractions.Fraction)
+
+    def test_dict_keys(self):
+        results = {self.frozen: 'first'}
+        key = build_matrix([[1, 2], [3, 4]], True).freeze()
+        self.assertEqual(results[key], 'first')
+        self.assertNotIn(identity_matrix(2, True).freeze(), results)
+
+    def test_unequal_matrices(self):
+        self.assertNotEqual(self.frozen, identity_matrix(2, True).freeze())
+        self.assertNotEqual(self.frozen,
+                            build_matrix([[1, 2, 3]], True).freeze())
+        self.assertNotEqual(self.frozen, self.matrix * 2)
+
+    def test_frozen_matrices_cannot_change(self):
+        with self.assertRaises(TypeError):
+            self.frozen.store_value(0, 1, 1)
+        with self.assertRaises(TypeError):
+            self.frozen.add_scaled(self.matrix)
+        with self.assertRaises(AttributeError):
+            self.frozen.matrix = [[0, 0], [0, 0]]
+        with self.assertRaises(TypeError):
+            self.frozen.matrix[0][0] = 0
+
+        result = self.frozen
+        result += self.matrix.freeze()
+        self.assertIsNot(result, self.frozen)
+        self.assertNotIsInstance(result, FrozenMatrix)
+        self.assertEqual(self.frozen.matrix, ((1, 2), (3, 4)))
+        result = self.frozen
+        result *= 2
+        self.assertEqual(result, self.frozen * 2)
+        self.assertEqual(self.frozen.matrix, ((1, 2), (3, 4)))
+
+    def test_results(self):
+        self.assertEqual(self.frozen.find_determinant(), -2)
+        self.assertEqual(self.frozen.find_inverse(),
+                         self.matrix.find_inverse())
+        self.assertEqual(self.frozen * self.frozen,
+                         self.matrix * self.matrix)
+
+
+if __name__ == '__main__':
+    unittest.main()
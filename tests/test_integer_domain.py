@@ -0,0 +1,81 @@
+import unittest
+from MatrixMath import Fraction, Matrix
+from MatrixMath.tests import build_matrix
+
+
+def entries_are_ints(matrix):
+    return all(type(entry) is int for entry in matrix._flat())
+
+
+class TestIntegerDomain(unittest.TestCase):
+    def setUp(self):
+        self.matrix = build_matrix([[2, 1, 3], [0, -1, 4], [5, 2, 1]],
+                                   True)
+        self.rational = self.matrix.to_rational()
+
+    def test_entries_stay_ints(self):
+        for result in (self.matrix + self.matrix, self.matrix * self.matrix,
+                       self.matrix * 3, self.matrix ** 5,
+                       self.matrix.find_transpose()):
+            self.assertTrue(result.integer)
+            self.assertTrue(entries_are_ints(result))
+
+    def test_results_match_the_rational_domain(self):
+        self.assertEqual(self.matrix * self.matrix,
+                         self.rational * self.rational)
+        self.assertEqual(self.matrix ** 5, self.rational ** 5)
+        determinant = self.matrix.find_determinant()
+        self.assertIs(type(determinant), int)
+        self.assertEqual(determinant, self.rational.find_determinant())
+        self.assertEqual(determinant, 17)
+
+    def test_powers(self):
+        product = build_matrix([[1, 0, 0], [0, 1, 0], [0, 0, 1]], True)
+        for power in range(6):
+            self.assertEqual(self.matrix ** power, product)
+            product = product * self.matrix
+
+    def test_division_leaves_the_integer_domain(self):
+        inverse = self.matrix.find_inverse()
+        self.assertFalse(inverse.integer)
+        self.assertEqual(inverse * self.rational,
+                         build_matrix([[1, 0, 0], [0, 1, 0], [0, 0, 1]]))
+        self.assertEqual(self.matrix ** -1, inverse)
+        self.assertIs(self.matrix.find_inverse(), inverse)
+
+    def test_singular_negative_power(self):
+        singular = build_matrix([[1, 2], [2, 4]], True)
+        with self.assertRaises(ValueError):
+            singular ** -1
+
+    def test_row_operations(self):
+        result = self.matrix.add_row(1, 2, 2)
+        self.assertTrue(result.integer)
+        self.assertEqual(result._row(0).tolist(), [2, -1, 11])
+        result = self.matrix.multiply_row(1, Fraction(1, 2))
+        self.assertFalse(result.integer)
+        self.assertEqual(result.matrix[0][0], 1)
+
+    def test_store_value(self):
+        matrix = Matrix(2, 2, True)
+        matrix.store_value(Fraction(6, 3), 1, 1)
+        self.assertIs(type(matrix.matrix[0][0]), int)
+        with self.assertRaises(ValueError):
+            matrix.store_value(Fraction(1, 2), 1, 2)
+
+    def test_conversions(self):
+        self.assertFalse(self.rational.integer)
+        self.assertEqual(self.rational.to_integer(), self.matrix)
+        self.assertTrue(entries_are_ints(self.rational.to_integer()))
+        with self.assertRaises(ValueError):
+            self.matrix.find_inverse().to_integer()
+
+    def test_large_fractions_reduce_exactly(self):
+        big = 2 ** 80 + 1
+        fraction = Fraction(big * 3, 3)
+        self.assertEqual(fraction.numerator, big)
+        self.assertEqual(fraction.denominator, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
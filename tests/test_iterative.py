@@ -0,0 +1,112 @@
+import unittest
+from MatrixMath import Fraction, SparseMatrix
+from MatrixMath.Iterative import METHODS, solve_iterative
+from MatrixMath.tests import build_matrix
+
+
+def tridiagonal(size):
+    entries = []
+    for i in range(size):
+        entries.append((i, i, 4))
+        if i:
+            entries.append((i, i - 1, -1))
+            entries.append((i - 1, i, -1))
+    return SparseMatrix(size, size, entries)
+
+
+class TestSparseMatrix(unittest.TestCase):
+    def test_entries(self):
+        sparse = SparseMatrix(2, 3, [(0, 1, 2), (0, 1, 3), (1, 2, 0),
+                                     (1, 0, Fraction(1, 2))])
+        self.assertEqual(sparse.count_nonzero(), 2)
+        self.assertEqual(sparse.get(0, 1), 5.0)
+        self.assertEqual(sparse.get(1, 0), 0.5)
+        self.assertEqual(sparse.get(1, 2), 0.0)
+        self.assertEqual(sparse.matvec([1, 2, 3]), [10.0, 0.5])
+        self.assertEqual(sparse.diagonal(), [0.0, 0.0])
+
+    def test_conversions(self):
+        matrix = build_matrix([[0, 2], [Fraction(1, 4), 0]])
+        sparse = matrix.to_sparse()
+        self.assertEqual(sparse.count_nonzero(), 2)
+        dense = sparse.to_matrix()
+        self.assertEqual(dense, matrix)
+        self.assertEqual(sparse.to_matrix('stdlib'), matrix)
+
+    def test_round_trip_keeps_the_exact_methods(self):
+        matrix = build_matrix([[4, 1], [2, 3]])
+        dense = SparseMatrix.from_matrix(matrix).to_matrix()
+        self.assertEqual(dense.find_determinant(), 10)
+        self.assertEqual(dense.find_trace(), 7)
+        self.assertEqual(dense.find_inverse(), matrix.find_inverse())
+        self.assertEqual(dense.solve([1, 1]), matrix.solve([1, 1]))
+
+        # Floats are converted exactly, not to the nearest simple rational.
+        dense = SparseMatrix(1, 2, [(0, 0, 0.1)]).to_matrix()
+        self.assertEqual(dense._flat()[0], Fraction(*(0.1).as_integer_ratio()))
+        with self.assertRaises(ValueError):
+            SparseMatrix(1, 1, [(0, 0, float('nan'))]).to_matrix()
+
+    def test_invalid_entries(self):
+        with self.assertRaises(ValueError):
+            SparseMatrix(0, 2)
+        with self.assertRaises(IndexError):
+            SparseMatrix(2, 2, [(2, 0, 1)])
+        with self.assertRaises(ValueError):
+            SparseMatrix(2, 2).matvec([1])
+
+
+class TestIterative(unittest.TestCase):
+    def setUp(self):
+        self.size = 20
+        self.sparse = tridiagonal(self.size)
+        self.constants = [i % 3 - 1 for i in range(self.size)]
+        exact = build_matrix(
+            [[int(self.sparse.get(i, j)) for j in range(self.size)]
+             for i in range(self.size)], True).solve(self.constants)[0]
+        self.exact = [float(entry.numerator) / entry.denominator
+                      for entry in exact]
+
+    def test_every_method_converges(self):
+        for method in METHODS:
+            for preconditioner in (False, True):
+                result = solve_iterative(
+                    self.sparse, self.constants, method,
+                    diagonal_preconditioner=preconditioner)
+                self.assertTrue(result.converged, method)
+                self.assertEqual(result.method, method)
+                self.assertEqual(result.iterations, len(result.history) - 1)
+                for value, expected in zip(result.solution, self.exact):
+                    self.assertAlmostEqual(value, expected, places=8)
+
+    def test_successive_over_relaxation(self):
+        result = self.sparse.solve_iterative(self.constants, 'gauss_seidel',
+                                             relaxation=1.1)
+        self.assertTrue(result.converged)
+        for value, expected in zip(result.solution, self.exact):
+            self.assertAlmostEqual(value, expected, places=8)
+
+    def test_matrix_solve_iterative(self):
+        matrix = self.sparse.to_matrix()
+        result = matrix.solve_iterative(self.constants, 'jacobi')
+        self.assertTrue(result.converged)
+
+    def test_iteration_limit(self):
+        result = solve_iterative(self.sparse, self.constants, 'jacobi',
+                                 max_iterations=2)
+        self.assertFalse(result.converged)
+        self.assertEqual(result.iterations, 2)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            solve_iterative(self.sparse, self.constants, 'newton')
+        with self.assertRaises(ValueError):
+            solve_iterative(self.sparse, [1, 2])
+        with self.assertRaises(ValueError):
+            solve_iterative(SparseMatrix(2, 3), [1, 2])
+        with self.assertRaises(TypeError):
+            solve_iterative([[1]], [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import unittest
+from random import Random
+from MatrixMath import Fraction, Matrix, MatrixBatch
+from MatrixMath.tests import build_matrix, random_matrix
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def random_matrices(count, size, bound, seed):
+    generator = Random(seed)
+    return [random_matrix(size, size, generator, bound)
+            for _ in range(count)]
+
+
+@unittest.skipUnless(numpy, 'NumPy is not installed')
+class TestMatrixBatch(unittest.TestCase):
+    def test_round_trip(self):
+        matrices = random_matrices(5, 3, 9, 0)
+        batch = MatrixBatch.from_matrices(matrices)
+        self.assertEqual(len(batch), 5)
+        self.assertTrue(batch.integer)
+        self.assertEqual(batch.to_matrices(), matrices)
+        self.assertTrue(batch[0].integer)
+
+    def test_exact_determinants(self):
+        for size in range(1, 7):
+            matrices = random_matrices(6, size, 9, size)
+            batch = MatrixBatch.from_matrices(matrices)
+            self.assertEqual([int(value) for value in batch.determinant()],
+                             [matrix.find_determinant()
+                              for matrix in matrices])
+
+    def test_large_entries_do_not_overflow(self):
+        matrices = random_matrices(4, 4, 2 ** 40, 1)
+        batch = MatrixBatch.from_matrices(matrices)
+        self.assertEqual(list(batch.determinant()),
+                         [matrix.find_determinant() for matrix in matrices])
+        product = batch @ batch
+        self.assertEqual(product.to_matrices(),
+                         [matrix * matrix for matrix in matrices])
+
+    def test_large_unsigned_entries_stay_exact(self):
+        batch = MatrixBatch(numpy.array([[[2 ** 63 + 5, 1], [2, 3]]],
+                                        dtype=numpy.uint64))
+        self.assertTrue(batch.integer)
+        self.assertEqual(batch.data[0, 0, 0], 2 ** 63 + 5)
+        self.assertEqual(list(batch.determinant()),
+                         [3 * (2 ** 63 + 5) - 2])
+        small = MatrixBatch(numpy.array([[[7]]], dtype=numpy.uint64))
+        self.assertEqual(small.data.dtype, numpy.int64)
+
+    def test_exact_inverses(self):
+        matrices = random_matrices(6, 3, 3, 2)
+        matrices.append(build_matrix([[1, 2, 3], [2, 4, 6], [0, 0, 1]],
+                                     True))
+        inverses = MatrixBatch.from_matrices(matrices).inverse(True)
+        self.assertEqual(inverses, [matrix.find_inverse()
+                                    for matrix in matrices])
+        self.assertIsNone(inverses[-1])
+
+    def test_float_inverses(self):
+        for size in (2, 5):
+            matrices = random_matrices(4, size, 9, size + 10)
+            matrices.append(Matrix(size, size, True))
+            inverse = MatrixBatch.from_matrices(matrices).inverse()
+            self.assertFalse(inverse.integer)
+            for index, matrix in enumerate(matrices[:-1]):
+                exact = matrix.find_inverse()
+                if exact is None:
+                    continue
+                expected = [[value.numerator / value.denominator
+                             for value in row] for row in exact._rows()]
+                self.assertTrue(numpy.allclose(inverse.data[index],
+                                               expected))
+            self.assertTrue(numpy.isnan(inverse.data[-1]).all())
+
+    def test_float_matrices_keep_the_exact_methods(self):
+        batch = MatrixBatch([[[4.0, -1.0], [-1.0, 3.0]], [[0.1, 0], [0, 1]]])
+        first, second = batch.to_matrices()
+        self.assertFalse(first.integer)
+        self.assertEqual(first.find_determinant(), 11)
+        self.assertEqual(first.find_trace(), 7)
+        self.assertEqual(first.find_inverse(),
+                         build_matrix([[4, -1], [-1, 3]]).find_inverse())
+        self.assertEqual(second.matrix[0][0],
+                         Fraction(*(0.1).as_integer_ratio()))
+        with self.assertRaises(ValueError):
+            MatrixBatch([[[float('nan')]]])[0]
+
+    def test_transpose_and_products(self):
+        matrices = random_matrices(3, 3, 9, 3)
+        batch = MatrixBatch.from_matrices(matrices)
+        self.assertEqual(batch.transpose().to_matrices(),
+                         [matrix.find_transpose() for matrix in matrices])
+        single = matrices[0]
+        self.assertEqual((batch * single).to_matrices(),
+                         [matrix * single for matrix in matrices])
+
+    def test_invalid_batches(self):
+        with self.assertRaises(ValueError):
+            MatrixBatch([[1, 2], [3, 4]])
+        with self.assertRaises(TypeError):
+            MatrixBatch([[['a']]])
+        with self.assertRaises(ValueError):
+            MatrixBatch.from_matrices([Matrix(2, 2), Matrix(3, 3)])
+        batch = MatrixBatch(numpy.zeros((2, 2, 3)))
+        self.assertIsNone(batch.determinant())
+        with self.assertRaises(TypeError):
+            batch.inverse(True)
+        with self.assertRaises(ValueError):
+            batch @ batch
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+import random
+import unittest
+from unittest import mock
+from MatrixMath import Fraction, Matrix, ModularMatrix
+
+PRIME = 1000000007
+LARGE_PRIME = 2305843009213693951
+
+
+def fibonacci(index: int, modulus: int) -> tuple:
+    """
+    Returns F(index) and F(index + 1) modulo modulus by fast doubling.
+    """
+    if not index:
+        return 0, 1
+    first, second = fibonacci(index // 2, modulus)
+    doubled = first * (2 * second - first) % modulus
+    following = (first * first + second * second) % modulus
+    if index % 2:
+        return following, (doubled + following) % modulus
+    return doubled, following
+
+
+def product_rows(first: list, second: list, modulus: int) -> list:
+    return [[sum(left * right for left, right in zip(row, column)) % modulus
+             for column in zip(*second)] for row in first]
+
+
+class TestConstruction(unittest.TestCase):
+    def test_residues(self):
+        matrix = ModularMatrix.from_rows([[-1, 8], [Fraction(1, 2), 3]], 7)
+        self.assertEqual(matrix.rows_list(), [[6, 1], [4, 3]])
+        self.assertEqual(matrix.get(1, 0), 4)
+        matrix.set(1, 0, Fraction(-1, 3))
+        self.assertEqual(matrix.get(1, 0), 2)
+        self.assertEqual(str(matrix), '[6 1]\n[2 3] (mod 7)')
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            ModularMatrix.from_rows([[Fraction(1, 7)]], 7)
+        with self.assertRaises(ValueError):
+            ModularMatrix(2, 2, 1)
+        with self.assertRaises(ValueError):
+            ModularMatrix(2, 2, 2 ** 62 + 1)
+        with self.assertRaises(TypeError):
+            ModularMatrix(2, 2, 7.0)
+        with self.assertRaises(ValueError):
+            ModularMatrix(2, 2, 7, [1, 2, 3])
+        with self.assertRaises(IndexError):
+            ModularMatrix(2, 2, 7).get(2, 0)
+
+    def test_matrix_conversions(self):
+        matrix = Matrix.from_rows([[1, Fraction(1, 2)], [-3, 4]])
+        modular = matrix.to_modular(5)
+        self.assertEqual(modular, ModularMatrix.from_matrix(matrix, 5))
+        self.assertEqual(modular.rows_list(), [[1, 3], [2, 4]])
+        self.assertEqual(modular.to_matrix(),
+                         Matrix.from_rows([[1, 3], [2, 4]], True))
+        with self.assertRaises(TypeError):
+            ModularMatrix.from_matrix([[1]], 5)
+
+
+class TestArithmetic(unittest.TestCase):
+    def setUp(self):
+        self.first = ModularMatrix.from_rows([[1, 2], [3, 4]], 5)
+        self.second = ModularMatrix.from_rows([[4, 4], [0, 1]], 5)
+
+    def test_ring_operations(self):
+        self.assertEqual((self.first + self.second).rows_list(),
+                         [[0, 1], [3, 0]])
+        self.assertEqual((self.first - self.second).rows_list(),
+                         [[2, 3], [3, 3]])
+        self.assertEqual((-self.first).rows_list(), [[4, 3], [2, 1]])
+        self.assertEqual((2 * self.first).rows_list(), [[2, 4], [1, 3]])
+        self.assertEqual((self.first * self.second).rows_list(),
+                         [[4, 1], [2, 1]])
+        self.assertEqual(self.first @ self.second,
+                         self.first * self.second)
+        self.assertEqual(self.first.transpose().rows_list(),
+                         [[1, 3], [2, 4]])
+
+    def test_mismatches(self):
+        with self.assertRaises(ValueError):
+            self.first + ModularMatrix.from_rows([[1, 2], [3, 4]], 7)
+        with self.assertRaises(ValueError):
+            self.first * ModularMatrix(3, 3, 5)
+        with self.assertRaises(TypeError):
+            self.first * Matrix.from_rows([[1, 2], [3, 4]], True)
+        with self.assertRaises(ValueError):
+            self.first * Fraction(1, 5)
+
+    def test_large_products(self):
+        generator = random.Random(5)
+        for modulus, inner in ((PRIME, 40), (LARGE_PRIME, 12),
+                               (2 ** 62, 3)):
+            first = [[generator.randrange(modulus) for _ in range(inner)]
+                     for _ in range(3)]
+            second = [[generator.randrange(modulus) for _ in range(4)]
+                      for _ in range(inner)]
+            expected = product_rows(first, second, modulus)
+            product = ModularMatrix.from_rows(first, modulus) \
+                * ModularMatrix.from_rows(second, modulus)
+            self.assertEqual(product.rows_list(), expected)
+            with mock.patch('MatrixMath.ModularMatrix.numpy', None):
+                product = ModularMatrix.from_rows(first, modulus) \
+                    * ModularMatrix.from_rows(second, modulus)
+            self.assertEqual(product.rows_list(), expected)
+
+    def test_power(self):
+        for modulus in (PRIME, LARGE_PRIME):
+            matrix = ModularMatrix.from_rows([[1, 1], [1, 0]], modulus)
+            power = 10 ** 18
+            fib, following = fibonacci(power, modulus)
+            previous = (following - fib) % modulus
+            self.assertEqual((matrix ** power).rows_list(),
+                             [[following, fib], [fib, previous]])
+        self.assertEqual(self.first ** 0, ModularMatrix.identity(2, 5))
+        self.assertEqual(self.first ** 3,
+                         self.first * self.first * self.first)
+        self.assertEqual(self.first ** -1 * self.first,
+                         ModularMatrix.identity(2, 5))
+        with self.assertRaises(ValueError):
+            ModularMatrix.from_rows([[1, 2], [2, 4]], 5) ** -1
+        with self.assertRaises(TypeError):
+            self.first ** 1.5
+
+
+class TestElimination(unittest.TestCase):
+    def setUp(self):
+        self.regular = ModularMatrix.from_rows(
+            [[2, 0, 1], [1, 3, 2], [1, 1, 2]], 7)
+        self.singular = ModularMatrix.from_rows(
+            [[1, 2, 3], [4, 5, 6], [7, 8, 9]], 7)
+
+    def test_rank_and_determinant(self):
+        self.assertEqual(self.regular.find_rank(), 3)
+        self.assertEqual(self.singular.find_rank(), 2)
+        self.assertEqual(self.regular.find_determinant(), 6)
+        self.assertEqual(self.singular.find_determinant(), 0)
+        self.assertEqual(ModularMatrix.from_rows(
+            [[2, 0, 1], [1, 3, 2], [1, 1, 2]], 4).find_determinant(), 2)
+        self.assertIsNone(ModularMatrix(2, 3, 7).find_determinant())
+
+    def test_inverse(self):
+        inverse = self.regular.find_inverse()
+        self.assertEqual(inverse * self.regular,
+                         ModularMatrix.identity(3, 7))
+        self.assertIsNone(self.singular.find_inverse())
+
+    def test_solve(self):
+        solution = self.regular.solve([1, 2, 3])
+        self.assertEqual(len(solution), 1)
+        values = ModularMatrix(3, 1, 7, solution[0])
+        self.assertEqual((self.regular * values).rows_list(),
+                         [[1], [2], [3]])
+
+        constants = ModularMatrix.from_rows([[1], [1], [1]], 7)
+        solution = self.singular.solve(constants)
+        self.assertEqual(len(solution), 2)
+        column, vector = solution[0]
+        for parameter in range(7):
+            values = ModularMatrix(3, 1, 7, [
+                value + parameter * entry
+                for value, entry in zip(solution[-1], vector)])
+            self.assertEqual((self.singular * values).rows_list(),
+                             [[1], [1], [1]])
+        self.assertIsNone(self.singular.solve([1, 2, 4]))
+        with self.assertRaises(ValueError):
+            self.regular.solve([1, 2])
+
+    def test_composite_modulus(self):
+        matrix = ModularMatrix.from_rows([[1, 2], [3, 4]], 6)
+        for method in (matrix.find_rank, matrix.find_inverse):
+            with self.assertRaises(ValueError):
+                method()
+        with self.assertRaises(ValueError):
+            matrix.solve([1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
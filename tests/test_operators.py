@@ -0,0 +1,81 @@
+import unittest
+from array import array
+from MatrixMath import Fraction, Matrix
+from MatrixMath.tests import build_matrix, identity_matrix
+
+
+class TestOperators(unittest.TestCase):
+    def setUp(self):
+        self.first = build_matrix([[1, 2], [3, 4]], True)
+        self.second = build_matrix([[5, -6], [7, 0]], True)
+
+    def test_sub_and_neg(self):
+        difference = self.first - self.second
+        self.assertTrue(difference.integer)
+        self.assertEqual(difference, build_matrix([[-4, 8], [-4, 4]]))
+        self.assertEqual(-self.first, self.first * -1)
+        self.assertEqual(self.first - self.first, Matrix(2, 2))
+        with self.assertRaises(TypeError):
+            self.first - 1
+        with self.assertRaises(ValueError):
+            self.first - Matrix(2, 3)
+
+    def test_scalars(self):
+        self.assertEqual(self.first * 2, 2 * self.first)
+        self.assertTrue((self.first * Fraction(4, 2)).integer)
+        half = self.first * Fraction(1, 2)
+        self.assertFalse(half.integer)
+        self.assertEqual(half.matrix[0][0], Fraction(1, 2))
+        self.assertEqual(Fraction(1, 2) * self.first, half)
+        self.assertEqual(self.first * 0.5, half)
+        self.assertEqual((self.first * 0.1).matrix[0][0],
+                         Fraction(*(0.1).as_integer_ratio()))
+        with self.assertRaises(TypeError):
+            self.first * 'a'
+        with self.assertRaises(ValueError):
+            self.first * float('inf')
+
+    def test_add_scaled(self):
+        result = self.first.copy_matrix()
+        self.assertIs(result.add_scaled(self.second, 3), result)
+        self.assertEqual(result, self.first + self.second * 3)
+        self.assertTrue(result.integer)
+        result.add_scaled(self.second, Fraction(1, 2))
+        self.assertFalse(result.integer)
+        self.assertEqual(result, self.first + self.second * Fraction(7, 2))
+
+    def test_in_place_operators(self):
+        result = self.first.copy_matrix()
+        buffer = result._flat()
+        result += self.second
+        self.assertEqual(result, self.first + self.second)
+        result -= self.second
+        self.assertEqual(result, self.first)
+        result *= 3
+        self.assertEqual(result, self.first * 3)
+        self.assertIs(result._flat(), buffer)
+        self.assertIsInstance(buffer, array)
+
+        result *= build_matrix([[1], [1]], True)
+        self.assertEqual((result.rows, result.cols), (2, 1))
+        self.assertEqual(result, build_matrix([[9], [21]]))
+
+    def test_in_place_operators_clear_stored_results(self):
+        result = self.first.copy_matrix()
+        self.assertEqual(result.find_determinant(), -2)
+        result += identity_matrix(2, True)
+        self.assertEqual(result.find_determinant(), 4)
+        result *= 2
+        self.assertEqual(result.find_determinant(), 16)
+        result -= identity_matrix(2, True)
+        self.assertEqual(result.find_determinant(), 3)
+
+    def test_values_too_large_for_the_array(self):
+        result = self.first.copy_matrix()
+        result *= 2 ** 70
+        self.assertEqual(result.matrix[1][1], 2 ** 72)
+        self.assertTrue(result.integer)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+from MatrixMath import Fraction
+from MatrixMath.Factorization import PIVOTING, choose_pivot
+from MatrixMath.tests import build_matrix, random_matrix
+
+
+class TestPivoting(unittest.TestCase):
+    def test_choose_pivot(self):
+        rows = [[0, 1, 1], [Fraction(1000, 3), 1, 0], [0, 0, 0], [2, 1, 1]]
+        self.assertEqual(choose_pivot(rows, 0, 0, 'first'), 1)
+        self.assertEqual(choose_pivot(rows, 0, 0, 'smallest'), 3)
+        rows = [[0, 1, 1], [5, 1, 1], [0, 0, 0], [7, 0, 0]]
+        self.assertEqual(choose_pivot(rows, 0, 0, 'sparse'), 3)
+        self.assertIsNone(choose_pivot(rows, 2, 2, 'first'))
+        self.assertIsNone(choose_pivot(rows, 2, 1, 'smallest'))
+
+    def test_strategies_give_the_same_results(self):
+        for seed in range(5):
+            matrix = random_matrix(6, seed=seed)
+            results = []
+            for pivoting in PIVOTING:
+                copy = matrix.copy_matrix()
+                results.append((copy.find_determinant(pivoting),
+                                copy.find_inverse(pivoting),
+                                copy.gaussian_elimination(pivoting),
+                                copy.solve([1, 2, 3, 4, 5, 6], pivoting)))
+            self.assertEqual(results[0], results[1])
+            self.assertEqual(results[0], results[2])
+
+    def test_a_new_strategy_factorizes_again(self):
+        matrix = random_matrix(4, seed=0)
+        first = matrix.factorize('first')
+        self.assertIs(matrix.factorize(), first)
+        sparse = matrix.factorize('sparse')
+        self.assertIsNot(sparse, first)
+        self.assertEqual(sparse.pivoting, 'sparse')
+        self.assertIs(matrix.factorize(), sparse)
+
+    def test_elimination_statistics(self):
+        matrix = build_matrix([[0, 2, 4], [3, 1, 1], [6, 5, 9]], True)
+        statistics = matrix.elimination_statistics('smallest')
+        self.assertEqual(statistics['pivoting'], 'smallest')
+        self.assertEqual(statistics['rank'], 3)
+        self.assertTrue(statistics['reduced'])
+        self.assertGreaterEqual(statistics['swaps'], 1)
+        self.assertGreaterEqual(statistics['operations'],
+                                statistics['swaps'])
+        self.assertIsInstance(statistics['peak_bit_length'], int)
+        self.assertGreater(statistics['peak_bit_length'], 0)
+        self.assertIs(matrix.elimination_statistics()['pivoting'],
+                      'smallest')
+
+    def test_bit_length_is_only_tracked_when_asked(self):
+        matrix = random_matrix(3, seed=1)
+        self.assertIsNone(matrix.factorize().statistics()['peak_bit_length'])
+
+    def test_invalid_strategies(self):
+        matrix = random_matrix(3, seed=2)
+        with self.assertRaises(ValueError):
+            matrix.find_determinant('partial')
+        with self.assertRaises(TypeError):
+            matrix.elimination_statistics(1)
+
+
+if __name__ == '__main__':
+    unittest.main()
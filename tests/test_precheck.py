@@ -0,0 +1,117 @@
+import unittest
+from MatrixMath import Fraction, ModularPrecheck, modular_precheck
+from MatrixMath.Precheck import eliminate_modulo, is_prime, residue
+from MatrixMath.tests import build_matrix, identity_matrix
+
+
+SINGULAR = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+REGULAR = [[2, 0, 1], [1, 3, 2], [1, 1, 2]]
+
+
+class TestModularArithmetic(unittest.TestCase):
+    def test_is_prime(self):
+        primes = [value for value in range(50) if is_prime(value)]
+        self.assertEqual(primes, [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31,
+                                  37, 41, 43, 47])
+        self.assertTrue(is_prime(2 ** 61 - 1))
+        self.assertFalse(is_prime(2 ** 61 + 1))
+        self.assertFalse(is_prime(3215031751))
+
+    def test_residue(self):
+        self.assertEqual(residue(-1, 7), 6)
+        self.assertEqual(residue(Fraction(1, 2), 7), 4)
+        self.assertIsNone(residue(Fraction(1, 7), 7))
+
+    def test_eliminate_modulo(self):
+        pivot_cols, determinant = eliminate_modulo(
+            [[entry % 101 for entry in row] for row in REGULAR], 101)
+        self.assertEqual(pivot_cols, [0, 1, 2])
+        self.assertEqual(determinant, 6)
+        pivot_cols, determinant = eliminate_modulo(
+            [list(row) for row in SINGULAR], 101)
+        self.assertEqual(pivot_cols, [0, 1])
+        self.assertEqual(determinant, 0)
+
+
+class TestModularPrecheck(unittest.TestCase):
+    def test_rank_and_singularity(self):
+        precheck = ModularPrecheck()
+        self.assertTrue(precheck.is_singular(build_matrix(SINGULAR)))
+        self.assertFalse(precheck.is_singular(build_matrix(REGULAR)))
+        self.assertEqual(precheck.rank(build_matrix(SINGULAR)), 2)
+        self.assertEqual(precheck.statistics()['checks'], 3)
+        self.assertGreaterEqual(precheck.statistics()['primes'], 3)
+
+    def test_solution_dimension(self):
+        precheck = ModularPrecheck()
+        self.assertIsNone(precheck.solution_dimension(
+            [row + [index * index] for index, row in enumerate(SINGULAR)], 3))
+        self.assertEqual(precheck.solution_dimension(
+            [row + [1] for row in SINGULAR], 3), 1)
+        self.assertEqual(precheck.solution_dimension(
+            [row + [1] for row in REGULAR], 3), 0)
+
+    def test_trials(self):
+        precheck = ModularPrecheck(2.0 ** -64)
+        few = precheck.trials([[1, 2], [3, 4]])
+        self.assertGreaterEqual(few, 1)
+        precheck.configure(2.0 ** -200)
+        self.assertGreater(precheck.trials([[1, 2], [3, 4]]), few)
+
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            ModularPrecheck(0)
+        with self.assertRaises(TypeError):
+            ModularPrecheck(confirm=1)
+        with self.assertRaises(TypeError):
+            ModularPrecheck().enable('0.5')
+
+
+class TestMatrixPrecheck(unittest.TestCase):
+    def setUp(self):
+        modular_precheck.enable()
+        modular_precheck.reset_counters()
+
+    def tearDown(self):
+        modular_precheck.disable()
+        modular_precheck.configure(confirm=False)
+        modular_precheck.reset_counters()
+
+    def test_singular_matrices_are_rejected_without_elimination(self):
+        for integer in (True, False):
+            matrix = build_matrix(SINGULAR, integer)
+            self.assertEqual(matrix.find_determinant(), 0)
+            self.assertIsNone(build_matrix(SINGULAR,
+                                           integer).find_inverse())
+            self.assertFalse(matrix.factorization_found)
+        self.assertEqual(modular_precheck.statistics()['rejected'], 4)
+
+    def test_inconsistent_systems_are_rejected(self):
+        matrix = build_matrix(SINGULAR, True)
+        self.assertIsNone(matrix.solve([0, 1, 3]))
+        self.assertFalse(matrix.factorization_found)
+        augmented = build_matrix([row + [index * index] for index, row
+                                  in enumerate(SINGULAR)], True)
+        self.assertIsNone(augmented.find_solution())
+        self.assertIsNone(augmented.find_solution_dimension())
+        self.assertEqual(modular_precheck.statistics()['rejected'], 2)
+
+    def test_regular_matrices_are_unchanged(self):
+        matrix = build_matrix(REGULAR, True)
+        self.assertEqual(matrix.find_determinant(), 6)
+        self.assertEqual(matrix.find_inverse() * matrix, identity_matrix(3))
+        self.assertEqual(len(matrix.solve([1, 2, 3])), 1)
+        self.assertEqual(modular_precheck.statistics()['rejected'], 0)
+
+    def test_confirm(self):
+        modular_precheck.configure(confirm=True)
+        matrix = build_matrix(SINGULAR, True)
+        self.assertIsNone(matrix.find_inverse())
+        statistics = modular_precheck.statistics()
+        self.assertEqual(statistics['rejected'], 1)
+        self.assertEqual(statistics['confirmed'], 1)
+        self.assertEqual(build_matrix(SINGULAR).find_determinant(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+from MatrixMath import Fraction, Matrix
+from MatrixMath.Spectral import evaluate_polynomial
+from MatrixMath.tests import build_matrix, identity_matrix, random_matrix
+
+
+def fibonacci(count):
+    first, second = 0, 1
+    for _ in range(count):
+        first, second = second, first + second
+    return first
+
+
+class TestSpectral(unittest.TestCase):
+    def test_trace(self):
+        matrix = build_matrix([[2, 1], [1, 3]], True)
+        self.assertEqual(matrix.find_trace(), 5)
+        rational = build_matrix([[Fraction(1, 2), 1], [1, Fraction(1, 3)]])
+        self.assertEqual(rational.find_trace(), Fraction(5, 6))
+        self.assertIsNone(Matrix(2, 3).find_trace())
+
+    def test_characteristic_polynomial(self):
+        matrix = build_matrix([[2, 1], [1, 3]], True)
+        self.assertEqual(matrix.find_characteristic_polynomial(), [5, -5, 1])
+        self.assertIsNone(Matrix(2, 3).find_characteristic_polynomial())
+
+    def test_both_domains_agree(self):
+        for size in range(1, 7):
+            matrix = random_matrix(size, seed=size, bound=5)
+            polynomial = matrix.find_characteristic_polynomial()
+            self.assertTrue(all(type(entry) is int for entry in polynomial))
+            self.assertEqual(
+                matrix.to_rational().find_characteristic_polynomial(),
+                polynomial)
+            self.assertEqual(polynomial[-1], 1)
+            self.assertEqual(polynomial[-2], -matrix.find_trace())
+            self.assertEqual(polynomial[0],
+                             (-1) ** size * matrix.find_determinant())
+
+    def test_cayley_hamilton(self):
+        for seed in range(4):
+            matrix = random_matrix(4, seed=seed, bound=5)
+            for polynomial in (matrix.find_characteristic_polynomial(),
+                               matrix.find_minimal_polynomial()):
+                self.assertEqual(evaluate_polynomial(polynomial, matrix),
+                                 Matrix(4, 4, True))
+
+    def test_minimal_polynomial(self):
+        self.assertEqual(identity_matrix(3, True).find_minimal_polynomial(),
+                         [-1, 1])
+        nilpotent = build_matrix([[0, 1, 0], [0, 0, 0], [0, 0, 0]], True)
+        self.assertEqual(nilpotent.find_minimal_polynomial(), [0, 0, 1])
+        self.assertEqual(nilpotent.find_characteristic_polynomial(),
+                         [0, 0, 0, 1])
+        rational = build_matrix([[Fraction(1, 2), 0], [0, Fraction(1, 2)]])
+        self.assertEqual(rational.find_minimal_polynomial(),
+                         [Fraction(-1, 2), 1])
+
+    def test_large_powers(self):
+        matrix = build_matrix([[1, 1], [1, 0]], True)
+        power = matrix ** 1000
+        self.assertEqual(power, build_matrix(
+            [[fibonacci(1001), fibonacci(1000)],
+             [fibonacci(1000), fibonacci(999)]], True))
+        self.assertTrue(power.integer)
+
+        matrix = random_matrix(3, seed=5, bound=5)
+        expected = identity_matrix(3, True)
+        for _ in range(200):
+            expected = expected * matrix
+        self.assertEqual(matrix ** 200, expected)
+
+    def test_large_rational_powers(self):
+        matrix = build_matrix([[Fraction(1, 2), 1], [0, 1]])
+        self.assertEqual(matrix ** 200, build_matrix(
+            [[Fraction(1, 2 ** 200), 2 - Fraction(2, 2 ** 200)], [0, 1]]))
+
+
+if __name__ == '__main__':
+    unittest.main()
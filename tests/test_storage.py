@@ -0,0 +1,80 @@
+import unittest
+from array import array
+from MatrixMath import Fraction, Matrix
+from MatrixMath.Storage import Storage, flat_buffer
+from MatrixMath.tests import build_matrix
+
+
+class TestStorage(unittest.TestCase):
+    def test_flat_buffer(self):
+        self.assertIsInstance(flat_buffer([1, 2, 3]), array)
+        self.assertIsInstance(flat_buffer([1, 2 ** 70]), list)
+        self.assertIsInstance(flat_buffer([1, Fraction(1, 2)]), list)
+        self.assertEqual(list(flat_buffer(iter([4, 5]))), [4, 5])
+
+    def test_entries_are_row_major(self):
+        storage = Storage.from_rows([[1, 2, 3], [4, 5, 6]])
+        self.assertEqual((storage.rows, storage.cols), (2, 3))
+        self.assertEqual(storage.get(1, 0), 4)
+        self.assertEqual(storage.get(-1, -1), 6)
+        self.assertEqual(list(storage.row(1)), [4, 5, 6])
+        self.assertEqual(storage.rows_list(), [[1, 2, 3], [4, 5, 6]])
+        self.assertEqual(storage.columns_list(), [[1, 4], [2, 5], [3, 6]])
+        self.assertEqual(storage.transposed().rows_list(),
+                         [[1, 4], [2, 5], [3, 6]])
+
+    def test_large_values_turn_the_array_into_a_list(self):
+        storage = Storage.zeros(2, 2)
+        self.assertTrue(storage.is_machine_int())
+        storage.set(0, 1, 7)
+        self.assertTrue(storage.is_machine_int())
+        storage.set(1, 1, 2 ** 64)
+        self.assertFalse(storage.is_machine_int())
+        self.assertEqual(storage.rows_list(), [[0, 7], [0, 2 ** 64]])
+
+        storage = Storage.zeros(2, 2)
+        storage.set_row(0, [2 ** 64, 1])
+        self.assertEqual(storage.rows_list(), [[2 ** 64, 1], [0, 0]])
+        storage = Storage.zeros(1, 2)
+        storage.replace([Fraction(1, 2), 3])
+        self.assertEqual(storage.rows_list(), [[Fraction(1, 2), 3]])
+
+    def test_swap_rows_and_copy(self):
+        storage = Storage.from_rows([[1, 2], [3, 4]])
+        copy = storage.copy()
+        storage.swap_rows(0, 1)
+        self.assertEqual(storage.rows_list(), [[3, 4], [1, 2]])
+        self.assertEqual(copy.rows_list(), [[1, 2], [3, 4]])
+
+
+class TestMatrixAccessor(unittest.TestCase):
+    def test_reads(self):
+        matrix = build_matrix([[1, 2], [3, 4]])
+        self.assertEqual(len(matrix.matrix), 2)
+        self.assertEqual(len(matrix.matrix[0]), 2)
+        self.assertEqual(matrix.matrix[1][0], 3)
+        self.assertEqual(matrix.matrix[-1][-1], 4)
+        self.assertEqual(matrix.matrix[0][0:1], [1])
+        self.assertEqual(matrix.matrix, [[1, 2], [3, 4]])
+        self.assertEqual([list(row) for row in matrix.matrix],
+                         [[1, 2], [3, 4]])
+        with self.assertRaises(IndexError):
+            matrix.matrix[2]
+        with self.assertRaises(IndexError):
+            matrix.matrix[0][2]
+
+    def test_writes_reach_the_matrix(self):
+        matrix = build_matrix([[1, 2], [3, 4]])
+        matrix.matrix[0][1] = 2 ** 80
+        self.assertEqual(matrix.matrix[0][1], 2 ** 80)
+        self.assertEqual(matrix.find_determinant(),
+                         Fraction(4 - 3 * 2 ** 80, 1))
+
+    def test_setting_the_rows(self):
+        matrix = Matrix(2, 2)
+        matrix.matrix = [[5, 6], [7, 8]]
+        self.assertEqual(matrix.matrix, [[5, 6], [7, 8]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+import os
+import tempfile
+import unittest
+from random import Random
+from MatrixMath import Fraction, TiledMatrix
+from MatrixMath.tests import build_matrix
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def random_rows(rows, cols, seed):
+    generator = Random(seed)
+    return [[generator.randint(-9, 9) for _ in range(cols)]
+            for _ in range(rows)]
+
+
+@unittest.skipUnless(numpy, 'NumPy is not installed')
+class TestTiledMatrix(unittest.TestCase):
+    def tiled(self, rows, cols, seed, budget=4096):
+        matrix = build_matrix(random_rows(rows, cols, seed), True)
+        tiled = matrix.to_tiled(4, memory_budget=budget)
+        self.addCleanup(tiled.close)
+        return matrix, tiled
+
+    def test_round_trip(self):
+        matrix, tiled = self.tiled(10, 7, 0)
+        self.assertEqual((tiled.tile_rows, tiled.tile_cols), (3, 2))
+        self.assertEqual(tiled.to_matrix()._rows(), matrix._rows())
+        self.assertEqual(tiled.get(9, 6), float(matrix.matrix[9][6]))
+        tiled.set(9, 6, 100)
+        self.assertEqual(tiled.to_matrix().matrix[9][6], 100)
+        with self.assertRaises(IndexError):
+            tiled.get(10, 0)
+
+    def test_arithmetic(self):
+        first, first_tiled = self.tiled(10, 7, 1)
+        second, second_tiled = self.tiled(7, 9, 2)
+        product = first_tiled * second_tiled
+        self.addCleanup(product.close)
+        self.assertEqual(product.to_matrix()._rows(),
+                         (first * second)._rows())
+
+        total = first_tiled + first_tiled
+        self.addCleanup(total.close)
+        scaled = 2 * first_tiled
+        self.addCleanup(scaled.close)
+        self.assertEqual(total.to_matrix()._rows(),
+                         scaled.to_matrix()._rows())
+
+        transpose = first_tiled.transpose()
+        self.addCleanup(transpose.close)
+        self.assertEqual(transpose.to_matrix()._rows(),
+                         first.find_transpose()._rows())
+        with self.assertRaises(ValueError):
+            first_tiled * first_tiled
+
+    def test_the_cache_stays_within_its_budget(self):
+        _, first = self.tiled(12, 12, 3, 3 * 4 * 4 * 8)
+        _, second = self.tiled(12, 12, 4, 3 * 4 * 4 * 8)
+        first.reset_statistics()
+        product = first * second
+        self.addCleanup(product.close)
+        statistics = first.statistics()
+        self.assertLessEqual(statistics['peak_bytes'],
+                             statistics['memory_budget'])
+        self.assertGreater(statistics['tile_reads'], 0)
+
+    def test_determinant_and_solve(self):
+        matrix, tiled = self.tiled(10, 10, 5)
+        self.assertAlmostEqual(tiled.find_determinant(),
+                               float(matrix.find_determinant()),
+                               delta=1e-6 * abs(matrix.find_determinant()))
+        constants = list(range(10))
+        exact = matrix.solve(constants)[0]
+        solution = tiled.solve(constants)[0]
+        for value, expected in zip(solution, exact):
+            self.assertAlmostEqual(value, expected.evaluate(), places=8)
+
+    def test_round_trip_keeps_the_exact_methods(self):
+        matrix = build_matrix([[4, -1], [-1, 3]], True)
+        tiled = matrix.to_tiled(4)
+        self.addCleanup(tiled.close)
+        copy = tiled.to_matrix()
+        self.assertEqual(copy.find_determinant(), 11)
+        self.assertEqual(copy.find_trace(), 7)
+        self.assertEqual(copy.find_inverse(), matrix.find_inverse())
+        self.assertEqual(copy.solve([1, 2]), matrix.solve([1, 2]))
+        tiled.set(0, 0, 0.1)
+        self.assertEqual(tiled.to_matrix().matrix[0][0],
+                         Fraction(*(0.1).as_integer_ratio()))
+
+    def test_singular_solve(self):
+        tiled = TiledMatrix(6, 6, 4)
+        self.addCleanup(tiled.close)
+        self.assertEqual(tiled.find_determinant(), 0.0)
+        self.assertIsNone(tiled.solve([1] * 6))
+
+    def test_files(self):
+        handle, path = tempfile.mkstemp(suffix='.tiles')
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        rows = random_rows(5, 5, 6)
+        TiledMatrix.from_rows(rows, 5, 5, 4, path).close()
+        with TiledMatrix.open(path, 5, 5, 4) as tiled:
+            self.assertEqual(tiled.to_matrix()._rows(), rows)
+
+        temporary = TiledMatrix(2, 2, 4)
+        temporary_path = temporary.path
+        temporary.close()
+        self.assertFalse(os.path.exists(temporary_path))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            TiledMatrix(2, 2, 4, memory_budget=8)
+        with self.assertRaises(TypeError):
+            TiledMatrix(2.0, 2)
+        with self.assertRaises(ValueError):
+            TiledMatrix.from_rows([[1, 2]], 2, 2, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+import fractions
+import unittest
+from array import array
+from MatrixMath import Fraction, Vector
+from MatrixMath.tests import build_matrix
+
+
+class TestVector(unittest.TestCase):
+    def test_buffers(self):
+        self.assertIsInstance(Vector([1, 2, 3]).values, array)
+        self.assertIsInstance(Vector([1, Fraction(1, 2)]).values, list)
+        self.assertEqual(Vector.zeros(3), Vector([0, 0, 0]))
+        with self.assertRaises(ValueError):
+            Vector.zeros(0)
+
+    def test_sequence(self):
+        vector = Vector([4, 5, 6])
+        self.assertEqual(len(vector), 3)
+        self.assertEqual(vector[-1], 6)
+        self.assertEqual(vector[1:], [5, 6])
+        self.assertEqual(list(vector), [4, 5, 6])
+        self.assertEqual(str(vector), '[4, 5, 6]')
+        self.assertEqual(Vector([1, 2]), Vector([Fraction(1, 1), 2]))
+        self.assertNotEqual(Vector([1, 2]), Vector([1, 2, 3]))
+
+    def test_arithmetic(self):
+        first = Vector([1, 2, 3])
+        second = Vector([4, -5, 6])
+        self.assertEqual(first + second, Vector([5, -3, 9]))
+        self.assertEqual(first - second, Vector([-3, 7, -3]))
+        self.assertEqual(-first, Vector([-1, -2, -3]))
+        self.assertEqual(first * 2, 2 * first)
+        self.assertEqual(first * Fraction(1, 2),
+                         Vector([Fraction(1, 2), 1, Fraction(3, 2)]))
+        self.assertEqual(first.dot(second), 12)
+        with self.assertRaises(ValueError):
+            first + Vector([1])
+        with self.assertRaises(TypeError):
+            first * first
+
+    def test_in_place_operations(self):
+        vector = Vector([1, 2, 3])
+        buffer = vector.values
+        vector += Vector([1, 1, 1])
+        vector -= Vector([0, 1, 0])
+        vector *= 3
+        vector.axpy(2, Vector([1, 0, 0]))
+        self.assertEqual(vector, Vector([8, 6, 12]))
+        self.assertIs(vector.values, buffer)
+
+        vector.axpy(Fraction(1, 2), Vector([1, 0, 0]))
+        self.assertEqual(vector[0], Fraction(17, 2))
+        vector *= 2 ** 70
+        self.assertEqual(vector[1], 6 * 2 ** 70)
+
+    def test_copy_is_independent(self):
+        vector = Vector([1, 2])
+        copy = vector.copy()
+        vector += Vector([1, 1])
+        self.assertEqual(copy, Vector([1, 2]))
+
+    def test_norms(self):
+        vector = Vector([3, -4])
+        self.assertEqual(vector.norm(), 5.0)
+        self.assertEqual(vector.norm('one'), 7)
+        self.assertEqual(vector.norm('max'), 4)
+        with self.assertRaises(ValueError):
+            vector.norm('two')
+
+
+class TestVectorMatrix(unittest.TestCase):
+    def setUp(self):
+        self.matrix = build_matrix([[1, 2, 3], [4, 5, 6]], True)
+
+    def test_products(self):
+        self.assertEqual(self.matrix.matvec(Vector([1, 0, -1])),
+                         Vector([-2, -2]))
+        self.assertEqual(self.matrix.vecmat(Vector([1, 1])),
+                         Vector([5, 7, 9]))
+        column = build_matrix([[1], [0], [-1]], True)
+        self.assertEqual(Vector.from_matrix(self.matrix * column),
+                         self.matrix.matvec(Vector([1, 0, -1])))
+        with self.assertRaises(ValueError):
+            self.matrix.matvec(Vector([1, 2]))
+        with self.assertRaises(TypeError):
+            self.matrix.vecmat([1, 2])
+
+    def test_rational_products(self):
+        half = Fraction(1, 2)
+        vector = Vector([half, 1, -half])
+        self.assertEqual(vector.dot(vector), Fraction(3, 2))
+        self.assertEqual(vector.dot(Vector([2, 4, 6])), 2)
+        third = self.matrix * Fraction(1, 3)
+        self.assertEqual(third.matvec(vector),
+                         Vector([Fraction(1, 3), Fraction(4, 3)]))
+        self.assertEqual(self.matrix.vecmat(Vector([half, half])),
+                         Vector([Fraction(5, 2), Fraction(7, 2),
+                                 Fraction(9, 2)]))
+        column = build_matrix([[1], [0], [-1]], True)
+        row = build_matrix([[1, 1]], True)
+        for backend in ('builtin', 'stdlib'):
+            matrix = third.convert(backend)
+            self.assertEqual(matrix.matvec(Vector([1, 0, -1])),
+                             Vector.from_matrix(matrix * column))
+            self.assertEqual(matrix.vecmat(Vector([1, 1])),
+                             Vector.from_matrix(row.convert(backend) * matrix))
+
+    def test_conversions(self):
+        vector = Vector([1, 2, 3])
+        column = vector.to_matrix()
+        self.assertEqual((column.rows, column.cols), (3, 1))
+        self.assertTrue(column.integer)
+        row = vector.to_matrix(False)
+        self.assertEqual((row.rows, row.cols), (1, 3))
+        self.assertEqual(Vector.from_matrix(row), vector)
+        with self.assertRaises(ValueError):
+            Vector.from_matrix(self.matrix)
+
+    def test_rationals_are_converted_to_the_backend(self):
+        row = Vector([Fraction(1, 2), 1]).to_matrix(False, 'stdlib')
+        self.assertFalse(row.integer)
+        self.assertTrue(all(isinstance(entry, fractions.Fraction)
+                            for entry in row._flat()))
+        column = build_matrix([[1], [2]], backend='stdlib')
+        self.assertEqual((row * column).matrix[0][0],
+                         fractions.Fraction(5, 2))
+
+    def test_floats_are_converted_exactly(self):
+        column = Vector([0.5, 2.0]).to_matrix()
+        self.assertFalse(column.integer)
+        self.assertEqual(column._flat(), [Fraction(1, 2), 2])
+        self.assertEqual(column.find_transpose() * column,
+                         build_matrix([[Fraction(17, 4)]]))
+        self.assertEqual(Vector([0.1]).to_matrix().matrix[0][0],
+                         Fraction(*(0.1).as_integer_ratio()))
+        with self.assertRaises(ValueError):
+            Vector([float('nan'), 1.0]).to_matrix()
+
+    def test_from_solution(self):
+        matrix = build_matrix([[1, 2, 3], [2, 4, 6], [1, 0, 1]], True)
+        solution = matrix.solve([1, 2, 1])
+        for parameters in (None, [0], [5], [Fraction(-1, 3)]):
+            values = Vector.from_solution(solution, parameters)
+            self.assertEqual(matrix.matvec(values), Vector([1, 2, 1]))
+        with self.assertRaises(ValueError):
+            Vector.from_solution(solution, [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+from unittest import mock
+from MatrixMath import Fraction, Matrix
+
+FIRST = [[1, 2, 3], [4, 5, 6]]
+SECOND = [[7, -1], [0, 2], [Fraction(1, 2), 3]]
+REGULAR = [[2, 0, 1], [1, 3, 2], [1, 1, 2]]
+SYSTEM = [[1, 2, 3], [2, 4, 6], [1, 0, 1]]
+
+
+class TestVerifyProduct(unittest.TestCase):
+    def setUp(self):
+        self.first = Matrix.from_rows(FIRST, True)
+        self.second = Matrix.from_rows(SECOND)
+
+    def test_correct_product(self):
+        product = self.first * self.second
+        for modular in (False, True):
+            self.assertTrue(Matrix.verify_product(
+                self.first, self.second, product, 3, modular))
+
+    def test_wrong_product(self):
+        rows = [list(row) for row in (self.first * self.second).matrix]
+        rows[1][0] += Fraction(1, 3)
+        product = Matrix.from_rows(rows)
+        for modular in (False, True):
+            with self.assertRaises(ArithmeticError):
+                Matrix.verify_product(self.first, self.second, product, 2,
+                                      modular)
+
+    def test_invalid_arguments(self):
+        product = self.first * self.second
+        with self.assertRaises(ValueError):
+            Matrix.verify_product(self.first, self.first, product)
+        with self.assertRaises(TypeError):
+            Matrix.verify_product(self.first, self.second, [[1]])
+        with self.assertRaises(ValueError):
+            Matrix.verify_product(self.first, self.second, product, 0)
+        with self.assertRaises(TypeError):
+            Matrix.verify_product(self.first, self.second, product, 1.5)
+
+    def test_multiply(self):
+        self.assertEqual(self.first.multiply(self.second, True),
+                         self.first * self.second)
+        wrong = Matrix.from_rows([[0, 0], [0, 0]], True)
+        with mock.patch.object(Matrix, '__mul__', return_value=wrong):
+            with self.assertRaises(ArithmeticError):
+                self.first.multiply(self.second, True)
+            self.assertIs(self.first.multiply(self.second), wrong)
+        with self.assertRaises(TypeError):
+            self.first.multiply('2', True)
+
+
+class TestVerifyInverse(unittest.TestCase):
+    def setUp(self):
+        self.matrix = Matrix.from_rows(REGULAR)
+
+    def test_inverse(self):
+        inverse = self.matrix.find_inverse(verify=True)
+        for modular in (False, True):
+            self.assertTrue(Matrix.verify_inverse(self.matrix, inverse, 2,
+                                                  modular))
+        rows = [list(row) for row in inverse.matrix]
+        rows[0][0] = 0
+        inverse = Matrix.from_rows(rows)
+        for modular in (False, True):
+            with self.assertRaises(ArithmeticError):
+                Matrix.verify_inverse(self.matrix, inverse, 2, modular)
+
+    def test_singular(self):
+        singular = Matrix.from_rows([[1, 2], [2, 4]], True)
+        self.assertIsNone(singular.find_inverse(verify=True))
+        with self.assertRaises(ValueError):
+            Matrix.verify_inverse(self.matrix, singular)
+
+
+class TestVerifySolution(unittest.TestCase):
+    def setUp(self):
+        self.matrix = Matrix.from_rows(SYSTEM, True)
+
+    def test_solution(self):
+        solution = self.matrix.solve([1, 2, 1], verify=True)
+        for modular in (False, True):
+            self.assertTrue(Matrix.verify_solution(
+                self.matrix, solution, [1, 2, 1], 2, modular))
+        constants = Matrix.from_rows([[1], [2], [1]], True)
+        self.assertTrue(Matrix.verify_solution(self.matrix, solution,
+                                               constants))
+        augmented = Matrix.from_rows([row + [constant] for row, constant
+                                      in zip(SYSTEM, [1, 2, 1])], True)
+        self.assertTrue(Matrix.verify_solution(
+            augmented, augmented.find_solution(verify=True)))
+
+    def test_wrong_solution(self):
+        solution = self.matrix.solve([1, 2, 1])
+        for wrong in ([[solution[0][0], [0, 0, 1]], solution[1]],
+                      [solution[0], [Fraction(1, 2), 0, 0]]):
+            for modular in (False, True):
+                with self.assertRaises(ArithmeticError):
+                    Matrix.verify_solution(self.matrix, wrong, [1, 2, 1], 2,
+                                           modular)
+
+    def test_no_solution(self):
+        self.assertIsNone(self.matrix.solve([1, 3, 1], verify=True))
+
+    def test_invalid_arguments(self):
+        solution = self.matrix.solve([1, 2, 1])
+        with self.assertRaises(ValueError):
+            Matrix.verify_solution(self.matrix, solution, [1, 2])
+        with self.assertRaises(TypeError):
+            Matrix.verify_solution(self.matrix, None, [1, 2, 1])
+        with self.assertRaises(ValueError):
+            Matrix.verify_solution(self.matrix, [[0, 0]], [1, 2, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+from MatrixMath import Fraction, MatrixView
+from MatrixMath.tests import build_matrix
+
+
+def sample():
+    return build_matrix([[1, 2, 3, 4], [5, 6, 7, 8],
+                         [9, 10, 11, 12], [13, 14, 15, 17]])
+
+
+class TestViews(unittest.TestCase):
+    def test_view_selects_slices(self):
+        view = sample().view(slice(1, 3), slice(0, 4, 2))
+        self.assertIsInstance(view, MatrixView)
+        self.assertEqual((view.rows, view.cols), (2, 2))
+        self.assertEqual(view.materialize(),
+                         build_matrix([[5, 7], [9, 11]]))
+
+    def test_views_of_views_compose(self):
+        view = sample().view(slice(1, None)).view(slice(None, 2),
+                                                  slice(1, 3))
+        self.assertEqual(view.base.rows, 4)
+        self.assertEqual(view.materialize(),
+                         build_matrix([[6, 7], [10, 11]]))
+
+    def test_row_and_col_views(self):
+        matrix = sample()
+        self.assertEqual(matrix.row_view(2).materialize(),
+                         build_matrix([[5, 6, 7, 8]]))
+        self.assertEqual(matrix.col_view(4).materialize(),
+                         build_matrix([[4], [8], [12], [17]]))
+        with self.assertRaises(ValueError):
+            matrix.row_view(5)
+        with self.assertRaises(TypeError):
+            matrix.col_view('1')
+
+    def test_minor_view_matches_find_minor(self):
+        matrix = sample()
+        for row in range(1, 5):
+            for col in range(1, 5):
+                minor = matrix.minor_view(row, col)
+                rows = [[entry for j, entry in enumerate(values)
+                         if j != col - 1]
+                        for i, values in enumerate(matrix._rows())
+                        if i != row - 1]
+                expected = build_matrix(rows)
+                self.assertEqual(minor.materialize(), expected)
+                self.assertEqual(matrix.find_minor(row, col),
+                                 expected.find_determinant())
+
+    def test_transpose_view(self):
+        matrix = sample()
+        view = matrix.transpose_view()
+        self.assertEqual(view.materialize(), matrix.find_transpose())
+        self.assertEqual(view.transpose_view().materialize(), matrix)
+        self.assertEqual(view.view(slice(0, 1)).materialize(),
+                         build_matrix([[1, 5, 9, 13]]))
+
+    def test_views_are_read_as_matrices(self):
+        matrix = sample()
+        view = matrix.view(slice(0, 2), slice(0, 2))
+        copy = view.materialize()
+        self.assertEqual(view.find_determinant(), copy.find_determinant())
+        self.assertEqual(view * view, copy * copy)
+        self.assertEqual(view, copy)
+        self.assertEqual(view + copy, copy * 2)
+
+    def test_views_share_the_entries_of_their_base(self):
+        matrix = sample()
+        view = matrix.view(slice(0, 2), slice(0, 2))
+        copy = view.materialize()
+        matrix.store_value(100, 1, 1)
+        self.assertEqual(view.matrix[0][0], 100)
+        self.assertEqual(copy.matrix[0][0], 1)
+
+    def test_views_are_read_only(self):
+        view = sample().view(slice(0, 2))
+        with self.assertRaises(TypeError):
+            view.store_value(1, 1, 1)
+        with self.assertRaises(TypeError):
+            view.add_scaled(view)
+        result = view
+        result += view
+        self.assertIsNot(result, view)
+        self.assertEqual(result, view.materialize() * 2)
+
+    def test_empty_views_are_rejected(self):
+        with self.assertRaises(ValueError):
+            sample().view(slice(2, 2))
+
+    def test_rational_views(self):
+        matrix = build_matrix([[Fraction(1, 2), 1], [3, 4]])
+        view = matrix.transpose_view()
+        self.assertEqual(view.find_determinant(), matrix.find_determinant())
+
+
+if __name__ == '__main__':
+    unittest.main()